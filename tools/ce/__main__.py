@@ -20,6 +20,7 @@ from .cli_handlers import (
     cmd_prp_analyze,
     cmd_pipeline_validate,
     cmd_pipeline_render,
+    cmd_pipeline_run,
     cmd_metrics,
     cmd_analyze_context,
     cmd_update_context,
@@ -47,6 +48,7 @@ Examples:
   ce run_py tmp/script.py
   ce run_py --code "import sys; print(sys.version)"
   ce run_py --file tmp/script.py --args "--input data.csv"
+  ce run_py --warm "import json; print(json.dumps([1]))"
         """
     )
 
@@ -73,6 +75,16 @@ Examples:
         "--files",
         help="Comma-separated list of implementation files (for level 4, optional - auto-detected if not provided)"
     )
+    validate_parser.add_argument(
+        "--full-tests",
+        action="store_true",
+        help="Level 2: run the full test suite instead of only tests affected by changes"
+    )
+    validate_parser.add_argument(
+        "--no-select",
+        action="store_true",
+        help="Level 2: skip test impact analysis and run 'npm test'"
+    )
     validate_parser.add_argument(
         "--json",
         action="store_true",
@@ -198,6 +210,24 @@ Examples:
         choices=["accepted", "rejected", "examples_updated"],
         help="Filter by action type (for history)"
     )
+    drift_parser.add_argument(
+        "--min-score",
+        type=float,
+        help="Minimum drift score (for history)"
+    )
+    drift_parser.add_argument(
+        "--max-score",
+        type=float,
+        help="Maximum drift score (for history)"
+    )
+    drift_parser.add_argument(
+        "--since",
+        help="Only decisions at or after ISO date, e.g. 2025-10-01 (for history)"
+    )
+    drift_parser.add_argument(
+        "--until",
+        help="Only decisions before ISO date (for history)"
+    )
     drift_parser.add_argument(
         "--json",
         action="store_true",
@@ -228,6 +258,11 @@ Examples:
         dest="script_args",
         help="Arguments to pass to Python script"
     )
+    runpy_parser.add_argument(
+        "--warm",
+        action="store_true",
+        help="Run on the warm interpreter pool (preload modules via CE_RUN_PY_PRELOAD; also CE_RUN_PY_WARM=1)"
+    )
     runpy_parser.add_argument(
         "--json",
         action="store_true",
@@ -281,6 +316,11 @@ Examples:
         action="store_false",
         help="Disable sequential thinking (use heuristics)"
     )
+    prp_generate_parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Print per-stage timings and the critical path"
+    )
 
     # prp execute subcommand
     prp_execute_parser = prp_subparsers.add_parser(
@@ -301,6 +341,13 @@ Examples:
     prp_execute_parser.add_argument(
         "--dry-run", action="store_true", help="Parse blueprint only, don't execute"
     )
+    prp_execute_parser.add_argument(
+        "--parallel", action="store_true",
+        help="Run phases with disjoint files concurrently in git worktrees"
+    )
+    prp_execute_parser.add_argument(
+        "--max-workers", type=int, help="Max concurrent phases (for --parallel)"
+    )
     prp_execute_parser.add_argument(
         "--json", action="store_true", help="Output as JSON"
     )
@@ -310,11 +357,21 @@ Examples:
         "analyze", help="Analyze PRP size and complexity"
     )
     prp_analyze_parser.add_argument(
-        "file", help="Path to PRP markdown file"
+        "file", nargs="?", help="Path to PRP markdown file"
+    )
+    prp_analyze_parser.add_argument(
+        "--all", action="store_true",
+        help="Analyze every PRP under PRPs/ and report aggregate distributions"
     )
     prp_analyze_parser.add_argument(
         "--json", action="store_true", help="Output as JSON"
     )
+    prp_analyze_parser.add_argument(
+        "--csv", action="store_true", help="Output per-PRP rows as CSV (with --all)"
+    )
+    prp_analyze_parser.add_argument(
+        "--workers", type=int, help="Process pool size for --all (default: CPU count)"
+    )
 
     # === PIPELINE COMMAND ===
     pipeline_parser = subparsers.add_parser(
@@ -345,6 +402,23 @@ Examples:
         "-o", "--output", help="Output file path"
     )
 
+    # pipeline run subcommand
+    pipeline_run_parser = pipeline_subparsers.add_parser(
+        "run", help="Run abstract pipeline locally (parallel stages, cached nodes)"
+    )
+    pipeline_run_parser.add_argument(
+        "pipeline_file", help="Path to abstract pipeline YAML file"
+    )
+    pipeline_run_parser.add_argument(
+        "--workers", type=int, help="Max concurrent node commands (default: CPU count)"
+    )
+    pipeline_run_parser.add_argument(
+        "--no-cache", action="store_true", help="Run every node even if inputs are unchanged"
+    )
+    pipeline_run_parser.add_argument(
+        "--plan", action="store_true", help="Print the execution plan without running"
+    )
+
     # === METRICS COMMAND ===
     metrics_parser = subparsers.add_parser(
         "metrics",
@@ -555,6 +629,8 @@ Examples:
             return cmd_pipeline_validate(args)
         elif args.pipeline_command == "render":
             return cmd_pipeline_render(args)
+        elif args.pipeline_command == "run":
+            return cmd_pipeline_run(args)
     elif args.command == "metrics":
         return cmd_metrics(args)
     elif args.command in ["analyze-context", "analyse-context"]:
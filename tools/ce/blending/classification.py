@@ -27,6 +27,8 @@ from dataclasses import dataclass
 import anthropic
 import os
 
+from ce.doc_probe import probe_doc
+
 
 @dataclass
 class ClassificationResult:
@@ -101,10 +103,9 @@ def validate_prp(file_path: str) -> ClassificationResult:
             file_type="garbage"
         )
 
-    # Read file content
+    # Probe file head (body is read only if a check needs it)
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        probe = probe_doc(file_path)
     except Exception as e:
         return ClassificationResult(
             valid=False,
@@ -115,7 +116,7 @@ def validate_prp(file_path: str) -> ClassificationResult:
 
     # Check for PRP ID in content (required)
     prp_id_pattern = r'(?:PRP-\d+(?:\.\d+)*|prp_id:\s*["\']?[\d.]+["\']?)'
-    if not re.search(prp_id_pattern, content, re.IGNORECASE):
+    if not probe.search(prp_id_pattern, re.IGNORECASE):
         issues.append("No PRP ID found in content or YAML")
         return ClassificationResult(
             valid=False,
@@ -125,14 +126,14 @@ def validate_prp(file_path: str) -> ClassificationResult:
         )
 
     # Check for YAML header (optional, +0.2 confidence)
-    if re.match(r'^---\s*\n', content):
+    if probe.has_frontmatter_start():
         confidence += 0.2
     else:
         issues.append("No YAML header (optional but recommended)")
 
     # Check for standard sections (optional, +0.1 confidence)
     standard_sections = ["TL;DR", "Context", "Implementation", "Validation"]
-    found_sections = sum(1 for section in standard_sections if section in content)
+    found_sections = sum(1 for section in standard_sections if probe.search(re.escape(section)))
     if found_sections >= 3:
         confidence += 0.1
     else:
@@ -178,10 +179,9 @@ def validate_example(file_path: str) -> ClassificationResult:
             file_type="garbage"
         )
 
-    # Read file content
+    # Probe file head (body is read only if a check needs it)
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        probe = probe_doc(file_path)
     except Exception as e:
         return ClassificationResult(
             valid=False,
@@ -191,7 +191,7 @@ def validate_example(file_path: str) -> ClassificationResult:
         )
 
     # Check for H1 title (required)
-    if not re.search(r'^#\s+.+', content, re.MULTILINE):
+    if not probe.search(r'^#\s+.+', re.MULTILINE):
         issues.append("No H1 title found")
         return ClassificationResult(
             valid=False,
@@ -201,24 +201,25 @@ def validate_example(file_path: str) -> ClassificationResult:
         )
 
     # Check for H2 sections (optional, +0.2 confidence)
-    h2_sections = re.findall(r'^##\s+.+', content, re.MULTILINE)
+    h2_sections = re.findall(r'^##\s+.+', probe.head, re.MULTILINE)
+    if len(h2_sections) < 2 and not probe.complete:
+        h2_sections = re.findall(r'^##\s+.+', probe.body, re.MULTILINE)
     if len(h2_sections) >= 2:
         confidence += 0.2
     else:
         issues.append(f"Found {len(h2_sections)} H2 sections (recommended: ≥2)")
 
     # Check for code blocks (optional, +0.2 confidence)
-    code_blocks = re.findall(r'```.*?```', content, re.DOTALL)
-    if len(code_blocks) >= 1:
+    if probe.search(r'```.*?```', re.DOTALL):
         confidence += 0.2
     else:
         issues.append("No code blocks found (recommended for examples)")
 
     # Check substantial content (optional, +0.1 confidence)
-    if len(content) > 500:
+    if probe.char_count_exceeds(500):
         confidence += 0.1
     else:
-        issues.append(f"Short content ({len(content)} chars, recommended: >500)")
+        issues.append(f"Short content ({len(probe.body)} chars, recommended: >500)")
 
     return ClassificationResult(
         valid=True,
@@ -257,10 +258,9 @@ def validate_memory(file_path: str) -> ClassificationResult:
             file_type="garbage"
         )
 
-    # Read file content
+    # Probe file head (body is read only if a check needs it)
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        probe = probe_doc(file_path)
     except Exception as e:
         return ClassificationResult(
             valid=False,
@@ -270,7 +270,7 @@ def validate_memory(file_path: str) -> ClassificationResult:
         )
 
     # Check for YAML frontmatter (required)
-    if not re.match(r'^---\s*\n', content):
+    if not probe.has_frontmatter_start():
         issues.append("No YAML frontmatter found")
         return ClassificationResult(
             valid=False,
@@ -280,8 +280,8 @@ def validate_memory(file_path: str) -> ClassificationResult:
         )
 
     # Extract YAML header
-    yaml_match = re.match(r'^---\s*\n(.*?)\n---', content, re.DOTALL)
-    if not yaml_match:
+    yaml_content = probe.frontmatter()
+    if yaml_content is None:
         issues.append("Malformed YAML frontmatter")
         return ClassificationResult(
             valid=False,
@@ -290,8 +290,6 @@ def validate_memory(file_path: str) -> ClassificationResult:
             file_type="unknown"
         )
 
-    yaml_content = yaml_match.group(1)
-
     # Check for type field (required)
     type_match = re.search(r'type:\s*(regular|critical|user)', yaml_content)
     if not type_match:
@@ -8,7 +8,9 @@ from typing import Generator, Dict, List, Any, Optional, Union
 from contextlib import contextmanager
 
 from ce.blending.llm_client import BlendingLLM
+from ce.blending.manifest import MANIFEST_NAME
 from ce.config_loader import BlendConfig
+from ce.snapshot import clone_path, remove_path, replace_path
 
 logger = logging.getLogger(__name__)
 
@@ -19,9 +21,12 @@ def backup_context(file_path: Path) -> Generator[Path, None, None]:
     Context manager for backup-modify-restore pattern.
 
     Creates backup before modification, removes on success, restores on failure.
+    The backup is a reflink clone where the filesystem supports it (metadata
+    only), a copy otherwise; restore is a rename. Directories are backed up
+    as whole trees.
 
     Args:
-        file_path: Path to file to backup
+        file_path: Path to file or directory to backup
 
     Yields:
         backup_path: Path to backup file
@@ -42,7 +47,8 @@ def backup_context(file_path: Path) -> Generator[Path, None, None]:
     # Create backup
     if file_path.exists():
         try:
-            shutil.copy2(file_path, backup_path)
+            remove_path(backup_path)
+            clone_path(file_path, backup_path)
             logger.info(f"✓ Backed up to {backup_path.name}")
         except OSError as e:
             raise OSError(
@@ -55,7 +61,7 @@ def backup_context(file_path: Path) -> Generator[Path, None, None]:
 
         # Success - remove backup
         if backup_path.exists():
-            backup_path.unlink()
+            remove_path(backup_path)
             logger.debug(f"Removed backup {backup_path.name}")
 
     except Exception as e:
@@ -64,7 +70,7 @@ def backup_context(file_path: Path) -> Generator[Path, None, None]:
 
         if backup_path.exists():
             try:
-                shutil.copy2(backup_path, file_path)
+                replace_path(backup_path, file_path)
                 logger.info(f"✓ Restored from backup {backup_path.name}")
             except OSError as restore_error:
                 logger.critical(
@@ -605,13 +611,15 @@ class BlendingOrchestrator:
                     if domain == 'prps':
                         params = {
                             "source_dir": source_dir,
-                            "target_dir": target_dir / ".ce" / "PRPs"
+                            "target_dir": target_dir / ".ce" / "PRPs",
+                            "manifest_path": target_dir / ".ce" / MANIFEST_NAME
                         }
                     elif domain == 'commands':
                         params = {
                             "source_dir": source_dir,
                             "target_dir": target_dir / ".claude" / "commands",
-                            "backup_dir": target_dir / ".claude" / "commands.backup"
+                            "backup_dir": target_dir / ".claude" / "commands.backup",
+                            "manifest_path": target_dir / ".ce" / MANIFEST_NAME
                         }
                     else:
                         # Fallback for unknown strategies
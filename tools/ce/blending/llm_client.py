@@ -2,6 +2,7 @@
 
 import os
 import logging
+import threading
 from typing import Dict, Any, Optional, List
 from anthropic import Anthropic
 
@@ -88,9 +89,10 @@ class BlendingLLM:
                 f"  3. Check Anthropic status: https://status.anthropic.com"
             ) from e
 
-        # Token usage tracking
+        # Token usage tracking (calls may run concurrently)
         self.total_input_tokens = 0
         self.total_output_tokens = 0
+        self._token_lock = threading.Lock()
 
     def get_token_usage(self) -> Dict[str, int]:
         """
@@ -108,8 +110,9 @@ class BlendingLLM:
     def _track_tokens(self, usage: Any) -> None:
         """Track tokens from API response usage object."""
         if usage:
-            self.total_input_tokens += getattr(usage, 'input_tokens', 0)
-            self.total_output_tokens += getattr(usage, 'output_tokens', 0)
+            with self._token_lock:
+                self.total_input_tokens += getattr(usage, 'input_tokens', 0)
+                self.total_output_tokens += getattr(usage, 'output_tokens', 0)
 
     def blend_content(
         self,
@@ -0,0 +1,167 @@
+"""Persistent migration manifest for incremental blending.
+
+Records, per migrated source file, its size, mtime and content hash plus
+the stat of the destination that was written from it. A re-run of a
+simple strategy (PRPs, commands) can then skip an unchanged source with
+two stat calls instead of reading and hashing both sides.
+
+The manifest lives at <target>/.ce/blend-manifest.json and is written
+once per strategy run (save()), atomically.
+
+Example:
+    manifest = MigrationManifest.load(target / ".ce" / "blend-manifest.json")
+    section = manifest.section("prps")
+    if section.is_unchanged(src, dest):
+        ...
+    section.record(src, dest, src_hash)
+    manifest.save()
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "blend-manifest.json"
+MANIFEST_VERSION = 1
+
+
+def hash_bytes(data: bytes) -> str:
+    """SHA256 hex digest of data."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def _stat(path: Path) -> Optional[os.stat_result]:
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+class ManifestSection:
+    """Entries of one strategy, keyed by absolute source path."""
+
+    def __init__(self, manifest: "MigrationManifest", entries: Dict[str, Dict[str, Any]]):
+        self._manifest = manifest
+        self._entries = entries
+
+    def get(self, source: Path) -> Optional[Dict[str, Any]]:
+        """Recorded entry for source (None if never migrated)."""
+        return self._entries.get(os.path.abspath(source))
+
+    def is_unchanged(self, source: Path, dest: Optional[Path] = None) -> bool:
+        """True if neither source nor dest changed since the recorded migration.
+
+        Costs two stat calls; no file content is read.
+
+        Args:
+            source: Source file
+            dest: Expected destination (default: the recorded one)
+        """
+        entry = self.get(source)
+        if entry is None:
+            return False
+        if dest is not None and entry.get("dest") != os.path.abspath(dest):
+            return False
+        src_stat = _stat(source)
+        if src_stat is None:
+            return False
+        return (
+            src_stat.st_size == entry["size"]
+            and src_stat.st_mtime_ns == entry["mtime_ns"]
+            and self.dest_unchanged(source)
+        )
+
+    def dest_unchanged(self, source: Path) -> bool:
+        """True if the destination recorded for source still has its recorded stat."""
+        entry = self.get(source)
+        if entry is None:
+            return False
+        dest_stat = _stat(Path(entry["dest"]))
+        return (
+            dest_stat is not None
+            and dest_stat.st_size == entry["dest_size"]
+            and dest_stat.st_mtime_ns == entry["dest_mtime_ns"]
+        )
+
+    def record(self, source: Path, dest: Path, source_hash: str) -> None:
+        """Record a migrated (or verified identical) source/destination pair."""
+        src_stat = _stat(source)
+        dest_stat = _stat(dest)
+        if src_stat is None or dest_stat is None:
+            return
+        self._entries[os.path.abspath(source)] = {
+            "size": src_stat.st_size,
+            "mtime_ns": src_stat.st_mtime_ns,
+            "sha256": source_hash,
+            "dest": os.path.abspath(dest),
+            "dest_size": dest_stat.st_size,
+            "dest_mtime_ns": dest_stat.st_mtime_ns,
+        }
+        self._manifest.dirty = True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class MigrationManifest:
+    """JSON manifest of migrated files, grouped into per-strategy sections.
+
+    A manifest without a path is in-memory only (save() is a no-op).
+
+    Attributes:
+        path: Manifest file (None = not persisted)
+        dirty: True if entries changed since load/save
+    """
+
+    def __init__(self, path: Optional[Path] = None, sections: Optional[Dict[str, Dict]] = None):
+        self.path = Path(path) if path else None
+        self._sections: Dict[str, Dict[str, Dict[str, Any]]] = sections or {}
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path: Optional[Path]) -> "MigrationManifest":
+        """Load manifest from path (empty if missing, unreadable or old version)."""
+        if path is None:
+            return cls()
+        path = Path(path)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return cls(path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable blend manifest {path}: {e}")
+            return cls(path)
+
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            return cls(path)
+        return cls(path, data.get("sections", {}))
+
+    def section(self, name: str) -> ManifestSection:
+        """Entries for one strategy (created on first use)."""
+        return ManifestSection(self, self._sections.setdefault(name, {}))
+
+    def save(self) -> None:
+        """Write all entries in one atomic replace (no-op if unchanged)."""
+        if self.path is None or not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps(
+            {"version": MANIFEST_VERSION, "sections": self._sections},
+            indent=1,
+            sort_keys=True,
+        )
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp, self.path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self.dirty = False
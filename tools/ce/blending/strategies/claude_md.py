@@ -2,15 +2,37 @@
 
 Philosophy: Copy framework sections (authoritative) + import target [PROJECT]
 sections where non-contradictory. RULES.md enforced as invariants.
+
+Sonnet results are cached per section fingerprint (framework section +
+target section + rules), in a bounded in-memory LRU and, once the target
+has a .ce/ directory, under <target>/.ce/cache/claude-md/, so re-blending
+only sends changed sections to the LLM. Cache misses are merged
+concurrently.
 """
 
+import hashlib
+import json
 import logging
-from typing import Dict, List, Any, Optional
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
 
 from .base import BlendStrategy
+from ...prp_sections import read_disk_cache, write_disk_cache
 
 logger = logging.getLogger(__name__)
 
+# Bump to invalidate cached merges (prompt or model change)
+MERGE_CACHE_VERSION = 1
+MAX_MERGE_WORKERS = 4
+
+_CACHE_KIND = "claude-md"
+_MEMORY_CACHE_SIZE = 256
+_memory_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_memory_lock = threading.Lock()
+
 # Section categories
 FRAMEWORK_SECTIONS = {
     "Core Principles", "Framework Initialization", "Tool Naming Convention",
@@ -122,7 +144,9 @@ class ClaudeMdBlendStrategy(BlendStrategy):
         Args:
             framework_content: Framework CLAUDE.md content
             target_content: Target project CLAUDE.md content (may be empty)
-            context: Dict with llm_client and optional rules_content
+            context: Dict with llm_client and optional rules_content,
+                target_dir (enables the on-disk merge cache) and
+                max_workers (concurrent LLM calls, default 4)
 
         Returns:
             Blended CLAUDE.md content
@@ -156,22 +180,18 @@ class ClaudeMdBlendStrategy(BlendStrategy):
                 logger.debug(f"  Framework section: {section_name} (copied)")
 
         # 2. Hybrid sections - Sonnet merge
+        # 3. Target-only sections - import if project-specific, else validate
+        jobs: List[Tuple[str, str, Dict[str, str]]] = []
         for section_name in HYBRID_SECTIONS:
             if section_name in framework_sections:
-                target_section = target_sections.get(section_name, "")
-
-                # Build merge prompt
                 logger.debug(f"  Hybrid section: {section_name} (merging)")
-                result = llm.blend_content(
-                    framework_content=framework_sections[section_name],
-                    target_content=target_section,
-                    rules_content=rules,
-                    domain=f"claude_md_{section_name.replace(' ', '_').lower()}"
-                )
+                jobs.append((section_name, "merge", {
+                    "framework_content": framework_sections[section_name],
+                    "target_content": target_sections.get(section_name, ""),
+                    "rules_content": rules,
+                    "domain": f"claude_md_{section_name.replace(' ', '_').lower()}"
+                }))
 
-                blended_sections[section_name] = result["blended"]
-
-        # 3. Target-only sections - import if project-specific
         for section_name in target_sections:
             if section_name not in framework_sections:
                 category = self.categorize_section(section_name)
@@ -183,23 +203,77 @@ class ClaudeMdBlendStrategy(BlendStrategy):
                 else:
                     # Unknown section - validate with Sonnet
                     logger.debug(f"  Target section: {section_name} (validating)")
-                    result = llm.blend_content(
-                        framework_content=rules if rules else "# Framework Rules\n\nNo rules provided.",
-                        target_content=target_sections[section_name],
-                        rules_content=rules,
-                        domain=f"validate_{section_name.replace(' ', '_').lower()}"
-                    )
-
-                    # Import if high confidence (non-contradictory)
-                    if result["confidence"] > 0.7:
-                        blended_sections[section_name] = target_sections[section_name]
-                        logger.debug(f"    → Imported (confidence: {result['confidence']:.2f})")
-                    else:
-                        logger.warning(f"    → Skipped (confidence: {result['confidence']:.2f})")
+                    jobs.append((section_name, "validate", {
+                        "framework_content": rules if rules else "# Framework Rules\n\nNo rules provided.",
+                        "target_content": target_sections[section_name],
+                        "rules_content": rules,
+                        "domain": f"validate_{section_name.replace(' ', '_').lower()}"
+                    }))
+
+        results = self._run_llm_jobs(llm, jobs, context)
+
+        for (section_name, kind, _), result in zip(jobs, results):
+            if kind == "merge":
+                blended_sections[section_name] = result["blended"]
+            elif result["confidence"] > 0.7:
+                # Import if high confidence (non-contradictory)
+                blended_sections[section_name] = target_sections[section_name]
+                logger.debug(f"    {section_name} → Imported (confidence: {result['confidence']:.2f})")
+            else:
+                logger.warning(f"    {section_name} → Skipped (confidence: {result['confidence']:.2f})")
 
         # 4. Reassemble in logical order
         return self._reassemble_sections(blended_sections, framework_sections)
 
+    def _run_llm_jobs(
+        self,
+        llm: Any,
+        jobs: List[Tuple[str, str, Dict[str, str]]],
+        context: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        Run blend_content() for each job, skipping sections with a cached result.
+
+        Args:
+            llm: LLM client (blend_content interface)
+            jobs: (section_name, kind, blend_content kwargs) tuples
+            context: blend() context (target_dir, max_workers)
+
+        Returns:
+            blend_content() results ({"blended", "confidence", ...}) in job order
+        """
+        target_dir = context.get("target_dir")
+        cache_root = Path(target_dir) if target_dir else None
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(jobs)
+        pending = []
+        for i, (_, kind, kwargs) in enumerate(jobs):
+            key = _fingerprint(kind, kwargs)
+            cached = _read_cached(cache_root, key)
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.append((i, key, kwargs))
+
+        if pending:
+            workers = max(1, min(context.get("max_workers", MAX_MERGE_WORKERS), len(pending)))
+
+            def call(job):
+                i, key, kwargs = job
+                result = llm.blend_content(**kwargs)
+                _write_cached(cache_root, key, result)
+                return i, result
+
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for i, result in pool.map(call, pending):
+                    results[i] = result
+
+        logger.info(
+            f"  CLAUDE.md sections: {len(pending)} sent to LLM, "
+            f"{len(jobs) - len(pending)} from cache"
+        )
+        return results
+
     def _reassemble_sections(
         self,
         blended_sections: Dict[str, str],
@@ -300,3 +374,42 @@ class ClaudeMdBlendStrategy(BlendStrategy):
 
         logger.info(f"✓ Validated CLAUDE.md ({len(sections)} sections)")
         return True
+
+
+def _fingerprint(kind: str, kwargs: Dict[str, str]) -> str:
+    """Hash of everything that determines a section's LLM result."""
+    payload = json.dumps([MERGE_CACHE_VERSION, kind, kwargs], sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _read_cached(cache_root: Optional[Path], key: str) -> Optional[Dict[str, Any]]:
+    """Cached LLM result for a section fingerprint (memory, then <root>/.ce/cache)."""
+    with _memory_lock:
+        cached = _memory_cache.get(key)
+        if cached is not None:
+            _memory_cache.move_to_end(key)
+            return cached
+    if cache_root is None:
+        return None
+
+    cached = read_disk_cache(_CACHE_KIND, key, root=cache_root)
+    if not isinstance(cached, dict) or not {"blended", "confidence"} <= cached.keys():
+        return None
+    _remember(key, cached)
+    return cached
+
+
+def _write_cached(cache_root: Optional[Path], key: str, result: Dict[str, Any]) -> None:
+    """Store an LLM result (blended text and confidence) for a section fingerprint."""
+    entry = {"blended": result["blended"], "confidence": result["confidence"]}
+    _remember(key, entry)
+    if cache_root is not None:
+        write_disk_cache(_CACHE_KIND, key, entry, root=cache_root)
+
+
+def _remember(key: str, entry: Dict[str, Any]) -> None:
+    with _memory_lock:
+        _memory_cache[key] = entry
+        _memory_cache.move_to_end(key)
+        if len(_memory_cache) > _MEMORY_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
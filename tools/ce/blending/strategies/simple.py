@@ -8,6 +8,8 @@ Philosophy:
 - No ID deduplication for PRPs (preserve all user PRPs)
 - Framework authority for commands (backup user versions)
 - Hash-based deduplication (skip identical files)
+- Incremental re-runs: a migration manifest (.ce/blend-manifest.json)
+  lets unchanged sources be skipped with a stat call
 - Atomic operations with proper error handling
 """
 
@@ -18,6 +20,18 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, List
 
+from ce.blending.manifest import MigrationManifest, hash_bytes
+
+
+def _same_content(dest: Path, data: bytes) -> bool:
+    """True if dest exists with exactly data (compares sizes before reading)."""
+    try:
+        if dest.stat().st_size != len(data):
+            return False
+        return dest.read_bytes() == data
+    except OSError:
+        return False
+
 
 class PRPMoveStrategy:
     """
@@ -28,6 +42,7 @@ class PRPMoveStrategy:
     - Determines status (executed vs feature-requests) from content
     - Adds 'type: user' YAML header if missing
     - Skips if identical file exists (hash-based dedupe)
+    - Skips sources unchanged since the last run (manifest stat check)
     - No ID-based deduplication (all PRPs preserved)
 
     Usage:
@@ -46,13 +61,15 @@ class PRPMoveStrategy:
         Args:
             input_data: {
                 "source_dir": Path to source PRPs directory,
-                "target_dir": Path to target .ce/PRPs directory
+                "target_dir": Path to target .ce/PRPs directory,
+                "manifest_path": Optional migration manifest file
             }
 
         Returns:
             {
                 "prps_moved": int,
                 "prps_skipped": int,
+                "prps_unchanged": int (skipped via manifest, not read),
                 "errors": List[str]
             }
         """
@@ -76,15 +93,34 @@ class PRPMoveStrategy:
         (target_dir / "executed").mkdir(parents=True, exist_ok=True)
         (target_dir / "feature-requests").mkdir(parents=True, exist_ok=True)
 
+        manifest = MigrationManifest.load(input_data.get("manifest_path"))
+        section = manifest.section("prps")
+
         moved = 0
         skipped = 0
+        unchanged = 0
         errors = []
 
         # Find all markdown files in source (recursively)
         for prp_file in source_dir.glob("**/*.md"):
             try:
-                # Read content
-                content = prp_file.read_text(encoding="utf-8")
+                # Unchanged since last migration: stat only, no reads
+                if section.is_unchanged(prp_file):
+                    skipped += 1
+                    unchanged += 1
+                    continue
+
+                raw = prp_file.read_bytes()
+                source_hash = hash_bytes(raw)
+
+                # Touched but identical content, destination untouched
+                entry = section.get(prp_file)
+                if entry and entry["sha256"] == source_hash and section.dest_unchanged(prp_file):
+                    section.record(prp_file, Path(entry["dest"]), source_hash)
+                    skipped += 1
+                    continue
+
+                content = raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
 
                 # Add user header if missing
                 if not self._has_yaml_header(content):
@@ -116,23 +152,30 @@ class PRPMoveStrategy:
                 # Ensure parent directory exists
                 dest.parent.mkdir(parents=True, exist_ok=True)
 
-                # Hash-based deduplication
-                if dest.exists():
-                    if self._calculate_hash(content) == self._calculate_hash(dest.read_text(encoding="utf-8")):
-                        skipped += 1
-                        continue
+                # Content deduplication (size check first, bytes only on size match)
+                if _same_content(dest, content.encode("utf-8")):
+                    section.record(prp_file, dest, source_hash)
+                    skipped += 1
+                    continue
 
                 # Write to destination
                 dest.write_text(content, encoding="utf-8")
+                section.record(prp_file, dest, source_hash)
                 moved += 1
 
             except Exception as e:
                 errors.append(f"Error processing {prp_file.name}: {str(e)}")
 
+        try:
+            manifest.save()
+        except OSError as e:
+            errors.append(f"Error saving migration manifest: {e}")
+
         return {
             "success": len(errors) == 0,
             "prps_moved": moved,
             "prps_skipped": skipped,
+            "prps_unchanged": unchanged,
             "errors": errors,
             "files_processed": moved
         }
@@ -218,6 +261,7 @@ class CommandOverwriteStrategy:
     - Backs up existing commands to .claude/commands.backup/
     - Overwrites with framework commands from source
     - Skips if identical file exists (hash-based dedupe)
+    - Skips sources unchanged since the last run (manifest stat check)
     - Preserves user custom commands (not in framework)
 
     Usage:
@@ -238,7 +282,8 @@ class CommandOverwriteStrategy:
             input_data: {
                 "source_dir": Path to framework commands,
                 "target_dir": Path to target .claude/commands,
-                "backup_dir": Path to backup directory
+                "backup_dir": Path to backup directory,
+                "manifest_path": Optional migration manifest file
             }
 
         Returns:
@@ -246,6 +291,7 @@ class CommandOverwriteStrategy:
                 "commands_overwritten": int,
                 "commands_backed_up": int,
                 "commands_skipped": int,
+                "commands_unchanged": int (skipped via manifest, not read),
                 "errors": List[str]
             }
         """
@@ -272,9 +318,13 @@ class CommandOverwriteStrategy:
         target_dir.mkdir(parents=True, exist_ok=True)
         backup_dir.mkdir(parents=True, exist_ok=True)
 
+        manifest = MigrationManifest.load(input_data.get("manifest_path"))
+        section = manifest.section("commands")
+
         overwritten = 0
         backed_up = 0
         skipped = 0
+        unchanged = 0
         errors = []
 
         # Process all command files in source
@@ -282,17 +332,22 @@ class CommandOverwriteStrategy:
             try:
                 target_file = target_dir / cmd_file.name
 
+                # Unchanged since last run: stat only, no reads
+                if section.is_unchanged(cmd_file, target_file):
+                    skipped += 1
+                    unchanged += 1
+                    continue
+
                 # Read source content
                 source_content = cmd_file.read_text(encoding="utf-8")
-                source_hash = self._calculate_hash(source_content)
+                source_data = source_content.encode("utf-8")
+                source_hash = hash_bytes(source_data)
 
                 # Check if target exists and needs backup
                 if target_file.exists():
-                    target_content = target_file.read_text(encoding="utf-8")
-                    target_hash = self._calculate_hash(target_content)
-
-                    # Hash-based deduplication
-                    if source_hash == target_hash:
+                    # Content deduplication (size check first, bytes only on size match)
+                    if _same_content(target_file, source_data):
+                        section.record(cmd_file, target_file, source_hash)
                         skipped += 1
                         continue
 
@@ -303,16 +358,23 @@ class CommandOverwriteStrategy:
 
                 # Overwrite with framework command
                 target_file.write_text(source_content, encoding="utf-8")
+                section.record(cmd_file, target_file, source_hash)
                 overwritten += 1
 
             except Exception as e:
                 errors.append(f"Error processing {cmd_file.name}: {str(e)}")
 
+        try:
+            manifest.save()
+        except OSError as e:
+            errors.append(f"Error saving migration manifest: {e}")
+
         return {
             "success": len(errors) == 0,
             "commands_overwritten": overwritten,
             "commands_backed_up": backed_up,
             "commands_skipped": skipped,
+            "commands_unchanged": unchanged,
             "errors": errors,
             "files_processed": overwritten
         }
@@ -9,6 +9,7 @@ from typing import Dict, Any, List, Optional
 from pathlib import Path
 
 from .exceptions import BlueprintParseError
+from .prp_sections import load_prp
 
 
 def parse_blueprint(prp_path: str) -> List[Dict[str, Any]]:
@@ -39,7 +40,8 @@ def parse_blueprint(prp_path: str) -> List[Dict[str, Any]]:
                     }
                 ],
                 "validation_command": "pytest tests/test_auth.py -v",
-                "checkpoint_command": "git add src/ && git commit -m 'feat: auth'"
+                "checkpoint_command": "git add src/ && git commit -m 'feat: auth'",
+                "depends_on": []  # phase numbers from **Depends On**: Phase 1, Phase 2
             },
             # ... more phases
         ]
@@ -49,9 +51,9 @@ def parse_blueprint(prp_path: str) -> List[Dict[str, Any]]:
         BlueprintParseError: If blueprint section missing or malformed
 
     Process:
-        1. Read PRP file
-        2. Extract ## 🔧 Implementation Blueprint section
-        3. Split by ### Phase N: pattern
+        1. Load sectionized PRP (prp_sections.load_prp, cached by content hash)
+        2. Find ## 🔧 Implementation Blueprint section
+        3. Split by ### Phase N: headings
         4. For each phase:
            a. Extract phase number, name, hours from heading
            b. Extract **Goal**: text
@@ -61,6 +63,7 @@ def parse_blueprint(prp_path: str) -> List[Dict[str, Any]]:
            f. Extract **Key Functions**: code blocks
            g. Extract **Validation Command**: command
            h. Extract **Checkpoint**: git command
+           i. Parse optional **Depends On**: phase list
         5. Validate required fields present
     """
     # Check file exists
@@ -71,18 +74,13 @@ def parse_blueprint(prp_path: str) -> List[Dict[str, Any]]:
             f"🔧 Troubleshooting: Verify file path is correct"
         )
 
-    # Read file
-    content = path.read_text()
+    # Sectionize once (cached by content hash, shared with other consumers)
+    doc = load_prp(path)
 
-    # Extract IMPLEMENTATION BLUEPRINT section
-    # Note: (?=\n## [^#]) ensures we stop at ## headers (not ###)
-    blueprint_match = re.search(
-        r"##\s+🔧\s+Implementation\s+Blueprint\s*\n(.*?)(?=\n## [^#]|\Z)",
-        content,
-        re.DOTALL | re.IGNORECASE
-    )
+    # Extract IMPLEMENTATION BLUEPRINT section (up to next ## header, not ###)
+    blueprint = doc.find(r"🔧\s+Implementation\s+Blueprint$", level=2)
 
-    if not blueprint_match:
+    if not blueprint:
         raise BlueprintParseError(
             prp_path,
             "Missing '## 🔧 Implementation Blueprint' section\n"
@@ -92,11 +90,15 @@ def parse_blueprint(prp_path: str) -> List[Dict[str, Any]]:
             "   - Reference: examples/system-prps/ for correct format"
         )
 
-    blueprint_text = blueprint_match.group(1)
-
-    # Split by phase headings: ### Phase N: Name (X hours)
-    phase_pattern = r"###\s+Phase\s+(\d+):\s+([^\(]+)\(([^)]+)\)"
-    phase_splits = list(re.finditer(phase_pattern, blueprint_text))
+    # Phase headings: ### Phase N: Name (X hours)
+    phase_pattern = re.compile(r"Phase\s+(\d+):\s+([^\(]+)\(([^)]+)\)")
+    phase_splits = [
+        (section, phase_pattern.match(section.title))
+        for section in doc.sections
+        if section.level == 3
+        and blueprint.body_start <= section.start < blueprint.end
+        and phase_pattern.match(section.title)
+    ]
 
     if not phase_splits:
         raise BlueprintParseError(
@@ -110,7 +112,7 @@ def parse_blueprint(prp_path: str) -> List[Dict[str, Any]]:
 
     phases = []
 
-    for i, match in enumerate(phase_splits):
+    for i, (section, match) in enumerate(phase_splits):
         phase_number = int(match.group(1))
         phase_name = match.group(2).strip()
         hours_str = match.group(3).strip()
@@ -119,10 +121,9 @@ def parse_blueprint(prp_path: str) -> List[Dict[str, Any]]:
         hours_match = re.search(r"(\d+(?:\.\d+)?)", hours_str)
         hours = float(hours_match.group(1)) if hours_match else 0.0
 
-        # Extract phase content (from this phase to next phase or end)
-        start = match.end()
-        end = phase_splits[i + 1].start() if i + 1 < len(phase_splits) else len(blueprint_text)
-        phase_text = blueprint_text[start:end]
+        # Extract phase content (from this phase to next phase or blueprint end)
+        end = phase_splits[i + 1][0].start if i + 1 < len(phase_splits) else blueprint.end
+        phase_text = doc.content[section.body_start:end]
 
         # Parse phase content
         phase_data = {
@@ -145,7 +146,8 @@ def parse_blueprint(prp_path: str) -> List[Dict[str, Any]]:
                 r"\*\*Checkpoint\*\*:\s*`([^`]+)`",
                 prp_path,
                 required=False
-            )
+            ),
+            "depends_on": parse_phase_dependencies(phase_text)
         }
 
         phases.append(phase_data)
@@ -228,6 +230,25 @@ def parse_file_list(section_text: str, marker: str) -> List[Dict[str, str]]:
     return result
 
 
+def parse_phase_dependencies(phase_text: str) -> List[int]:
+    """Parse optional **Depends On**: line into phase numbers.
+
+    Args:
+        phase_text: Phase section text
+
+    Returns:
+        Sorted phase numbers, e.g. [1, 2] for "**Depends On**: Phase 1, Phase 2"
+
+    Pattern:
+        **Depends On**: Phase 1, Phase 2
+    """
+    match = re.search(r"\*\*Depends\s+On\*\*:\s*([^\n]+)", phase_text, re.IGNORECASE)
+    if not match:
+        return []
+
+    return sorted({int(n) for n in re.findall(r"\d+", match.group(1))})
+
+
 def extract_function_signatures(phase_text: str) -> List[Dict[str, str]]:
     """Extract function signatures from **Key Functions**: code blocks.
 
@@ -0,0 +1,328 @@
+"""PRP checkpoint ref index.
+
+Lists checkpoint tags with a single `git for-each-ref` call, keeps a cached
+PRP → phase → latest checkpoint index, and prunes tags in one batched
+`git update-ref --stdin` transaction instead of one `git tag -d` per tag.
+
+Tag naming: checkpoint-{prp_id}-{phase}-{YYYYMMDD-HHMMSS}
+"""
+
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+from .core import run_cmd
+
+logger = logging.getLogger(__name__)
+
+TAG_PREFIX = "checkpoint-"
+TAG_REF_PATTERN = "refs/tags/checkpoint-*"
+
+# NUL-separated: tag subjects may contain any printable character
+_REF_FORMAT = "%(refname:strip=2)%00%(contents:subject)%00%(*objectname:short)%00%(objectname:short)"
+
+
+def parse_checkpoint_tag(tag_name: str) -> Optional[Dict[str, str]]:
+    """Parse checkpoint tag name into prp_id, phase and ISO timestamp.
+
+    Args:
+        tag_name: e.g. "checkpoint-PRP-003-phase1-20251012-143000"
+
+    Returns:
+        {"prp_id": "PRP-003", "phase": "phase1", "timestamp": "2025-10-12T14:30:00+00:00"}
+        or None if tag_name is not a PRP checkpoint tag
+    """
+    if not tag_name.startswith(TAG_PREFIX):
+        return None
+
+    tag_parts = tag_name.split("-", 3)  # ["checkpoint", "PRP", "X", "phase-YYYYMMDD-HHMMSS"]
+    if len(tag_parts) < 4:
+        return None
+
+    prp_id = f"{tag_parts[1]}-{tag_parts[2]}"
+    remaining = tag_parts[3]
+    phase_timestamp = remaining.rsplit("-", 2)  # Split from right to preserve phase name
+    if len(phase_timestamp) == 3:
+        phase = phase_timestamp[0]
+        timestamp_str = f"{phase_timestamp[1]}-{phase_timestamp[2]}"
+        try:
+            dt = datetime.strptime(timestamp_str, "%Y%m%d-%H%M%S")
+            timestamp_iso = dt.replace(tzinfo=timezone.utc).isoformat()
+        except ValueError:
+            timestamp_iso = timestamp_str
+    else:
+        phase = remaining
+        timestamp_iso = ""
+
+    return {"prp_id": prp_id, "phase": phase, "timestamp": timestamp_iso}
+
+
+class CheckpointManager:
+    """Cached index of PRP checkpoint tags.
+
+    The index is rebuilt from one `git for-each-ref` call when the repo's
+    tag refs change on disk (refs/tags mtime or packed-refs mtime), and is
+    updated in place for checkpoints created or pruned through the manager.
+
+    Example:
+        manager = CheckpointManager()
+        cp = manager.create("PRP-003", "phase1", "Core logic done")
+        latest = manager.latest("PRP-003")
+        manager.prune("PRP-003", keep_final=True)
+
+    Attributes:
+        cwd: Repository working directory (None = current directory)
+    """
+
+    def __init__(self, cwd: Optional[str] = None):
+        self.cwd = cwd
+        self._git_dir: Optional[Path] = None
+        self._signature: Optional[Tuple[int, int]] = None
+        self._by_tag: Dict[str, Dict[str, Any]] = {}
+        self._by_prp: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._latest: Dict[str, Dict[str, Any]] = {}
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def list(self, prp_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List checkpoints, optionally for a single PRP (sorted by tag name)."""
+        self._ensure_fresh()
+        if prp_id:
+            checkpoints = [
+                cp for cp in self._by_tag.values() if cp["prp_id"] == prp_id
+            ]
+        else:
+            checkpoints = list(self._by_tag.values())
+        return sorted(checkpoints, key=lambda cp: cp["tag_name"])
+
+    def latest(self, prp_id: str, phase: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Latest checkpoint for a PRP, or for a specific phase of it."""
+        self._ensure_fresh()
+        if phase is None:
+            return self._latest.get(prp_id)
+        return self._by_prp.get(prp_id, {}).get(phase)
+
+    # ------------------------------------------------------------------
+    # Mutations
+    # ------------------------------------------------------------------
+
+    def create(self, prp_id: str, phase: str, message: Optional[str] = None) -> Dict[str, Any]:
+        """Create annotated checkpoint tag at HEAD.
+
+        Uses `git status --porcelain=v2 --branch` to check the working tree
+        and read HEAD in one call, then `git tag -a`.
+
+        Raises:
+            RuntimeError: If working tree not clean or git operation fails
+        """
+        status_result = run_cmd(
+            ["git", "status", "--porcelain=v2", "--branch"], cwd=self.cwd
+        )
+        if not status_result["success"]:
+            raise RuntimeError(
+                f"Failed to check git status: {status_result['stderr']}\n"
+                f"🔧 Troubleshooting: Ensure you're in a git repository"
+            )
+
+        head_sha = None
+        for line in status_result["stdout"].splitlines():
+            if line.startswith("# branch.oid "):
+                head_sha = line.split(" ", 2)[2].strip()
+            elif line and not line.startswith("#"):
+                raise RuntimeError(
+                    f"Working tree has uncommitted changes\n"
+                    f"🔧 Troubleshooting: Commit or stash changes before creating checkpoint"
+                )
+
+        if not head_sha or head_sha == "(initial)":
+            raise RuntimeError(
+                f"Failed to get commit SHA: repository has no commits\n"
+                f"🔧 Troubleshooting: Ensure you're in a git repository with commits"
+            )
+
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
+        tag_name = f"{TAG_PREFIX}{prp_id}-{phase}-{timestamp}"
+        tag_message = message or f"{phase} checkpoint"
+
+        tag_result = run_cmd(
+            ["git", "tag", "-a", tag_name, "-m", tag_message], cwd=self.cwd
+        )
+        if not tag_result["success"]:
+            raise RuntimeError(
+                f"Failed to create checkpoint tag: {tag_result['stderr']}\n"
+                f"🔧 Troubleshooting: Ensure git is configured correctly"
+            )
+
+        checkpoint = {
+            "tag_name": tag_name,
+            "prp_id": prp_id,
+            "phase": phase,
+            "timestamp": parse_checkpoint_tag(tag_name)["timestamp"],
+            "commit_sha": head_sha[:7],
+            "message": tag_message
+        }
+        if self._signature is not None:
+            self._add(checkpoint)
+            self._signature = self._refs_signature()
+
+        return checkpoint
+
+    def prune(self, prp_id: str, keep_final: bool = True) -> Dict[str, Any]:
+        """Delete a PRP's intermediate checkpoints in one git invocation.
+
+        Args:
+            prp_id: PRP identifier
+            keep_final: Keep *-final checkpoints for rollback
+
+        Returns:
+            {"success": bool, "deleted_count": int, "kept": [tag_name, ...]}
+        """
+        to_delete = []
+        kept = []
+        for cp in self.list(prp_id):
+            if keep_final and cp["phase"] == "final":
+                kept.append(cp["tag_name"])
+            else:
+                to_delete.append(cp["tag_name"])
+
+        if not to_delete:
+            return {"success": True, "deleted_count": 0, "kept": kept}
+
+        stdin = "".join(f"delete refs/tags/{tag}\n" for tag in to_delete)
+        result = _run_git_stdin(["git", "update-ref", "--stdin"], stdin, self.cwd)
+        if not result["success"]:
+            logger.warning(f"Failed to delete checkpoint tags for {prp_id}: {result['stderr']}")
+            return {"success": False, "deleted_count": 0, "kept": kept}
+
+        for tag in to_delete:
+            self._remove(tag)
+            logger.info(f"Deleted checkpoint: {tag}")
+        self._signature = self._refs_signature()
+
+        return {"success": True, "deleted_count": len(to_delete), "kept": kept}
+
+    def refresh(self) -> None:
+        """Rebuild the index from `git for-each-ref`."""
+        result = run_cmd(
+            ["git", "for-each-ref", f"--format={_REF_FORMAT}", TAG_REF_PATTERN],
+            cwd=self.cwd
+        )
+
+        self._by_tag = {}
+        self._by_prp = {}
+        self._latest = {}
+
+        if not result["success"]:
+            logger.warning(f"Failed to list tags: {result['stderr']}")
+            self._signature = None
+            return
+
+        for line in result["stdout"].splitlines():
+            parts = line.split("\0")
+            if len(parts) < 4:
+                continue
+            tag_name, subject, peeled_sha, object_sha = parts[:4]
+            parsed = parse_checkpoint_tag(tag_name)
+            if not parsed:
+                continue
+            self._add({
+                "tag_name": tag_name,
+                "prp_id": parsed["prp_id"],
+                "phase": parsed["phase"],
+                "timestamp": parsed["timestamp"],
+                "commit_sha": peeled_sha or object_sha,
+                "message": subject
+            })
+
+        self._signature = self._refs_signature()
+
+    # ------------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------------
+
+    def _ensure_fresh(self) -> None:
+        if self._signature is None or self._signature != self._refs_signature():
+            self.refresh()
+
+    def _add(self, checkpoint: Dict[str, Any]) -> None:
+        self._by_tag[checkpoint["tag_name"]] = checkpoint
+        prp_id = checkpoint["prp_id"]
+        phases = self._by_prp.setdefault(prp_id, {})
+
+        current = phases.get(checkpoint["phase"])
+        if current is None or _sort_key(checkpoint) > _sort_key(current):
+            phases[checkpoint["phase"]] = checkpoint
+
+        latest = self._latest.get(prp_id)
+        if latest is None or _sort_key(checkpoint) > _sort_key(latest):
+            self._latest[prp_id] = checkpoint
+
+    def _remove(self, tag_name: str) -> None:
+        checkpoint = self._by_tag.pop(tag_name, None)
+        if checkpoint is None:
+            return
+
+        prp_id = checkpoint["prp_id"]
+        remaining = [cp for cp in self._by_tag.values() if cp["prp_id"] == prp_id]
+        self._by_prp.pop(prp_id, None)
+        self._latest.pop(prp_id, None)
+        for cp in remaining:
+            self._add(cp)
+
+    def _refs_signature(self) -> Tuple[int, int]:
+        """Cheap staleness check: mtimes of refs/tags/ and packed-refs."""
+        if self._git_dir is None:
+            result = run_cmd(["git", "rev-parse", "--git-common-dir"], cwd=self.cwd)
+            if not result["success"]:
+                return (0, 0)
+            git_dir = Path(result["stdout"].strip())
+            if not git_dir.is_absolute():
+                git_dir = Path(self.cwd or ".") / git_dir
+            self._git_dir = git_dir
+
+        signature = []
+        for path in (self._git_dir / "refs" / "tags", self._git_dir / "packed-refs"):
+            try:
+                signature.append(path.stat().st_mtime_ns)
+            except OSError:
+                signature.append(0)
+        return (signature[0], signature[1])
+
+
+def _sort_key(checkpoint: Dict[str, Any]) -> Tuple[str, str]:
+    return (checkpoint["timestamp"], checkpoint["tag_name"])
+
+
+def _run_git_stdin(cmd: List[str], stdin: str, cwd: Optional[str]) -> Dict[str, Any]:
+    """Run git command feeding stdin (run_cmd has no stdin support)."""
+    import subprocess
+
+    result = subprocess.run(
+        cmd,
+        input=stdin,
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        shell=False,  # ✅ SAFE
+        timeout=60
+    )
+    return {
+        "success": result.returncode == 0,
+        "stdout": result.stdout,
+        "stderr": result.stderr,
+        "exit_code": result.returncode
+    }
+
+
+_managers: Dict[str, CheckpointManager] = {}
+
+
+def get_checkpoint_manager(cwd: Optional[str] = None) -> CheckpointManager:
+    """Get process-wide CheckpointManager for a repository directory."""
+    key = str(Path(cwd or ".").resolve())
+    if key not in _managers:
+        _managers[key] = CheckpointManager(cwd)
+    return _managers[key]
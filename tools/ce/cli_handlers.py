@@ -26,6 +26,7 @@ from .drift import (
 from .pipeline import load_abstract_pipeline, validate_pipeline
 from .executors.github_actions import GitHubActionsExecutor
 from .executors.mock import MockExecutor
+from .executors.local import LocalExecutor
 from .metrics import MetricsCollector
 from .update_context import sync_context
 from .blend import run_blend as blend_run_blend
@@ -77,7 +78,10 @@ def cmd_validate(args) -> int:
         if args.level == "1":
             result = validate_level_1()
         elif args.level == "2":
-            result = validate_level_2()
+            result = validate_level_2(
+                select_tests=not getattr(args, "no_select", False),
+                force_full=getattr(args, "full_tests", False)
+            )
         elif args.level == "3":
             result = validate_level_3()
         elif args.level == "4":
@@ -278,7 +282,11 @@ def _handle_drift_history(args) -> int:
     history = get_drift_history(
         last_n=args.last,
         prp_id=args.prp_id,
-        action_filter=args.action_filter
+        action_filter=args.action_filter,
+        min_score=getattr(args, "min_score", None),
+        max_score=getattr(args, "max_score", None),
+        since=getattr(args, "since", None),
+        until=getattr(args, "until", None)
     )
 
     if args.json:
@@ -462,7 +470,8 @@ def cmd_run_py(args) -> int:
             code=args.code if hasattr(args, 'code') else None,
             file=args.file if hasattr(args, 'file') else None,
             auto=auto_input,
-            args=args.script_args or ""
+            args=args.script_args or "",
+            warm=True if getattr(args, "warm", False) else None
         )
 
         if result["stdout"]:
@@ -519,18 +528,23 @@ def cmd_prp_generate(args) -> int:
 
         output_dir = args.output or "PRPs/feature-requests"
         join_prp = getattr(args, 'join_prp', None)
-        prp_path = generate_prp(args.initial_md, output_dir, join_prp=join_prp)
+        timings = {}
+        prp_path = generate_prp(args.initial_md, output_dir, join_prp=join_prp, timings=timings)
 
         result = {
             "success": True,
             "prp_path": prp_path,
-            "message": f"PRP generated: {prp_path}"
+            "message": f"PRP generated: {prp_path}",
+            "timings": timings
         }
 
         if args.json:
             print(format_output(result, True))
         else:
             print(f"✅ PRP generated: {prp_path}")
+            if getattr(args, 'timings', False):
+                from .stage_graph import format_stage_timings
+                print(format_stage_timings(timings))
 
         return 0
 
@@ -556,7 +570,9 @@ def cmd_prp_execute(args) -> int:
             start_phase=args.start_phase,
             end_phase=args.end_phase,
             skip_validation=args.skip_validation,
-            dry_run=args.dry_run
+            dry_run=args.dry_run,
+            parallel=getattr(args, "parallel", False),
+            max_workers=getattr(args, "max_workers", None)
         )
 
         if args.json:
@@ -567,6 +583,10 @@ def cmd_prp_execute(args) -> int:
             print(f"\n✅ Dry run: {len(result['phases'])} phases parsed")
             for phase in result['phases']:
                 print(f"  Phase {phase['phase_number']}: {phase['phase_name']} ({phase['hours']}h)")
+            if result.get("waves"):
+                print(f"\nParallel plan: {len(result['waves'])} waves")
+                for i, wave in enumerate(result["waves"], 1):
+                    print(f"  Wave {i}: phases {', '.join(str(n) for n in wave)}")
         else:
             print(f"\n{'='*80}")
             print(f"✅ PRP-{args.prp_id} execution complete")
@@ -609,6 +629,13 @@ def cmd_prp_analyze(args) -> int:
     from pathlib import Path
     from .prp_analyzer import analyze_prp, format_analysis_report
 
+    if getattr(args, "all", False):
+        return _cmd_prp_analyze_corpus(args)
+
+    if not args.file:
+        print("❌ PRP file required (or use --all)", file=sys.stderr)
+        return 1
+
     try:
         prp_path = Path(args.file)
         analysis = analyze_prp(prp_path)
@@ -632,6 +659,27 @@ def cmd_prp_analyze(args) -> int:
         return 1
 
 
+def _cmd_prp_analyze_corpus(args) -> int:
+    """Execute prp analyze --all (corpus mode)."""
+    from .prp_analyzer import analyze_corpus, format_corpus_report
+
+    if args.json:
+        output_format = "json"
+    elif getattr(args, "csv", False):
+        output_format = "csv"
+    else:
+        output_format = "text"
+
+    try:
+        result = analyze_corpus(workers=getattr(args, "workers", None))
+        print(format_corpus_report(result, output_format), end="" if output_format == "csv" else "\n")
+        return 1 if result["errors"] else 0
+
+    except Exception as e:
+        print(f"❌ PRP corpus analysis failed: {str(e)}", file=sys.stderr)
+        return 1
+
+
 # === PIPELINE COMMANDS ===
 
 def cmd_pipeline_validate(args) -> int:
@@ -681,6 +729,54 @@ def cmd_pipeline_render(args) -> int:
         return 1
 
 
+def cmd_pipeline_run(args) -> int:
+    """Execute pipeline run command (local executor)."""
+    from pathlib import Path
+
+    try:
+        pipeline = load_abstract_pipeline(args.pipeline_file)
+        result = validate_pipeline(pipeline)
+        if not result["success"]:
+            print("❌ Pipeline validation failed:")
+            for error in result["errors"]:
+                print(f"  - {error}")
+            return 1
+
+        # CI commands are written relative to the repository root
+        cwd = Path.cwd()
+        project_root = cwd.parent if cwd.name == "tools" else cwd
+
+        executor = LocalExecutor(
+            cwd=project_root,
+            max_workers=args.workers,
+            use_cache=not args.no_cache
+        )
+
+        if args.plan:
+            print(executor.render(pipeline))
+            return 0
+
+        run_result = executor.run(pipeline)
+        print()
+        print(executor.format_report(run_result))
+
+        if run_result["success"]:
+            print("✅ Pipeline passed")
+            return 0
+
+        print("❌ Pipeline failed")
+        for stage in run_result["stages"]:
+            for node in stage["nodes"]:
+                if node["status"] in ("failed", "timeout") and node["output"]:
+                    print(f"\n--- {stage['name']}/{node['name']} (last lines) ---")
+                    print(node["output"])
+        return 1
+
+    except Exception as e:
+        print(f"❌ Pipeline run error: {str(e)}", file=sys.stderr)
+        return 1
+
+
 # === METRICS COMMAND ===
 
 def cmd_metrics(args) -> int:
@@ -0,0 +1,460 @@
+"""Offline code search index.
+
+A SQLite index under .ce/index/ that lets PRP generation research the
+codebase without Serena:
+
+    - identifier postings: token → (file, line), with identifiers also
+      split into their snake_case/camelCase words
+    - a trigram index over the token vocabulary for substring matches
+      ("auth" finds authenticate, OAuthHandler)
+    - symbol definitions: Python via AST (classes, functions, methods),
+      TypeScript/JavaScript via regex
+
+Files are re-indexed only when their size/mtime changed and their content
+hash differs; deleted files are dropped. Queries are indexed lookups that
+answer in milliseconds, ranked by keyword coverage and IDF, with symbol
+definitions weighted highest.
+
+Example:
+    with CodeIndex(project_root) as index:
+        index.update()
+        hits = index.search(["authentication", "jwt"], limit=10)
+"""
+
+import ast
+import hashlib
+import logging
+import math
+import os
+import re
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .import_graph import PRUNED_DIRS
+
+logger = logging.getLogger(__name__)
+
+INDEX_DIR = ".ce/index"
+INDEX_NAME = "code-index.db"
+INDEX_VERSION = 1
+
+SOURCE_EXTENSIONS = {".py", ".pyi", ".ts", ".tsx", ".js", ".jsx", ".mjs", ".cjs"}
+MAX_FILE_BYTES = 1_000_000  # Larger files are usually generated or minified
+MAX_POSTINGS_PER_TOKEN = 20  # Lines kept per token per file
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    token TEXT NOT NULL,
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    line INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS symbols (
+    name TEXT NOT NULL,
+    qualname TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    line INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS vocab (token TEXT PRIMARY KEY) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS trigrams (tri TEXT NOT NULL, token TEXT NOT NULL, PRIMARY KEY (tri, token)) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_postings_token ON postings(token, file_id);
+CREATE INDEX IF NOT EXISTS idx_postings_file ON postings(file_id);
+CREATE INDEX IF NOT EXISTS idx_symbols_name ON symbols(name);
+CREATE INDEX IF NOT EXISTS idx_symbols_file ON symbols(file_id);
+"""
+
+_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_WORD = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+[0-9]*|[A-Z]+[0-9]*|[0-9]+")
+
+# TypeScript/JavaScript definitions (one per line)
+_TS_SYMBOL = re.compile(
+    r"^\s*(?:export\s+)?(?:default\s+)?(?:declare\s+)?(?:abstract\s+)?(?:async\s+)?"
+    r"(?:(?P<kind>function\*?|class|interface|type|enum)\s+(?P<name>[A-Za-z_$][\w$]*)"
+    r"|(?:const|let|var)\s+(?P<var>[A-Za-z_$][\w$]*)\s*(?::[^=]+)?=\s*(?:async\s+)?(?:\([^)]*\)|[A-Za-z_$][\w$]*)\s*=>)"
+)
+_TS_METHOD = re.compile(
+    r"^\s+(?:public\s+|private\s+|protected\s+|static\s+|async\s+|readonly\s+)*"
+    r"(?P<name>[A-Za-z_$][\w$]*)\s*\([^)]*\)\s*(?::\s*[^{]+)?\{\s*$"
+)
+_TS_KEYWORDS = {"if", "for", "while", "switch", "catch", "function", "return", "constructor"}
+
+
+def tokenize(identifier: str) -> List[str]:
+    """Lowercase index tokens for an identifier: itself plus its words."""
+    lowered = identifier.lower()
+    tokens = [lowered]
+    for part in identifier.split("_"):
+        for word in _WORD.findall(part):
+            word = word.lower()
+            if len(word) > 1 and word != lowered:
+                tokens.append(word)
+    return tokens
+
+
+def trigrams(token: str) -> Set[str]:
+    """Character trigrams of token."""
+    return {token[i:i + 3] for i in range(len(token) - 2)}
+
+
+def python_symbols(source: str) -> List[Tuple[str, str, str, int]]:
+    """(name, qualname, kind, line) for classes, functions and methods."""
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return []
+
+    symbols = []
+
+    def visit(nodes: Iterable[ast.AST], prefix: str, in_class: bool) -> None:
+        for node in nodes:
+            if isinstance(node, ast.ClassDef):
+                qualname = prefix + node.name
+                symbols.append((node.name, qualname, "class", node.lineno))
+                visit(node.body, qualname + ".", True)
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                qualname = prefix + node.name
+                symbols.append((node.name, qualname, "method" if in_class else "function", node.lineno))
+
+    visit(tree.body, "", False)
+    return symbols
+
+
+def script_symbols(source: str) -> List[Tuple[str, str, str, int]]:
+    """(name, qualname, kind, line) for TypeScript/JavaScript definitions."""
+    symbols = []
+    current_class = None
+    for lineno, line in enumerate(source.splitlines(), 1):
+        match = _TS_SYMBOL.match(line)
+        if match:
+            if match["var"]:
+                symbols.append((match["var"], match["var"], "function", lineno))
+                continue
+            kind = "function" if match["kind"].startswith("function") else match["kind"]
+            symbols.append((match["name"], match["name"], kind, lineno))
+            current_class = match["name"] if kind == "class" else None
+            continue
+        match = _TS_METHOD.match(line)
+        if match and current_class and match["name"] not in _TS_KEYWORDS:
+            qualname = f"{current_class}.{match['name']}"
+            symbols.append((match["name"], qualname, "method", lineno))
+    return symbols
+
+
+class CodeIndex:
+    """Incremental identifier/trigram/symbol index of a source tree.
+
+    Attributes:
+        root: Indexed directory (paths are stored relative to it)
+        db_path: SQLite file, or ":memory:" outside a CE project
+    """
+
+    def __init__(self, root: Optional[Path] = None, db_path: Optional[str] = None):
+        """Open (or create) the index.
+
+        Args:
+            root: Directory to index (default: project root — cwd, or its
+                parent when run from tools/)
+            db_path: Index location (default: <root>/.ce/index/code-index.db
+                if <root>/.ce exists, in-memory otherwise)
+        """
+        if root is None:
+            cwd = Path.cwd()
+            root = cwd.parent if cwd.name == "tools" else cwd
+        self.root = Path(root).resolve()
+
+        if db_path is None:
+            if (self.root / ".ce").is_dir():
+                (self.root / INDEX_DIR).mkdir(parents=True, exist_ok=True)
+                db_path = str(self.root / INDEX_DIR / INDEX_NAME)
+            else:
+                db_path = ":memory:"
+        self.db_path = db_path
+
+        try:
+            self._conn = sqlite3.connect(db_path)
+            self._conn.execute("PRAGMA foreign_keys = ON")
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._conn.executescript(_SCHEMA)
+            self._check_version()
+        except sqlite3.Error as e:
+            raise RuntimeError(
+                f"Failed to open code index: {db_path}\n"
+                f"Error: {str(e)}\n"
+                f"🔧 Troubleshooting: Delete {INDEX_DIR}/ to rebuild the index"
+            ) from e
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> "CodeIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Indexing
+    # ------------------------------------------------------------------
+
+    def update(self) -> Dict[str, int]:
+        """Bring the index in line with the source tree.
+
+        Returns:
+            {"indexed": n, "unchanged": n, "removed": n, "files": total}
+        """
+        known = {
+            path: (file_id, size, mtime_ns, sha)
+            for file_id, path, size, mtime_ns, sha in self._conn.execute(
+                "SELECT id, path, size, mtime_ns, sha256 FROM files"
+            )
+        }
+        stats = {"indexed": 0, "unchanged": 0, "removed": 0}
+        seen = set()
+        dropped_tokens: Set[str] = set()  # Tokens of replaced/removed files
+
+        with self._conn:
+            for path in self._iter_sources():
+                rel = path.relative_to(self.root).as_posix()
+                seen.add(rel)
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                entry = known.get(rel)
+                if entry and entry[1] == st.st_size and entry[2] == st.st_mtime_ns:
+                    stats["unchanged"] += 1
+                    continue
+                try:
+                    data = path.read_bytes()
+                except OSError as e:
+                    logger.debug(f"Cannot read {path}: {e}")
+                    continue
+                sha = hashlib.sha256(data).hexdigest()
+                if entry and entry[3] == sha:
+                    self._conn.execute(
+                        "UPDATE files SET size = ?, mtime_ns = ? WHERE id = ?",
+                        (st.st_size, st.st_mtime_ns, entry[0])
+                    )
+                    stats["unchanged"] += 1
+                    continue
+                if entry:
+                    dropped_tokens.update(self._file_tokens(entry[0]))
+                self._index_file(rel, data.decode("utf-8", "replace"), st, sha, entry[0] if entry else None)
+                stats["indexed"] += 1
+
+            for rel in set(known) - seen:
+                dropped_tokens.update(self._file_tokens(known[rel][0]))
+                self._conn.execute("DELETE FROM files WHERE id = ?", (known[rel][0],))
+                stats["removed"] += 1
+
+            self._prune_vocab(dropped_tokens)
+
+        stats["files"] = len(seen)
+        logger.debug(f"Code index update: {stats}")
+        return stats
+
+    def _iter_sources(self) -> Iterable[Path]:
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [
+                d for d in dirnames
+                if d not in PRUNED_DIRS and not d.startswith(".") and not d.endswith(".egg-info")
+            ]
+            for filename in filenames:
+                path = Path(dirpath) / filename
+                if path.suffix in SOURCE_EXTENSIONS and not filename.endswith(".min.js"):
+                    try:
+                        if path.stat().st_size <= MAX_FILE_BYTES:
+                            yield path
+                    except OSError:
+                        continue
+
+    def _index_file(self, rel: str, source: str, st: os.stat_result, sha: str, file_id: Optional[int]) -> None:
+        if file_id is not None:
+            self._conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+        cursor = self._conn.execute(
+            "INSERT INTO files (path, size, mtime_ns, sha256) VALUES (?, ?, ?, ?)",
+            (rel, st.st_size, st.st_mtime_ns, sha)
+        )
+        file_id = cursor.lastrowid
+
+        postings: Dict[str, List[int]] = {}
+        for lineno, line in enumerate(source.splitlines(), 1):
+            for identifier in set(_IDENTIFIER.findall(line)):
+                if len(identifier) < 2:
+                    continue
+                for token in tokenize(identifier):
+                    lines = postings.setdefault(token, [])
+                    if len(lines) < MAX_POSTINGS_PER_TOKEN and (not lines or lines[-1] != lineno):
+                        lines.append(lineno)
+
+        self._conn.executemany(
+            "INSERT INTO postings (token, file_id, line) VALUES (?, ?, ?)",
+            ((token, file_id, line) for token, lines in postings.items() for line in lines)
+        )
+        new_tokens = [
+            token for token in postings
+            if self._conn.execute("INSERT OR IGNORE INTO vocab (token) VALUES (?)", (token,)).rowcount
+        ]
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO trigrams (tri, token) VALUES (?, ?)",
+            ((tri, token) for token in new_tokens for tri in trigrams(token))
+        )
+
+        symbols = python_symbols(source) if rel.endswith((".py", ".pyi")) else script_symbols(source)
+        self._conn.executemany(
+            "INSERT INTO symbols (name, qualname, kind, file_id, line) VALUES (?, ?, ?, ?, ?)",
+            ((name.lower(), qualname, kind, file_id, line) for name, qualname, kind, line in symbols)
+        )
+
+    def _file_tokens(self, file_id: int) -> List[str]:
+        return [token for (token,) in self._conn.execute(
+            "SELECT DISTINCT token FROM postings WHERE file_id = ?", (file_id,)
+        )]
+
+    def _prune_vocab(self, tokens: Iterable[str]) -> None:
+        """Drop vocab/trigram rows for tokens no longer present in any file."""
+        orphans = [
+            (token,) for token in tokens
+            if self._conn.execute("SELECT 1 FROM postings WHERE token = ? LIMIT 1", (token,)).fetchone() is None
+        ]
+        self._conn.executemany("DELETE FROM vocab WHERE token = ?", orphans)
+        self._conn.executemany(
+            "DELETE FROM trigrams WHERE tri = ? AND token = ?",
+            ((tri, token) for (token,) in orphans for tri in trigrams(token))
+        )
+
+    def _check_version(self) -> None:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if row and row[0] == str(INDEX_VERSION):
+            return
+        with self._conn:
+            for table in ("postings", "symbols", "files", "trigrams", "vocab"):
+                self._conn.execute(f"DELETE FROM {table}")
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)", (str(INDEX_VERSION),)
+            )
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def search(self, keywords: Iterable[str], limit: int = 20) -> List[Dict[str, Any]]:
+        """Rank files by how well they match keywords.
+
+        Each keyword matches tokens exactly, by prefix or by substring
+        (trigram lookup); symbol definitions whose name contains it score
+        highest. Scores are weighted by inverse document frequency.
+
+        Args:
+            keywords: Search terms (case-insensitive)
+            limit: Max hits
+
+        Returns:
+            [{"file", "line", "snippet", "score", "symbol", "matched"}]
+            sorted by score; symbol is the matched definition (or None)
+        """
+        keywords = [k.lower() for k in dict.fromkeys(keywords) if len(k) >= 2]
+        total = self._conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+        if not keywords or not total:
+            return []
+
+        scores: Dict[int, float] = {}
+        best: Dict[int, Tuple[float, int, Optional[str]]] = {}  # file → (weight, line, symbol)
+        matched: Dict[int, List[str]] = {}
+
+        for keyword in keywords:
+            contributions: Dict[int, Tuple[float, int, Optional[str]]] = {}
+            for token in self._matching_tokens(keyword):
+                weight = 3.0 if token == keyword else 1.5 if token.startswith(keyword) else 1.0
+                rows = self._conn.execute(
+                    "SELECT file_id, MIN(line) FROM postings WHERE token = ? GROUP BY file_id", (token,)
+                ).fetchall()
+                idf = math.log(1 + total / len(rows)) if rows else 0
+                for file_id, line in rows:
+                    value = weight * idf
+                    if value > contributions.get(file_id, (0, 0, None))[0]:
+                        contributions[file_id] = (value, line, None)
+
+            # A matching definition adds a bonus and becomes the hit location
+            token_values = {file_id: c[0] for file_id, c in contributions.items()}
+            for file_id, qualname, line, name in self._conn.execute(
+                "SELECT file_id, qualname, line, name FROM symbols WHERE name LIKE ? ESCAPE '\\'",
+                (f"%{_escape_like(keyword)}%",)
+            ):
+                bonus = (2.0 if name == keyword else 1.0) * math.log(1 + total)
+                value = token_values.get(file_id, 0.0) + bonus
+                if value > contributions.get(file_id, (0, 0, None))[0]:
+                    contributions[file_id] = (value, line, qualname)
+
+            for file_id, contribution in contributions.items():
+                scores[file_id] = scores.get(file_id, 0.0) + contribution[0]
+                matched.setdefault(file_id, []).append(keyword)
+                if contribution[0] > best.get(file_id, (0, 0, None))[0]:
+                    best[file_id] = contribution
+
+        ranked = sorted(scores, key=lambda f: (-len(matched[f]), -scores[f]))[:limit]
+        paths = dict(self._conn.execute(
+            f"SELECT id, path FROM files WHERE id IN ({','.join('?' * len(ranked))})", ranked
+        ).fetchall()) if ranked else {}
+
+        hits = []
+        for file_id in ranked:
+            _, line, symbol = best[file_id]
+            hits.append({
+                "file": paths[file_id],
+                "line": line,
+                "snippet": self._snippet(paths[file_id], line),
+                "score": round(scores[file_id], 3),
+                "symbol": symbol,
+                "matched": matched[file_id],
+            })
+        return hits
+
+    def find_symbols(self, name: str, limit: int = 50) -> List[Dict[str, Any]]:
+        """Definitions whose name equals name (case-insensitive)."""
+        rows = self._conn.execute(
+            "SELECT s.qualname, s.kind, f.path, s.line FROM symbols s JOIN files f ON f.id = s.file_id "
+            "WHERE s.name = ? ORDER BY f.path, s.line LIMIT ?",
+            (name.lower(), limit)
+        ).fetchall()
+        return [{"symbol": q, "kind": k, "file": p, "line": l} for q, k, p, l in rows]
+
+    def _matching_tokens(self, keyword: str, limit: int = 200) -> List[str]:
+        """Vocabulary tokens equal to, or containing, keyword (exact match first)."""
+        row = self._conn.execute("SELECT token FROM vocab WHERE token = ?", (keyword,)).fetchone()
+        tokens = [row[0]] if row else []
+        grams = sorted(trigrams(keyword))
+        if not grams:
+            return tokens
+        rows = self._conn.execute(
+            f"SELECT token FROM trigrams WHERE tri IN ({','.join('?' * len(grams))}) AND token != ? "
+            f"GROUP BY token HAVING COUNT(*) = ? ORDER BY length(token), token LIMIT ?",
+            (*grams, keyword, len(grams), limit * 5)
+        ).fetchall()
+        contained = [token for (token,) in rows if keyword in token]
+        contained.sort(key=lambda t: (not t.startswith(keyword), len(t)))
+        return (tokens + contained)[:limit]
+
+    def _snippet(self, rel: str, line: int) -> str:
+        try:
+            with open(self.root / rel, encoding="utf-8", errors="replace") as f:
+                for lineno, text in enumerate(f, 1):
+                    if lineno == line:
+                        return text.strip()[:200]
+        except OSError:
+            pass
+        return ""
+
+
+def _escape_like(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
@@ -1,10 +1,23 @@
 """Core operations: file, git, and shell utilities."""
 
+import asyncio
+import codecs
+import os
+import signal
 import subprocess
+import sys
+import threading
 import time
 import shlex
+from collections import deque
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from typing import IO, Dict, Iterator, List, Any, Optional, Union
+
+# Characters kept per stream by the streaming runners (half head, half tail)
+DEFAULT_MAX_OUTPUT = 1_000_000
+_READ_CHUNK = 65536
+_READER_GRACE = 5  # Seconds to wait for pipe readers after the process group is killed
 
 
 def find_project_root(start_path: Optional[Path] = None) -> Path:
@@ -63,21 +76,12 @@ def run_cmd(
               String commands are safely parsed with shlex.split().
     
     Note: No fishy fallbacks - exceptions are thrown to troubleshoot quickly.
+          Output is buffered in full; use run_cmd_stream for long-running or
+          verbose commands.
     """
     start = time.time()
 
-    # Convert string to safe list
-    if isinstance(cmd, str):
-        cmd_list = shlex.split(cmd)  # Safe parsing with proper escaping
-    else:
-        cmd_list = cmd
-
-    # Handle empty command
-    if not cmd_list:
-        raise ValueError(
-            "Empty command provided\n"
-            "🔧 Troubleshooting: Provide a valid command string or list"
-        )
+    cmd_list = _split_cmd(cmd)  # Safe parsing with proper escaping
 
     try:
         result = subprocess.run(
@@ -115,6 +119,345 @@ def run_cmd(
         ) from e
 
 
+class OutputCapture:
+    """Bounded capture of a text stream: its first and last characters.
+
+    Memory stays at max_chars however much is written; the middle of
+    longer output is replaced by a truncation marker in getvalue().
+
+    Attributes:
+        total: Characters written so far
+    """
+
+    def __init__(self, max_chars: int = DEFAULT_MAX_OUTPUT):
+        self.head_limit = max_chars // 2
+        self.tail_limit = max_chars - self.head_limit
+        self.total = 0
+        self._head: List[str] = []
+        self._head_len = 0
+        self._tail: deque = deque()
+        self._tail_len = 0
+
+    def write(self, text: str) -> None:
+        """Append text."""
+        self.total += len(text)
+        if self._head_len < self.head_limit:
+            take = text[:self.head_limit - self._head_len]
+            self._head.append(take)
+            self._head_len += len(take)
+            text = text[len(take):]
+        if text:
+            self._tail.append(text)
+            self._tail_len += len(text)
+            while self._tail and self._tail_len - len(self._tail[0]) >= self.tail_limit:
+                self._tail_len -= len(self._tail.popleft())
+
+    @property
+    def truncated(self) -> bool:
+        """True if part of the output was dropped."""
+        return self.total > self.head_limit + self.tail_limit
+
+    def getvalue(self) -> str:
+        """Captured text (head + marker + tail when truncated)."""
+        head = "".join(self._head)
+        tail = "".join(self._tail)[-self.tail_limit:] if self.tail_limit else ""
+        dropped = self.total - len(head) - len(tail)
+        if dropped > 0:
+            return f"{head}\n... [{dropped} characters truncated] ...\n{tail}"
+        return head + tail
+
+
+class _Tee:
+    """Line-buffered live copy of command output to a text stream."""
+
+    _lock = threading.Lock()  # Shared: parallel commands may tee to one stream
+
+    def __init__(self, sink: Optional[IO[str]], prefix: str = ""):
+        self.sink = sink
+        self.prefix = prefix
+        self._partial = ""
+
+    def feed(self, text: str) -> None:
+        if self.sink is None:
+            return
+        lines = (self._partial + text).split("\n")
+        self._partial = lines.pop()
+        if lines:
+            with self._lock:
+                self.sink.write("".join(f"{self.prefix}{line}\n" for line in lines))
+                self.sink.flush()
+
+    def close(self) -> None:
+        if self.sink is not None and self._partial:
+            with self._lock:
+                self.sink.write(f"{self.prefix}{self._partial}\n")
+                self.sink.flush()
+            self._partial = ""
+
+
+@contextmanager
+def _open_tee(tee: Union[None, str, Path, IO[str]]) -> Iterator[Optional[IO[str]]]:
+    """Yield a text stream for tee (a stream, "console" = stderr, or a log file path)."""
+    if tee is None or hasattr(tee, "write"):
+        yield tee
+    elif tee == "console":
+        yield sys.stderr
+    else:
+        Path(tee).parent.mkdir(parents=True, exist_ok=True)
+        with open(tee, "a", encoding="utf-8") as f:
+            yield f
+
+
+def _split_cmd(cmd: Union[str, List[str]]) -> List[str]:
+    cmd_list = shlex.split(cmd) if isinstance(cmd, str) else list(cmd)
+    if not cmd_list:
+        raise ValueError(
+            "Empty command provided\n"
+            "🔧 Troubleshooting: Provide a valid command string or list"
+        )
+    return cmd_list
+
+
+def _kill_group(proc) -> None:
+    """Kill a process started with start_new_session and its children."""
+    try:
+        if os.name == "posix":
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def _stream_result(exit_code: int, out: OutputCapture, err: OutputCapture, start: float) -> Dict[str, Any]:
+    return {
+        "success": exit_code == 0,
+        "stdout": out.getvalue(),
+        "stderr": err.getvalue(),
+        "exit_code": exit_code,
+        "duration": time.time() - start,
+        "truncated": out.truncated or err.truncated
+    }
+
+
+def _timeout_error(timeout: float, cmd_list: List[str]) -> TimeoutError:
+    return TimeoutError(
+        f"Command timed out after {timeout}s: {' '.join(cmd_list)}\n"
+        f"🔧 Troubleshooting: Increase timeout or check for hanging process"
+    )
+
+
+def _spawn_error(cmd_list: List[str], e: Exception) -> RuntimeError:
+    return RuntimeError(
+        f"Command failed: {' '.join(cmd_list)}\n"
+        f"Error: {str(e)}\n"
+        f"🔧 Troubleshooting: Check command syntax and permissions"
+    )
+
+
+def run_cmd_stream(
+    cmd: Union[str, List[str]],
+    cwd: Optional[str] = None,
+    timeout: int = 60,
+    tee: Union[None, str, Path, IO[str]] = None,
+    max_output: int = DEFAULT_MAX_OUTPUT,
+    prefix: str = ""
+) -> Dict[str, Any]:
+    """Execute command, streaming stdout/stderr instead of buffering them.
+
+    Both pipes are read concurrently as output arrives. The returned
+    strings keep at most max_output characters each (head and tail), so
+    memory stays bounded for huge outputs. With tee, output is copied
+    live, line by line.
+
+    Args:
+        cmd: Shell command (str will be safely split) or list of args
+        cwd: Working directory (default: current)
+        timeout: Command timeout in seconds (process group is killed)
+        tee: Live copy target: a text stream, "console" (stderr) or a log file path
+        max_output: Characters kept per stream
+        prefix: Prepended to every teed line
+
+    Returns:
+        Same dict as run_cmd plus truncated (bool)
+
+    Raises:
+        ValueError: If command is empty
+        TimeoutError: If command exceeds timeout
+        RuntimeError: If command cannot be started
+
+    Security: Uses shell=False to prevent command injection (CWE-78).
+    """
+    start = time.time()
+    cmd_list = _split_cmd(cmd)
+    out, err = OutputCapture(max_output), OutputCapture(max_output)
+
+    with _open_tee(tee) as sink:
+        try:
+            proc = subprocess.Popen(
+                cmd_list,
+                shell=False,  # ✅ SAFE
+                cwd=cwd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                start_new_session=True
+            )
+        except OSError as e:
+            raise _spawn_error(cmd_list, e) from e
+
+        def pump(pipe, capture: OutputCapture) -> None:
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            echo = _Tee(sink, prefix)
+            with pipe:
+                while True:
+                    chunk = pipe.read1(_READ_CHUNK)
+                    text = decoder.decode(chunk, final=not chunk)
+                    capture.write(text)
+                    echo.feed(text)
+                    if not chunk:
+                        break
+            echo.close()
+
+        readers = [
+            threading.Thread(target=pump, args=(proc.stdout, out), daemon=True),
+            threading.Thread(target=pump, args=(proc.stderr, err), daemon=True),
+        ]
+        for reader in readers:
+            reader.start()
+
+        deadline = time.monotonic() + timeout
+        try:
+            exit_code = proc.wait(timeout=timeout)
+            # A background child can keep the pipes open after the command exits
+            for reader in readers:
+                reader.join(max(deadline - time.monotonic(), 0))
+            if any(reader.is_alive() for reader in readers):
+                raise subprocess.TimeoutExpired(cmd_list, timeout)
+        except subprocess.TimeoutExpired as e:
+            _kill_group(proc)
+            proc.wait()
+            raise _timeout_error(timeout, cmd_list) from e
+        except BaseException:
+            _kill_group(proc)
+            proc.wait()
+            raise
+        finally:
+            for reader in readers:
+                reader.join(_READER_GRACE)
+
+    return _stream_result(exit_code, out, err, start)
+
+
+async def run_cmd_async(
+    cmd: Union[str, List[str]],
+    cwd: Optional[str] = None,
+    timeout: int = 60,
+    tee: Union[None, str, Path, IO[str]] = None,
+    max_output: int = DEFAULT_MAX_OUTPUT,
+    prefix: str = ""
+) -> Dict[str, Any]:
+    """Async run_cmd_stream: await several with asyncio.gather to run in parallel.
+
+    On timeout or cancellation the command's process group is killed.
+
+    Args:
+        cmd: Shell command (str will be safely split) or list of args
+        cwd: Working directory (default: current)
+        timeout: Command timeout in seconds
+        tee: Live copy target (see run_cmd_stream)
+        max_output: Characters kept per stream
+        prefix: Prepended to every teed line
+
+    Returns:
+        Same dict as run_cmd_stream
+
+    Raises:
+        ValueError: If command is empty
+        TimeoutError: If command exceeds timeout
+        RuntimeError: If command cannot be started
+    """
+    start = time.time()
+    cmd_list = _split_cmd(cmd)
+    out, err = OutputCapture(max_output), OutputCapture(max_output)
+
+    with _open_tee(tee) as sink:
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd_list,
+                cwd=cwd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                start_new_session=True
+            )
+        except OSError as e:
+            raise _spawn_error(cmd_list, e) from e
+
+        async def pump(stream, capture: OutputCapture) -> None:
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            echo = _Tee(sink, prefix)
+            while True:
+                chunk = await stream.read(_READ_CHUNK)
+                text = decoder.decode(chunk, final=not chunk)
+                capture.write(text)
+                echo.feed(text)
+                if not chunk:
+                    break
+            echo.close()
+
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(pump(proc.stdout, out), pump(proc.stderr, err), proc.wait()),
+                timeout
+            )
+        except asyncio.TimeoutError as e:
+            _kill_group(proc)
+            await proc.wait()
+            raise _timeout_error(timeout, cmd_list) from e
+        except BaseException:
+            _kill_group(proc)
+            await proc.wait()
+            raise
+
+    return _stream_result(proc.returncode, out, err, start)
+
+
+def run_cmds_parallel(
+    cmds: List[Union[str, List[str]]],
+    max_concurrency: Optional[int] = None,
+    **kwargs: Any
+) -> List[Dict[str, Any]]:
+    """Run several commands concurrently with run_cmd_async.
+
+    Args:
+        cmds: Commands to run
+        max_concurrency: Max commands running at once (default: all)
+        **kwargs: Passed to run_cmd_async (cwd, timeout, tee, max_output)
+
+    Returns:
+        Results in the order of cmds
+
+    Raises:
+        TimeoutError/RuntimeError: First command error (the others are killed)
+    """
+    async def run_all() -> List[Dict[str, Any]]:
+        limit = asyncio.Semaphore(max_concurrency or max(len(cmds), 1))
+
+        async def run_one(cmd):
+            async with limit:
+                return await run_cmd_async(cmd, **kwargs)
+
+        tasks = [asyncio.ensure_future(run_one(cmd)) for cmd in cmds]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    return asyncio.run(run_all())
+
+
 def count_git_files() -> int:
     """Count total tracked files in git repository.
 
@@ -262,8 +605,19 @@ def git_checkpoint(message: str = "Context Engineering checkpoint") -> str:
     return checkpoint_id
 
 
-def run_py(code: Optional[str] = None, file: Optional[str] = None, args: str = "", auto: Optional[str] = None) -> Dict[str, Any]:
-    """Execute Python code using uv with strict LOC limits."""
+def run_py(
+    code: Optional[str] = None,
+    file: Optional[str] = None,
+    args: str = "",
+    auto: Optional[str] = None,
+    warm: Optional[bool] = None
+) -> Dict[str, Any]:
+    """Execute Python code using uv with strict LOC limits.
+
+    With warm (or $CE_RUN_PY_WARM=1), code runs on the warm interpreter
+    pool server (see ce.py_pool) instead of a fresh process; falls back to
+    a fresh process where the pool is unsupported (no fork/Unix sockets).
+    """
     if auto is not None:
         if code is not None or file is not None:
             raise ValueError("Cannot use 'auto' with 'code' or 'file'\n🔧 Troubleshooting: Check inputs and system state")
@@ -275,10 +629,18 @@ def run_py(code: Optional[str] = None, file: Optional[str] = None, args: str = "
     if code is not None and file is not None:
         raise ValueError("Cannot provide both 'code' and 'file'\n🔧 Troubleshooting: Check inputs and system state")
 
+    if warm is None:
+        warm = os.environ.get("CE_RUN_PY_WARM") == "1"
+    if warm:
+        from .py_pool import run_warm, warm_supported
+        warm = warm_supported()
+
     if code is not None:
         lines = [line for line in code.split('\n') if line.strip()]
         if len(lines) > 3:
             raise ValueError(f"Ad-hoc code exceeds 3 LOC limit\n🔧 Troubleshooting: Check inputs and system state")
+        if warm:
+            return run_warm(code=code, argv=args.split(), timeout=120)
         cmd = ["uv", "run", "python", "-c", code]
         if args:
             cmd.extend(args.split())
@@ -290,6 +652,8 @@ def run_py(code: Optional[str] = None, file: Optional[str] = None, args: str = "
             raise ValueError(f"File must be in tmp/ folder")
         if not file_path.exists():
             raise FileNotFoundError(f"Python file not found: {file}\n🔧 Troubleshooting: Check inputs and system state")
+        if warm:
+            return run_warm(file=file, argv=args.split(), timeout=300)
         cmd = ["uv", "run", "python", file]
         if args:
             cmd.extend(args.split())
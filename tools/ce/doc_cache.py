@@ -0,0 +1,367 @@
+"""Persistent documentation cache and concurrent fetcher for PRP generation.
+
+Fetched documentation (library docs keyed by library id + topics, external
+links keyed by URL) is stored in a SQLite file under .ce/cache/ so the
+same stack is fetched once, not once per PRP:
+
+    - entries younger than max_age are served without touching the network
+    - older entries are revalidated with If-None-Match / If-Modified-Since;
+      a 304 only refreshes the entry's timestamp
+    - the cache is size-bounded; least recently used entries are evicted
+    - offline (CE_DOCS_OFFLINE=1, or when the network fails) entries are
+      served regardless of age
+
+DocFetcher runs fetches on a thread pool with a per-host concurrency cap,
+so a PRP with many links to one site does not hammer it.
+
+Example:
+    with DocCache() as cache:
+        fetcher = DocFetcher(cache)
+        pages = fetcher.fetch_all(["https://jwt.io/introduction", ...])
+"""
+
+import html
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = ".ce/cache/docs.db"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_AGE = 24 * 3600  # Seconds an entry is used without revalidation
+DEFAULT_PER_HOST = 2
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_TIMEOUT = 15
+MAX_DOC_BYTES = 2 * 1024 * 1024  # Larger responses are truncated
+OFFLINE_ENV = "CE_DOCS_OFFLINE"
+USER_AGENT = "ce-doc-fetcher/1.0"
+ALLOWED_SCHEMES = ("http", "https")  # Links come from INITIAL.md; never read file:// etc.
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    key TEXT PRIMARY KEY,
+    url TEXT,
+    content TEXT NOT NULL,
+    metadata_json TEXT NOT NULL DEFAULT '{}',
+    etag TEXT,
+    last_modified TEXT,
+    size INTEGER NOT NULL,
+    validated_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_docs_accessed ON docs(accessed_at);
+"""
+
+_DROPPED_HTML = re.compile(r"<(script|style|noscript|svg)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+_BLOCK_TAG = re.compile(r"<(?:br|/p|/div|/li|/h[1-6]|/tr|/pre)\b[^>]*>", re.IGNORECASE)
+_TAG = re.compile(r"<[^>]+>")
+_BLANK_LINES = re.compile(r"\n\s*\n+")
+
+
+def library_key(library_id: str, topics: Sequence[str]) -> str:
+    """Cache key for library docs (topic order does not matter)."""
+    return f"lib:{library_id.strip().lower()}#{','.join(sorted({t.lower() for t in topics}))}"
+
+
+def url_key(url: str) -> str:
+    """Cache key for a fetched URL (fragment ignored)."""
+    return f"url:{url.split('#', 1)[0]}"
+
+
+def offline_mode() -> bool:
+    """True if CE_DOCS_OFFLINE is set to a truthy value."""
+    return os.environ.get(OFFLINE_ENV, "").lower() in ("1", "true", "yes")
+
+
+def html_to_text(markup: str) -> str:
+    """Readable text from an HTML page (scripts/styles dropped, tags stripped)."""
+    text = _DROPPED_HTML.sub("", markup)
+    text = _BLOCK_TAG.sub("\n", text)
+    text = html.unescape(_TAG.sub("", text))
+    return _BLANK_LINES.sub("\n\n", text).strip()
+
+
+class DocCache:
+    """Size-bounded SQLite store of fetched documentation.
+
+    Safe to share between threads (one connection behind a lock).
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age: float = DEFAULT_MAX_AGE
+    ):
+        """Open (and create if needed) the cache.
+
+        Args:
+            db_path: Database location (default: .ce/cache/docs.db under the
+                project root if it has .ce/, in-memory otherwise)
+            max_bytes: Total content size kept before LRU eviction
+            max_age: Seconds an entry is served without revalidation
+        """
+        if db_path is None:
+            cwd = Path.cwd()
+            root = cwd.parent if cwd.name == "tools" else cwd
+            if (root / ".ce").is_dir():
+                db_file = root / DEFAULT_CACHE_PATH
+                db_file.parent.mkdir(parents=True, exist_ok=True)
+                db_path = str(db_file)
+            else:
+                db_path = ":memory:"
+
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        try:
+            self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+            self._conn.row_factory = sqlite3.Row
+            if db_path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+        except sqlite3.Error as e:
+            raise RuntimeError(
+                f"Failed to open doc cache at {db_path}: {e}\n"
+                f"🔧 Troubleshooting: Delete {db_path} to rebuild the cache"
+            ) from e
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> "DocCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Cached entry for key (None if absent); marks it recently used.
+
+        Returns:
+            {"key", "url", "content", "metadata", "etag", "last_modified",
+             "validated_at", "fresh"}
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM docs WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE docs SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+        return {
+            "key": row["key"],
+            "url": row["url"],
+            "content": row["content"],
+            "metadata": json.loads(row["metadata_json"]),
+            "etag": row["etag"],
+            "last_modified": row["last_modified"],
+            "validated_at": row["validated_at"],
+            "fresh": now - row["validated_at"] < self.max_age,
+        }
+
+    def put(
+        self,
+        key: str,
+        content: str,
+        url: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> None:
+        """Store (or replace) an entry, then evict down to max_bytes."""
+        now = time.time()
+        size = len(content.encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO docs (key, url, content, metadata_json, etag, last_modified, size,"
+                " validated_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, url, content, json.dumps(metadata or {}), etag, last_modified, size, now, now),
+            )
+            self._evict_locked()
+            self._conn.commit()
+
+    def mark_validated(self, key: str) -> None:
+        """Record a successful revalidation (304): entry is fresh again."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("UPDATE docs SET validated_at = ?, accessed_at = ? WHERE key = ?", (now, now, key))
+            self._conn.commit()
+
+    def evict(self) -> int:
+        """Drop least recently used entries until under max_bytes; return count."""
+        with self._lock:
+            removed = self._evict_locked()
+            self._conn.commit()
+        return removed
+
+    def stats(self) -> Dict[str, int]:
+        """Entry count and total content size."""
+        with self._lock:
+            count, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM docs").fetchone()
+        return {"entries": count, "bytes": total}
+
+    def _evict_locked(self) -> int:
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM docs").fetchone()[0]
+        if total <= self.max_bytes:
+            return 0
+        victims = []
+        for row in self._conn.execute("SELECT key, size FROM docs ORDER BY accessed_at, key"):
+            if total <= self.max_bytes:
+                break
+            victims.append((row["key"],))
+            total -= row["size"]
+        self._conn.executemany("DELETE FROM docs WHERE key = ?", victims)
+        logger.debug(f"Evicted {len(victims)} doc cache entries")
+        return len(victims)
+
+
+class DocFetcher:
+    """Concurrent, cache-first documentation fetcher.
+
+    Example:
+        fetcher = DocFetcher(cache, per_host=2)
+        page = fetcher.fetch_url("https://jwt.io/introduction")
+        page["content"], page["status"]  # "cached" | "revalidated" | "fetched" | "stale"
+    """
+
+    def __init__(
+        self,
+        cache: DocCache,
+        per_host: int = DEFAULT_PER_HOST,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        timeout: float = DEFAULT_TIMEOUT,
+        offline: Optional[bool] = None
+    ):
+        """Create fetcher.
+
+        Args:
+            cache: Backing DocCache
+            per_host: Maximum concurrent requests to one host
+            max_workers: Thread pool size for fetch_all/map
+            timeout: Per-request timeout in seconds
+            offline: Serve from cache only (default: CE_DOCS_OFFLINE)
+        """
+        self.cache = cache
+        self.per_host = per_host
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.offline = offline_mode() if offline is None else offline
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._slots_lock = threading.Lock()
+
+    def host_slot(self, host: str) -> threading.BoundedSemaphore:
+        """Semaphore limiting concurrent work against host."""
+        with self._slots_lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.BoundedSemaphore(self.per_host)
+            return slot
+
+    def map(self, tasks: Sequence[Tuple[str, Callable[[], Any]]]) -> List[Any]:
+        """Run (host, fn) tasks concurrently under per-host caps.
+
+        Returns:
+            Results in task order; a task that raised yields None (logged)
+        """
+        def run(task: Tuple[str, Callable[[], Any]]) -> Any:
+            host, fn = task
+            try:
+                with self.host_slot(host):
+                    return fn()
+            except Exception as e:
+                logger.warning(f"Documentation fetch failed ({host}): {e}")
+                return None
+
+        if len(tasks) <= 1:
+            return [run(task) for task in tasks]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(tasks))) as pool:
+            return list(pool.map(run, tasks))
+
+    def fetch_all(self, urls: Sequence[str]) -> List[Optional[Dict[str, Any]]]:
+        """fetch_url for each URL concurrently (duplicates fetched once)."""
+        unique = list(dict.fromkeys(urls))
+        results = self.map([(urlsplit(url).netloc, lambda url=url: self.fetch_url(url)) for url in unique])
+        by_url = dict(zip(unique, results))
+        return [by_url[url] for url in urls]
+
+    def fetch_url(self, url: str) -> Dict[str, Any]:
+        """Fetch url, using and maintaining the cache.
+
+        Returns:
+            {"url", "content", "status"} where status is "cached" (fresh entry,
+            no request), "revalidated" (304), "fetched" (new content) or
+            "stale" (offline or network error, served from cache)
+
+        Raises:
+            ValueError: URL scheme is not http or https (e.g. file://)
+            RuntimeError: Offline or fetch failed, and nothing cached
+        """
+        scheme = urlsplit(url).scheme.lower()
+        if scheme not in ALLOWED_SCHEMES:
+            raise ValueError(
+                f"Refusing to fetch {url}: scheme '{scheme}' is not http(s)\n"
+                f"🔧 Troubleshooting: Documentation links must be http:// or https:// URLs"
+            )
+
+        key = url_key(url)
+        entry = self.cache.get(key)
+        if entry and (entry["fresh"] or self.offline):
+            return {"url": url, "content": entry["content"], "status": "cached" if entry["fresh"] else "stale"}
+        if self.offline:
+            raise RuntimeError(
+                f"{url} is not in the doc cache (offline mode)\n"
+                f"🔧 Troubleshooting: Unset {OFFLINE_ENV} and fetch once while online"
+            )
+
+        request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+        if entry and entry["etag"]:
+            request.add_header("If-None-Match", entry["etag"])
+        if entry and entry["last_modified"]:
+            request.add_header("If-Modified-Since", entry["last_modified"])
+
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                body = response.read(MAX_DOC_BYTES + 1)
+                headers = response.headers
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and entry:
+                self.cache.mark_validated(key)
+                return {"url": url, "content": entry["content"], "status": "revalidated"}
+            return self._stale_or_raise(url, entry, f"HTTP {e.code}")
+        except (urllib.error.URLError, OSError) as e:
+            return self._stale_or_raise(url, entry, str(getattr(e, "reason", e)))
+
+        if len(body) > MAX_DOC_BYTES:
+            logger.warning(f"Truncated {url} to {MAX_DOC_BYTES} bytes")
+            body = body[:MAX_DOC_BYTES]
+        content = body.decode(headers.get_content_charset() or "utf-8", "replace")
+        if "html" in headers.get_content_type():
+            content = html_to_text(content)
+        self.cache.put(
+            key, content, url=url,
+            etag=headers.get("ETag"), last_modified=headers.get("Last-Modified"),
+        )
+        return {"url": url, "content": content, "status": "fetched"}
+
+    def _stale_or_raise(self, url: str, entry: Optional[Dict[str, Any]], reason: str) -> Dict[str, Any]:
+        if entry:
+            logger.warning(f"Serving cached {url} ({reason})")
+            return {"url": url, "content": entry["content"], "status": "stale"}
+        raise RuntimeError(
+            f"Failed to fetch {url}: {reason}\n"
+            f"🔧 Troubleshooting: Check network access and the URL"
+        )
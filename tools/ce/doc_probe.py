@@ -0,0 +1,190 @@
+"""Bounded-read probes for markdown documents.
+
+Most document checks (frontmatter, title, status lines, temp-doc markers)
+only need the first few hundred bytes. probe_doc() reads the first
+HEAD_SIZE bytes, parses frontmatter lazily, and reads the rest of the file
+only when a check actually needs the body. Probes are cached by
+(device, inode, mtime, size), so repeated checks of the same unchanged
+file - across vacuum strategies or blend classification - hit memory.
+Cached probes hold only the head; full bodies live in a separate LRU
+bounded by _BODY_CACHE_CHARS, so a large docs tree never pins every file.
+
+Example:
+    probe = probe_doc("PRPs/executed/PRP-1-foo.md")
+    if probe.frontmatter() is None:
+        ...
+    if probe.search(r"PRP-\\d+"):  # Head first, body only if needed
+        ...
+"""
+
+import codecs
+import os
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional, Pattern, Tuple, Union
+
+HEAD_SIZE = 4096
+_CACHE_SIZE = 4096
+_BODY_CACHE_CHARS = 16 * 1024 * 1024
+
+_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---", re.DOTALL)
+
+
+class DocProbe:
+    """Lazily-read view of one text file.
+
+    Attributes:
+        path: File path
+        size: File size in bytes
+        head: Decoded first HEAD_SIZE bytes (newlines normalized to \\n)
+        complete: True if head is the whole file
+    """
+
+    def __init__(self, path: Path, size: int, head: str, complete: bool, errors: str, key: Tuple):
+        self.path = path
+        self.size = size
+        self.head = head
+        self.complete = complete
+        self._errors = errors
+        self._key = key  # probe_doc() cache key, shared with the body LRU
+        self._frontmatter: Union[str, None, bool] = False  # False = not parsed yet
+
+    @property
+    def body(self) -> str:
+        """Full file text (read on first access unless head already covers it)."""
+        if self.complete:
+            return self.head
+        with _cache_lock:
+            text = _bodies.get(self._key)
+            if text is not None:
+                _bodies.move_to_end(self._key)
+                return text
+        with open(self.path, "r", encoding="utf-8", errors=self._errors) as f:
+            text = f.read()
+        _remember_body(self._key, text)
+        return text
+
+    @property
+    def body_loaded(self) -> bool:
+        """True if the full text is in memory (for tests and diagnostics)."""
+        with _cache_lock:
+            return self.complete or self._key in _bodies
+
+    def frontmatter(self) -> Optional[str]:
+        """YAML frontmatter text between leading --- markers, or None.
+
+        Reads past the head only if the frontmatter is still open at its end.
+        """
+        if self._frontmatter is False:
+            if not re.match(r"^---\s*\n", self.head):
+                self._frontmatter = None
+            else:
+                match = _FRONTMATTER_RE.match(self.head)
+                if match is None and not self.complete:
+                    match = _FRONTMATTER_RE.match(self.body)
+                self._frontmatter = match.group(1) if match else None
+        return self._frontmatter
+
+    def has_frontmatter_start(self) -> bool:
+        """True if the file starts with a --- line."""
+        return re.match(r"^---\s*\n", self.head) is not None
+
+    def search(self, pattern: Union[str, Pattern], flags: int = 0) -> Optional[re.Match]:
+        """First match in the head, falling back to the full body."""
+        regex = re.compile(pattern, flags) if isinstance(pattern, str) else pattern
+        match = regex.search(self.head)
+        if match is None and not self.complete:
+            match = regex.search(self.body)
+        return match
+
+    def lines(self, count: int) -> List[str]:
+        """First count lines (without line endings)."""
+        lines = self.head.split("\n")
+        if len(lines) <= count and not self.complete:
+            lines = self.body.split("\n")
+        elif not self.complete:
+            lines = lines[:-1]  # Last head line may be cut mid-line
+        return lines[:count]
+
+    def char_count_exceeds(self, limit: int) -> bool:
+        """True if the decoded text is longer than limit characters."""
+        # UTF-8 uses at most 4 bytes per character
+        if self.size > 4 * limit:
+            return True
+        return len(self.body) > limit
+
+
+_cache: "OrderedDict[Tuple, DocProbe]" = OrderedDict()
+_bodies: "OrderedDict[Tuple, str]" = OrderedDict()
+_body_chars = 0
+_cache_lock = threading.Lock()
+
+
+def _remember_body(key: Tuple, text: str) -> None:
+    """Keep a full body in the size-bounded body LRU (oversized bodies are not kept)."""
+    global _body_chars
+    if len(text) > _BODY_CACHE_CHARS:
+        return
+    with _cache_lock:
+        if key in _bodies:
+            return
+        _bodies[key] = text
+        _body_chars += len(text)
+        while _body_chars > _BODY_CACHE_CHARS:
+            _, evicted = _bodies.popitem(last=False)
+            _body_chars -= len(evicted)
+
+
+def probe_doc(path: Union[str, Path], head_size: int = HEAD_SIZE, errors: str = "strict") -> DocProbe:
+    """Probe a text file, reading only its first head_size bytes.
+
+    Args:
+        path: File to probe
+        head_size: Bytes to read up front
+        errors: UTF-8 decode error handling ("strict", "ignore", "replace")
+
+    Returns:
+        DocProbe (cached by device, inode, mtime and size)
+
+    Raises:
+        OSError: If the file cannot be read
+        UnicodeDecodeError: If errors="strict" and the head is not valid UTF-8
+    """
+    path = Path(path)
+    st = os.stat(path)
+    key = (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size, head_size, errors)
+
+    with _cache_lock:
+        probe = _cache.get(key)
+        if probe is not None:
+            _cache.move_to_end(key)
+            return probe
+
+    with open(path, "rb") as f:
+        raw = f.read(head_size + 1)
+    complete = len(raw) <= head_size
+    raw = raw[:head_size]
+
+    # Incremental decoder keeps a multi-byte character split at the cut out of the head
+    head = codecs.getincrementaldecoder("utf-8")(errors).decode(raw, final=complete)
+    if not complete and head.endswith("\r"):
+        head = head[:-1]  # Might be half of a \r\n
+    head = head.replace("\r\n", "\n").replace("\r", "\n")
+
+    probe = DocProbe(path, st.st_size, head, complete, errors, key)
+    with _cache_lock:
+        _cache[key] = probe
+        if len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    return probe
+
+
+def clear_cache() -> None:
+    """Drop cached probes and bodies."""
+    global _body_chars
+    with _cache_lock:
+        _cache.clear()
+        _bodies.clear()
+        _body_chars = 0
@@ -7,11 +7,12 @@ across PRPs, creating an audit trail for pattern conformance validation.
 import yaml
 import re
 import logging
-from glob import glob
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timezone
 
+from .drift_store import DriftStore
+
 logger = logging.getLogger(__name__)
 
 
@@ -82,7 +83,11 @@ def parse_drift_justification(prp_path: str) -> Optional[Dict[str, Any]]:
 def get_drift_history(
     last_n: Optional[int] = None,
     prp_id: Optional[str] = None,
-    action_filter: Optional[str] = None
+    action_filter: Optional[str] = None,
+    min_score: Optional[float] = None,
+    max_score: Optional[float] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None
 ) -> List[Dict[str, Any]]:
     """Query drift decision history across all PRPs.
 
@@ -90,53 +95,33 @@ def get_drift_history(
         last_n: Return only last N decisions (by timestamp)
         prp_id: Filter by specific PRP ID
         action_filter: Filter by action (accepted, rejected, examples_updated)
+        min_score: Only decisions with score >= min_score
+        max_score: Only decisions with score <= max_score
+        since: Only decisions with timestamp >= since (ISO date/datetime)
+        until: Only decisions with timestamp < until (ISO date/datetime)
 
     Returns:
         List of drift decisions sorted by timestamp (newest first)
 
+    Note: Served from the indexed drift store (.ce/drift-history.db);
+          only PRPs modified since the last query are re-parsed.
+
     Example:
         >>> history = get_drift_history(last_n=3)
         >>> history[0]["drift_decision"]["score"]
         45.2
     """
-    prp_dirs = ["PRPs/executed", "PRPs/feature-requests"]
-    all_decisions = []
-
-    for prp_dir in prp_dirs:
-        dir_path = Path(prp_dir)
-        if not dir_path.exists():
-            continue
-
-        # Find all PRP markdown files
-        for prp_file in dir_path.glob("PRP-*.md"):
-            try:
-                decision = parse_drift_justification(str(prp_file))
-                if decision:
-                    all_decisions.append(decision)
-            except Exception as e:
-                logger.warning(f"Skipping {prp_file}: {e}")
-
-    # Apply filters
-    if prp_id:
-        all_decisions = [d for d in all_decisions if d["prp_id"] == prp_id]
-
-    if action_filter:
-        all_decisions = [
-            d for d in all_decisions
-            if d["drift_decision"]["action"] == action_filter
-        ]
-
-    # Sort by timestamp (newest first)
-    all_decisions.sort(
-        key=lambda d: d["drift_decision"].get("timestamp", ""),
-        reverse=True
-    )
-
-    # Apply limit
-    if last_n:
-        all_decisions = all_decisions[:last_n]
-
-    return all_decisions
+    with DriftStore() as store:
+        store.sync()
+        return store.query(
+            prp_id=prp_id,
+            action=action_filter,
+            min_score=min_score,
+            max_score=max_score,
+            since=since,
+            until=until,
+            limit=last_n
+        )
 
 
 def drift_summary() -> Dict[str, Any]:
@@ -0,0 +1,254 @@
+"""Indexed drift decision store.
+
+Persists drift decisions parsed from PRP YAML headers into a small SQLite
+index under .ce/ so drift queries don't re-parse every PRP on each call.
+The index is kept consistent with the PRP files via (mtime, size) checks:
+only new or modified PRPs are re-parsed, deleted PRPs are dropped.
+"""
+
+import json
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PRP_DIRS = ["PRPs/executed", "PRPs/feature-requests"]
+DEFAULT_STORE_PATH = ".ce/drift-history.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS prp_files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS decisions (
+    path TEXT PRIMARY KEY REFERENCES prp_files(path) ON DELETE CASCADE,
+    prp_id TEXT NOT NULL,
+    prp_name TEXT NOT NULL,
+    action TEXT,
+    score REAL,
+    timestamp TEXT NOT NULL,
+    decision_json TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_decisions_prp_id ON decisions(prp_id);
+CREATE INDEX IF NOT EXISTS idx_decisions_action ON decisions(action, timestamp);
+CREATE INDEX IF NOT EXISTS idx_decisions_score ON decisions(score);
+CREATE INDEX IF NOT EXISTS idx_decisions_timestamp ON decisions(timestamp);
+"""
+
+
+class DriftStore:
+    """SQLite-backed index of drift decisions keyed by PRP file.
+
+    Example:
+        store = DriftStore()
+        store.sync()
+        recent = store.query(limit=5)
+
+    Attributes:
+        db_path: SQLite file path, or ":memory:" when not in a CE project
+        prp_dirs: Directories scanned for PRP-*.md files
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        prp_dirs: Optional[List[str]] = None
+    ):
+        """Open (or create) the drift store.
+
+        Args:
+            db_path: Store location (default: .ce/drift-history.db if .ce/
+                exists in the current directory, in-memory otherwise)
+            prp_dirs: PRP directories to index (default: executed + feature-requests)
+        """
+        if db_path is None:
+            db_path = DEFAULT_STORE_PATH if Path(".ce").is_dir() else ":memory:"
+
+        self.db_path = db_path
+        self.prp_dirs = prp_dirs or DEFAULT_PRP_DIRS
+
+        try:
+            self._conn = sqlite3.connect(db_path)
+            self._conn.execute("PRAGMA foreign_keys = ON")
+            self._conn.executescript(_SCHEMA)
+        except sqlite3.Error as e:
+            raise RuntimeError(
+                f"Failed to open drift store: {db_path}\n"
+                f"Error: {str(e)}\n"
+                f"🔧 Troubleshooting: Delete the store file to rebuild it from PRPs"
+            ) from e
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> "DriftStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def sync(self) -> Dict[str, int]:
+        """Bring the index up to date with PRP files on disk.
+
+        Only files whose (mtime, size) changed since the last sync are
+        re-parsed; files no longer on disk are removed from the index.
+
+        Returns:
+            {"scanned": N, "reparsed": N, "removed": N}
+        """
+        known = {
+            row[0]: (row[1], row[2])
+            for row in self._conn.execute("SELECT path, mtime_ns, size FROM prp_files")
+        }
+
+        on_disk: Dict[str, Tuple[int, int]] = {}
+        for prp_dir in self.prp_dirs:
+            dir_path = Path(prp_dir)
+            if not dir_path.is_dir():
+                continue
+            for prp_file in dir_path.glob("PRP-*.md"):
+                st = prp_file.stat()
+                on_disk[str(prp_file)] = (st.st_mtime_ns, st.st_size)
+
+        stale = [p for p, sig in on_disk.items() if known.get(p) != sig]
+        removed = [p for p in known if p not in on_disk]
+
+        with self._conn:
+            if removed:
+                self._conn.executemany(
+                    "DELETE FROM prp_files WHERE path = ?",
+                    [(p,) for p in removed]
+                )
+            for path in stale:
+                self._index_file(path, on_disk[path])
+
+        return {"scanned": len(on_disk), "reparsed": len(stale), "removed": len(removed)}
+
+    def record(self, prp_path: str) -> Optional[Dict[str, Any]]:
+        """Re-index a single PRP file (used after persisting a decision).
+
+        Args:
+            prp_path: Path to PRP markdown file
+
+        Returns:
+            Parsed drift decision, or None if the PRP has none
+        """
+        st = Path(prp_path).stat()
+        with self._conn:
+            return self._index_file(str(prp_path), (st.st_mtime_ns, st.st_size))
+
+    def query(
+        self,
+        prp_id: Optional[str] = None,
+        action: Optional[str] = None,
+        min_score: Optional[float] = None,
+        max_score: Optional[float] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Query indexed drift decisions, newest first.
+
+        Args:
+            prp_id: Filter by PRP ID
+            action: Filter by action (accepted, rejected, examples_updated)
+            min_score: Inclusive lower bound on drift score
+            max_score: Inclusive upper bound on drift score
+            since: Inclusive lower bound on ISO timestamp (e.g. "2025-10-01")
+            until: Exclusive upper bound on ISO timestamp
+            limit: Return at most N decisions
+
+        Returns:
+            List of {"prp_id", "prp_name", "drift_decision"} dicts
+        """
+        clauses = []
+        params: List[Any] = []
+
+        if prp_id:
+            clauses.append("prp_id = ?")
+            params.append(prp_id)
+        if action:
+            clauses.append("action = ?")
+            params.append(action)
+        if min_score is not None:
+            clauses.append("score >= ?")
+            params.append(min_score)
+        if max_score is not None:
+            clauses.append("score <= ?")
+            params.append(max_score)
+        if since:
+            clauses.append("timestamp >= ?")
+            params.append(since)
+        if until:
+            clauses.append("timestamp < ?")
+            params.append(until)
+
+        sql = "SELECT prp_id, prp_name, decision_json FROM decisions"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY timestamp DESC, path"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        return [
+            {
+                "prp_id": row[0],
+                "prp_name": row[1],
+                "drift_decision": json.loads(row[2])
+            }
+            for row in self._conn.execute(sql, params)
+        ]
+
+    def _index_file(
+        self,
+        path: str,
+        signature: Tuple[int, int]
+    ) -> Optional[Dict[str, Any]]:
+        """Parse one PRP and upsert its file signature and decision.
+
+        Unparseable PRPs are indexed without a decision so they aren't
+        re-parsed until they change.
+        """
+        from .drift import parse_drift_justification
+
+        self._conn.execute(
+            "INSERT OR REPLACE INTO prp_files (path, mtime_ns, size) VALUES (?, ?, ?)",
+            (path, signature[0], signature[1])
+        )
+        self._conn.execute("DELETE FROM decisions WHERE path = ?", (path,))
+
+        try:
+            parsed = parse_drift_justification(path)
+        except Exception as e:
+            logger.warning(f"Skipping {path}: {e}")
+            return None
+
+        if not parsed:
+            return None
+
+        decision = parsed["drift_decision"]
+        # Normalize YAML datetimes so sorting and JSON round-trips agree
+        if "timestamp" in decision and not isinstance(decision["timestamp"], str):
+            decision["timestamp"] = str(decision["timestamp"])
+
+        score = decision.get("score")
+        self._conn.execute(
+            "INSERT INTO decisions "
+            "(path, prp_id, prp_name, action, score, timestamp, decision_json) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                path,
+                str(parsed["prp_id"]),
+                str(parsed["prp_name"]),
+                decision.get("action"),
+                float(score) if isinstance(score, (int, float)) else None,
+                decision.get("timestamp", ""),
+                json.dumps(decision, default=str)
+            )
+        )
+        return parsed
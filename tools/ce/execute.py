@@ -40,6 +40,7 @@ from typing import Dict, Any, List, Optional
 
 from .exceptions import EscalationRequired
 from .blueprint_parser import parse_blueprint
+from .phase_scheduler import plan_waves, run_parallel_wave, merge_phase_commits
 from .validation_loop import (
     run_validation_loop,
     calculate_confidence_score,
@@ -64,7 +65,9 @@ def execute_prp(
     start_phase: Optional[int] = None,
     end_phase: Optional[int] = None,
     skip_validation: bool = False,
-    dry_run: bool = False
+    dry_run: bool = False,
+    parallel: bool = False,
+    max_workers: Optional[int] = None
 ) -> Dict[str, Any]:
     """Main execution function - orchestrates PRP implementation.
 
@@ -74,6 +77,8 @@ def execute_prp(
         end_phase: Optional phase to end at (None = all phases)
         skip_validation: Skip validation loops (dangerous - for debugging only)
         dry_run: Parse blueprint and return phases without execution
+        parallel: Run phases with disjoint file sets concurrently in git worktrees
+        max_workers: Max concurrent phases per wave (default: wave size)
 
     Returns:
         {
@@ -109,6 +114,13 @@ def execute_prp(
         6. Calculate confidence score
         7. End PRP context: ce prp end <prp_id>
         8. Return execution summary
+
+    Parallel mode (parallel=True):
+        Phases are grouped into waves via phase_scheduler.plan_waves() (file
+        overlap + **Depends On**). Single-phase waves run in place as above;
+        multi-phase waves run concurrently in isolated worktrees and are
+        cherry-picked back in phase order. Falls back to in-place sequential
+        execution when the working tree is dirty.
     """
     import time
     from .prp import start_prp, end_prp, update_prp_phase, create_checkpoint
@@ -135,13 +147,16 @@ def execute_prp(
 
     # Dry run - return parsed blueprint
     if dry_run:
-        return {
+        result = {
             "success": True,
             "dry_run": True,
             "prp_id": prp_id,
             "phases": phases,
             "total_phases": len(phases)
         }
+        if parallel:
+            result["waves"] = [[p["phase_number"] for p in wave] for wave in plan_waves(phases)]
+        return result
 
     # Initialize PRP context
     prp_name = phases[0]["phase_name"] if phases else prp_id
@@ -152,48 +167,48 @@ def execute_prp(
     checkpoints_created = []
     validation_results = {}
 
-    try:
-        # Execute each phase
-        for phase in phases:
-            phase_num = phase["phase_number"]
-            phase_name = phase["phase_name"]
-
-            print(f"\n{'='*80}")
-            print(f"Phase {phase_num}: {phase_name}")
-            print(f"Goal: {phase['goal']}")
-            print(f"{'='*80}\n")
-
-            # Update phase in state
-            update_prp_phase(f"phase{phase_num}")
-
-            # Execute phase
-            exec_result = execute_phase(phase)
-            if not exec_result["success"]:
-                raise RuntimeError(
-                    f"Phase {phase_num} execution failed: {exec_result.get('error', 'Unknown error')}\n"
-                    f"🔧 Troubleshooting: Check phase implementation logic"
-                )
+    waves = plan_waves(phases) if parallel else [[phase] for phase in phases]
 
-            # Run validation loop (unless skipped)
-            if not skip_validation and phase.get("validation_command"):
-                val_result = run_validation_loop(phase, prp_path)
-                validation_results[f"Phase{phase_num}"] = val_result
+    try:
+        for wave in waves:
+            if len(wave) > 1 and _working_tree_clean():
+                phase_list = ", ".join(str(p["phase_number"]) for p in wave)
+                print(f"\n{'='*80}")
+                print(f"Phases {phase_list}: running in parallel worktrees")
+                print(f"{'='*80}\n")
 
-                if not val_result["success"]:
-                    raise RuntimeError(
-                        f"Phase {phase_num} validation failed after {val_result.get('attempts', 0)} attempts\n"
-                        f"🔧 Troubleshooting: Review validation errors"
+                wave_results = run_parallel_wave(wave, prp_path, skip_validation, max_workers)
+                phases_by_number = {p["phase_number"]: p for p in wave}
+
+                def checkpoint_merged_phase(phase_result: Dict[str, Any]) -> None:
+                    # Runs right after this phase's cherry-pick, so its tag
+                    # excludes later phases of the wave
+                    nonlocal phases_completed
+                    phase_num = phase_result["phase_number"]
+                    if phase_result["validation_result"] is not None:
+                        validation_results[f"Phase{phase_num}"] = phase_result["validation_result"]
+
+                    update_prp_phase(f"phase{phase_num}")
+                    checkpoint_result = create_checkpoint(
+                        f"phase{phase_num}",
+                        f"Phase {phase_num} complete: {phases_by_number[phase_num]['phase_name']}"
                     )
+                    checkpoints_created.append(checkpoint_result["tag_name"])
+                    phases_completed += 1
+                    print(f"\n✅ Phase {phase_num} complete\n")
 
-            # Create checkpoint
-            checkpoint_result = create_checkpoint(
-                f"phase{phase_num}",
-                f"Phase {phase_num} complete: {phase_name}"
-            )
-            checkpoints_created.append(checkpoint_result["tag_name"])
+                merge_phase_commits(wave_results, on_merged=checkpoint_merged_phase)
+                continue
+
+            if len(wave) > 1:
+                print("⚠️  Working tree not clean - running wave sequentially")
 
-            phases_completed += 1
-            print(f"\n✅ Phase {phase_num} complete\n")
+            for phase in wave:
+                val_result, tag_name = _execute_phase_in_place(phase, prp_path, skip_validation)
+                if val_result is not None:
+                    validation_results[f"Phase{phase['phase_number']}"] = val_result
+                checkpoints_created.append(tag_name)
+                phases_completed += 1
 
         # Calculate confidence score
         confidence_score = calculate_confidence_score(validation_results)
@@ -252,6 +267,69 @@ def execute_prp(
         raise
 
 
+def _execute_phase_in_place(
+    phase: Dict[str, Any],
+    prp_path: str,
+    skip_validation: bool
+) -> tuple:
+    """Execute, validate and checkpoint one phase in the current working tree.
+
+    Returns:
+        (validation_result or None, checkpoint tag name)
+
+    Raises:
+        RuntimeError: If execution or validation fails
+    """
+    from .prp import update_prp_phase, create_checkpoint
+
+    phase_num = phase["phase_number"]
+    phase_name = phase["phase_name"]
+
+    print(f"\n{'='*80}")
+    print(f"Phase {phase_num}: {phase_name}")
+    print(f"Goal: {phase['goal']}")
+    print(f"{'='*80}\n")
+
+    # Update phase in state
+    update_prp_phase(f"phase{phase_num}")
+
+    # Execute phase
+    exec_result = execute_phase(phase)
+    if not exec_result["success"]:
+        raise RuntimeError(
+            f"Phase {phase_num} execution failed: {exec_result.get('error', 'Unknown error')}\n"
+            f"🔧 Troubleshooting: Check phase implementation logic"
+        )
+
+    # Run validation loop (unless skipped)
+    val_result = None
+    if not skip_validation and phase.get("validation_command"):
+        val_result = run_validation_loop(phase, prp_path)
+
+        if not val_result["success"]:
+            raise RuntimeError(
+                f"Phase {phase_num} validation failed after {val_result.get('attempts', 0)} attempts\n"
+                f"🔧 Troubleshooting: Review validation errors"
+            )
+
+    # Create checkpoint
+    checkpoint_result = create_checkpoint(
+        f"phase{phase_num}",
+        f"Phase {phase_num} complete: {phase_name}"
+    )
+
+    print(f"\n✅ Phase {phase_num} complete\n")
+    return val_result, checkpoint_result["tag_name"]
+
+
+def _working_tree_clean() -> bool:
+    """Check working tree is clean (worktrees only see committed state)."""
+    from .core import run_cmd
+
+    result = run_cmd(["git", "status", "--porcelain"])
+    return result["success"] and not result["stdout"].strip()
+
+
 def execute_phase(phase: Dict[str, Any]) -> Dict[str, Any]:
     """Execute a single blueprint phase using Serena MCP for file operations.
 
@@ -1,15 +1,18 @@
 """CI/CD pipeline executors package.
 
-Provides platform-specific executors for rendering abstract pipelines.
+Provides platform-specific executors for rendering abstract pipelines,
+and a local executor that runs them.
 """
 
 from .base import PipelineExecutor, BaseExecutor
 from .github_actions import GitHubActionsExecutor
+from .local import LocalExecutor
 from .mock import MockExecutor
 
 __all__ = [
     "PipelineExecutor",
     "BaseExecutor",
     "GitHubActionsExecutor",
+    "LocalExecutor",
     "MockExecutor",
 ]
@@ -0,0 +1,439 @@
+"""Local executor for running abstract pipelines on the developer machine.
+
+Runs ci/abstract/*.yml directly instead of rendering it for a CI platform:
+stages start as soon as their depends_on stages pass, nodes of a
+`parallel: true` stage run concurrently, and each node is a bash
+subprocess with its declared timeout. Output is streamed line by line,
+prefixed with the node name.
+
+Successful node results are cached under .ce/cache/ci/, keyed by the
+command and the content of its inputs: the files matching the node's
+`inputs` globs, or the whole git working tree when none are declared.
+A re-run with unchanged inputs skips the node.
+"""
+
+import hashlib
+import json
+import os
+import signal
+import subprocess
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from .base import BaseExecutor
+
+# Lines of node output kept in results (full output is streamed)
+OUTPUT_TAIL_LINES = 50
+
+DEFAULT_NODE_TIMEOUT = 600
+
+
+class LocalExecutor(BaseExecutor):
+    """Run abstract pipelines locally with parallel stages and result caching.
+
+    Mapping (same semantics as the GitHub Actions rendering):
+        - stages → run concurrently unless ordered by depends_on
+        - parallel: true → nodes of the stage run concurrently
+        - parallel: false → nodes run in order, stopping at the first failure
+        - a failed stage skips every stage that depends on it
+        - strategy: mock → node is not run (reported as mocked)
+
+    Commands run through `bash -c` in the project root, like CI `run:` steps.
+    Pipeline files are trusted project configuration.
+
+    Example:
+        executor = LocalExecutor(Path("."))
+        result = executor.run(load_abstract_pipeline("ci/abstract/validation.yml"))
+        print(executor.format_report(result))
+    """
+
+    def __init__(
+        self,
+        cwd: Optional[Path] = None,
+        max_workers: Optional[int] = None,
+        use_cache: bool = True,
+        log: Optional[Callable[[str], None]] = None
+    ):
+        """Initialize local executor.
+
+        Args:
+            cwd: Project root commands run in (default: current directory)
+            max_workers: Max concurrent node subprocesses (default: CPU count)
+            use_cache: Skip nodes whose command and inputs are unchanged
+            log: Line sink for streamed output (default: print)
+        """
+        self.cwd = Path(cwd or Path.cwd()).resolve()
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.use_cache = use_cache
+        self._log = log or (lambda line: print(line, flush=True))
+        self._log_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_workers)
+        self._file_hashes: Dict[str, str] = {}
+        self._tree_fingerprint: Optional[str] = None
+        # Running node subprocesses, killed if run() is interrupted
+        self._procs: Set[subprocess.Popen] = set()
+        self._procs_lock = threading.Lock()
+        self._cancelled = threading.Event()
+
+    # ------------------------------------------------------------------
+    # PipelineExecutor interface
+    # ------------------------------------------------------------------
+
+    def render(self, pipeline: Dict[str, Any]) -> str:
+        """Render the local execution plan (stage waves and node commands).
+
+        Args:
+            pipeline: Abstract pipeline definition
+
+        Returns:
+            Human-readable plan
+        """
+        lines = [f"# Local plan: {pipeline['name']}"]
+        for wave_num, wave in enumerate(self._stage_waves(pipeline["stages"]), 1):
+            lines.append(f"# Wave {wave_num} (concurrent): {', '.join(s['name'] for s in wave)}")
+            for stage in wave:
+                mode = "parallel" if stage.get("parallel") else "sequential"
+                lines.append(f"{stage['name']} [{mode}]")
+                for node in stage["nodes"]:
+                    timeout = node.get("timeout", DEFAULT_NODE_TIMEOUT)
+                    lines.append(f"  {node['name']} ({timeout}s): {node['command']}")
+        return "\n".join(lines)
+
+    def validate_output(self, output: str) -> Dict[str, Any]:
+        """Local plans need no platform validation."""
+        return {"success": True, "errors": []}
+
+    def get_platform_name(self) -> str:
+        """Return 'local'."""
+        return "local"
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    def run(self, pipeline: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute pipeline stages and nodes.
+
+        Args:
+            pipeline: Abstract pipeline definition (validated)
+
+        Returns:
+            Dict with: success (bool), duration (float), stages (List[Dict])
+            Each stage: name, status (passed/failed/skipped), duration, nodes
+            Each node: name, status (passed/failed/timeout/cached/mocked/skipped),
+                       exit_code, duration, output (last lines)
+
+        Raises:
+            RuntimeError: If stage dependencies are unknown or form a cycle
+            KeyboardInterrupt: Re-raised after killing every running node
+                (nodes run in their own sessions, so Ctrl-C never reaches them)
+        """
+        stages = pipeline["stages"]
+        self._stage_waves(stages)  # Dependency check before running anything
+        self._cancelled.clear()
+
+        start = time.perf_counter()
+        results: Dict[str, Dict[str, Any]] = {}
+        started = set()
+
+        with ThreadPoolExecutor(max_workers=max(1, len(stages))) as pool:
+            running = {}
+            try:
+                while True:
+                    for stage in stages:
+                        name = stage["name"]
+                        deps = stage.get("depends_on", [])
+                        if name in started or not all(dep in results for dep in deps):
+                            continue
+                        started.add(name)
+                        failed_deps = [dep for dep in deps if results[dep]["status"] != "passed"]
+                        if failed_deps:
+                            results[name] = self._skipped_stage(stage, f"depends on failed stage: {', '.join(failed_deps)}")
+                            continue
+                        running[pool.submit(self._run_stage, stage)] = name
+
+                    if not running:
+                        if len(started) == len(stages):
+                            break
+                        continue  # Skips just unblocked more stages
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        results[running.pop(future)] = future.result()
+            except BaseException:
+                # Kill nodes before the pool waits on them (up to their full timeout)
+                self._cancel()
+                raise
+
+        ordered = [results[stage["name"]] for stage in stages]
+        return {
+            "success": all(stage["status"] == "passed" for stage in ordered),
+            "duration": time.perf_counter() - start,
+            "stages": ordered,
+        }
+
+    def format_report(self, result: Dict[str, Any]) -> str:
+        """Timing report for a run() result.
+
+        Args:
+            result: Value returned by run()
+
+        Returns:
+            Multi-line report with per-node status and durations
+        """
+        icons = {"passed": "✅", "failed": "❌", "timeout": "⏱️", "cached": "⏭️",
+                 "mocked": "🎭", "skipped": "⏸️"}
+        lines = ["## Pipeline Timing", ""]
+        node_total = 0.0
+        for stage in result["stages"]:
+            lines.append(f"{icons.get(stage['status'], '?')} {stage['name']}: {stage['duration']:.1f}s")
+            for node in stage["nodes"]:
+                node_total += node["duration"]
+                lines.append(f"    {icons.get(node['status'], '?')} {node['name']}: "
+                             f"{node['status']} ({node['duration']:.1f}s)")
+        lines.append("")
+        lines.append(f"Wall time: {result['duration']:.1f}s (serial node time: {node_total:.1f}s)")
+        return "\n".join(lines)
+
+    def _run_stage(self, stage: Dict[str, Any]) -> Dict[str, Any]:
+        """Run all nodes of one stage (concurrently if parallel)."""
+        start = time.perf_counter()
+        nodes = stage["nodes"]
+
+        if stage.get("parallel") and len(nodes) > 1:
+            with ThreadPoolExecutor(max_workers=len(nodes)) as pool:
+                node_results = list(pool.map(lambda node: self._run_node(stage, node), nodes))
+        else:
+            node_results = []
+            for node in nodes:
+                if node_results and node_results[-1]["status"] in ("failed", "timeout"):
+                    node_results.append(self._node_result(node, "skipped"))
+                else:
+                    node_results.append(self._run_node(stage, node))
+
+        passed = all(n["status"] in ("passed", "cached", "mocked") for n in node_results)
+        return {
+            "name": stage["name"],
+            "status": "passed" if passed else "failed",
+            "duration": time.perf_counter() - start,
+            "nodes": node_results,
+        }
+
+    def _run_node(self, stage: Dict[str, Any], node: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one node subprocess (or reuse its cached result)."""
+        label = f"{stage['name']}/{node['name']}"
+        if node.get("strategy") == "mock":
+            self._emit(f"[{label}] 🎭 mocked, not run")
+            return self._node_result(node, "mocked")
+
+        cache_key = self._cache_key(node) if self.use_cache else None
+        if cache_key and self._read_cache(cache_key):
+            self._emit(f"[{label}] ⏭️  unchanged since last successful run (cached)")
+            return self._node_result(node, "cached")
+
+        timeout = node.get("timeout", DEFAULT_NODE_TIMEOUT)
+        tail: deque = deque(maxlen=OUTPUT_TAIL_LINES)
+
+        with self._slots:
+            with self._procs_lock:
+                if self._cancelled.is_set():
+                    return self._node_result(node, "skipped")
+                self._emit(f"[{label}] $ {node['command']}")
+                start = time.perf_counter()
+                proc = subprocess.Popen(
+                    ["bash", "-c", node["command"]],
+                    cwd=self.cwd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    errors="replace",
+                    start_new_session=True,  # Own process group: timeout kills children too
+                )
+                self._procs.add(proc)
+            reader = threading.Thread(target=self._pump, args=(proc, label, tail), daemon=True)
+            reader.start()
+            try:
+                exit_code = proc.wait(timeout=timeout)
+                status = "passed" if exit_code == 0 else "failed"
+            except subprocess.TimeoutExpired:
+                self._kill(proc)
+                exit_code = None
+                status = "timeout"
+                self._emit(f"[{label}] ⏱️  timed out after {timeout}s")
+            except BaseException:
+                self._kill(proc)
+                raise
+            finally:
+                with self._procs_lock:
+                    self._procs.discard(proc)
+            reader.join(timeout=5)
+            duration = time.perf_counter() - start
+
+        if status == "passed" and cache_key:
+            self._write_cache(cache_key, {"command": node["command"], "duration": duration})
+
+        result = self._node_result(node, status, exit_code, duration)
+        result["output"] = "\n".join(tail)
+        return result
+
+    def _pump(self, proc: subprocess.Popen, label: str, tail: deque) -> None:
+        """Stream subprocess output lines to the log sink."""
+        for line in proc.stdout:
+            line = line.rstrip("\n")
+            tail.append(line)
+            self._emit(f"[{label}] {line}")
+        proc.stdout.close()
+
+    def _emit(self, line: str) -> None:
+        with self._log_lock:
+            self._log(line)
+
+    def _cancel(self) -> None:
+        """Stop starting nodes and kill the process group of every running one."""
+        with self._procs_lock:
+            self._cancelled.set()
+            procs = list(self._procs)
+        for proc in procs:
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except (AttributeError, ProcessLookupError, PermissionError):
+                proc.kill()
+
+    @staticmethod
+    def _kill(proc: subprocess.Popen) -> None:
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except (AttributeError, ProcessLookupError, PermissionError):
+            proc.kill()
+        proc.wait()
+
+    @staticmethod
+    def _node_result(
+        node: Dict[str, Any],
+        status: str,
+        exit_code: Optional[int] = None,
+        duration: float = 0.0
+    ) -> Dict[str, Any]:
+        return {"name": node["name"], "status": status, "exit_code": exit_code,
+                "duration": duration, "output": ""}
+
+    def _skipped_stage(self, stage: Dict[str, Any], reason: str) -> Dict[str, Any]:
+        self._emit(f"[{stage['name']}] ⏸️  skipped ({reason})")
+        return {
+            "name": stage["name"],
+            "status": "skipped",
+            "duration": 0.0,
+            "nodes": [self._node_result(node, "skipped") for node in stage["nodes"]],
+        }
+
+    @staticmethod
+    def _stage_waves(stages: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Group stages into waves whose members only depend on earlier waves.
+
+        Raises:
+            RuntimeError: If depends_on names an unknown stage or forms a cycle
+        """
+        remaining = {stage["name"]: set(stage.get("depends_on", [])) for stage in stages}
+        by_name = {stage["name"]: stage for stage in stages}
+        for name, deps in remaining.items():
+            unknown = deps - set(by_name)
+            if unknown:
+                raise RuntimeError(
+                    f"Stage '{name}' depends on unknown stage(s): {', '.join(sorted(unknown))}\n"
+                    f"🔧 Troubleshooting: Run 'ce pipeline validate' on the pipeline file"
+                )
+        done: set = set()
+        waves = []
+        while remaining:
+            ready = [name for name, deps in remaining.items() if deps <= done]
+            if not ready:
+                raise RuntimeError(
+                    f"Pipeline stages have circular depends_on: {', '.join(sorted(remaining))}\n"
+                    f"🔧 Troubleshooting: Remove one depends_on entry to break the cycle"
+                )
+            waves.append([by_name[name] for name in ready])
+            done.update(ready)
+            for name in ready:
+                del remaining[name]
+        return waves
+
+    # ------------------------------------------------------------------
+    # Result cache
+    # ------------------------------------------------------------------
+
+    def _cache_dir(self) -> Optional[Path]:
+        """Cache location (only inside a CE project)."""
+        if not (self.cwd / ".ce").is_dir():
+            return None
+        return self.cwd / ".ce" / "cache" / "ci"
+
+    def _cache_key(self, node: Dict[str, Any]) -> Optional[str]:
+        """Hash of command + input contents (None if inputs cannot be fingerprinted)."""
+        if self._cache_dir() is None:
+            return None
+        inputs = node.get("inputs")
+        if inputs:
+            fingerprint = self._inputs_fingerprint(inputs)
+        else:
+            fingerprint = self._working_tree_fingerprint()
+        if fingerprint is None:
+            return None
+        payload = json.dumps([node["command"], fingerprint])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _inputs_fingerprint(self, patterns: List[str]) -> str:
+        """Content hash of all files matching the node's input globs."""
+        files = sorted({p for pattern in patterns for p in self.cwd.glob(pattern) if p.is_file()})
+        digest = hashlib.sha256()
+        for path in files:
+            digest.update(f"{path.relative_to(self.cwd).as_posix()}\0{self._hash_file(path)}\n".encode())
+        return digest.hexdigest()
+
+    def _working_tree_fingerprint(self) -> Optional[str]:
+        """Hash of the git index plus uncommitted/untracked file contents (once per run)."""
+        if self._tree_fingerprint is None:
+            index = subprocess.run(
+                ["git", "ls-files", "-s"], cwd=self.cwd, capture_output=True, text=True
+            )
+            changed = subprocess.run(
+                ["git", "ls-files", "-m", "-o", "--exclude-standard", "-z"],
+                cwd=self.cwd, capture_output=True, text=True
+            )
+            if index.returncode != 0 or changed.returncode != 0:
+                return None  # Not a git checkout: never cache
+            digest = hashlib.sha256(index.stdout.encode())
+            for rel in sorted(set(filter(None, changed.stdout.split("\0")))):
+                if rel.startswith(".ce/"):
+                    continue  # Local caches and state (includes this cache)
+                path = self.cwd / rel
+                file_hash = self._hash_file(path) if path.is_file() else "deleted"
+                digest.update(f"{rel}\0{file_hash}\n".encode())
+            self._tree_fingerprint = digest.hexdigest()
+        return self._tree_fingerprint
+
+    def _hash_file(self, path: Path) -> str:
+        key = str(path)
+        if key not in self._file_hashes:
+            digest = hashlib.sha256()
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+            self._file_hashes[key] = digest.hexdigest()
+        return self._file_hashes[key]
+
+    def _read_cache(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads((self._cache_dir() / f"{key}.json").read_text())
+        except (OSError, ValueError):
+            return None
+
+    def _write_cache(self, key: str, data: Dict[str, Any]) -> None:
+        cache_dir = self._cache_dir()
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            (cache_dir / f"{key}.json").write_text(json.dumps(data))
+        except OSError:
+            pass  # Cache is an optimization only
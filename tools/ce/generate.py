@@ -14,6 +14,10 @@ import re
 import logging
 from pathlib import Path
 from typing import Dict, List, Any, Optional
+from urllib.parse import urlparse
+
+from .doc_cache import DocCache, DocFetcher, library_key
+from .stage_graph import StageSpec, format_stage_timings, run_stage_graph
 
 logger = logging.getLogger(__name__)
 
@@ -305,8 +309,8 @@ def research_codebase(
 
     Process:
         1. Extract keywords from feature_name (e.g., "authentication", "JWT")
-        2. Search for patterns: mcp__serena__search_for_pattern(keywords)
-        3. Discover symbols: mcp__serena__find_symbol(related_classes)
+        2. Search for patterns: local code index (.ce/index/), ranked file:line hits
+        3. Discover symbols: matched symbol definitions become similar_implementations
         4. Get detailed code: mcp__serena__find_symbol(include_body=True)
         5. Find references: mcp__serena__find_referencing_symbols(key_functions)
         6. Infer architecture: Analyze file structure and imports
@@ -329,18 +333,24 @@ def research_codebase(
     }
 
     try:
-        # Check if Serena MCP is available by attempting import
-        # In production, this would be: from mcp import serena
-        # For now, we'll gracefully handle unavailability
-        logger.info("Serena MCP research would execute here (graceful degradation)")
-
-        # Extract keywords from feature name
+        # Serena MCP is not integrated yet; the local code index
+        # (ce.code_index, .ce/index/) provides offline research instead
         keywords = _extract_keywords(feature_name)
         logger.info(f"Extracted keywords: {keywords}")
 
         # Search for similar patterns
         patterns = search_similar_patterns(keywords)
         result["patterns"] = patterns
+        result["related_files"] = list(dict.fromkeys(hit["file"] for hit in patterns))[:10]
+        result["similar_implementations"] = [
+            {
+                "file": hit["file"],
+                "symbol": hit["symbol"],
+                "code": hit["snippet"],
+                "relevance": f"Matches {', '.join(hit['matched'])}"
+            }
+            for hit in patterns if hit.get("symbol")
+        ][:5]
 
         # Infer test patterns
         test_patterns = infer_test_patterns({})
@@ -349,40 +359,44 @@ def research_codebase(
         result["serena_available"] = False  # Will be True when MCP integrated
 
     except Exception as e:
-        logger.warning(f"Serena MCP unavailable or error during research: {e}")
+        logger.warning(f"Codebase research unavailable or failed: {e}")
         logger.warning("Continuing with reduced research functionality")
 
     return result
 
 
-def search_similar_patterns(keywords: List[str], path: str = ".") -> List[Dict[str, Any]]:
+def search_similar_patterns(keywords: List[str], path: str = ".", limit: int = 20) -> List[Dict[str, Any]]:
     """Search for similar code patterns using keywords.
 
-    Uses: mcp__serena__search_for_pattern
+    Uses the local code index (ce.code_index), updated incrementally
+    before each search.
 
     Args:
         keywords: Search terms (e.g., ["authenticate", "JWT", "token"])
-        path: Search scope (default: entire project)
+        path: Search scope (default: project root)
+        limit: Max hits
 
     Returns:
         [
-            {"file": "src/auth.py", "line": 42, "snippet": "..."},
-            {"file": "src/oauth.py", "line": 67, "snippet": "..."}
+            {"file": "src/auth.py", "line": 42, "snippet": "...", "score": 12.3,
+             "symbol": "AuthHandler.authenticate", "matched": ["authenticate"]},
+            ...
         ]
+        Empty list if the index is unavailable.
     """
     logger.info(f"Searching for patterns with keywords: {keywords}")
+    if not keywords:
+        return []
 
-    # Graceful degradation when Serena unavailable
-    patterns = []
+    from .code_index import CodeIndex
 
     try:
-        # This would use: mcp__serena__search_for_pattern(pattern="|".join(keywords))
-        # For now, return empty (will be populated when MCP integrated)
-        logger.info("Pattern search would execute via Serena MCP")
+        with CodeIndex(None if path == "." else Path(path)) as index:
+            index.update()
+            return index.search(keywords, limit=limit)
     except Exception as e:
         logger.warning(f"Pattern search unavailable: {e}")
-
-    return patterns
+        return []
 
 
 def analyze_symbol_structure(symbol_name: str, file_path: str) -> Dict[str, Any]:
@@ -525,6 +539,10 @@ def fetch_documentation(
         3. Fetch docs: mcp__context7__get-library-docs(library_id, topics)
         4. Fetch external links: WebFetch tool for URLs
         5. Synthesize relevance scores
+
+    Library docs and links are fetched concurrently (per-host cap) through
+    the persistent doc cache (ce.doc_cache), so docs shared by several PRPs
+    are fetched once and generation works offline from the cache.
     """
     logger.info("Starting documentation fetch with Context7 and Sequential Thinking")
 
@@ -541,23 +559,24 @@ def fetch_documentation(
         topics = extract_topics_from_feature(feature_context, serena_research)
         logger.info(f"Extracted topics: {topics}")
 
-        # Resolve library IDs and fetch docs
+        # Fetch library docs and external links concurrently, cache first
         libraries = [doc for doc in documentation_links if doc["type"] == "library"]
-        for lib in libraries:
-            lib_result = resolve_and_fetch_library_docs(
-                lib["title"],
-                topics,
-                feature_context
-            )
-            if lib_result:
-                result["library_docs"].append(lib_result)
-
-        # Fetch external link content
         external_links = [doc for doc in documentation_links if doc["type"] == "link"]
-        for link in external_links:
-            link_result = fetch_external_link(link["url"], link["title"], topics)
-            if link_result:
-                result["external_links"].append(link_result)
+        with DocCache() as cache:
+            fetcher = DocFetcher(cache)
+            tasks = [
+                ("context7", lambda lib=lib: resolve_and_fetch_library_docs(
+                    lib["title"], topics, feature_context, cache=cache))
+                for lib in libraries
+            ] + [
+                (urlparse(link["url"]).netloc, lambda link=link: fetch_external_link(
+                    link["url"], link["title"], topics, fetcher=fetcher))
+                for link in external_links
+            ]
+            results = fetcher.map(tasks)
+
+        result["library_docs"] = [r for r in results[:len(libraries)] if r]
+        result["external_links"] = [r for r in results[len(libraries):] if r]
 
         result["context7_available"] = False  # Will be True when MCP integrated
         result["sequential_thinking_available"] = False
@@ -742,7 +761,8 @@ def resolve_and_fetch_library_docs(
     library_name: str,
     topics: List[str],
     feature_context: str,
-    max_tokens: int = 5000
+    max_tokens: int = 5000,
+    cache: Optional[DocCache] = None
 ) -> Dict[str, Any]:
     """Resolve library ID and fetch documentation.
 
@@ -753,6 +773,7 @@ def resolve_and_fetch_library_docs(
         topics: Topics to focus documentation (e.g., ["routing", "security"])
         feature_context: Feature description for relevance filtering
         max_tokens: Maximum tokens to retrieve
+        cache: Doc cache consulted first and filled on fetch (optional)
 
     Returns:
         {
@@ -765,62 +786,88 @@ def resolve_and_fetch_library_docs(
         None if library not found or fetch fails
 
     Process:
-        1. resolve-library-id(library_name) → library_id
-        2. get-library-docs(library_id, topics, max_tokens)
+        1. Cached library_id for library_name, else resolve-library-id(library_name)
+        2. Cached docs for (library_id, topics), else get-library-docs(library_id, topics, max_tokens)
         3. Return structured result
     """
     logger.info(f"Resolving and fetching docs for library: {library_name}")
 
+    # library_key(name, []) maps a library name to its resolved Context7 id
+    if cache is not None:
+        resolved = cache.get(library_key(library_name, []))
+        if resolved:
+            docs = cache.get(library_key(resolved["content"], topics))
+            if docs:
+                logger.info(f"Using cached docs for {library_name}")
+                return {**docs["metadata"], "content": docs["content"]}
+
     # Graceful degradation
     try:
         # Would use: mcp__context7__resolve-library-id(libraryName=library_name)
         # Would use: mcp__context7__get-library-docs(context7CompatibleLibraryID=library_id, topic=topics, tokens=max_tokens)
         logger.info(f"Context7 fetch would execute for {library_name}")
-        return None  # Return None when MCP unavailable
+        lib_result = None  # None when MCP unavailable
     except Exception as e:
         logger.warning(f"Failed to fetch docs for {library_name}: {e}")
         return None
 
+    if lib_result and cache is not None:
+        cache.put(library_key(library_name, []), lib_result["library_id"])
+        metadata = {k: v for k, v in lib_result.items() if k != "content"}
+        cache.put(library_key(lib_result["library_id"], topics), lib_result["content"], metadata=metadata)
+    return lib_result
+
 
 def fetch_external_link(
     url: str,
     title: str,
-    topics: List[str]
+    topics: List[str],
+    fetcher: Optional[DocFetcher] = None
 ) -> Dict[str, Any]:
-    """Fetch external documentation link using WebFetch.
-
-    Uses: WebFetch tool
+    """Fetch external documentation link through the doc cache.
 
     Args:
         url: URL to fetch
         title: Link title from INITIAL.md
         topics: Topics for relevance filtering
+        fetcher: Shared DocFetcher (default: one over the project doc cache)
 
     Returns:
         {
             "title": "JWT Best Practices",
             "url": "https://jwt.io/introduction",
-            "content": "<fetched markdown>",
-            "relevant_sections": ["token structure", "security"]
+            "content": "<page text>",
+            "relevant_sections": ["token structure", "security"],
+            "cache_status": "cached"  # or "revalidated", "fetched", "stale"
         }
-        None if fetch fails
+        None if fetch fails and the URL is not cached
 
     Process:
-        1. WebFetch(url, prompt=f"Extract content relevant to: {topics}")
-        2. Parse and structure response
-        3. Identify relevant sections
+        1. Fresh cache entry → no request; stale entry → conditional GET (ETag/Last-Modified)
+        2. Extract page text
+        3. Identify relevant sections (topics mentioned in the page)
     """
     logger.info(f"Fetching external link: {url}")
 
-    # Graceful degradation
     try:
-        # Would use: WebFetch(url=url, prompt=f"Extract documentation relevant to: {', '.join(topics)}")
-        logger.info(f"WebFetch would execute for {url}")
-        return None  # Return None for now
+        if fetcher is None:
+            with DocCache() as cache:
+                page = DocFetcher(cache).fetch_url(url)
+        else:
+            page = fetcher.fetch_url(url)
     except Exception as e:
         logger.warning(f"Failed to fetch {url}: {e}")
         return None
 
+    lowered = page["content"].lower()
+    return {
+        "title": title,
+        "url": url,
+        "content": page["content"],
+        "relevant_sections": [topic for topic in topics if topic.lower() in lowered],
+        "cache_status": page["status"],
+    }
+
 
 # =============================================================================
 # Phase 4: Template Engine
@@ -830,7 +877,8 @@ def fetch_external_link(
 def generate_prp(
     initial_md_path: str,
     output_dir: str = "PRPs/feature-requests",
-    join_prp: Optional[str] = None
+    join_prp: Optional[str] = None,
+    timings: Optional[Dict[str, Any]] = None
 ) -> str:
     """Generate complete PRP from INITIAL.md.
 
@@ -841,6 +889,8 @@ def generate_prp(
         output_dir: Directory for output PRP file
         join_prp: Optional PRP to join (number, ID like 'PRP-12', or file path)
                   If provided, updates existing PRP's Linear issue instead of creating new
+        timings: If given, filled with the stage timings of phases 1-5
+                 ({"timings", "critical_path", "duration"}, see ce.stage_graph)
 
     Returns:
         Path to generated PRP file
@@ -852,13 +902,14 @@ def generate_prp(
 
     Process:
         1. Parse INITIAL.md → structured data
-        2. Research codebase → Serena findings
-        3. Fetch documentation → Context7 + WebFetch
-        4. Synthesize sections (TLDR, Implementation, Validation Gates, etc.)
+        2. Research codebase → Serena findings         } concurrent
+        3. Fetch documentation → Context7 + WebFetch   }
+        4. Synthesize sections (TLDR, Implementation, Validation Gates, etc.),
+           each as soon as its inputs are ready
         5. Get next PRP ID
         6. Write PRP file with YAML header
-        7. Create/update Linear issue with defaults
-        8. Update PRP YAML with issue ID
+        7. Queue Linear issue create/update in the outbox (flushed in background)
+        8. Update PRP YAML with issue ID (on join, or once the create is delivered)
         9. Check completeness
     """
     logger.info(f"Starting PRP generation from: {initial_md_path}")
@@ -878,31 +929,27 @@ def generate_prp(
                 f"🔧 Troubleshooting: Run 'ce context health' to diagnose issues"
             ) from e
 
-    # Phase 1: Parse INITIAL.md
-    parsed_data = parse_initial_md(initial_md_path)
+    # Phases 1-4: parse, research, fetch docs and synthesize sections as a
+    # dependency graph - research and docs overlap, sections start as soon
+    # as their inputs are ready
+    run = run_stage_graph(_prp_stage_graph(initial_md_path, output_dir))
+    logger.info(format_stage_timings(run))
+    if timings is not None:
+        timings.update({key: value for key, value in run.items() if key != "results"})
+
+    results = run["results"]
+    parsed_data = results["parsed"]
+    serena_research = results["research"]
+    documentation = results["documentation"]
     logger.info(f"Parsed feature: {parsed_data['feature_name']}")
-
-    # Phase 2: Research codebase
-    serena_research = research_codebase(
-        parsed_data["feature_name"],
-        parsed_data["examples"],
-        parsed_data["feature"]
-    )
     logger.info(f"Codebase research complete: {len(serena_research['patterns'])} patterns found")
-
-    # Phase 3: Fetch documentation
-    documentation = fetch_documentation(
-        parsed_data["documentation"],
-        parsed_data["feature"],
-        serena_research
-    )
     logger.info(f"Documentation fetched: {len(documentation['library_docs'])} libraries")
 
-    # Phase 4: Synthesize PRP sections
-    prp_content = synthesize_prp_content(parsed_data, serena_research, documentation)
-
-    # Get next PRP ID
-    prp_id = get_next_prp_id(output_dir)
+    prp_content = _assemble_prp_content(
+        parsed_data, serena_research, documentation,
+        {name: results[name] for name in PRP_SECTIONS}
+    )
+    prp_id = results["prp_id"]
     logger.info(f"Assigned PRP ID: {prp_id}")
 
     # Write PRP file
@@ -914,15 +961,11 @@ def generate_prp(
 
     logger.info(f"PRP generated: {output_path}")
 
-    # Step 7: Create or update Linear issue
+    # Step 7: Queue Linear issue create/update (delivered in background)
     try:
-        from .linear_utils import create_issue_with_defaults
-        from .linear_mcp_resilience import (
-            create_issue_resilient,
-            update_issue_resilient,
-            get_linear_mcp_status
-        )
+        from .linear_outbox import get_linear_dispatcher
 
+        dispatcher = get_linear_dispatcher()
         issue_identifier = None
 
         if join_prp:
@@ -935,8 +978,8 @@ def generate_prp(
                 logger.warning(f"Target PRP has no Linear issue: {target_prp_path}")
                 logger.warning("Creating new issue instead")
             else:
-                # Update existing issue with resilience + auth recovery
-                logger.info(f"Updating Linear issue: {target_issue_id}")
+                # Issue ID is known up front - the update itself is queued
+                logger.info(f"Queueing Linear issue update: {target_issue_id}")
                 result = _update_linear_issue_with_resilience(
                     target_issue_id,
                     prp_id,
@@ -946,40 +989,30 @@ def generate_prp(
 
                 if result["success"]:
                     issue_identifier = target_issue_id
-                    logger.info(f"Updated issue {target_issue_id} with {prp_id}")
+                    logger.info(f"Joined issue {target_issue_id} with {prp_id}")
                 else:
-                    logger.warning(f"Failed to update issue: {result['error']}")
+                    logger.warning(f"Failed to queue issue update: {result['error']}")
                     logger.info("Will create new issue instead")
 
-        if not issue_identifier:
-            # Create new issue with resilience + auth recovery
-            logger.info("Creating new Linear issue with resilience")
-            result = create_issue_resilient(
+        if issue_identifier:
+            _update_prp_yaml_with_issue(str(output_path), issue_identifier)
+            logger.info(f"Updated PRP YAML with issue: {issue_identifier}")
+        else:
+            # Placeholder ID until the create is delivered and returns the real one
+            _update_prp_yaml_with_issue(str(output_path), f"{prp_id}-created")
+            dispatcher.outbox.enqueue_create(
+                key=prp_id,
                 title=f"{prp_id}: {parsed_data['feature_name']}",
                 description=_generate_issue_description(prp_id, parsed_data, str(output_path)),
-                state="todo"
+                state="todo",
+                prp_path=str(output_path)
             )
+            logger.info(f"Queued Linear issue creation for {prp_id}")
 
-            if result["success"]:
-                issue_data = result.get("result", {})
-                # Extract identifier from result (when actual MCP integration added)
-                issue_identifier = issue_data.get("id") or issue_data.get("identifier") or f"{prp_id}-created"
-                logger.info(f"Created Linear issue: {issue_identifier}")
-            else:
-                logger.error(f"Linear issue creation failed: {result['error']}")
-                logger.warning("Circuit breaker state:", get_linear_mcp_status())
-                logger.warning("Continuing without Linear integration")
-
-        # Update PRP YAML with issue ID
-        if issue_identifier:
-            _update_prp_yaml_with_issue(str(output_path), issue_identifier)
-            logger.info(f"Updated PRP YAML with issue: {issue_identifier}")
+        dispatcher.flush_async()
 
-    except ImportError as e:
-        logger.warning(f"Linear resilience utils not available: {e}")
-        logger.warning("Skipping issue creation")
     except Exception as e:
-        logger.error(f"Linear issue creation failed: {e}")
+        logger.error(f"Linear issue queueing failed: {e}")
         logger.warning("Continuing without Linear integration")
 
     # Check completeness
@@ -1018,14 +1051,59 @@ def synthesize_prp_content(
     """
     logger.info("Synthesizing PRP content")
 
-    # Generate sections
-    yaml_header = _generate_yaml_header(parsed_data)
-    tldr = synthesize_tldr(parsed_data, serena_research)
-    context = synthesize_context(parsed_data, documentation)
-    implementation = synthesize_implementation(parsed_data, serena_research)
-    validation_gates = synthesize_validation_gates(parsed_data, serena_research)
-    testing = synthesize_testing_strategy(parsed_data, serena_research)
-    rollout = synthesize_rollout_plan(parsed_data)
+    sections = {
+        "yaml_header": _generate_yaml_header(parsed_data),
+        "tldr": synthesize_tldr(parsed_data, serena_research),
+        "context": synthesize_context(parsed_data, documentation),
+        "implementation": synthesize_implementation(parsed_data, serena_research),
+        "validation_gates": synthesize_validation_gates(parsed_data, serena_research),
+        "testing": synthesize_testing_strategy(parsed_data, serena_research),
+        "rollout": synthesize_rollout_plan(parsed_data),
+    }
+    return _assemble_prp_content(parsed_data, serena_research, documentation, sections)
+
+
+def _prp_stage_graph(initial_md_path: str, output_dir: str) -> Dict[str, StageSpec]:
+    """Stage graph for generate_prp phases 1-5 (see ce.stage_graph).
+
+    Documentation topics are extracted from the feature text alone, so the
+    fetch does not wait for codebase research.
+    """
+    return {
+        "parsed": ((), lambda: parse_initial_md(initial_md_path)),
+        "research": (("parsed",), lambda parsed: research_codebase(
+            parsed["feature_name"], parsed["examples"], parsed["feature"])),
+        "documentation": (("parsed",), lambda parsed: fetch_documentation(
+            parsed["documentation"], parsed["feature"], {})),
+        "yaml_header": (("parsed",), _generate_yaml_header),
+        "tldr": (("parsed", "research"), synthesize_tldr),
+        "context": (("parsed", "documentation"), synthesize_context),
+        "implementation": (("parsed", "research"), synthesize_implementation),
+        "validation_gates": (("parsed", "research"), synthesize_validation_gates),
+        "testing": (("parsed", "research"), synthesize_testing_strategy),
+        "rollout": (("parsed",), synthesize_rollout_plan),
+        "prp_id": ((), lambda: get_next_prp_id(output_dir)),
+    }
+
+
+# Synthesized PRP sections (keys of the sections dict for _assemble_prp_content)
+PRP_SECTIONS = ("yaml_header", "tldr", "context", "implementation", "validation_gates", "testing", "rollout")
+
+
+def _assemble_prp_content(
+    parsed_data: Dict[str, Any],
+    serena_research: Dict[str, Any],
+    documentation: Dict[str, Any],
+    sections: Dict[str, str]
+) -> str:
+    """Combine synthesized sections (PRP_SECTIONS keys) into PRP markdown."""
+    yaml_header = sections["yaml_header"]
+    tldr = sections["tldr"]
+    context = sections["context"]
+    implementation = sections["implementation"]
+    validation_gates = sections["validation_gates"]
+    testing = sections["testing"]
+    rollout = sections["rollout"]
 
     # Combine sections
     prp_content = f"""---
@@ -1718,7 +1796,11 @@ def _update_linear_issue_with_resilience(
     feature_name: str,
     prp_path: str
 ) -> Dict[str, Any]:
-    """Update existing Linear issue with new PRP info using resilience layer.
+    """Queue an update of an existing Linear issue with new PRP info.
+
+    The update is recorded in the Linear outbox and delivered by the
+    dispatcher through the resilience layer (circuit breaker + retry +
+    auth recovery); pending updates to the same issue are coalesced.
 
     Args:
         issue_id: Linear issue identifier (e.g., "BLA-24")
@@ -1727,16 +1809,24 @@ def _update_linear_issue_with_resilience(
         prp_path: Path to new PRP file
 
     Returns:
-        Result dict from update_issue_resilient with success/error status
-
-    Process:
-        1. Generate update text for new PRP
-        2. Call update_issue_resilient with auth recovery
-        3. Return detailed result with success status
+        {"success": bool, "method": "queued" | "not_supported", "operation_id": int | None,
+         "error": str | None}
+        Nothing is queued ("not_supported") while the dispatcher has no
+        update handler - such updates could never be delivered.
     """
-    from .linear_mcp_resilience import update_issue_resilient
+    from .linear_outbox import get_linear_dispatcher
 
-    logger.info(f"Updating Linear issue {issue_id} with {prp_id}")
+    dispatcher = get_linear_dispatcher()
+    if dispatcher.update_fn is None:
+        logger.warning(f"Linear issue updates not supported - not queueing {issue_id} update")
+        return {
+            "success": False,
+            "method": "not_supported",
+            "operation_id": None,
+            "error": "Linear issue updates are not supported yet (no Linear MCP update handler)"
+        }
+
+    logger.info(f"Queueing Linear issue {issue_id} update with {prp_id}")
 
     update_text = f"""
 
@@ -1749,15 +1839,15 @@ def _update_linear_issue_with_resilience(
 This PRP is related to the same feature/initiative.
 """
 
-    # Call with resilience + auth recovery
-    result = update_issue_resilient(issue_id, update_text)
-
-    if result["success"]:
-        logger.info(f"Successfully updated issue {issue_id}")
-    else:
-        logger.warning(f"Failed to update issue: {result['error']}")
+    try:
+        op_id = dispatcher.outbox.enqueue_update(
+            issue_id, update_text, prp_path=prp_path
+        )
+    except Exception as e:
+        logger.warning(f"Failed to queue issue update: {e}")
+        return {"success": False, "method": "queued", "operation_id": None, "error": str(e)}
 
-    return result
+    return {"success": True, "method": "queued", "operation_id": op_id, "error": None}
 
 
 def _generate_issue_description(
@@ -1850,5 +1940,7 @@ def _update_prp_yaml_with_issue(prp_path: str, issue_id: str) -> None:
     # Replace YAML block in content
     updated_content = content.replace(yaml_block, updated_yaml)
 
-    # Write back to file
-    Path(prp_path).write_text(updated_content, encoding="utf-8")
+    # Write back atomically (may run on the Linear outbox flush thread)
+    tmp_path = Path(f"{prp_path}.tmp")
+    tmp_path.write_text(updated_content, encoding="utf-8")
+    tmp_path.replace(prp_path)
@@ -0,0 +1,375 @@
+"""Test impact analysis: run only the tests affected by a change.
+
+Maps each test file under tools/tests/ to the modules it imports
+(transitively, via the AST import graph) and, when a coverage data file
+with per-test contexts is present (pytest --cov-context=test), to the
+source files it executed. Changes are found by diffing a content snapshot
+of tools/ against the snapshot recorded at the last green run
+(.ce/test-impact.json).
+
+A full run is selected when there is no green state yet, when the last
+full run is older than FULL_RUN_INTERVAL, when forced, or when a change
+cannot be attributed to tests (conftest.py, pyproject.toml, deleted
+modules, non-Python files outside tests/fixtures/, and modules no test
+reaches, such as the ce/__main__.py entry point that tests only run
+through a subprocess).
+
+Example:
+    selector = ImpactSelector(Path("tools"))
+    selection = selector.select()
+    if selection["mode"] != "none":
+        ...run pytest on selection["tests"]...
+    selector.record_green(selection)  # After the selected tests pass
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import shlex
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from .import_graph import ImportGraph
+
+logger = logging.getLogger(__name__)
+
+STATE_VERSION = 1
+FULL_RUN_INTERVAL = 24 * 3600  # Seconds between scheduled full runs
+
+# Top-level tools/ files that affect every test
+_GLOBAL_FILES = ("pyproject.toml", "uv.lock")
+_SOURCE_DIRS = ("ce", "tests")
+
+_FAILED_RE = re.compile(r"^(?:FAILED|ERROR) (\S+?\.py(?:::\S+)?)", re.MULTILINE)
+
+
+def find_tools_dir(start: Optional[Path] = None) -> Optional[Path]:
+    """Directory holding ce/ and tests/ (cwd or cwd/tools), or None."""
+    cwd = Path(start or Path.cwd()).resolve()
+    for candidate in (cwd, cwd / "tools"):
+        if (candidate / "ce").is_dir() and (candidate / "tests").is_dir():
+            return candidate
+    return None
+
+
+class ImpactSelector:
+    """Select tests affected by changes since the last green run.
+
+    Attributes:
+        tools_dir: Directory holding ce/ and tests/
+        state_path: Green-run state file
+    """
+
+    def __init__(
+        self,
+        tools_dir: Path,
+        state_path: Optional[Path] = None,
+        coverage_file: Optional[Path] = None,
+        full_run_interval: int = FULL_RUN_INTERVAL
+    ):
+        """Initialize selector.
+
+        Args:
+            tools_dir: Directory holding ce/ and tests/
+            state_path: State file (default: <project>/.ce/test-impact.json)
+            coverage_file: Coverage data with test contexts (default: tools/.coverage)
+            full_run_interval: Seconds after which a full run is scheduled
+        """
+        self.tools_dir = Path(tools_dir).resolve()
+        project_root = self.tools_dir.parent if self.tools_dir.name == "tools" else self.tools_dir
+        self.state_path = Path(state_path) if state_path else project_root / ".ce" / "test-impact.json"
+        self.coverage_file = Path(coverage_file) if coverage_file else self.tools_dir / ".coverage"
+        self.full_run_interval = full_run_interval
+
+    # ------------------------------------------------------------------
+    # Snapshots and state
+    # ------------------------------------------------------------------
+
+    def snapshot(self, previous: Optional[Dict[str, Dict]] = None) -> Dict[str, Dict[str, Any]]:
+        """Content snapshot of ce/, tests/ and global config files.
+
+        Files whose size and mtime match previous reuse its hash (stat only).
+
+        Args:
+            previous: Earlier snapshot to reuse hashes from
+
+        Returns:
+            {relative_path: {"size", "mtime_ns", "sha256"}}
+        """
+        previous = previous or {}
+        snapshot = {}
+        for path in self._source_files():
+            rel = path.relative_to(self.tools_dir).as_posix()
+            st = path.stat()
+            old = previous.get(rel)
+            if old and old["size"] == st.st_size and old["mtime_ns"] == st.st_mtime_ns:
+                snapshot[rel] = old
+                continue
+            snapshot[rel] = {
+                "size": st.st_size,
+                "mtime_ns": st.st_mtime_ns,
+                "sha256": hashlib.sha256(path.read_bytes()).hexdigest(),
+            }
+        return snapshot
+
+    def load_state(self) -> Dict[str, Any]:
+        """Green-run state ({} if missing, unreadable or from another version)."""
+        try:
+            state = json.loads(self.state_path.read_text())
+        except (OSError, ValueError):
+            return {}
+        return state if state.get("version") == STATE_VERSION else {}
+
+    def record_green(self, selection: Dict[str, Any]) -> None:
+        """Record the current tree as green after the selected tests passed.
+
+        Args:
+            selection: Result of select() that was run successfully
+        """
+        state = self.load_state()
+        files = selection.get("_snapshot") or self.snapshot(state.get("files"))
+        state.update({"version": STATE_VERSION, "files": files, "last_green": time.time()})
+        if selection["mode"] == "full":
+            state["last_full"] = time.time()
+        try:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            self.state_path.write_text(json.dumps(state))
+        except OSError as e:
+            logger.warning(f"Could not record green test state: {e}")
+
+    @staticmethod
+    def diff(old: Dict[str, Dict], new: Dict[str, Dict]) -> Dict[str, List[str]]:
+        """Added, modified and deleted paths between two snapshots."""
+        return {
+            "added": sorted(set(new) - set(old)),
+            "modified": sorted(p for p in set(new) & set(old) if new[p]["sha256"] != old[p]["sha256"]),
+            "deleted": sorted(set(old) - set(new)),
+        }
+
+    # ------------------------------------------------------------------
+    # Selection
+    # ------------------------------------------------------------------
+
+    def select(self, force_full: bool = False) -> Dict[str, Any]:
+        """Choose the tests to run.
+
+        Args:
+            force_full: Run every test regardless of changes
+
+        Returns:
+            Dict with:
+                mode: "full", "impacted" or "none" (only when nothing changed)
+                reason: Why this mode was chosen
+                tests: Test files relative to tools_dir (["tests"] for full)
+                changed: Changed paths since the last green run
+                rationale: {test_file: [changed paths that select it]}
+        """
+        state = self.load_state()
+        current = self.snapshot(state.get("files"))
+
+        if force_full:
+            return self._full("forced", [], current)
+        if not state.get("files"):
+            return self._full("no green run recorded", [], current)
+
+        changes = self.diff(state["files"], current)
+        changed = changes["added"] + changes["modified"] + changes["deleted"]
+
+        last_full = state.get("last_full", 0)
+        if time.time() - last_full > self.full_run_interval:
+            return self._full(f"scheduled (last full run over {self.full_run_interval // 3600}h ago)", changed, current)
+
+        if not changed:
+            return {"mode": "none", "reason": "no changes since last green run", "tests": [],
+                    "changed": [], "rationale": {}, "_snapshot": current}
+
+        if changes["deleted"]:
+            return self._full(f"deleted files: {', '.join(changes['deleted'])}", changed, current)
+
+        rationale = self.impacted_tests(changed)
+        if not rationale:
+            return self._full("change not attributable to tests (config, conftest, data or "
+                              "a module no test imports)", changed, current)
+
+        return {
+            "mode": "impacted",
+            "reason": f"{len(rationale)} test file(s) affected by {len(changed)} changed file(s)",
+            "tests": sorted(rationale),
+            "changed": changed,
+            "rationale": rationale,
+            "_snapshot": current,
+        }
+
+    def impacted_tests(self, changed: Iterable[str]) -> Optional[Dict[str, List[str]]]:
+        """Map changed tools-relative paths to the test files they affect.
+
+        Args:
+            changed: Changed paths relative to tools_dir
+
+        Returns:
+            {test_file: [causes]}, or None if a change requires a full run
+            (including a changed module that no test imports or executed)
+        """
+        graph = self._import_graph()
+        module_of = {path.resolve(): name for name, paths in graph.modules.items() for path in paths}
+        tests = {name: path for path, name in module_of.items() if self._is_test_file(path)}
+        coverage_map = self._coverage_map()
+        rationale: Dict[str, Set[str]] = {}
+
+        for rel in changed:
+            path = (self.tools_dir / rel).resolve()
+            if rel in _GLOBAL_FILES or path.name == "conftest.py":
+                return None
+
+            if rel.startswith("tests/fixtures/"):
+                # Data file: tests that mention it by name
+                hits = [p for p in tests.values() if path.name in p.read_text(errors="ignore")]
+                if not hits:
+                    return None
+                for test_path in hits:
+                    rationale.setdefault(self._rel(test_path), set()).add(rel)
+                continue
+
+            module = module_of.get(path)
+            if module is None:
+                return None  # Non-Python file under ce/ or tests/
+
+            hits = [self._rel(tests[dependent]) for dependent in self._dependents(graph, module) | {module}
+                    if dependent in tests]
+            hits.extend(coverage_map.get(rel, ()))
+            if not hits:
+                return None  # Entry point or dead module: nothing attributable covers it
+            for test_rel in hits:
+                rationale.setdefault(test_rel, set()).add(rel)
+
+        return {test: sorted(causes) for test, causes in rationale.items()}
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _full(self, reason: str, changed: List[str], current: Dict) -> Dict[str, Any]:
+        return {"mode": "full", "reason": reason, "tests": ["tests"], "changed": changed,
+                "rationale": {}, "_snapshot": current}
+
+    def _source_files(self) -> List[Path]:
+        files = [self.tools_dir / name for name in _GLOBAL_FILES if (self.tools_dir / name).is_file()]
+        for top in _SOURCE_DIRS:
+            for dirpath, dirnames, filenames in os.walk(self.tools_dir / top):
+                dirnames[:] = [d for d in dirnames if d != "__pycache__" and not d.startswith(".")]
+                files.extend(Path(dirpath) / f for f in filenames if not f.endswith(".pyc"))
+        return sorted(files)
+
+    def _import_graph(self) -> ImportGraph:
+        # Rebuilt per call (import_graph caches file scans by content hash)
+        py_files = [p for p in self._source_files() if p.suffix == ".py"]
+        return ImportGraph(self.tools_dir, py_files)
+
+    @staticmethod
+    def _dependents(graph: ImportGraph, module: str) -> Set[str]:
+        """Modules that import module directly or transitively."""
+        seen: Set[str] = set()
+        stack = [module]
+        while stack:
+            for importer in graph.importers(stack.pop()):
+                if importer not in seen:
+                    seen.add(importer)
+                    stack.append(importer)
+        return seen
+
+    def _is_test_file(self, path: Path) -> bool:
+        rel = path.relative_to(self.tools_dir)
+        return rel.parts[0] == "tests" and path.name.startswith("test_")
+
+    def _rel(self, path: Path) -> str:
+        return path.relative_to(self.tools_dir).as_posix()
+
+    def _coverage_map(self) -> Dict[str, Set[str]]:
+        """{source file: test files that executed it} from coverage contexts (optional)."""
+        if not self.coverage_file.is_file():
+            return {}
+        try:
+            from coverage import CoverageData
+        except ImportError:
+            return {}
+
+        mapping: Dict[str, Set[str]] = {}
+        try:
+            data = CoverageData(basename=str(self.coverage_file))
+            data.read()
+            for measured in data.measured_files():
+                try:
+                    rel = Path(measured).resolve().relative_to(self.tools_dir).as_posix()
+                except ValueError:
+                    continue
+                for contexts in data.contexts_by_lineno(measured).values():
+                    for context in contexts:
+                        test_file = context.split("::", 1)[0]
+                        if test_file.startswith("tests/"):
+                            mapping.setdefault(rel, set()).add(test_file)
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable coverage data {self.coverage_file}: {e}")
+            return {}
+        return mapping
+
+
+def failed_test_ids(output: str) -> List[str]:
+    """Node ids from pytest FAILED/ERROR summary lines (in order, unique)."""
+    return list(dict.fromkeys(_FAILED_RE.findall(output)))
+
+
+def narrow_pytest_command(command: str, test_ids: List[str]) -> Optional[str]:
+    """Rewrite a pytest command to run only test_ids.
+
+    Positional test paths are replaced; options are kept. Test ids outside
+    the original paths are dropped.
+
+    Args:
+        command: Validation command (e.g. "uv run pytest tests/ -v")
+        test_ids: Test files or node ids to run
+
+    Returns:
+        Narrowed command, or None if command is not a pytest invocation or
+        nothing is left to select
+    """
+    try:
+        tokens = shlex.split(command)
+    except ValueError:
+        return None
+    if any(token in ("&&", "||", ";", "|") for token in tokens):
+        return None
+
+    pytest_at = next(
+        (i for i, token in enumerate(tokens) if Path(token).name in ("pytest", "py.test")
+         or (token == "pytest" and i > 0 and tokens[i - 1] == "-m")),
+        None,
+    )
+    if pytest_at is None:
+        return None
+
+    head, args = tokens[:pytest_at + 1], tokens[pytest_at + 1:]
+    options, paths = [], []
+    takes_value = {"-k", "-m", "-p", "-c", "-o", "--rootdir", "--maxfail", "--tb", "--deselect", "--ignore"}
+    i = 0
+    while i < len(args):
+        token = args[i]
+        if token.startswith("-"):
+            options.append(token)
+            if token in takes_value and i + 1 < len(args):
+                options.append(args[i + 1])
+                i += 1
+        else:
+            paths.append(token.rstrip("/"))
+        i += 1
+
+    def in_scope(test_id: str) -> bool:
+        file_part = test_id.split("::", 1)[0]
+        return not paths or any(file_part == p or file_part.startswith(p + "/") for p in paths)
+
+    selected = [t for t in test_ids if in_scope(t)]
+    if not selected:
+        return None
+    return " ".join(shlex.quote(t) for t in head + options + selected)
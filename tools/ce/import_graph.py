@@ -0,0 +1,338 @@
+"""AST-based Python module import graph.
+
+Parses every Python file once (cached by content hash, in memory and on
+disk under .ce/cache/import-graph/) into its import statements, top-level
+definitions and used identifiers, then builds a module → imported modules
+graph. Handles `import a.b`, `from a.b import c` (c may be a submodule),
+relative imports and `__init__` re-exports.
+
+Reachability is computed from entry points:
+    - pyproject.toml [project.scripts] / [project.gui-scripts] targets
+    - test files (test_*.py, *_test.py, conftest.py)
+    - __main__.py files and scripts with an `if __name__ == "__main__"` guard
+
+Module names follow package structure: a file's name is its path from the
+first ancestor directory without __init__.py (tools/ce/core.py → ce.core).
+"""
+
+import ast
+import hashlib
+import logging
+import os
+from collections import OrderedDict, deque
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+try:
+    import tomllib  # Python 3.11+
+except ImportError:
+    import tomli as tomllib  # Fallback for Python 3.10
+
+from .prp_sections import read_disk_cache, write_disk_cache
+
+logger = logging.getLogger(__name__)
+
+# Directories never scanned for Python sources
+PRUNED_DIRS = {
+    ".git", "node_modules", "__pycache__", ".venv", "venv", ".tox",
+    ".mypy_cache", ".pytest_cache", "build", "dist", ".eggs"
+}
+
+# Bump when _scan_source() output changes (invalidates on-disk entries)
+SCAN_CACHE_VERSION = 1
+_CACHE_KIND = "import-graph"
+_MEMORY_CACHE_SIZE = 4096
+_memory_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+
+def iter_python_files(root: Path) -> Iterable[Path]:
+    """Yield *.py files under root, pruning VCS, dependency and cache dirs."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [
+            d for d in dirnames
+            if d not in PRUNED_DIRS and not d.endswith(".egg-info")
+        ]
+        for filename in filenames:
+            if filename.endswith(".py"):
+                yield Path(dirpath) / filename
+
+
+def scan_file(path: Path) -> Dict[str, Any]:
+    """Extract imports, definitions and used names from one file (cached).
+
+    Returns:
+        {
+            "imports": [[module, level, names_or_None], ...],  # None = plain import
+            "defs": [top-level function/class names],
+            "uses": [identifiers loaded or accessed as attributes],
+            "main_guard": bool
+        }
+        Files that fail to parse yield empty lists.
+    """
+    try:
+        source = path.read_bytes()
+    except OSError as e:
+        logger.debug(f"Cannot read {path}: {e}")
+        return _empty_scan()
+
+    content_hash = hashlib.sha256(source).hexdigest()
+    if content_hash in _memory_cache:
+        _memory_cache.move_to_end(content_hash)
+        return _memory_cache[content_hash]
+
+    cache_key = f"{content_hash}-v{SCAN_CACHE_VERSION}"
+    data = read_disk_cache(_CACHE_KIND, cache_key)
+    if data is None:
+        data = _scan_source(source, path)
+        write_disk_cache(_CACHE_KIND, cache_key, data)
+
+    _memory_cache[content_hash] = data
+    if len(_memory_cache) > _MEMORY_CACHE_SIZE:
+        _memory_cache.popitem(last=False)
+    return data
+
+
+def _empty_scan() -> Dict[str, Any]:
+    return {"imports": [], "defs": [], "uses": [], "main_guard": False}
+
+
+def _scan_source(source: bytes, path: Path) -> Dict[str, Any]:
+    try:
+        tree = ast.parse(source, filename=str(path))
+    except (SyntaxError, ValueError) as e:
+        logger.debug(f"Skipping unparsable {path}: {e}")
+        return _empty_scan()
+
+    imports: List[List[Any]] = []
+    uses: Set[str] = set()
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imports.extend([alias.name, 0, None] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            imports.append([node.module or "", node.level, [a.name for a in node.names]])
+        elif isinstance(node, ast.Name) and not isinstance(node.ctx, ast.Store):
+            uses.add(node.id)
+        elif isinstance(node, ast.Attribute):
+            uses.add(node.attr)
+        elif isinstance(node, ast.Constant) and isinstance(node.value, str) and node.value.isidentifier():
+            uses.add(node.value)  # __all__ entries, getattr(obj, "name"), registries
+
+    defs = [
+        node.name for node in tree.body
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
+    ]
+    main_guard = any(_is_main_guard(node) for node in tree.body)
+
+    return {"imports": imports, "defs": defs, "uses": sorted(uses), "main_guard": main_guard}
+
+
+def _is_main_guard(node: ast.stmt) -> bool:
+    """True for `if __name__ == "__main__":`."""
+    if not isinstance(node, ast.If) or not isinstance(node.test, ast.Compare):
+        return False
+    operands = [node.test.left, *node.test.comparators]
+    names = {o.id for o in operands if isinstance(o, ast.Name)}
+    values = {o.value for o in operands if isinstance(o, ast.Constant)}
+    return "__name__" in names and "__main__" in values
+
+
+def module_name(path: Path, package_dirs: Set[Path]) -> str:
+    """Dotted module name for path given the set of directories with __init__.py."""
+    parts = [] if path.stem == "__init__" else [path.stem]
+    directory = path.parent
+    while directory in package_dirs:
+        parts.insert(0, directory.name)
+        directory = directory.parent
+    return ".".join(parts) or path.stem
+
+
+class ImportGraph:
+    """Module import graph with entry-point reachability.
+
+    Example:
+        graph = ImportGraph(Path("."))
+        for module in graph.unreachable_modules():
+            print(module, graph.modules[module])
+
+    Attributes:
+        root: Project root
+        modules: {module_name: [paths]} (names can collide across source roots)
+        edges: {module_name: {imported module names}}
+        entry_points: Module names reachability starts from
+    """
+
+    def __init__(self, root: Path, files: Optional[Iterable[Path]] = None):
+        """Build graph.
+
+        Args:
+            root: Project root (pyproject.toml files are found under it)
+            files: Python files to include (default: iter_python_files(root))
+        """
+        self.root = Path(root)
+        paths = sorted(files if files is not None else iter_python_files(self.root))
+        package_dirs = {p.parent for p in paths if p.name == "__init__.py"}
+
+        self.modules: Dict[str, List[Path]] = {}
+        self.scans: Dict[str, Dict[str, Any]] = {}
+        self._is_package: Dict[str, bool] = {}
+        for path in paths:
+            name = module_name(path, package_dirs)
+            self.modules.setdefault(name, []).append(path)
+            self._is_package[name] = path.name == "__init__.py"
+
+        self.edges: Dict[str, Set[str]] = {}
+        self._imported_names: Dict[str, Set[str]] = {}
+        self._star_imported: Set[str] = set()
+        self.entry_points: Set[str] = set()
+
+        for name, module_paths in self.modules.items():
+            targets: Set[str] = set()
+            for path in module_paths:
+                scan = scan_file(path)
+                self.scans[str(path)] = scan
+                for module, level, names in scan["imports"]:
+                    targets |= self._resolve(name, module, level, names)
+                if self._is_entry_file(path, scan):
+                    self.entry_points.add(name)
+            targets.discard(name)
+            self.edges[name] = targets
+
+        self.entry_points |= self._pyproject_entry_points()
+        self._reachable: Optional[Set[str]] = None
+        self._reverse: Optional[Dict[str, Set[str]]] = None
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def reachable(self) -> Set[str]:
+        """Modules reachable from any entry point (BFS, cached)."""
+        if self._reachable is None:
+            seen = set(self.entry_points)
+            queue = deque(seen)
+            while queue:
+                for target in self.edges.get(queue.popleft(), ()):
+                    if target not in seen:
+                        seen.add(target)
+                        queue.append(target)
+            self._reachable = seen
+        return self._reachable
+
+    def unreachable_modules(self) -> List[str]:
+        """Modules not reachable from any entry point (sorted)."""
+        reachable = self.reachable()
+        return sorted(name for name in self.modules if name not in reachable)
+
+    def importers(self, module: str) -> Set[str]:
+        """Modules that import module directly."""
+        if self._reverse is None:
+            self._reverse = {}
+            for name, targets in self.edges.items():
+                for target in targets:
+                    self._reverse.setdefault(target, set()).add(name)
+        return self._reverse.get(module, set())
+
+    def unreferenced_symbols(self) -> Dict[str, List[str]]:
+        """Top-level definitions never imported, accessed or used anywhere.
+
+        A symbol counts as referenced if another module imports it by name,
+        any module star-imports its module, or its identifier is used
+        anywhere (name, attribute or string constant). Conservative by
+        design: identifiers shared across modules keep each other alive.
+        Entry-point modules are skipped (their runner calls their defs).
+
+        Returns:
+            {module_name: [unreferenced symbol names]} for modules that have any
+        """
+        used: Set[str] = set()
+        for scan in self.scans.values():
+            used.update(scan["uses"])
+
+        result = {}
+        for name, module_paths in self.modules.items():
+            if name in self._star_imported or name in self.entry_points:
+                continue
+            imported = self._imported_names.get(name, set())
+            unreferenced = sorted({
+                symbol
+                for path in module_paths
+                for symbol in self.scans[str(path)]["defs"]
+                if symbol not in used and symbol not in imported and not symbol.startswith("__")
+            })
+            if unreferenced:
+                result[name] = unreferenced
+        return result
+
+    # ------------------------------------------------------------------
+    # Construction helpers
+    # ------------------------------------------------------------------
+
+    def _resolve(self, importer: str, module: str, level: int,
+                 names: Optional[List[str]]) -> Set[str]:
+        """Known modules an import statement loads (including parent packages)."""
+        if level:
+            package = importer if self._is_package.get(importer) else importer.rpartition(".")[0]
+            for _ in range(level - 1):
+                package = package.rpartition(".")[0]
+            base = ".".join(p for p in (package, module) if p)
+        else:
+            base = module
+
+        targets = {prefix for prefix in _prefixes(base) if prefix in self.modules}
+        for symbol in names or ():
+            if symbol == "*":
+                self._star_imported.add(base)
+                continue
+            submodule = f"{base}.{symbol}" if base else symbol
+            if submodule in self.modules:
+                targets.add(submodule)
+            else:
+                self._imported_names.setdefault(base, set()).add(symbol)
+        return targets
+
+    @staticmethod
+    def _is_entry_file(path: Path, scan: Dict[str, Any]) -> bool:
+        name = path.name
+        return (
+            name == "__main__.py"
+            or name == "conftest.py"
+            or (name.startswith("test_") or name.endswith("_test.py"))
+            or scan["main_guard"]
+        )
+
+    def _pyproject_entry_points(self) -> Set[str]:
+        """Modules named by console/gui script entry points in pyproject.toml files."""
+        entries: Set[str] = set()
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [d for d in dirnames if d not in PRUNED_DIRS and not d.startswith(".")]
+            if "pyproject.toml" not in filenames:
+                continue
+            try:
+                with open(Path(dirpath) / "pyproject.toml", "rb") as f:
+                    data = tomllib.load(f)
+            except (OSError, tomllib.TOMLDecodeError) as e:
+                logger.debug(f"Skipping pyproject.toml in {dirpath}: {e}")
+                continue
+
+            project = data.get("project", {})
+            scripts = {
+                **project.get("scripts", {}),
+                **project.get("gui-scripts", {}),
+                **data.get("tool", {}).get("poetry", {}).get("scripts", {})
+            }
+            for target in scripts.values():
+                if isinstance(target, str):
+                    entries.add(target.split(":")[0].strip())
+        return {e for e in entries if e in self.modules}
+
+
+def _prefixes(dotted: str) -> List[str]:
+    """["a", "a.b", "a.b.c"] for "a.b.c"."""
+    parts = dotted.split(".") if dotted else []
+    return [".".join(parts[:i]) for i in range(1, len(parts) + 1)]
+
+
+def clear_cache() -> None:
+    """Drop in-memory scan cache (on-disk cache is content-addressed)."""
+    _memory_cache.clear()
@@ -20,6 +20,10 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from ce.snapshot import Snapshot, replace_path
+
+# User-owned paths the blend phase rewrites (snapshotted, restored on failure)
+BLEND_SNAPSHOT_PATHS = [".serena", ".serena.old", ".claude", "CLAUDE.md"]
 
 @dataclass
 class ValidationResult:
@@ -593,6 +597,10 @@ class ProjectInitializer:
 
         Delegates to: uv run ce blend --all --target-dir <target>
 
+        User files the blend rewrites (BLEND_SNAPSHOT_PATHS) are snapshotted
+        first - reflink clones where the filesystem supports them - and
+        restored if the blend fails.
+
         Returns:
             Dict with blend status and stdout/stderr
         """
@@ -603,6 +611,39 @@ class ProjectInitializer:
             status["stdout"] = f"[DRY-RUN] Would run: uv run ce blend --all --target-dir {self.target_project}"
             return status
 
+        try:
+            snapshot = Snapshot.take(
+                self.target_project,
+                BLEND_SNAPSHOT_PATHS,
+                self.target_project / ".ce.blend-snapshot",
+            )
+        except OSError as e:
+            status["message"] = (
+                f"❌ Failed to snapshot user files before blend: {e}\n"
+                f"🔧 Check disk space and permissions in {self.target_project}"
+            )
+            return status
+
+        self._run_blend(status)
+
+        if status["success"]:
+            snapshot.discard()
+            return status
+
+        try:
+            snapshot.restore()
+            status["message"] += "\n♻️  Restored user files from pre-blend snapshot"
+        except OSError as e:
+            status["message"] += (
+                f"\n⚠️ Failed to restore pre-blend snapshot: {e}\n"
+                f"🔧 Manual recovery: copy files back from {snapshot.snapshot_dir}"
+            )
+        if self.error_logger:
+            self.error_logger.error(status["message"])
+        return status
+
+    def _run_blend(self, status: Dict) -> Dict:
+        """Run the blend command and GATE 3, filling in status."""
         try:
             # Run blend command with explicit config path
             blend_config = self.ce_dir / "blend-config.yml"
@@ -852,9 +893,9 @@ class ProjectInitializer:
                 if self.error_logger:
                     self.error_logger.info(f"Removed partial .ce/ directory")
 
-            # Restore from backup if it exists
+            # Restore from backup if it exists (a rename on the same filesystem)
             if self.backup_dir and self.backup_dir.exists():
-                shutil.move(str(self.backup_dir), str(self.ce_dir))
+                replace_path(self.backup_dir, self.ce_dir)
                 print(f"✓ Restored .ce/ from backup")
                 if self.error_logger:
                     self.error_logger.info(f"Restored .ce/ from {self.backup_dir}")
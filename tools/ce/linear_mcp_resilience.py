@@ -8,7 +8,8 @@ Ensures Linear MCP within Syntropy calls handles authentication failures gracefu
 
 Design:
 - Circuit breaker prevents repeated auth attempts after threshold
-- Retry with exponential backoff (1s, 2s, 4s)
+- Retry with full-jitter exponential backoff (up to 1s, 2s, 4s)
+- Bulkhead caps concurrent Linear calls (e.g. from the outbox dispatcher)
 - Detailed error messages with troubleshooting guidance
 - No silent failures - all auth issues surfaced
 """
@@ -18,7 +19,13 @@ from typing import Callable, Any, Optional, Dict
 from pathlib import Path
 from datetime import datetime
 
-from ce.resilience import CircuitBreaker, retry_with_backoff, CircuitBreakerOpenError
+from ce.resilience import (
+    Bulkhead,
+    BulkheadFullError,
+    CircuitBreaker,
+    CircuitBreakerOpenError,
+    retry_with_backoff
+)
 from ce.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -37,6 +44,13 @@ auth_recovery_breaker = CircuitBreaker(
     recovery_timeout=600  # 10 minutes between recovery attempts
 )
 
+# Concurrency limit for Linear MCP calls; excess callers queue, then fail fast
+linear_bulkhead = Bulkhead(
+    name="linear-mcp",
+    max_concurrent=4,
+    max_queue=64
+)
+
 # Auth cache to avoid repeated resets
 _auth_reset_cache: Dict[str, datetime] = {}
 AUTH_RESET_COOLDOWN = 60  # Minimum seconds between auth resets
@@ -132,7 +146,8 @@ def _reset_linear_mcp_auth() -> bool:
     max_attempts=3,
     base_delay=1.0,
     max_delay=10.0,
-    exceptions=(RuntimeError, ConnectionError, IOError, OSError)
+    exceptions=(RuntimeError, ConnectionError, IOError, OSError),
+    jitter=True
 )
 def _call_linear_mcp_with_retry(func: Callable, *args, **kwargs) -> Any:
     """Call Linear MCP function with retry logic.
@@ -228,22 +243,15 @@ def call_linear_mcp_resilient(
     recovery_attempted = False
 
     try:
-        # Check circuit breaker
-        if linear_breaker.state == "open":
-            if not linear_breaker._should_attempt_reset():
-                raise CircuitBreakerOpenError(
-                    f"Circuit breaker '{linear_breaker.name}' is OPEN\n"
-                    f"Failures: {linear_breaker.failure_count}/{linear_breaker.failure_threshold}\n"
-                    f"🔧 Troubleshooting: Wait {linear_breaker.recovery_timeout}s or check Linear service health"
-                )
-            # Attempt recovery from half-open state
-            linear_breaker._transition_to_half_open()
+        # Check circuit breaker (moves open → half_open after recovery timeout)
+        linear_breaker.before_call()
 
         # Call with retry + auth recovery
         attempt = 1
         try:
-            result = _call_linear_mcp_with_retry(func, *args, **kwargs)
-            linear_breaker._on_success()
+            with linear_bulkhead.slot():
+                result = _call_linear_mcp_with_retry(func, *args, **kwargs)
+            linear_breaker.record_success()
 
             return {
                 "success": True,
@@ -260,8 +268,9 @@ def call_linear_mcp_resilient(
                 recovery_attempted = True
                 attempt += 1
                 logger.info(f"Retrying after auth recovery (attempt {attempt})")
-                result = _call_linear_mcp_with_retry(func, *args, **kwargs)
-                linear_breaker._on_success()
+                with linear_bulkhead.slot():
+                    result = _call_linear_mcp_with_retry(func, *args, **kwargs)
+                linear_breaker.record_success()
 
                 return {
                     "success": True,
@@ -274,7 +283,7 @@ def call_linear_mcp_resilient(
             raise
 
     except CircuitBreakerOpenError as e:
-        linear_breaker._on_failure()
+        # Rejections don't count as failures (would keep the circuit open forever)
         logger.error(f"Circuit breaker open: {e}")
 
         return {
@@ -286,8 +295,22 @@ def call_linear_mcp_resilient(
             "recovery_attempted": False
         }
 
+    except BulkheadFullError as e:
+        # Local saturation, not a Linear failure - only give back the admission
+        linear_breaker.release_call()
+        logger.warning(f"Linear MCP bulkhead full: {e}")
+
+        return {
+            "success": False,
+            "result": None,
+            "method": "bulkhead_full",
+            "attempts": attempt,
+            "error": str(e),
+            "recovery_attempted": False
+        }
+
     except Exception as e:
-        linear_breaker._on_failure()
+        linear_breaker.record_failure()
         error_msg = str(e)
 
         logger.error(f"Linear MCP operation failed: {error_msg}")
@@ -396,6 +419,7 @@ def get_linear_mcp_status() -> Dict[str, Any]:
             "failure_count": N,
             "last_auth_reset": "ISO timestamp or null",
             "auth_reset_available": True/False,
+            "bulkhead": {"active", "waiting", "admitted", "rejected", ...},
             "diagnostics": "..."
         }
     """
@@ -405,6 +429,7 @@ def get_linear_mcp_status() -> Dict[str, Any]:
         "failure_count": linear_breaker.failure_count,
         "last_auth_reset": _auth_reset_cache.get("linear_mcp_last_reset"),
         "auth_reset_available": _can_reset_auth(),
+        "bulkhead": linear_bulkhead.snapshot(),
         "diagnostics": f"Circuit state: {linear_breaker.state}, "
                       f"Failures: {linear_breaker.failure_count}/{linear_breaker.failure_threshold}"
     }
@@ -0,0 +1,457 @@
+"""Durable outbox and batched dispatcher for Linear issue operations.
+
+Issue creates and updates are recorded in a small SQLite queue under .ce/
+instead of being sent inline, so PRP generation never blocks on Linear
+latency and work survives an open circuit breaker or a crashed process.
+
+LinearDispatcher drains the queue with bounded parallelism:
+- Updates to the same issue are coalesced into one call (descriptions
+  appended in enqueue order, last explicit state wins)
+- Every call goes through call_linear_mcp_resilient (linear_breaker +
+  retry_with_backoff + auth recovery)
+- Calls rejected by an open breaker or a full bulkhead stay pending without
+  using an attempt; real failures count attempts and are parked as "dead"
+  after max_attempts
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_OUTBOX_PATH = ".ce/linear-outbox.db"
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_MAX_WORKERS = 4
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS operations (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    issue_key TEXT NOT NULL,
+    payload_json TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    result_json TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_operations_status ON operations(status, id);
+"""
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class LinearOutbox:
+    """SQLite queue of pending Linear issue operations.
+
+    Example:
+        outbox = LinearOutbox()
+        outbox.enqueue_update("BLA-24", "\\n## Related: PRP-15 ...")
+        LinearDispatcher(outbox).flush()
+
+    Attributes:
+        db_path: SQLite file path, or ":memory:" when not in a CE project
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        """Open (or create) the outbox.
+
+        Args:
+            db_path: Queue location (default: .ce/linear-outbox.db if .ce/
+                exists in the current directory, in-memory otherwise)
+        """
+        if db_path is None:
+            db_path = DEFAULT_OUTBOX_PATH if Path(".ce").is_dir() else ":memory:"
+
+        self.db_path = db_path
+        self._lock = threading.Lock()
+
+        try:
+            # Shared with the dispatcher's background flush thread
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._conn.executescript(_SCHEMA)
+        except sqlite3.Error as e:
+            raise RuntimeError(
+                f"Failed to open Linear outbox: {db_path}\n"
+                f"Error: {str(e)}\n"
+                f"🔧 Troubleshooting: Check .ce/ permissions or move the corrupt file aside"
+            ) from e
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> "LinearOutbox":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def enqueue_create(
+        self,
+        key: str,
+        title: str,
+        description: str,
+        state: str = "todo",
+        labels: Optional[list] = None,
+        prp_path: Optional[str] = None
+    ) -> int:
+        """Record an issue create.
+
+        Args:
+            key: Local key for the new issue (e.g. PRP ID)
+            title: Issue title
+            description: Issue description (markdown)
+            state: Issue state
+            labels: Optional labels
+            prp_path: PRP whose YAML receives the issue ID once created
+
+        Returns:
+            Operation ID
+        """
+        return self._enqueue("create", key, {
+            "title": title,
+            "description": description,
+            "state": state,
+            "labels": labels,
+            "prp_path": prp_path
+        })
+
+    def enqueue_update(
+        self,
+        issue_id: str,
+        description: str,
+        state: Optional[str] = None,
+        prp_path: Optional[str] = None
+    ) -> int:
+        """Record an issue update (description text is appended).
+
+        Args:
+            issue_id: Linear issue identifier (e.g. "BLA-24")
+            description: Text to append to the issue description
+            state: Optional new state
+            prp_path: PRP that triggered the update (informational)
+
+        Returns:
+            Operation ID
+        """
+        return self._enqueue("update", issue_id, {
+            "description": description,
+            "state": state,
+            "prp_path": prp_path
+        })
+
+    def pending(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Pending operations in enqueue order.
+
+        Returns:
+            [{"id", "kind", "issue_key", "payload", "attempts"}, ...]
+        """
+        sql = (
+            "SELECT id, kind, issue_key, payload_json, attempts FROM operations "
+            "WHERE status = 'pending' ORDER BY id"
+        )
+        params: List[Any] = []
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+
+        return [
+            {
+                "id": row[0],
+                "kind": row[1],
+                "issue_key": row[2],
+                "payload": json.loads(row[3]),
+                "attempts": row[4]
+            }
+            for row in rows
+        ]
+
+    def mark_sent(self, op_ids: List[int], result: Any = None) -> None:
+        """Mark operations as delivered."""
+        result_json = json.dumps(result, default=str)
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE operations SET status = 'sent', result_json = ?, "
+                "last_error = NULL, updated_at = ? WHERE id = ?",
+                [(result_json, _now(), op_id) for op_id in op_ids]
+            )
+
+    def mark_failed(
+        self,
+        op_ids: List[int],
+        error: str,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    ) -> None:
+        """Record a failed delivery attempt; park as dead after max_attempts."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE operations SET attempts = attempts + 1, last_error = ?, "
+                "status = CASE WHEN attempts + 1 >= ? THEN 'dead' ELSE status END, "
+                "updated_at = ? WHERE id = ?",
+                [(error, max_attempts, _now(), op_id) for op_id in op_ids]
+            )
+
+    def requeue_dead(self) -> int:
+        """Move dead operations back to pending with a fresh attempt budget.
+
+        Returns:
+            Number of requeued operations
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE operations SET status = 'pending', attempts = 0, updated_at = ? "
+                "WHERE status = 'dead'",
+                (_now(),)
+            )
+            return cursor.rowcount
+
+    def stats(self) -> Dict[str, int]:
+        """Operation counts by status."""
+        counts = {"pending": 0, "sent": 0, "dead": 0}
+        with self._lock:
+            for status, count in self._conn.execute(
+                "SELECT status, COUNT(*) FROM operations GROUP BY status"
+            ):
+                counts[status] = count
+        return counts
+
+    def _enqueue(self, kind: str, issue_key: str, payload: Dict[str, Any]) -> int:
+        now = _now()
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO operations (kind, issue_key, payload_json, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (kind, issue_key, json.dumps(payload), now, now)
+            )
+            return cursor.lastrowid
+
+
+class LinearDispatcher:
+    """Flushes a LinearOutbox through the resilient Linear MCP call path.
+
+    Handlers are plain callables so the dispatcher can run against the
+    real Linear MCP or a local fake:
+        create_fn(title=..., description=..., state=..., labels=...) -> issue dict
+            (with "id" or "identifier"; a result without one counts as failed)
+        update_fn(issue_id, description, state) -> result
+
+    Operations without a configured handler stay pending.
+
+    Example:
+        dispatcher = LinearDispatcher(outbox, create_fn=fake.create, update_fn=fake.update)
+        summary = dispatcher.flush()
+    """
+
+    def __init__(
+        self,
+        outbox: LinearOutbox,
+        create_fn: Optional[Callable[..., Any]] = None,
+        update_fn: Optional[Callable[..., Any]] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        on_created: Optional[Callable[[Dict[str, Any], Any], None]] = None
+    ):
+        """Initialize dispatcher.
+
+        Args:
+            outbox: Queue to drain
+            create_fn: Issue create handler
+            update_fn: Issue update handler
+            max_workers: Max concurrent Linear calls
+            max_attempts: Failed attempts before an operation is parked as dead
+            on_created: Called with (payload, issue) after a successful create
+        """
+        self.outbox = outbox
+        self.create_fn = create_fn
+        self.update_fn = update_fn
+        self.max_workers = max_workers
+        self.max_attempts = max_attempts
+        self.on_created = on_created
+        self._background: Optional[ThreadPoolExecutor] = None
+
+    def flush(self) -> Dict[str, int]:
+        """Deliver all pending operations.
+
+        Returns:
+            {"sent": N, "failed": N, "deferred": N, "coalesced": N} counted
+            in operations (coalesced = operations merged into another call)
+        """
+        batches = coalesce_operations(self.outbox.pending())
+        summary = {"sent": 0, "failed": 0, "deferred": 0, "coalesced": 0}
+
+        runnable = []
+        for batch in batches:
+            if self._handler(batch["kind"]) is None:
+                summary["deferred"] += len(batch["op_ids"])
+            else:
+                runnable.append(batch)
+            summary["coalesced"] += len(batch["op_ids"]) - 1
+
+        if not runnable:
+            return summary
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(runnable))) as pool:
+            futures = [(batch, pool.submit(self._send, batch)) for batch in runnable]
+            for batch, future in futures:
+                outcome = self._record(batch, future.result())
+                summary[outcome] += len(batch["op_ids"])
+
+        logger.info(
+            f"Linear outbox flush: {summary['sent']} sent, {summary['failed']} failed, "
+            f"{summary['deferred']} deferred"
+        )
+        return summary
+
+    def flush_async(self) -> Future:
+        """Flush on a background thread; flushes run one at a time.
+
+        The worker thread is joined at interpreter exit, so a CLI process
+        finishes delivering before it exits; anything still undelivered
+        stays in the outbox for the next flush.
+
+        Returns:
+            Future resolving to the flush() summary
+        """
+        if self._background is None:
+            self._background = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="linear-outbox"
+            )
+        return self._background.submit(self.flush)
+
+    def _handler(self, kind: str) -> Optional[Callable[..., Any]]:
+        return self.create_fn if kind == "create" else self.update_fn
+
+    def _send(self, batch: Dict[str, Any]) -> Dict[str, Any]:
+        from .linear_mcp_resilience import call_linear_mcp_resilient
+
+        payload = batch["payload"]
+        if batch["kind"] == "create":
+            return call_linear_mcp_resilient(
+                self.create_fn,
+                title=payload["title"],
+                description=payload["description"],
+                state=payload["state"],
+                labels=payload["labels"],
+                operation_name=f"create issue {batch['issue_key']}"
+            )
+        return call_linear_mcp_resilient(
+            self.update_fn,
+            batch["issue_key"],
+            payload["description"],
+            payload["state"],
+            operation_name=f"update issue {batch['issue_key']}"
+        )
+
+    def _record(self, batch: Dict[str, Any], result: Dict[str, Any]) -> str:
+        if result["success"] and batch["kind"] == "create" and _issue_id(result["result"]) is None:
+            # Handler returned no issue (e.g. only a prepared payload) - nothing reached Linear
+            result = {**result, "success": False, "error": "create handler returned no issue ID"}
+
+        if result["success"]:
+            self.outbox.mark_sent(batch["op_ids"], result["result"])
+            if batch["kind"] == "create" and self.on_created:
+                try:
+                    self.on_created(batch["payload"], result["result"])
+                except Exception as e:
+                    logger.warning(f"Post-create hook failed for {batch['issue_key']}: {e}")
+            return "sent"
+
+        if result["method"] in ("circuit_breaker_open", "bulkhead_full"):
+            return "deferred"
+
+        logger.warning(f"Linear {batch['kind']} {batch['issue_key']} failed: {result['error']}")
+        self.outbox.mark_failed(batch["op_ids"], result["error"], self.max_attempts)
+        return "failed"
+
+
+def coalesce_operations(ops: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Group pending operations into calls.
+
+    Each create is its own call. Updates to the same issue merge into one
+    call: descriptions are concatenated in enqueue order and the last
+    explicit state wins.
+
+    Args:
+        ops: Pending operations from LinearOutbox.pending() (enqueue order)
+
+    Returns:
+        [{"kind", "issue_key", "payload", "op_ids"}, ...] ordered by first operation
+    """
+    batches: List[Dict[str, Any]] = []
+    updates: Dict[str, Dict[str, Any]] = {}
+
+    for op in ops:
+        if op["kind"] != "update":
+            batches.append({
+                "kind": op["kind"],
+                "issue_key": op["issue_key"],
+                "payload": op["payload"],
+                "op_ids": [op["id"]]
+            })
+            continue
+
+        batch = updates.get(op["issue_key"])
+        if batch is None:
+            batch = {
+                "kind": "update",
+                "issue_key": op["issue_key"],
+                "payload": {"description": "", "state": None},
+                "op_ids": []
+            }
+            updates[op["issue_key"]] = batch
+            batches.append(batch)
+
+        batch["payload"]["description"] += op["payload"]["description"]
+        if op["payload"].get("state"):
+            batch["payload"]["state"] = op["payload"]["state"]
+        batch["op_ids"].append(op["id"])
+
+    return batches
+
+
+def _write_issue_to_prp(payload: Dict[str, Any], issue: Any) -> None:
+    """Default post-create hook: record the new issue ID in the PRP YAML."""
+    from .generate import _update_prp_yaml_with_issue
+
+    prp_path = payload.get("prp_path")
+    issue_id = _issue_id(issue)
+    if prp_path and issue_id:
+        _update_prp_yaml_with_issue(prp_path, issue_id)
+
+
+def _issue_id(issue: Any) -> Optional[str]:
+    """Linear issue ID from a create result, or None."""
+    if not isinstance(issue, dict):
+        return None
+    return issue.get("id") or issue.get("identifier")
+
+
+_dispatcher: Optional[LinearDispatcher] = None
+
+
+def get_linear_dispatcher() -> LinearDispatcher:
+    """Process-wide dispatcher over the project outbox.
+
+    There is no Linear MCP issue handler yet (create_issue_resilient only
+    prepares the payload, update_issue_resilient is not implemented), so
+    create_fn and update_fn are None: creates stay pending until a handler
+    is configured (the PRP keeps its "<PRP-ID>-created" placeholder), and
+    callers must not queue updates.
+    """
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = LinearDispatcher(LinearOutbox(), on_created=_write_issue_to_prp)
+    return _dispatcher
@@ -5,7 +5,9 @@ and falling back to local filesystem operations when MCP is unavailable.
 
 MCP Availability:
     - Claude Code context: Serena MCP typically available
-    - Standalone CLI: Falls back to filesystem
+    - Standalone CLI with CE_MCP_SESSIONS=true: Serena from
+      syntropy-mcp/servers.json over a pooled stdio session (ce.mcp_pool)
+    - Standalone CLI otherwise: Falls back to filesystem
     - Test environment: Uses mcp_fake for testing
 
 Design Decision (ADR-001):
@@ -15,9 +17,10 @@ Design Decision (ADR-001):
     - Performance acceptable (<100ms overhead per MCP call)
 """
 
+import json
 from typing import Dict, Any, List, Optional
 from pathlib import Path
-from ce.resilience import retry_with_backoff, CircuitBreaker, CircuitBreakerOpenError
+from ce.resilience import retry_with_backoff, Bulkhead, CircuitBreaker, CircuitBreakerOpenError
 from ce.logging_config import get_logger
 
 # Logger
@@ -26,20 +29,102 @@ logger = get_logger(__name__)
 # Global circuit breaker for Serena MCP operations
 serena_breaker = CircuitBreaker(name="serena-mcp", failure_threshold=5, recovery_timeout=60)
 
+# Concurrency limit for Serena MCP writes (full bulkhead → filesystem fallback)
+serena_bulkhead = Bulkhead(name="serena-mcp", max_concurrent=8, max_queue=32, timeout=30)
+
+
+# Serena functions the adapter relies on
+_REQUIRED_SERENA_FUNCTIONS = ("read_file", "create_text_file", "get_symbols_overview", "insert_after_symbol")
+
 
 def _import_serena_mcp():
     """Import Serena MCP module dynamically.
 
     Returns:
-        The mcp__serena module
+        The mcp__serena module, or (when it is not importable and
+        CE_MCP_SESSIONS=true) a PooledSerena over the pooled Serena session
 
     Raises:
-        ImportError: If module cannot be imported
+        ImportError: If module cannot be imported and no pooled session is available
 
     Note: Helper function to avoid repeated import logic throughout module.
     """
     import importlib
-    return importlib.import_module("mcp__serena")
+    try:
+        return importlib.import_module("mcp__serena")
+    except ImportError:
+        serena = _pooled_serena()
+        if serena is None:
+            raise
+        return serena
+
+
+def _pooled_serena() -> Optional["PooledSerena"]:
+    """PooledSerena if Python-side MCP sessions are enabled and Serena exposes the needed tools."""
+    from ce.mcp_utils import _sessions_enabled
+
+    if not _sessions_enabled():
+        return None
+
+    try:
+        from ce.mcp_pool import get_mcp_manager
+
+        manager = get_mcp_manager()
+        # Spawns Serena once per process; tool discovery is cached by the session
+        if not all(manager.has_tool("serena", name) for name in _REQUIRED_SERENA_FUNCTIONS):
+            return None
+    except Exception as e:
+        logger.debug(f"Pooled Serena session unavailable: {e}")
+        return None
+    return PooledSerena(manager)
+
+
+class PooledSerena:
+    """mcp__serena-compatible functions backed by a pooled Serena MCP session.
+
+    Tool results are decoded from their text content (JSON when possible).
+
+    Example:
+        serena = PooledSerena(get_mcp_manager())
+        symbols = serena.get_symbols_overview("ce/core.py")
+    """
+
+    def __init__(self, manager):
+        self._manager = manager
+
+    def read_file(self, relative_path: str, start_line: int = 0, end_line: Optional[int] = None) -> Any:
+        arguments = {"relative_path": relative_path, "start_line": start_line}
+        if end_line is not None:
+            arguments["end_line"] = end_line
+        return self._call("read_file", arguments)
+
+    def create_text_file(self, relative_path: str, content: str) -> Any:
+        return self._call("create_text_file", {"relative_path": relative_path, "content": content})
+
+    def get_symbols_overview(self, relative_path: str) -> Any:
+        return self._call("get_symbols_overview", {"relative_path": relative_path})
+
+    def insert_after_symbol(self, name_path: str, relative_path: str, body: str) -> Any:
+        return self._call("insert_after_symbol",
+                          {"name_path": name_path, "relative_path": relative_path, "body": body})
+
+    def insert_before_symbol(self, name_path: str, relative_path: str, body: str) -> Any:
+        return self._call("insert_before_symbol",
+                          {"name_path": name_path, "relative_path": relative_path, "body": body})
+
+    def _call(self, tool: str, arguments: Dict[str, Any]) -> Any:
+        from ce.mcp_pool import _content_text
+
+        try:
+            result = self._manager.call_tool("serena", tool, arguments)
+        except RuntimeError as e:
+            # Tool errors are retryable I/O failures for the adapter's retry/breaker
+            raise IOError(str(e)) from e
+        text = _content_text(result)
+        try:
+            return json.loads(text)
+        except ValueError:
+            return text
 
 
 def is_mcp_available() -> bool:
@@ -50,8 +135,8 @@ def is_mcp_available() -> bool:
 
     Detection Strategy:
         1. Try importing mcp__serena tools
-        2. Attempt minimal read operation
-        3. Cache result for session (not implemented in MVP)
+        2. Else, with CE_MCP_SESSIONS=true, check the pooled Serena session's
+           tool list (spawned and discovered once per process, then cached)
 
     Note: This is a simple detection strategy. More sophisticated
     approaches (version checking, capability negotiation) deferred to future.
@@ -61,14 +146,7 @@ def is_mcp_available() -> bool:
         serena_module = _import_serena_mcp()
 
         # Check if key functions exist
-        required_functions = [
-            "read_file",
-            "create_text_file",
-            "get_symbols_overview",
-            "insert_after_symbol"
-        ]
-
-        for func_name in required_functions:
+        for func_name in _REQUIRED_SERENA_FUNCTIONS:
             if not hasattr(serena_module, func_name):
                 return False
 
@@ -78,9 +156,11 @@ def is_mcp_available() -> bool:
         return False
 
 
-@retry_with_backoff(max_attempts=3, base_delay=1.0, exceptions=(IOError, ConnectionError, TimeoutError))
+@serena_bulkhead.call
+@serena_breaker.call
+@retry_with_backoff(max_attempts=3, base_delay=1.0, exceptions=(IOError, ConnectionError, TimeoutError), jitter=True)
 def _create_file_via_mcp(filepath: str, content: str):
-    """Create file via MCP with retry logic.
+    """Create file via MCP with retry, circuit breaker and bulkhead.
 
     Args:
         filepath: Relative path to file
@@ -89,7 +169,7 @@ def _create_file_via_mcp(filepath: str, content: str):
     Raises:
         Exception: If MCP call fails after retries
 
-    Note: Internal function with retry decorator. Circuit breaker applied at call site.
+    Note: One exhausted retry sequence counts as one circuit breaker failure.
     """
     serena = _import_serena_mcp()
     serena.create_text_file(filepath, content)
@@ -171,9 +251,11 @@ def create_file_with_mcp(filepath: str, content: str) -> Dict[str, Any]:
         ) from e
 
 
-@retry_with_backoff(max_attempts=3, base_delay=1.0, exceptions=(IOError, ConnectionError, TimeoutError))
+@serena_bulkhead.call
+@serena_breaker.call
+@retry_with_backoff(max_attempts=3, base_delay=1.0, exceptions=(IOError, ConnectionError, TimeoutError), jitter=True)
 def _insert_code_via_mcp(filepath: str, code: str, mode: str, symbol_name: str):
-    """Insert code via MCP with retry logic.
+    """Insert code via MCP with retry, circuit breaker and bulkhead.
 
     Args:
         filepath: Path to file
@@ -184,7 +266,7 @@ def _insert_code_via_mcp(filepath: str, code: str, mode: str, symbol_name: str):
     Raises:
         Exception: If MCP call fails after retries
 
-    Note: Internal function with retry decorator.
+    Note: Shares serena_breaker with _create_file_via_mcp.
     """
     serena = _import_serena_mcp()
     if mode == "after":
@@ -0,0 +1,562 @@
+"""Pooled persistent MCP client sessions over stdio JSON-RPC.
+
+Each configured server (syntropy-mcp/servers.json) is spawned once per
+process and kept alive. Requests are multiplexed over the single stdio
+pipe by JSON-RPC id: any number of threads can have calls in flight, and
+a reader thread routes each response to its waiting caller. The
+initialize handshake and tools/list discovery run once per session, so
+repeated availability checks and tool lookups are dictionary reads.
+
+Framing is the MCP stdio transport: one JSON-RPC message per line.
+
+Example:
+    manager = get_mcp_manager()
+    if manager.has_tool("serena", "find_symbol"):
+        result = manager.call_tool("serena", "find_symbol", {"name_path": "Foo"})
+"""
+
+import asyncio
+import atexit
+import itertools
+import json
+import logging
+import os
+import shutil
+import subprocess
+import threading
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .resilience import CircuitBreaker
+
+logger = logging.getLogger(__name__)
+
+PROTOCOL_VERSION = "2024-11-05"
+SERVER_PREFIX = "syn-"
+DEFAULT_CONFIG = "syntropy-mcp/servers.json"
+
+_STDERR_TAIL_LINES = 50
+
+
+def find_servers_config() -> Optional[Path]:
+    """Locate servers.json ($CE_MCP_SERVERS, else syntropy-mcp/ at project root)."""
+    override = os.environ.get("CE_MCP_SERVERS")
+    if override:
+        return Path(override)
+
+    cwd = Path.cwd()
+    project_root = cwd.parent if cwd.name == "tools" else cwd
+    candidate = project_root / DEFAULT_CONFIG
+    return candidate if candidate.exists() else None
+
+
+def load_server_configs(config_path: Optional[Path] = None) -> Dict[str, Dict[str, Any]]:
+    """Load MCP server launch configs.
+
+    Args:
+        config_path: servers.json path (default: find_servers_config())
+
+    Returns:
+        {server_name: {"command": str, "args": [...], "env": {...}}}
+        Empty dict if no config file is found.
+
+    Raises:
+        ValueError: If the config file is not valid JSON
+    """
+    path = Path(config_path) if config_path else find_servers_config()
+    if path is None or not path.exists():
+        return {}
+
+    try:
+        data = json.loads(path.read_text())
+    except ValueError as e:
+        raise ValueError(
+            f"Invalid MCP server config {path}: {e}\n"
+            f"🔧 Troubleshooting: Check servers.json syntax"
+        ) from e
+
+    return dict(data.get("servers", {}))
+
+
+class MCPSession:
+    """One live stdio connection to an MCP server.
+
+    Thread-safe: writes are serialized by a lock, and responses are matched
+    to callers by request id, so concurrent calls share the pipe.
+
+    Attributes:
+        name: Server name
+        server_info: serverInfo from the initialize response
+        capabilities: Server capabilities from the initialize response
+    """
+
+    def __init__(self, name: str, command: str, args: Optional[List[str]] = None,
+                 env: Optional[Dict[str, str]] = None, cwd: Optional[str] = None):
+        """Spawn the server process (call initialize() before use).
+
+        Raises:
+            RuntimeError: If the server command cannot be started
+        """
+        self.name = name
+        self.server_info: Dict[str, Any] = {}
+        self.capabilities: Dict[str, Any] = {}
+
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, Future] = {}
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._tools: Optional[List[Dict[str, Any]]] = None
+        self._stderr_tail: deque = deque(maxlen=_STDERR_TAIL_LINES)
+        self._closed = False
+
+        try:
+            self._process = subprocess.Popen(
+                [command, *(args or [])],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                cwd=cwd,
+                env={**os.environ, **(env or {})},
+                bufsize=0
+            )
+        except OSError as e:
+            raise RuntimeError(
+                f"Failed to start MCP server '{name}' ({command}): {e}\n"
+                f"🔧 Troubleshooting: Check the command in servers.json is installed"
+            ) from e
+
+        self._reader = threading.Thread(
+            target=self._read_loop, name=f"mcp-{name}-reader", daemon=True
+        )
+        self._reader.start()
+        threading.Thread(
+            target=self._drain_stderr, name=f"mcp-{name}-stderr", daemon=True
+        ).start()
+
+    @property
+    def alive(self) -> bool:
+        """True while the server process is running and the session is open."""
+        return not self._closed and self._process.poll() is None
+
+    def initialize(self, timeout: float = 30.0) -> Dict[str, Any]:
+        """Run the MCP initialize handshake.
+
+        Returns:
+            initialize result (protocolVersion, capabilities, serverInfo)
+        """
+        result = self.request("initialize", {
+            "protocolVersion": PROTOCOL_VERSION,
+            "capabilities": {},
+            "clientInfo": {"name": "ce-tools", "version": "1.0"}
+        }, timeout=timeout)
+        self.server_info = result.get("serverInfo", {})
+        self.capabilities = result.get("capabilities", {})
+        self.notify("notifications/initialized")
+        return result
+
+    def list_tools(self, refresh: bool = False, timeout: float = 30.0) -> List[Dict[str, Any]]:
+        """Tool descriptors from tools/list (cached for the session lifetime)."""
+        if self._tools is None or refresh:
+            tools: List[Dict[str, Any]] = []
+            params: Dict[str, Any] = {}
+            while True:
+                result = self.request("tools/list", params, timeout=timeout)
+                tools.extend(result.get("tools", []))
+                cursor = result.get("nextCursor")
+                if not cursor:
+                    break
+                params = {"cursor": cursor}
+            self._tools = tools
+        return self._tools
+
+    def tool_names(self) -> List[str]:
+        """Names of tools the server exposes."""
+        return [tool["name"] for tool in self.list_tools()]
+
+    def cached_tool_names(self) -> Optional[List[str]]:
+        """Tool names if tools/list already ran, else None (never sends a request)."""
+        if self._tools is None:
+            return None
+        return [tool["name"] for tool in self._tools]
+
+    def call_tool(self, tool: str, arguments: Optional[Dict[str, Any]] = None,
+                  timeout: float = 60.0) -> Dict[str, Any]:
+        """Call a tool (tools/call).
+
+        Raises:
+            RuntimeError: On JSON-RPC error or isError tool result
+            TimeoutError: If no response arrives within timeout
+        """
+        result = self.request(
+            "tools/call", {"name": tool, "arguments": arguments or {}}, timeout=timeout
+        )
+        if result.get("isError"):
+            raise RuntimeError(
+                f"MCP tool {self.name}:{tool} failed: {_content_text(result)}\n"
+                f"🔧 Troubleshooting: Check tool arguments"
+            )
+        return result
+
+    def request(self, method: str, params: Optional[Dict[str, Any]] = None,
+                timeout: float = 60.0) -> Dict[str, Any]:
+        """Send a request and block for its result.
+
+        Raises:
+            RuntimeError: On JSON-RPC error response
+            ConnectionError: If the server exits before responding
+            TimeoutError: If no response arrives within timeout
+        """
+        request_id, future = self._submit(method, params)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            with self._lock:
+                self._pending.pop(request_id, None)
+            self.notify("notifications/cancelled", {"requestId": request_id})
+            raise TimeoutError(
+                f"MCP request {self.name}:{method} timed out after {timeout}s\n"
+                f"🔧 Troubleshooting: Check server health or raise the timeout"
+            )
+
+    async def request_async(self, method: str, params: Optional[Dict[str, Any]] = None,
+                            timeout: float = 60.0) -> Dict[str, Any]:
+        """Awaitable request(); shares the session with threaded callers."""
+        request_id, future = self._submit(method, params)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                self._pending.pop(request_id, None)
+            self.notify("notifications/cancelled", {"requestId": request_id})
+            raise TimeoutError(
+                f"MCP request {self.name}:{method} timed out after {timeout}s\n"
+                f"🔧 Troubleshooting: Check server health or raise the timeout"
+            )
+
+    def notify(self, method: str, params: Optional[Dict[str, Any]] = None) -> None:
+        """Send a notification (no response expected)."""
+        message: Dict[str, Any] = {"jsonrpc": "2.0", "method": method}
+        if params is not None:
+            message["params"] = params
+        try:
+            self._send(message)
+        except ConnectionError as e:
+            logger.debug(f"Dropped notification {method} to {self.name}: {e}")
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Terminate the server and fail any in-flight requests."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._process.stdin.close()
+        except OSError:
+            pass
+        try:
+            self._process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            self._process.wait()
+        self._fail_pending(ConnectionError(f"MCP session '{self.name}' closed"))
+
+    def stderr_tail(self) -> str:
+        """Last lines the server wrote to stderr (for diagnostics)."""
+        return "\n".join(self._stderr_tail)
+
+    # ------------------------------------------------------------------
+    # Transport
+    # ------------------------------------------------------------------
+
+    def _submit(self, method: str, params: Optional[Dict[str, Any]]):
+        future: Future = Future()
+        with self._lock:
+            request_id = next(self._ids)
+            self._pending[request_id] = future
+
+        message = {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params or {}}
+        try:
+            self._send(message)
+        except ConnectionError:
+            with self._lock:
+                self._pending.pop(request_id, None)
+            raise
+        return request_id, future
+
+    def _send(self, message: Dict[str, Any]) -> None:
+        data = (json.dumps(message) + "\n").encode("utf-8")
+        with self._write_lock:
+            if not self.alive:
+                raise ConnectionError(
+                    f"MCP session '{self.name}' is not running\n"
+                    f"🔧 Troubleshooting: Server stderr:\n{self.stderr_tail()}"
+                )
+            try:
+                self._process.stdin.write(data)
+                self._process.stdin.flush()
+            except (BrokenPipeError, OSError) as e:
+                raise ConnectionError(f"MCP session '{self.name}' pipe closed: {e}") from e
+
+    def _read_loop(self) -> None:
+        for raw in self._process.stdout:
+            line = raw.strip()
+            if not line:
+                continue
+            try:
+                message = json.loads(line)
+            except ValueError:
+                logger.debug(f"{self.name}: ignoring non-JSON output: {line[:200]!r}")
+                continue
+            self._dispatch(message)
+
+        self._fail_pending(ConnectionError(
+            f"MCP server '{self.name}' exited (code {self._process.poll()})\n"
+            f"🔧 Troubleshooting: Server stderr:\n{self.stderr_tail()}"
+        ))
+
+    def _dispatch(self, message: Dict[str, Any]) -> None:
+        if "method" in message:
+            # Server → client request or notification
+            if "id" in message:
+                self._answer_server_request(message)
+            return
+
+        with self._lock:
+            future = self._pending.pop(message.get("id"), None)
+        if future is None:
+            return  # Cancelled or timed out
+
+        if "error" in message:
+            error = message["error"]
+            future.set_exception(RuntimeError(
+                f"MCP error from {self.name}: {error.get('message')} (code {error.get('code')})\n"
+                f"🔧 Troubleshooting: Check request parameters"
+            ))
+        else:
+            future.set_result(message.get("result") or {})
+
+    def _answer_server_request(self, message: Dict[str, Any]) -> None:
+        if message["method"] == "ping":
+            reply = {"jsonrpc": "2.0", "id": message["id"], "result": {}}
+        else:
+            reply = {
+                "jsonrpc": "2.0",
+                "id": message["id"],
+                "error": {"code": -32601, "message": f"Method not supported: {message['method']}"}
+            }
+        try:
+            self._send(reply)
+        except ConnectionError:
+            pass
+
+    def _drain_stderr(self) -> None:
+        for raw in self._process.stderr:
+            self._stderr_tail.append(raw.decode("utf-8", "replace").rstrip())
+
+    def _fail_pending(self, error: Exception) -> None:
+        with self._lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+        for future in pending:
+            if not future.done():
+                future.set_exception(error)
+
+
+class MCPConnectionManager:
+    """Process-wide pool of MCP sessions, one per configured server.
+
+    Sessions are spawned lazily on first use and reused until they die;
+    a dead session is respawned on the next call. Spawn failures go
+    through a per-server circuit breaker so a missing server is not
+    re-forked on every call.
+
+    Server names may omit the "syn-" prefix ("serena" → "syn-serena").
+
+    Example:
+        manager = MCPConnectionManager()
+        tools = manager.tool_names("serena")
+        result = manager.call_tool("serena", "get_symbols_overview", {"relative_path": "ce/core.py"})
+    """
+
+    def __init__(self, config_path: Optional[Path] = None,
+                 configs: Optional[Dict[str, Dict[str, Any]]] = None,
+                 startup_timeout: float = 30.0, cwd: Optional[str] = None):
+        """Initialize manager.
+
+        Args:
+            config_path: servers.json path (ignored when configs is given)
+            configs: Server configs (default: load_server_configs(config_path))
+            startup_timeout: Seconds to wait for the initialize handshake
+            cwd: Working directory for spawned servers (default: current)
+        """
+        self.configs = configs if configs is not None else load_server_configs(config_path)
+        self.startup_timeout = startup_timeout
+        self.cwd = cwd
+        self._sessions: Dict[str, MCPSession] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._available: Dict[str, bool] = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, server: str) -> Optional[str]:
+        """Configured server name for server (with or without "syn-" prefix)."""
+        if server in self.configs:
+            return server
+        prefixed = f"{SERVER_PREFIX}{server}"
+        return prefixed if prefixed in self.configs else None
+
+    def is_available(self, server: str) -> bool:
+        """True if server is configured and its command is installed (no spawn).
+
+        Live sessions count as available; the command lookup is cached.
+        """
+        name = self.resolve(server)
+        if name is None:
+            return False
+        session = self._sessions.get(name)
+        if session is not None and session.alive:
+            return True
+        if name not in self._available:
+            self._available[name] = shutil.which(self.configs[name]["command"]) is not None
+        return self._available[name]
+
+    def is_connected(self, server: str) -> bool:
+        """True if a live session exists for server."""
+        name = self.resolve(server)
+        session = self._sessions.get(name) if name else None
+        return session is not None and session.alive
+
+    def get_session(self, server: str) -> MCPSession:
+        """Live session for server, spawning and initializing it if needed.
+
+        Raises:
+            ValueError: If server is not configured
+            RuntimeError: If the server cannot be started
+            CircuitBreakerOpenError: If recent spawns kept failing
+        """
+        name = self.resolve(server)
+        if name is None:
+            raise ValueError(
+                f"Unknown MCP server: {server}\n"
+                f"🔧 Troubleshooting: Configured servers: {', '.join(sorted(self.configs)) or 'none'}"
+            )
+
+        session = self._sessions.get(name)
+        if session is not None and session.alive:
+            return session
+
+        with self._lock:
+            lock = self._locks.setdefault(name, threading.Lock())
+            breaker = self._breakers.get(name)
+            if breaker is None:
+                breaker = CircuitBreaker(name=f"mcp-{name}", failure_threshold=3, recovery_timeout=60)
+                self._breakers[name] = breaker
+
+        with lock:
+            session = self._sessions.get(name)
+            if session is not None and session.alive:
+                return session
+            if session is not None:
+                logger.info(f"MCP server '{name}' died, respawning")
+                session.close()
+
+            session = breaker.call(self._spawn)(name)
+            self._sessions[name] = session
+            return session
+
+    def list_tools(self, server: str) -> List[Dict[str, Any]]:
+        """Cached tool descriptors for server."""
+        return self.get_session(server).list_tools()
+
+    def tool_names(self, server: str) -> List[str]:
+        """Cached tool names for server."""
+        return self.get_session(server).tool_names()
+
+    def has_tool(self, server: str, tool: str) -> bool:
+        """True if server is reachable and exposes tool (never raises)."""
+        if not self.is_available(server):
+            return False
+        try:
+            return tool in self.tool_names(server)
+        except Exception as e:
+            logger.debug(f"MCP capability check failed for {server}: {e}")
+            return False
+
+    def call_tool(self, server: str, tool: str, arguments: Optional[Dict[str, Any]] = None,
+                  timeout: float = 60.0) -> Dict[str, Any]:
+        """Call tool on server over its pooled session.
+
+        A session that died mid-call is respawned and the call retried once.
+        """
+        session = self.get_session(server)
+        try:
+            return session.call_tool(tool, arguments, timeout=timeout)
+        except ConnectionError:
+            if session.alive:
+                raise
+            return self.get_session(server).call_tool(tool, arguments, timeout=timeout)
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """Per-server diagnostics without spawning anything."""
+        result = {}
+        for name in sorted(self.configs):
+            session = self._sessions.get(name)
+            connected = session is not None and session.alive
+            result[name] = {
+                "available": self.is_available(name),
+                "connected": connected,
+                "server_info": session.server_info if connected else None,
+                "tools": session.cached_tool_names() if connected else None
+            }
+        return result
+
+    def close(self, server: str) -> None:
+        """Close one server's session (it is respawned on next use)."""
+        name = self.resolve(server)
+        session = self._sessions.pop(name, None) if name else None
+        if session is not None:
+            session.close()
+
+    def close_all(self) -> None:
+        """Close every session."""
+        for name in list(self._sessions):
+            self.close(name)
+
+    def _spawn(self, name: str) -> MCPSession:
+        config = self.configs[name]
+        session = MCPSession(
+            name,
+            config["command"],
+            config.get("args", []),
+            env=config.get("env"),
+            cwd=self.cwd
+        )
+        try:
+            session.initialize(timeout=self.startup_timeout)
+        except Exception:
+            session.close(timeout=1.0)
+            raise
+        logger.debug(f"MCP server '{name}' connected: {session.server_info}")
+        return session
+
+
+def _content_text(result: Dict[str, Any]) -> str:
+    """Concatenated text blocks of a tools/call result."""
+    return "\n".join(
+        block.get("text", "") for block in result.get("content", []) if block.get("type") == "text"
+    )
+
+
+_manager: Optional[MCPConnectionManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_mcp_manager() -> MCPConnectionManager:
+    """Get process-wide MCPConnectionManager (sessions closed at exit)."""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = MCPConnectionManager()
+            atexit.register(_manager.close_all)
+        return _manager
@@ -2,9 +2,17 @@
 
 Provides wrappers for calling Syntropy MCP tools with proper
 error handling and logging.
+
+Python-side sessions (ce.mcp_pool) are opt-in with CE_MCP_SESSIONS=true:
+servers from syntropy-mcp/servers.json ($CE_MCP_SERVERS overrides the
+path) are then spawned once per process and reused by call_syntropy_mcp,
+is_mcp_available and ce.mcp_adapter (Serena file operations). Without it,
+Python code never spawns servers; inside Claude Code the Syntropy
+aggregator already owns them.
 """
 
 import logging
+import os
 from typing import Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
@@ -30,24 +38,26 @@ def call_syntropy_mcp(
     Raises:
         RuntimeError: If MCP call fails
 
-    Note: This is a placeholder. Actual implementation will use
-    Claude Code's MCP infrastructure to make real tool calls.
+    Note: Calls go over pooled stdio sessions (ce.mcp_pool) to servers
+    from syntropy-mcp/servers.json. Python-side sessions are opt-in
+    (CE_MCP_SESSIONS=true); inside Claude Code the Syntropy aggregator
+    already owns the servers.
     """
     logger.info(f"Calling Syntropy MCP: {server}:{tool}")
     logger.debug(f"Arguments: {arguments}")
 
-    # FIXME: Placeholder - replace with actual MCP call
-    # In full implementation, this would:
-    # 1. Import Claude Code MCP client
-    # 2. Get client for server: client = get_mcp_client(f"syntropy-{server}")
-    # 3. Call tool: result = client.call_tool(tool, arguments, timeout=timeout)
-    # 4. Return result
+    if not _sessions_enabled():
+        raise RuntimeError(
+            f"MCP sessions disabled, cannot call {server}:{tool}\n"
+            f"🔧 Troubleshooting: Set CE_MCP_SESSIONS=true to spawn servers from servers.json"
+        )
+
+    from .mcp_pool import get_mcp_manager
 
-    # For now, log and raise (graceful degradation in callers)
-    raise RuntimeError(
-        f"MCP call not yet implemented: {server}:{tool}\n"
-        f"🔧 Troubleshooting: Full MCP integration pending"
-    )
+    try:
+        return get_mcp_manager().call_tool(server, tool, arguments, timeout=timeout)
+    except (ValueError, ConnectionError, TimeoutError) as e:
+        raise RuntimeError(f"MCP call failed: {server}:{tool}: {e}") from e
 
 
 def is_mcp_available(server: str) -> bool:
@@ -59,16 +69,21 @@ def is_mcp_available(server: str) -> bool:
     Returns:
         True if server available, False otherwise
     """
+    if not _sessions_enabled():
+        return False
+
     try:
-        # FIXME: Placeholder - replace with actual availability check
-        # Would ping server or check connection status
-        logger.debug(f"Checking MCP availability: {server}")
-        return False  # Return False until implemented
+        from .mcp_pool import get_mcp_manager
+        return get_mcp_manager().is_available(server)
     except Exception as e:
         logger.warning(f"MCP availability check failed: {e}")
         return False
 
 
+def _sessions_enabled() -> bool:
+    return os.environ.get("CE_MCP_SESSIONS", "false").lower() == "true"
+
+
 def call_sequential_thinking(
     prompt: str,
     thought_number: int = 1,
@@ -10,6 +10,7 @@ from typing import Dict, List, Any
 from pathlib import Path
 
 from .code_analyzer import analyze_code_patterns
+from .prp_sections import load_prp
 
 
 def extract_patterns_from_prp(prp_path: str) -> Dict[str, Any]:
@@ -43,23 +44,22 @@ def extract_patterns_from_prp(prp_path: str) -> Dict[str, Any]:
             f"   - Use: ls {prp_path_obj.parent} to list directory"
         )
 
-    content = prp_path_obj.read_text()
+    doc = load_prp(prp_path_obj)
 
     # Extract EXAMPLES section (both standalone and embedded in PRP)
-    examples_match = re.search(
-        r"##\s+EXAMPLES\s*\n(.*?)(?=\n##|\Z)",
-        content,
-        re.DOTALL | re.IGNORECASE
+    examples_section = next(
+        (s for s in doc.find_all(r"EXAMPLES$") if s.level >= 2),
+        None
     )
 
-    if not examples_match:
+    if not examples_section:
         raise ValueError(
             f"No EXAMPLES section found in {prp_path}\n"
             f"🔧 Troubleshooting: Ensure PRP contains '## EXAMPLES' section "
             f"with code blocks showing patterns to follow"
         )
 
-    examples_text = examples_match.group(1)
+    examples_text = doc.text(examples_section)
 
     # Extract code blocks
     code_blocks = re.findall(
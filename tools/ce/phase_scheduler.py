@@ -0,0 +1,269 @@
+"""Parallel phase scheduling for PRP execution.
+
+Builds a phase dependency graph from file overlap (files_to_modify ∪
+files_to_create) and explicit **Depends On** ordering, groups phases into
+waves of mutually independent phases, and runs multi-phase waves
+concurrently in isolated `git worktree` checkouts. Each phase commits in
+its worktree; commits are cherry-picked back in phase order with conflict
+detection.
+
+Phases that declare no files are treated as barriers (they may touch
+anything), so a blueprint without file lists degrades to sequential order.
+"""
+
+import logging
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Any, List, Optional, Set
+
+from .core import run_cmd
+
+logger = logging.getLogger(__name__)
+
+
+def phase_file_set(phase: Dict[str, Any]) -> Set[str]:
+    """Normalized set of paths a phase creates or modifies."""
+    entries = phase.get("files_to_modify", []) + phase.get("files_to_create", [])
+    return {os.path.normpath(entry["path"]) for entry in entries}
+
+
+def build_phase_graph(phases: List[Dict[str, Any]]) -> Dict[int, Set[int]]:
+    """Build phase dependency graph.
+
+    A phase depends on every earlier phase that touches an overlapping file
+    or is listed in its depends_on. Phases that declare no files act as
+    barriers: they depend on all earlier phases and all later phases
+    depend on them.
+
+    Args:
+        phases: Parsed phases from parse_blueprint() (in blueprint order)
+
+    Returns:
+        {phase_number: {dependency phase_numbers}}
+    """
+    graph: Dict[int, Set[int]] = {}
+    file_sets = {p["phase_number"]: phase_file_set(p) for p in phases}
+    known = set(file_sets)
+
+    for i, phase in enumerate(phases):
+        num = phase["phase_number"]
+        files = file_sets[num]
+        deps = {d for d in phase.get("depends_on", []) if d in known and d != num}
+
+        for earlier in phases[:i]:
+            earlier_num = earlier["phase_number"]
+            earlier_files = file_sets[earlier_num]
+            if not files or not earlier_files or files & earlier_files:
+                deps.add(earlier_num)
+
+        graph[num] = deps
+
+    return graph
+
+
+def plan_waves(phases: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+    """Group phases into waves; phases in a wave are mutually independent.
+
+    Each phase lands in the wave after its deepest dependency, so the
+    number of waves equals the critical path length.
+
+    Raises:
+        RuntimeError: If explicit dependencies form a cycle
+    """
+    graph = build_phase_graph(phases)
+    by_number = {p["phase_number"]: p for p in phases}
+    level: Dict[int, int] = {}
+
+    def resolve(num: int, visiting: Set[int]) -> int:
+        if num in level:
+            return level[num]
+        if num in visiting:
+            raise RuntimeError(
+                f"Circular phase dependency involving Phase {num}\n"
+                f"🔧 Troubleshooting: Check **Depends On** lines in the blueprint"
+            )
+        visiting.add(num)
+        deps = graph[num]
+        level[num] = 1 + max((resolve(d, visiting) for d in deps), default=-1)
+        visiting.discard(num)
+        return level[num]
+
+    for num in by_number:
+        resolve(num, set())
+
+    waves: List[List[Dict[str, Any]]] = [[] for _ in range(max(level.values(), default=-1) + 1)]
+    for phase in phases:
+        waves[level[phase["phase_number"]]].append(phase)
+    return waves
+
+
+def run_parallel_wave(
+    wave: List[Dict[str, Any]],
+    prp_path: str,
+    skip_validation: bool = False,
+    max_workers: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """Run independent phases concurrently in separate git worktrees.
+
+    Each phase gets a detached worktree at HEAD, runs execute_phase() and
+    its own validation loop there, and commits its changes. Worktrees are
+    removed afterwards; commits stay reachable by SHA for merge_phase_commits().
+
+    Args:
+        wave: Mutually independent phases
+        prp_path: Absolute path to PRP file (for L4 validation)
+        skip_validation: Skip validation loops
+        max_workers: Process pool size (default: len(wave))
+
+    Returns:
+        Per-phase results in phase order:
+        [{"phase_number", "commit_sha", "exec_result", "validation_result"}, ...]
+
+    Raises:
+        RuntimeError: If any phase fails (after all phases finish)
+    """
+    root_result = run_cmd(["git", "rev-parse", "--show-toplevel"])
+    if not root_result["success"]:
+        raise RuntimeError(
+            f"Parallel execution requires a git repository: {root_result['stderr']}\n"
+            f"🔧 Troubleshooting: Run without --parallel outside git repositories"
+        )
+    repo_root = root_result["stdout"].strip()
+    rel_cwd = os.path.relpath(os.getcwd(), repo_root)
+
+    base_dir = Path(tempfile.mkdtemp(prefix="ce-phase-worktrees-"))
+    worktrees: Dict[int, Path] = {}
+    results: Dict[int, Dict[str, Any]] = {}
+    errors: Dict[int, str] = {}
+
+    try:
+        for phase in wave:
+            num = phase["phase_number"]
+            path = base_dir / f"phase{num}"
+            add_result = run_cmd(
+                ["git", "worktree", "add", "--detach", str(path), "HEAD"],
+                cwd=repo_root
+            )
+            if not add_result["success"]:
+                raise RuntimeError(
+                    f"Failed to create worktree for Phase {num}: {add_result['stderr']}\n"
+                    f"🔧 Troubleshooting: Run 'git worktree prune' and retry"
+                )
+            worktrees[num] = path
+
+        with ProcessPoolExecutor(max_workers=max_workers or len(wave)) as pool:
+            futures = {
+                phase["phase_number"]: pool.submit(
+                    _run_phase_in_worktree,
+                    phase,
+                    prp_path,
+                    str(worktrees[phase["phase_number"]] / rel_cwd),
+                    skip_validation
+                )
+                for phase in wave
+            }
+            for num, future in futures.items():
+                try:
+                    results[num] = future.result()
+                except Exception as e:
+                    errors[num] = str(e)
+
+    finally:
+        for path in worktrees.values():
+            remove_result = run_cmd(
+                ["git", "worktree", "remove", "--force", str(path)], cwd=repo_root
+            )
+            if not remove_result["success"]:
+                logger.warning(f"Failed to remove worktree {path}: {remove_result['stderr']}")
+        shutil.rmtree(base_dir, ignore_errors=True)
+
+    if errors:
+        details = "\n".join(f"  Phase {num}: {msg}" for num, msg in sorted(errors.items()))
+        raise RuntimeError(
+            f"Parallel phase execution failed:\n{details}\n"
+            f"🔧 Troubleshooting: Re-run failed phases with --start-phase/--end-phase"
+        )
+
+    return [results[p["phase_number"]] for p in sorted(wave, key=lambda p: p["phase_number"])]
+
+
+def merge_phase_commits(
+    results: List[Dict[str, Any]],
+    on_merged: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> None:
+    """Cherry-pick phase commits onto the current branch in phase order.
+
+    Args:
+        results: run_parallel_wave() results
+        on_merged: Called with each result right after its cherry-pick, while
+            HEAD is that phase's commit (e.g. to create its checkpoint tag)
+
+    Raises:
+        RuntimeError: On merge conflict (cherry-pick is aborted, tree left clean)
+    """
+    for result in results:
+        sha = result["commit_sha"]
+        if sha:
+            pick = run_cmd(["git", "cherry-pick", "--allow-empty", sha])
+            if not pick["success"]:
+                _abort_conflicting_pick(result)
+        if on_merged is not None:
+            on_merged(result)
+
+
+def _abort_conflicting_pick(result: Dict[str, Any]) -> None:
+    """Abort a failed cherry-pick and raise RuntimeError naming the conflicts."""
+    conflicts = run_cmd(["git", "diff", "--name-only", "--diff-filter=U"])
+    conflicted = [f for f in conflicts["stdout"].splitlines() if f.strip()]
+    run_cmd(["git", "cherry-pick", "--abort"])
+    raise RuntimeError(
+        f"Merge conflict applying Phase {result['phase_number']} ({result['commit_sha'][:7]})\n"
+        f"Conflicting files: {', '.join(conflicted) or 'unknown'}\n"
+        f"🔧 Troubleshooting: Phases touch overlapping files - add **Depends On** "
+        f"to the blueprint or run without --parallel"
+    )
+
+
+def _run_phase_in_worktree(
+    phase: Dict[str, Any],
+    prp_path: str,
+    workdir: str,
+    skip_validation: bool
+) -> Dict[str, Any]:
+    """Process-pool worker: execute, validate and commit one phase in a worktree."""
+    from .execute import execute_phase
+    from .validation_loop import run_validation_loop
+
+    os.chdir(workdir)
+    num = phase["phase_number"]
+
+    exec_result = execute_phase(phase)
+    if not exec_result["success"]:
+        raise RuntimeError(f"execution failed: {exec_result.get('error', 'Unknown error')}")
+
+    validation_result = None
+    if not skip_validation and phase.get("validation_command"):
+        validation_result = run_validation_loop(phase, prp_path)
+        if not validation_result["success"]:
+            raise RuntimeError(
+                f"validation failed after {validation_result.get('attempts', 0)} attempts"
+            )
+
+    add_result = run_cmd(["git", "add", "-A"])
+    commit_result = run_cmd([
+        "git", "commit", "--allow-empty", "-q",
+        "-m", f"Phase {num}: {phase['phase_name']}"
+    ])
+    if not add_result["success"] or not commit_result["success"]:
+        raise RuntimeError(f"commit failed: {add_result['stderr']}{commit_result['stderr']}")
+
+    sha_result = run_cmd(["git", "rev-parse", "HEAD"])
+    return {
+        "phase_number": num,
+        "commit_sha": sha_result["stdout"].strip(),
+        "exec_result": exec_result,
+        "validation_result": validation_result
+    }
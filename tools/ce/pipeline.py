@@ -30,7 +30,8 @@ PIPELINE_SCHEMA = {
                                 "name": {"type": "string"},
                                 "command": {"type": "string"},
                                 "strategy": {"type": "string", "enum": ["real", "mock"]},
-                                "timeout": {"type": "integer"}
+                                "timeout": {"type": "integer"},
+                                "inputs": {"type": "array", "items": {"type": "string"}}
                             }
                         }
                     },
@@ -7,6 +7,7 @@ import logging
 from pathlib import Path
 from datetime import datetime, timezone
 from .core import find_project_root
+from .checkpoints import get_checkpoint_manager
 
 # Required fields schema
 REQUIRED_FIELDS = [
@@ -453,8 +454,6 @@ def create_checkpoint(phase: str, message: Optional[str] = None) -> Dict[str, An
           * If Serena unavailable: logs warning, continues successfully
           * Never fails on Serena unavailability
     """
-    from .core import run_cmd
-
     # Verify active PRP
     active = get_active_prp()
     if not active:
@@ -463,41 +462,8 @@ def create_checkpoint(phase: str, message: Optional[str] = None) -> Dict[str, An
             f"🔧 Troubleshooting: Start a PRP first with 'ce prp start PRP-XXX'"
         )
 
-    # Check git working tree clean
-    status_result = run_cmd("git status --porcelain")
-    if not status_result["success"]:
-        raise RuntimeError(
-            f"Failed to check git status: {status_result['stderr']}\n"
-            f"🔧 Troubleshooting: Ensure you're in a git repository"
-        )
-
-    if status_result["stdout"].strip():
-        raise RuntimeError(
-            f"Working tree has uncommitted changes\n"
-            f"🔧 Troubleshooting: Commit or stash changes before creating checkpoint"
-        )
-
-    # Generate timestamp and tag name
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
-    tag_name = f"checkpoint-{active['prp_id']}-{phase}-{timestamp}"
-
-    # Get current commit SHA
-    sha_result = run_cmd("git rev-parse HEAD")
-    if not sha_result["success"]:
-        raise RuntimeError(
-            f"Failed to get commit SHA: {sha_result['stderr']}\n"
-            f"🔧 Troubleshooting: Ensure you're in a git repository with commits"
-        )
-    commit_sha = sha_result["stdout"].strip()[:7]
-
-    # Create annotated tag
-    tag_message = message or f"{phase} checkpoint"
-    tag_result = run_cmd(f'git tag -a "{tag_name}" -m "{tag_message}"')
-    if not tag_result["success"]:
-        raise RuntimeError(
-            f"Failed to create checkpoint tag: {tag_result['stderr']}\n"
-            f"🔧 Troubleshooting: Ensure git is configured correctly"
-        )
+    checkpoint = get_checkpoint_manager().create(active["prp_id"], phase, message)
+    tag_name = checkpoint["tag_name"]
 
     # Update state
     active["last_checkpoint"] = tag_name
@@ -509,8 +475,8 @@ def create_checkpoint(phase: str, message: Optional[str] = None) -> Dict[str, An
     return {
         "success": True,
         "tag_name": tag_name,
-        "commit_sha": commit_sha,
-        "message": tag_message
+        "commit_sha": checkpoint["commit_sha"],
+        "message": checkpoint["message"]
     }
 
 
@@ -539,65 +505,7 @@ def list_checkpoints(prp_id: Optional[str] = None) -> List[Dict[str, Any]]:
         >>> for cp in checkpoints:
         ...     print(f"{cp['phase']}: {cp['message']}")
     """
-    from .core import run_cmd
-
-    # Get all tags
-    tags_result = run_cmd("git tag -l 'checkpoint-*' --format='%(refname:short)|%(subject)|%(objectname:short)'")
-    if not tags_result["success"]:
-        logger.warning(f"Failed to list tags: {tags_result['stderr']}")
-        return []
-
-    if not tags_result["stdout"].strip():
-        return []
-
-    checkpoints = []
-    for line in tags_result["stdout"].strip().split("\n"):
-        parts = line.split("|")
-        if len(parts) < 3:
-            continue
-
-        tag_name, tag_message, commit_sha = parts[0], parts[1], parts[2]
-
-        # Parse tag name: checkpoint-{prp_id}-{phase}-{timestamp}
-        if not tag_name.startswith("checkpoint-"):
-            continue
-
-        tag_parts = tag_name.split("-", 3)  # Split: ["checkpoint", "PRP", "X", "phase-YYYYMMDD-HHMMSS"]
-        if len(tag_parts) < 4:
-            continue
-
-        checkpoint_prp_id = f"{tag_parts[1]}-{tag_parts[2]}"  # "PRP-X"
-
-        # Filter by prp_id if provided
-        if prp_id and checkpoint_prp_id != prp_id:
-            continue
-
-        # Extract phase and timestamp
-        remaining = tag_parts[3]  # "phase1-20251012-143000"
-        phase_timestamp = remaining.rsplit("-", 2)  # Split from right to preserve phase name
-        if len(phase_timestamp) == 3:
-            phase = phase_timestamp[0]
-            timestamp_str = f"{phase_timestamp[1]}-{phase_timestamp[2]}"
-            # Convert timestamp to ISO format
-            try:
-                dt = datetime.strptime(timestamp_str, "%Y%m%d-%H%M%S")
-                timestamp_iso = dt.replace(tzinfo=timezone.utc).isoformat()
-            except ValueError:
-                timestamp_iso = timestamp_str
-        else:
-            phase = remaining
-            timestamp_iso = ""
-
-        checkpoints.append({
-            "tag_name": tag_name,
-            "prp_id": checkpoint_prp_id,
-            "phase": phase,
-            "timestamp": timestamp_iso,
-            "commit_sha": commit_sha,
-            "message": tag_message
-        })
-
-    return checkpoints
+    return get_checkpoint_manager().list(prp_id)
 
 
 def restore_checkpoint(prp_id: str, phase: Optional[str] = None) -> Dict[str, Any]:
@@ -638,28 +546,22 @@ def restore_checkpoint(prp_id: str, phase: Optional[str] = None) -> Dict[str, An
             f"🔧 Troubleshooting: Commit or stash changes before restoring checkpoint"
         )
 
-    # Find checkpoint
-    checkpoints = list_checkpoints(prp_id)
-    if not checkpoints:
-        raise RuntimeError(
-            f"No checkpoints found for {prp_id}\n"
-            f"🔧 Troubleshooting: Create a checkpoint first with 'ce prp checkpoint <phase>'"
-        )
-
-    # Select checkpoint
-    if phase:
-        checkpoint = next((cp for cp in checkpoints if cp["phase"] == phase), None)
-        if not checkpoint:
-            phases = [cp["phase"] for cp in checkpoints]
+    # Find checkpoint (O(1) lookup in cached ref index)
+    manager = get_checkpoint_manager()
+    checkpoint = manager.latest(prp_id, phase)
+    if not checkpoint:
+        checkpoints = manager.list(prp_id)
+        if not checkpoints:
             raise RuntimeError(
-                f"No checkpoint found for phase '{phase}' in {prp_id}\n"
-                f"Available phases: {', '.join(phases)}\n"
-                f"🔧 Troubleshooting: Use 'ce prp list' to see available checkpoints"
+                f"No checkpoints found for {prp_id}\n"
+                f"🔧 Troubleshooting: Create a checkpoint first with 'ce prp checkpoint <phase>'"
             )
-    else:
-        # Use latest (by timestamp)
-        checkpoints.sort(key=lambda x: x["timestamp"], reverse=True)
-        checkpoint = checkpoints[0]
+        phases = [cp["phase"] for cp in checkpoints]
+        raise RuntimeError(
+            f"No checkpoint found for phase '{phase}' in {prp_id}\n"
+            f"Available phases: {', '.join(phases)}\n"
+            f"🔧 Troubleshooting: Use 'ce prp list' to see available checkpoints"
+        )
 
     # Confirmation if interactive
     if sys.stdout.isatty():
@@ -699,40 +601,11 @@ def delete_intermediate_checkpoints(prp_id: str, keep_final: bool = True) -> Dic
         }
 
     Process:
-        1. List all checkpoints for prp_id
+        1. List all checkpoints for prp_id (cached ref index)
         2. Filter: keep *-final if keep_final=True
-        3. Delete remaining tags: git tag -d {tag_name}
+        3. Delete remaining tags in one `git update-ref --stdin` transaction
     """
-    from .core import run_cmd
-
-    checkpoints = list_checkpoints(prp_id)
-    if not checkpoints:
-        return {"success": True, "deleted_count": 0, "kept": []}
-
-    to_delete = []
-    kept = []
-
-    for checkpoint in checkpoints:
-        if keep_final and checkpoint["phase"] == "final":
-            kept.append(checkpoint["tag_name"])
-        else:
-            to_delete.append(checkpoint["tag_name"])
-
-    # Delete tags
-    deleted_count = 0
-    for tag_name in to_delete:
-        result = run_cmd(f"git tag -d {tag_name}")
-        if result["success"]:
-            deleted_count += 1
-            logger.info(f"Deleted checkpoint: {tag_name}")
-        else:
-            logger.warning(f"Failed to delete tag {tag_name}: {result['stderr']}")
-
-    return {
-        "success": True,
-        "deleted_count": deleted_count,
-        "kept": kept
-    }
+    return get_checkpoint_manager().prune(prp_id, keep_final=keep_final)
 
 
 # ============================================================================
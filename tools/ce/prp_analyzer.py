@@ -2,13 +2,47 @@
 
 Analyzes PRP documents for size constraints and provides decomposition
 recommendations to prevent "PRP obesity".
+
+Corpus mode (analyze_corpus) analyzes every PRP in the repo across a
+process pool and aggregates size/score/hours/risk distributions. Metrics
+are extracted in one combined regex pass and cached by content hash
+(in memory and under .ce/cache/prp-metrics/), so re-runs only scan
+changed PRPs.
 """
 
+import csv
+import io
+import json
+import os
 import re
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional
+from statistics import mean, median
+from typing import Any, Dict, List, Optional
+
+from .prp_sections import PRPDocument, load_prp, read_disk_cache, write_disk_cache
+
+# One pass over the content: each alternative starts with a distinct literal,
+# so matches never shadow each other.
+_METRICS_RE = re.compile(
+    r"estimated_hours:\s*(?P<hours>[0-9]+(?:-[0-9]+)?)"
+    r"|\*\*Risk\*\*:\s*(?P<risk>LOW|MEDIUM|HIGH)"
+    r"|(?P<func>def \w+\()"
+    r"|(?P<crit>- \[[ x]\])"
+)
+_EFFORT_RE = re.compile(r"Effort.*?([0-9]+-?[0-9]*)\s*hour", re.IGNORECASE)
+
+# Bump when _scan_metrics() or _METRICS_RE changes (invalidates on-disk entries)
+METRICS_CACHE_VERSION = 1
+_METRICS_CACHE_KIND = "prp-metrics"
+_METRICS_CACHE_SIZE = 1024
+_metrics_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+# Below this many files a process pool costs more than it saves
+_PARALLEL_THRESHOLD = 32
 
 
 class SizeCategory(Enum):
@@ -61,48 +95,74 @@ def extract_prp_metrics(prp_file: Path) -> PRPMetrics:
         )
 
     try:
-        content = prp_file.read_text()
+        doc = load_prp(prp_file)
     except Exception as e:
         raise RuntimeError(
             f"Failed to read PRP file: {e}\n"
             f"🔧 Troubleshooting: Check file permissions"
         )
 
-    # Extract metrics
-    name = prp_file.stem
-    lines = len(content.split('\n'))
-
-    # Hours - try multiple patterns
-    hours_match = re.search(r'estimated_hours:\s*([0-9]+(?:-[0-9]+)?)', content)
-    if not hours_match:
-        hours_match = re.search(r'Effort.*?([0-9]+-?[0-9]*)\s*hour', content, re.IGNORECASE)
-    hours = hours_match.group(1) if hours_match else None
-
-    # Phases
-    phases = len(re.findall(r'^### Phase [0-9]+', content, re.MULTILINE))
-
-    # Risk
-    risk_match = re.search(r'\*\*Risk\*\*:\s*(LOW|MEDIUM|HIGH)', content)
-    risk = risk_match.group(1) if risk_match else 'UNKNOWN'
-
-    # Functions (code examples in PRP)
-    functions = len(re.findall(r'def \w+\(', content))
-
-    # Success criteria
-    criteria = len(re.findall(r'- \[[ x]\]', content))
+    fields = _metrics_cache.get(doc.content_hash)
+    if fields is None:
+        cache_key = f"{doc.content_hash}-v{METRICS_CACHE_VERSION}"
+        fields = read_disk_cache(_METRICS_CACHE_KIND, cache_key)
+        if fields is None:
+            fields = _scan_metrics(doc)
+            write_disk_cache(_METRICS_CACHE_KIND, cache_key, fields)
+        _metrics_cache[doc.content_hash] = fields
+        if len(_metrics_cache) > _METRICS_CACHE_SIZE:
+            _metrics_cache.popitem(last=False)
+    else:
+        _metrics_cache.move_to_end(doc.content_hash)
 
     return PRPMetrics(
-        name=name,
-        lines=lines,
-        estimated_hours=hours,
-        phases=phases,
-        risk_level=risk,
-        functions=functions,
-        success_criteria=criteria,
+        name=prp_file.stem,
+        lines=fields["lines"],
+        estimated_hours=fields["hours"],
+        phases=fields["phases"],
+        risk_level=fields["risk"],
+        functions=fields["functions"],
+        success_criteria=fields["criteria"],
         file_path=prp_file
     )
 
 
+def _scan_metrics(doc: PRPDocument) -> Dict[str, Any]:
+    """Content-derived metric fields from one combined regex pass.
+
+    Line count and phases come from the cached section table (headings
+    inside code fences excluded).
+    """
+    hours = None
+    risk = None
+    functions = 0
+    criteria = 0
+
+    for match in _METRICS_RE.finditer(doc.content):
+        if match.group("func"):
+            functions += 1
+        elif match.group("crit"):
+            criteria += 1
+        elif match.group("hours"):
+            hours = hours or match.group("hours")
+        elif match.group("risk"):
+            risk = risk or match.group("risk")
+
+    # Fallback pattern only when there is no estimated_hours field
+    if hours is None:
+        effort_match = _EFFORT_RE.search(doc.content)
+        hours = effort_match.group(1) if effort_match else None
+
+    return {
+        "lines": doc.line_count,
+        "hours": hours,
+        "phases": len(doc.find_all(r'Phase [0-9]+', level=3)),
+        "risk": risk or 'UNKNOWN',
+        "functions": functions,
+        "criteria": criteria
+    }
+
+
 def calculate_complexity_score(metrics: PRPMetrics) -> float:
     """Calculate complexity score (0-100) for a PRP.
 
@@ -312,7 +372,6 @@ def format_analysis_report(analysis: PRPAnalysis, json_output: bool = False) ->
         Formatted report string
     """
     if json_output:
-        import json
         data = {
             'name': analysis.metrics.name,
             'size_category': analysis.size_category.value,
@@ -358,3 +417,206 @@ def format_analysis_report(analysis: PRPAnalysis, json_output: bool = False) ->
     lines.append(f"\n{'='*80}\n")
 
     return '\n'.join(lines)
+
+
+# ============================================================================
+# Corpus mode
+# ============================================================================
+
+CORPUS_CSV_FIELDS = [
+    'name', 'path', 'size_category', 'complexity_score', 'lines', 'hours',
+    'phases', 'risk', 'functions', 'criteria'
+]
+
+
+def discover_prp_files(root: Optional[Path] = None) -> List[Path]:
+    """Find all PRP-*.md files under <project root>/PRPs (recursive).
+
+    Args:
+        root: Project root (default: cwd, or its parent when run from tools/)
+
+    Returns:
+        Sorted list of PRP file paths
+    """
+    if root is None:
+        current_dir = Path.cwd()
+        root = current_dir.parent if current_dir.name == "tools" else current_dir
+
+    prps_dir = Path(root) / "PRPs"
+    if not prps_dir.is_dir():
+        return []
+    return sorted(prps_dir.rglob("PRP-*.md"))
+
+
+def analyze_corpus(
+    paths: Optional[List[Path]] = None,
+    root: Optional[Path] = None,
+    workers: Optional[int] = None
+) -> Dict[str, Any]:
+    """Analyze many PRPs across a process pool and aggregate distributions.
+
+    Small corpora (or workers=1) are analyzed in-process. Unreadable PRPs
+    are reported under "errors" instead of failing the whole run.
+
+    Args:
+        paths: PRP files to analyze (default: discover_prp_files(root))
+        root: Project root for discovery
+        workers: Process pool size (default: CPU count)
+
+    Returns:
+        {"prps": [row, ...], "errors": [{"path", "error"}, ...], "summary": {...}}
+        Rows follow input order; see CORPUS_CSV_FIELDS for row keys.
+    """
+    files = [str(p) for p in (paths if paths is not None else discover_prp_files(root))]
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or len(files) < _PARALLEL_THRESHOLD:
+        rows = [_analyze_corpus_entry(f) for f in files]
+    else:
+        # Large chunks amortize IPC; 4 chunks per worker keeps load balanced
+        chunksize = max(1, len(files) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            rows = list(pool.map(_analyze_corpus_entry, files, chunksize=chunksize))
+
+    prps = [r for r in rows if "error" not in r]
+    errors = [r for r in rows if "error" in r]
+
+    return {
+        "prps": prps,
+        "errors": errors,
+        "summary": summarize_corpus(prps)
+    }
+
+
+def summarize_corpus(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Aggregate size category, complexity, hours and risk distributions.
+
+    Hour ranges ("2-3") count as their midpoint.
+
+    Args:
+        rows: Per-PRP rows from analyze_corpus()
+
+    Returns:
+        Summary dict with total, size_categories, complexity, hours, risk
+    """
+    scores = [r['complexity_score'] for r in rows]
+    hours = [h for h in (_hours_value(r['hours']) for r in rows) if h is not None]
+
+    histogram = {f"{lo}-{lo + 10}": 0 for lo in range(0, 100, 10)}
+    for score in scores:
+        lo = min(int(score // 10) * 10, 90)
+        histogram[f"{lo}-{lo + 10}"] += 1
+
+    size_categories = {c.value: 0 for c in SizeCategory}
+    risk: Dict[str, int] = {}
+    for r in rows:
+        size_categories[r['size_category']] += 1
+        risk[r['risk']] = risk.get(r['risk'], 0) + 1
+
+    return {
+        'total': len(rows),
+        'size_categories': size_categories,
+        'complexity': {
+            'min': min(scores) if scores else None,
+            'max': max(scores) if scores else None,
+            'mean': round(mean(scores), 2) if scores else None,
+            'median': round(median(scores), 2) if scores else None,
+            'histogram': histogram
+        },
+        'hours': {
+            'known': len(hours),
+            'unknown': len(rows) - len(hours),
+            'total': round(sum(hours), 1),
+            'mean': round(mean(hours), 2) if hours else None,
+            'median': round(median(hours), 2) if hours else None
+        },
+        'risk': dict(sorted(risk.items()))
+    }
+
+
+def format_corpus_report(result: Dict[str, Any], output_format: str = "text") -> str:
+    """Format analyze_corpus() results as text summary, JSON or CSV.
+
+    Args:
+        result: analyze_corpus() result
+        output_format: "text", "json" or "csv" (CSV has one row per PRP)
+
+    Returns:
+        Formatted report string
+    """
+    if output_format == "json":
+        return json.dumps(result, indent=2)
+
+    if output_format == "csv":
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=CORPUS_CSV_FIELDS, lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(result["prps"])
+        return buffer.getvalue()
+
+    summary = result["summary"]
+    complexity = summary["complexity"]
+    hours = summary["hours"]
+    lines = [
+        f"\n{'='*80}",
+        f"PRP Corpus Analysis: {summary['total']} PRPs",
+        f"{'='*80}",
+        f"\nSize Categories:",
+    ]
+    for category, count in summary["size_categories"].items():
+        lines.append(f"  {category:<7} {count}")
+
+    lines.append(f"\nComplexity Score:")
+    lines.append(
+        f"  min {complexity['min']}  median {complexity['median']}  "
+        f"mean {complexity['mean']}  max {complexity['max']}"
+    )
+    for bucket, count in complexity["histogram"].items():
+        lines.append(f"  {bucket:>7}: {'#' * count} {count}")
+
+    lines.append(f"\nEstimated Hours:")
+    lines.append(
+        f"  known {hours['known']}  unknown {hours['unknown']}  "
+        f"total {hours['total']}  mean {hours['mean']}"
+    )
+
+    lines.append(f"\nRisk:")
+    for level, count in summary["risk"].items():
+        lines.append(f"  {level:<8} {count}")
+
+    if result["errors"]:
+        lines.append(f"\nErrors ({len(result['errors'])}):")
+        for err in result["errors"]:
+            lines.append(f"  • {err['path']}: {err['error']}")
+
+    lines.append(f"\n{'='*80}\n")
+    return '\n'.join(lines)
+
+
+def _analyze_corpus_entry(path: str) -> Dict[str, Any]:
+    """Process-pool worker: one flat, picklable row per PRP."""
+    try:
+        metrics = extract_prp_metrics(Path(path))
+    except Exception as e:
+        return {'path': path, 'error': str(e).split('\n')[0]}
+
+    score = calculate_complexity_score(metrics)
+    return {
+        'name': metrics.name,
+        'path': path,
+        'size_category': categorize_prp_size(score, metrics).value,
+        'complexity_score': score,
+        'lines': metrics.lines,
+        'hours': metrics.estimated_hours,
+        'phases': metrics.phases,
+        'risk': metrics.risk_level,
+        'functions': metrics.functions,
+        'criteria': metrics.success_criteria
+    }
+
+
+def _hours_value(hours: Optional[str]) -> Optional[float]:
+    if not hours:
+        return None
+    bounds = [float(part) for part in hours.split('-') if part]
+    return sum(bounds) / len(bounds) if bounds else None
@@ -0,0 +1,297 @@
+"""Single-pass PRP markdown sectionizer with content-hash caching.
+
+Splits a PRP into YAML front matter plus a flat list of heading sections
+(with parent/child structure implied by heading level) in one scan over
+the text. Fenced code blocks are skipped, so `## ...` lines inside examples
+are not mistaken for headings.
+
+Parsed section tables are cached by SHA-256 of the content, in memory and
+(inside a CE project) on disk under .ce/cache/prp-sections/, so a PRP is
+tokenized once per content version no matter how many consumers read it
+during `ce prp execute` + validation.
+
+Offsets are str indices into PRPDocument.content.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+from collections import OrderedDict
+from dataclasses import dataclass, astuple
+from pathlib import Path
+from typing import Any, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = ".ce/cache"
+# Bump when Section/PRPDocument parsing changes (invalidates on-disk entries)
+SECTIONS_CACHE_VERSION = 1
+_MEMORY_CACHE_SIZE = 256
+_PATH_CACHE_SIZE = 256
+
+_HEADING_RE = re.compile(r"(#{1,6})[ \t]+(.*?)[ \t#]*$")
+_FENCE_RE = re.compile(r"(`{3,}|~{3,})")
+
+
+@dataclass(frozen=True)
+class Section:
+    """One markdown heading section.
+
+    Attributes:
+        level: Heading level (2 for "## Title")
+        title: Heading text without #'s
+        start: Offset of the heading line
+        body_start: Offset just after the heading line
+        end: End of section including subsections
+        own_end: End of section text before its first subheading
+    """
+    level: int
+    title: str
+    start: int
+    body_start: int
+    end: int
+    own_end: int
+
+
+class PRPDocument:
+    """Parsed PRP: raw content, front matter and heading sections.
+
+    Example:
+        doc = load_prp("PRPs/executed/PRP-1-foo.md")
+        section = doc.find(r"🔧\\s+Implementation\\s+Blueprint", level=2)
+        if section:
+            blueprint_text = doc.text(section)
+    """
+
+    def __init__(self, path: Path, content: str, content_hash: str,
+                 frontmatter_end: int, sections: List[Section]):
+        self.path = path
+        self.content = content
+        self.content_hash = content_hash
+        self.frontmatter_end = frontmatter_end
+        self.sections = sections
+
+    @property
+    def frontmatter(self) -> Optional[str]:
+        """YAML front matter text (between --- markers), or None."""
+        if not self.frontmatter_end:
+            return None
+        block = self.content[:self.frontmatter_end]
+        return block[4:block.rfind("\n---")]
+
+    @property
+    def line_count(self) -> int:
+        """Line count matching len(content.split('\\n'))."""
+        return self.content.count("\n") + 1
+
+    def find(self, title_pattern: str, level: Optional[int] = None) -> Optional[Section]:
+        """First section whose title matches regex (case-insensitive, anchored at start)."""
+        matches = self.find_all(title_pattern, level)
+        return matches[0] if matches else None
+
+    def find_all(self, title_pattern: str, level: Optional[int] = None) -> List[Section]:
+        """All sections whose title matches regex (case-insensitive, anchored at start)."""
+        pattern = re.compile(title_pattern, re.IGNORECASE)
+        return [
+            s for s in self.sections
+            if (level is None or s.level == level) and pattern.match(s.title)
+        ]
+
+    def children(self, section: Section) -> List[Section]:
+        """Direct subsections of section."""
+        nested = [
+            s for s in self.sections
+            if section.body_start <= s.start < section.end
+        ]
+        if not nested:
+            return []
+        child_level = min(s.level for s in nested)
+        return [s for s in nested if s.level == child_level]
+
+    def text(self, section: Section, include_subsections: bool = True) -> str:
+        """Section body text (without its heading line)."""
+        end = section.end if include_subsections else section.own_end
+        return self.content[section.body_start:end]
+
+
+def parse_sections(content: str) -> Tuple[int, List[Section]]:
+    """Split markdown into front matter end offset and heading sections.
+
+    Args:
+        content: PRP markdown text
+
+    Returns:
+        (frontmatter_end, sections) - frontmatter_end is 0 if no front matter
+    """
+    frontmatter_end = 0
+    if content.startswith("---\n"):
+        close = re.search(r"\n---[ \t]*(?:\n|$)", content[3:])
+        if close:
+            frontmatter_end = 3 + close.end()
+
+    headings: List[Tuple[int, str, int, int]] = []  # (level, title, start, body_start)
+    fence: Optional[str] = None
+    pos = frontmatter_end
+
+    for line in content[frontmatter_end:].splitlines(keepends=True):
+        line_start = pos
+        pos += len(line)
+        stripped = line.strip()
+
+        fence_match = _FENCE_RE.match(stripped)
+        if fence_match:
+            marker = fence_match.group(1)
+            if fence is None:
+                fence = marker
+            elif marker[0] == fence[0] and len(marker) >= len(fence) and stripped == marker:
+                fence = None
+            continue
+        if fence is not None or not line.startswith("#"):
+            continue
+
+        heading = _HEADING_RE.match(line.rstrip("\r\n"))
+        if heading:
+            headings.append((len(heading.group(1)), heading.group(2), line_start, pos))
+
+    sections = []
+    for i, (level, title, start, body_start) in enumerate(headings):
+        end = len(content)
+        for later_level, _, later_start, _ in headings[i + 1:]:
+            if later_level <= level:
+                end = later_start
+                break
+        own_end = headings[i + 1][2] if i + 1 < len(headings) else len(content)
+        sections.append(Section(level, title, start, body_start, end, min(own_end, end)))
+
+    return frontmatter_end, sections
+
+
+# ============================================================================
+# Cache
+# ============================================================================
+
+_memory_cache: "OrderedDict[str, Tuple[int, List[Section]]]" = OrderedDict()
+_path_cache: "OrderedDict[str, Tuple[int, int, PRPDocument]]" = OrderedDict()
+
+
+def load_prp(path: Union[str, Path]) -> PRPDocument:
+    """Load and sectionize a PRP, reusing cached parses.
+
+    Lookup order: (path, mtime, size) → in-memory by content hash →
+    on-disk by content hash → fresh parse.
+
+    Args:
+        path: PRP markdown file
+
+    Returns:
+        PRPDocument
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+    """
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(
+            f"PRP file not found: {path}\n"
+            f"🔧 Troubleshooting: Verify file path is correct"
+        )
+
+    st = path.stat()
+    key = str(path.resolve())
+    cached = _path_cache.get(key)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        _path_cache.move_to_end(key)
+        return cached[2]
+
+    content = path.read_text()
+    content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+    frontmatter_end, sections = _lookup_sections(content, content_hash)
+
+    doc = PRPDocument(path, content, content_hash, frontmatter_end, sections)
+    _path_cache[key] = (st.st_mtime_ns, st.st_size, doc)
+    _path_cache.move_to_end(key)
+    if len(_path_cache) > _PATH_CACHE_SIZE:
+        _path_cache.popitem(last=False)
+    return doc
+
+
+def clear_cache() -> None:
+    """Drop in-memory caches (on-disk cache is content-addressed and never stale)."""
+    _memory_cache.clear()
+    _path_cache.clear()
+
+
+def _lookup_sections(content: str, content_hash: str) -> Tuple[int, List[Section]]:
+    if content_hash in _memory_cache:
+        _memory_cache.move_to_end(content_hash)
+        return _memory_cache[content_hash]
+
+    parsed = None
+    cache_key = f"{content_hash}-v{SECTIONS_CACHE_VERSION}"
+    data = read_disk_cache("prp-sections", cache_key)
+    if data is not None:
+        try:
+            parsed = data["frontmatter_end"], [Section(*row) for row in data["sections"]]
+        except (KeyError, TypeError) as e:
+            logger.debug(f"Ignoring corrupt section cache {cache_key}: {e}")
+
+    if parsed is None:
+        parsed = parse_sections(content)
+        write_disk_cache("prp-sections", cache_key, {
+            "frontmatter_end": parsed[0],
+            "sections": [list(astuple(s)) for s in parsed[1]]
+        })
+
+    _memory_cache[content_hash] = parsed
+    if len(_memory_cache) > _MEMORY_CACHE_SIZE:
+        _memory_cache.popitem(last=False)
+    return parsed
+
+
+def read_disk_cache(kind: str, content_hash: str, root: Optional[Path] = None) -> Optional[Any]:
+    """Read JSON entry from .ce/cache/<kind>/<hash>.json (None if absent).
+
+    Disk caching is only active inside a CE project (root, default cwd,
+    has .ce/).
+    """
+    root = Path(root) if root is not None else Path(".")
+    if not (root / ".ce").is_dir():
+        return None
+
+    cache_file = root / CACHE_DIR / kind / f"{content_hash}.json"
+    if not cache_file.exists():
+        return None
+
+    try:
+        return json.loads(cache_file.read_text())
+    except (OSError, ValueError) as e:
+        logger.debug(f"Ignoring corrupt cache entry {cache_file}: {e}")
+        return None
+
+
+def write_disk_cache(kind: str, content_hash: str, data: Any, root: Optional[Path] = None) -> None:
+    """Write JSON entry to .ce/cache/<kind>/<hash>.json (no-op outside CE project).
+
+    Written to a temp file and renamed, so concurrent readers never see a
+    partial entry.
+    """
+    root = Path(root) if root is not None else Path(".")
+    if not (root / ".ce").is_dir():
+        return
+
+    cache_dir = root / CACHE_DIR / kind
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_dir, prefix=f".{content_hash}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_name, cache_dir / f"{content_hash}.json")
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError as e:
+        logger.debug(f"Failed to write {kind} cache: {e}")
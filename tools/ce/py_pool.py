@@ -0,0 +1,595 @@
+"""Warm interpreter pool for ce run_py.
+
+PyWorkerPool keeps pre-started interpreters (ce/py_worker.py) that have
+already imported the configured modules. Code is sent over a pipe and
+runs in a fresh namespace, by default in a child forked from the warm
+worker (per-call isolation, timeout and memory limit), so small snippets
+return in milliseconds instead of paying interpreter startup each time.
+
+A CLI invocation is a short-lived process, so `ce run_py --warm` talks
+to a per-project pool server over a Unix socket; the first call starts
+the server, which exits after IDLE_TIMEOUT seconds without requests.
+
+Preloaded modules come from $CE_RUN_PY_PRELOAD (comma-separated).
+
+Each run gets the caller's os.environ (run_warm sends it with every
+request). Variables only read at interpreter startup (PYTHONPATH,
+PYTHONHASHSEED, ...) or by preloaded modules at import time still come
+from the environment that started the worker.
+
+Example:
+    pool = PyWorkerPool(size=2, preload=["json", "yaml"])
+    result = pool.run(code="import yaml; print(yaml.__version__)")
+    pool.close()
+
+    result = run_warm(code="print(1 + 1)")  # Via the shared pool server
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import logging
+import os
+import queue
+import shutil
+import signal
+import socket
+import socketserver
+import stat
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+try:
+    import fcntl
+except ImportError:  # Windows (no pool server, see warm_supported)
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+WORKER_SCRIPT = Path(__file__).with_name("py_worker.py")
+PRELOAD_ENV = "CE_RUN_PY_PRELOAD"
+DEFAULT_POOL_SIZE = 2
+IDLE_TIMEOUT = 900  # Seconds before an unused pool server exits
+STARTUP_TIMEOUT = 60
+_REPLY_GRACE = 5  # Seconds on top of a request timeout before the worker is killed
+_STDERR_TAIL_LINES = 50
+
+
+def default_interpreter() -> List[str]:
+    """Interpreter command for workers (project env via uv when available)."""
+    return ["uv", "run", "python"] if shutil.which("uv") else [sys.executable]
+
+
+def default_preload() -> List[str]:
+    """Modules to preload, from $CE_RUN_PY_PRELOAD."""
+    return [m.strip() for m in os.environ.get(PRELOAD_ENV, "").split(",") if m.strip()]
+
+
+def warm_supported() -> bool:
+    """True if the platform supports the pool server (Unix sockets and fork)."""
+    return hasattr(socket, "AF_UNIX") and hasattr(os, "fork") and fcntl is not None
+
+
+class PyWorker:
+    """One warm interpreter process speaking the py_worker protocol.
+
+    Attributes:
+        info: Startup message (pid, preloaded, failed)
+    """
+
+    def __init__(self, interpreter: Sequence[str], preload: Sequence[str],
+                 startup_timeout: float = STARTUP_TIMEOUT):
+        self.process = subprocess.Popen(
+            [*interpreter, str(WORKER_SCRIPT), "--preload", ",".join(preload)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            bufsize=1,
+            start_new_session=True,
+        )
+        self._replies: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+        self._stderr_tail: deque = deque(maxlen=_STDERR_TAIL_LINES)
+        self._ids = itertools.count(1)
+        threading.Thread(target=self._read_loop, daemon=True).start()
+        threading.Thread(target=self._drain_stderr, daemon=True).start()
+
+        self.info = self._next_reply(startup_timeout)
+        if self.info.get("failed"):
+            logger.warning(f"Worker could not preload: {self.info['failed']}")
+
+    @property
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def execute(self, request: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """Send one request and wait for its reply.
+
+        Raises:
+            TimeoutError: If no reply arrives in time (worker is killed)
+            RuntimeError: If the worker died
+        """
+        request = dict(request, id=next(self._ids))
+        try:
+            self.process.stdin.write(json.dumps(request) + "\n")
+            self.process.stdin.flush()
+        except (BrokenPipeError, OSError) as e:
+            raise RuntimeError(self._died_message()) from e
+        try:
+            return self._next_reply(timeout + _REPLY_GRACE)
+        except TimeoutError:
+            self.close(timeout=0)
+            raise
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Stop the worker (kill if it does not exit within timeout)."""
+        if self.process.stdin and not self.process.stdin.closed:
+            try:
+                self.process.stdin.close()
+            except OSError:
+                pass
+        try:
+            self.process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            try:
+                os.killpg(self.process.pid, signal.SIGKILL)  # Worker and forked runs
+            except (ProcessLookupError, PermissionError):
+                self.process.kill()
+            self.process.wait()
+
+    def _next_reply(self, timeout: float) -> Dict[str, Any]:
+        try:
+            reply = self._replies.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(
+                f"Python worker did not answer within {timeout:.0f}s\n"
+                f"🔧 Troubleshooting: Increase timeout or check for a hanging snippet"
+            ) from None
+        if reply is None:
+            raise RuntimeError(self._died_message())
+        return reply
+
+    def _read_loop(self) -> None:
+        for line in self.process.stdout:
+            try:
+                self._replies.put(json.loads(line))
+            except ValueError:
+                logger.debug(f"Ignoring non-protocol worker output: {line.rstrip()}")
+        self._replies.put(None)  # EOF: worker exited
+
+    def _drain_stderr(self) -> None:
+        for line in self.process.stderr:
+            self._stderr_tail.append(line.rstrip("\n"))
+
+    def _died_message(self) -> str:
+        tail = "\n".join(self._stderr_tail)
+        return (
+            f"Python worker exited (code {self.process.poll()})\n"
+            f"{tail}\n"
+            f"🔧 Troubleshooting: Check the interpreter and preloaded modules ({PRELOAD_ENV})"
+        )
+
+
+class PyWorkerPool:
+    """Fixed-size pool of warm PyWorkers (thread-safe).
+
+    Workers start lazily up to size; a worker that times out or dies is
+    replaced on the next request.
+    """
+
+    def __init__(
+        self,
+        size: int = DEFAULT_POOL_SIZE,
+        preload: Optional[Sequence[str]] = None,
+        interpreter: Optional[Sequence[str]] = None,
+        isolate: bool = True,
+        memory_mb: Optional[int] = None
+    ):
+        """Initialize pool.
+
+        Args:
+            size: Max concurrent workers
+            preload: Modules imported once per worker (default: default_preload())
+            interpreter: Worker interpreter command (default: default_interpreter())
+            isolate: Fork a child per request (fresh process state, enforced
+                timeout and memory limit); False runs code in the worker itself
+            memory_mb: Address-space limit per isolated request
+        """
+        self.size = max(1, size)
+        self.preload = list(default_preload() if preload is None else preload)
+        self.interpreter = list(interpreter or default_interpreter())
+        self.isolate = isolate
+        self.memory_mb = memory_mb
+        self._idle: List[PyWorker] = []
+        self._started = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def run(
+        self,
+        code: Optional[str] = None,
+        file: Optional[str] = None,
+        argv: Optional[Sequence[str]] = None,
+        cwd: Optional[str] = None,
+        timeout: float = 120,
+        isolate: Optional[bool] = None,
+        memory_mb: Optional[int] = None,
+        env: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """Run a snippet or file on a warm worker.
+
+        Args:
+            code: Python source
+            file: Python file (alternative to code)
+            argv: Script arguments (sys.argv[1:])
+            cwd: Working directory (default: current)
+            env: Environment for the run (default: the worker's own)
+            timeout: Seconds before the run is killed
+            isolate: Override the pool's isolation setting
+            memory_mb: Override the pool's memory limit
+
+        Returns:
+            Same dict as core.run_cmd plus truncated (bool)
+
+        Raises:
+            ValueError: If neither or both of code and file are given
+            TimeoutError: If the run exceeds timeout
+            RuntimeError: If a worker cannot be started or dies
+        """
+        if (code is None) == (file is None):
+            raise ValueError(
+                "Provide exactly one of 'code' or 'file'\n"
+                "🔧 Troubleshooting: Check inputs"
+            )
+        start = time.time()
+        request = {
+            "code": code,
+            "file": str(Path(file).resolve()) if file else None,
+            "argv": list(argv or []),
+            "cwd": str(cwd or os.getcwd()),
+            "env": dict(env) if env is not None else None,
+            "timeout": timeout,
+            "memory_mb": memory_mb if memory_mb is not None else self.memory_mb,
+            "isolate": self.isolate if isolate is None else isolate,
+        }
+
+        worker = self._acquire()
+        try:
+            reply = worker.execute(request, timeout)
+        except (TimeoutError, RuntimeError):
+            worker.close(timeout=0)
+            self._release(None)
+            raise
+        self._release(worker)
+
+        if reply.get("timed_out"):
+            raise TimeoutError(
+                f"Python run timed out after {timeout}s\n"
+                f"🔧 Troubleshooting: Increase timeout or check for hanging code"
+            )
+        return {
+            "success": reply["exit_code"] == 0,
+            "stdout": reply["stdout"],
+            "stderr": reply["stderr"],
+            "exit_code": reply["exit_code"],
+            "duration": time.time() - start,
+            "truncated": reply.get("truncated", False),
+        }
+
+    def warm_up(self) -> None:
+        """Start all workers now instead of on first use."""
+        workers = [self._acquire() for _ in range(self.size)]
+        for worker in workers:
+            self._release(worker)
+
+    def close(self) -> None:
+        """Stop all idle workers; busy ones stop when released."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for worker in idle:
+            worker.close()
+
+    def _acquire(self) -> PyWorker:
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Python worker pool is closed")
+                while self._idle:
+                    worker = self._idle.pop()
+                    if worker.alive:
+                        return worker
+                    self._started -= 1
+                if self._started < self.size:
+                    self._started += 1
+                    break
+                self._cond.wait()
+
+        try:
+            return PyWorker(self.interpreter, self.preload)
+        except BaseException:
+            self._release(None)
+            raise
+
+    def _release(self, worker: Optional[PyWorker]) -> None:
+        with self._cond:
+            if worker is None or not worker.alive:
+                self._started -= 1
+            elif self._closed:
+                self._started -= 1
+                threading.Thread(target=worker.close, daemon=True).start()
+            else:
+                self._idle.append(worker)
+            self._cond.notify()
+
+
+# ----------------------------------------------------------------------
+# Pool server (shared across CLI invocations)
+# ----------------------------------------------------------------------
+
+def socket_dir() -> Path:
+    """Private (0700, owned by this user) directory for pool sockets.
+
+    $XDG_RUNTIME_DIR/ce when set, else <tmp>/ce-<uid>.
+
+    Raises:
+        RuntimeError: If the directory is owned by someone else or is
+            accessible to other users
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    path = Path(runtime_dir) / "ce" if runtime_dir else Path(tempfile.gettempdir()) / f"ce-{os.getuid()}"
+    try:
+        path.mkdir(mode=0o700, exist_ok=True)
+    except OSError as e:
+        raise RuntimeError(
+            f"Cannot create socket directory {path}: {e}\n"
+            f"🔧 Troubleshooting: Check permissions of {path.parent}"
+        ) from e
+    info = path.lstat()
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise RuntimeError(
+            f"Socket directory {path} is not a private directory owned by you\n"
+            f"🔧 Troubleshooting: Remove it (or chmod 700 if it is yours) and retry"
+        )
+    return path
+
+
+def default_socket_path(project_root: Optional[Path] = None) -> Path:
+    """Per-user, per-project socket path (short enough for AF_UNIX)."""
+    cwd = Path.cwd()
+    root = project_root or (cwd.parent if cwd.name == "tools" else cwd)
+    digest = hashlib.sha256(str(Path(root).resolve()).encode()).hexdigest()[:12]
+    return socket_dir() / f"run-py-{digest}.sock"
+
+
+def _check_socket_owner(socket_path: Path) -> None:
+    """Refuse sockets not created by this user (FileNotFoundError if absent)."""
+    info = socket_path.lstat()
+    if not stat.S_ISSOCK(info.st_mode) or info.st_uid != os.getuid():
+        raise RuntimeError(
+            f"Refusing to use {socket_path}: not a socket owned by you\n"
+            f"🔧 Troubleshooting: Remove the file; the pool server recreates it"
+        )
+
+
+class PoolServerRunningError(RuntimeError):
+    """Another pool server already owns the socket path."""
+
+
+class PyPoolServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server running requests on a PyWorkerPool.
+
+    Each connection carries one JSON request line and gets one JSON reply
+    line. The server shuts down after idle_timeout seconds without requests.
+
+    One server per socket path: the server holds an exclusive lock on
+    <socket>.lock for its lifetime and only removes the socket it bound.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path, pool: PyWorkerPool, idle_timeout: float = IDLE_TIMEOUT):
+        """Bind the socket.
+
+        Raises:
+            PoolServerRunningError: If another server holds the socket path
+        """
+        self.pool = pool
+        self.idle_timeout = idle_timeout
+        self.last_used = time.time()
+        self.active = 0
+        self._lock = threading.Lock()
+        self.socket_path = Path(socket_path)
+
+        self._lock_file = open(self.socket_path.with_name(self.socket_path.name + ".lock"), "a")
+        try:
+            fcntl.flock(self._lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            self._lock_file.close()
+            raise PoolServerRunningError(
+                f"A pool server is already serving {self.socket_path}\n"
+                f"🔧 Troubleshooting: Use the running server, or stop it first"
+            ) from None
+
+        try:
+            self.socket_path.unlink(missing_ok=True)  # Stale: its server no longer holds the lock
+            old_umask = os.umask(0o177)  # Socket readable by its owner only
+            try:
+                super().__init__(str(self.socket_path), _PoolRequestHandler)
+            finally:
+                os.umask(old_umask)
+            self._socket_inode = self.socket_path.lstat().st_ino
+        except BaseException:
+            self._lock_file.close()
+            raise
+
+    def serve_until_idle(self) -> None:
+        """Serve requests until idle for idle_timeout, then clean up."""
+        def watch_idle():
+            while True:
+                time.sleep(min(self.idle_timeout, 5))
+                with self._lock:
+                    if self.active == 0 and time.time() - self.last_used > self.idle_timeout:
+                        break
+            self.shutdown()
+
+        threading.Thread(target=watch_idle, daemon=True).start()
+        try:
+            self.serve_forever()
+        finally:
+            self.server_close()
+            self.pool.close()
+            self._release_socket()
+
+    def _release_socket(self) -> None:
+        """Remove our socket (not one a later server bound) and drop the lock."""
+        try:
+            if self.socket_path.lstat().st_ino == self._socket_inode:
+                self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+        finally:
+            self._lock_file.close()
+
+
+class _PoolRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        server: PyPoolServer = self.server
+        with server._lock:
+            server.active += 1
+        try:
+            request = json.loads(self.rfile.readline())
+            try:
+                reply = server.pool.run(**request)
+            except Exception as e:
+                reply = {"error": str(e), "error_type": type(e).__name__}
+            self.wfile.write((json.dumps(reply) + "\n").encode("utf-8"))
+        finally:
+            with server._lock:
+                server.active -= 1
+                server.last_used = time.time()
+
+
+def _request(socket_path: Path, payload: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+    _check_socket_owner(socket_path)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.settimeout(timeout)
+        conn.connect(str(socket_path))
+        conn.sendall((json.dumps(payload) + "\n").encode("utf-8"))
+        with conn.makefile("r", encoding="utf-8") as reader:
+            line = reader.readline()
+    if not line:
+        raise RuntimeError(
+            "Python pool server closed the connection\n"
+            "🔧 Troubleshooting: Retry; the server restarts on the next call"
+        )
+    return json.loads(line)
+
+
+def _start_server(socket_path: Path) -> None:
+    """Start a detached pool server and wait until it accepts connections."""
+    subprocess.Popen(
+        [sys.executable, "-m", "ce.py_pool", "serve", "--socket", str(socket_path)],
+        cwd=str(Path(__file__).resolve().parents[1]),
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.time() + STARTUP_TIMEOUT
+    while time.time() < deadline:
+        if socket_path.exists():
+            try:
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                    probe.connect(str(socket_path))
+                return
+            except OSError:
+                pass
+        time.sleep(0.05)
+    raise RuntimeError(
+        f"Python pool server did not start ({socket_path})\n"
+        f"🔧 Troubleshooting: Run 'python -m ce.py_pool serve' from tools/ to see errors"
+    )
+
+
+def run_warm(
+    code: Optional[str] = None,
+    file: Optional[str] = None,
+    argv: Optional[Sequence[str]] = None,
+    cwd: Optional[str] = None,
+    timeout: float = 120,
+    socket_path: Optional[Path] = None,
+    env: Optional[Dict[str, str]] = None
+) -> Dict[str, Any]:
+    """Run code on the shared pool server (started on first use).
+
+    Args:
+        code: Python source
+        file: Python file (alternative to code)
+        argv: Script arguments
+        cwd: Working directory (default: current)
+        timeout: Seconds before the run is killed
+        socket_path: Server socket (default: default_socket_path())
+        env: Environment for the run (default: this process's os.environ,
+            not the server's)
+
+    Returns:
+        Same dict as PyWorkerPool.run
+
+    Raises:
+        TimeoutError: If the run exceeds timeout
+        RuntimeError: If the server cannot be reached or the run fails to start
+    """
+    path = Path(socket_path) if socket_path else default_socket_path()
+    payload = {
+        "code": code,
+        "file": str(Path(file).resolve()) if file else None,
+        "argv": list(argv or []),
+        "cwd": str(cwd or os.getcwd()),
+        "env": dict(os.environ if env is None else env),
+        "timeout": timeout,
+    }
+    try:
+        reply = _request(path, payload, timeout + 2 * _REPLY_GRACE)
+    except (FileNotFoundError, ConnectionRefusedError):
+        _start_server(path)
+        reply = _request(path, payload, timeout + STARTUP_TIMEOUT)
+
+    if "error" in reply:
+        error_type = {"TimeoutError": TimeoutError, "ValueError": ValueError}.get(reply["error_type"], RuntimeError)
+        raise error_type(reply["error"])
+    return reply
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m ce.py_pool", description="Warm Python pool server")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    serve_parser = subparsers.add_parser("serve", help="Serve run_py requests on a Unix socket")
+    serve_parser.add_argument("--socket", help="Socket path (default: per-project temp path)")
+    serve_parser.add_argument("--size", type=int, default=DEFAULT_POOL_SIZE, help="Number of workers")
+    serve_parser.add_argument("--memory-mb", type=int, help="Memory limit per run")
+    serve_parser.add_argument("--idle-timeout", type=float, default=IDLE_TIMEOUT, help="Exit after N idle seconds")
+    args = parser.parse_args(argv)
+
+    pool = PyWorkerPool(size=args.size, memory_mb=args.memory_mb)
+    try:
+        server = PyPoolServer(Path(args.socket) if args.socket else default_socket_path(), pool, args.idle_timeout)
+    except PoolServerRunningError as e:
+        logger.info(str(e))  # Lost a startup race - the other server answers
+        pool.close()
+        return 0
+    server.serve_until_idle()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
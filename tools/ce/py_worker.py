@@ -0,0 +1,241 @@
+"""Warm Python worker for ce run_py (stdlib only, launched as a script).
+
+Started by ce.py_pool with the project interpreter. Modules given with
+--preload are imported once; each request then runs in a fresh __main__
+namespace, by default in a child forked from this warm process, so a
+snippet starts without interpreter startup or re-imports and cannot
+leak state into the next one.
+
+Protocol (one JSON object per line on stdin/stdout):
+    startup:  {"ready": true, "pid": int, "preloaded": [...], "failed": {module: error}}
+    request:  {"id", "code" | "file", "argv", "cwd", "env", "timeout", "memory_mb", "isolate"}
+    response: {"id", "stdout", "stderr", "exit_code", "timed_out", "truncated", "duration"}
+
+timeout and memory_mb (RLIMIT_AS) are enforced for isolated (forked)
+requests only; the pool kills the whole worker if an inline request
+overruns. env, when given, replaces os.environ for the run.
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import os
+import selectors
+import signal
+import sys
+import time
+import traceback
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+MAX_OUTPUT = 1_000_000  # Bytes kept per stream
+
+_proto_fds = ()
+
+
+def _exit_code(code) -> int:
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def _execute(request) -> int:
+    """Run request in a fresh __main__ namespace; return its exit code."""
+    path = request.get("file")
+    try:
+        if path:
+            with open(path, "rb") as f:
+                code = compile(f.read(), path, "exec")
+        else:
+            code = compile(request["code"], "<string>", "exec")
+    except (OSError, SyntaxError, ValueError):
+        traceback.print_exc()
+        return 1
+
+    sys.argv = [path or "-c", *request.get("argv", [])]
+    sys.path[0] = os.path.dirname(os.path.abspath(path)) if path else ""
+    namespace = {"__name__": "__main__", "__builtins__": __builtins__}
+    if path:
+        namespace["__file__"] = path
+    try:
+        exec(code, namespace)
+    except SystemExit as e:
+        return _exit_code(e.code)
+    except BaseException:
+        traceback.print_exc()
+        return 1
+    return 0
+
+
+def _replace_environ(env) -> None:
+    """Make os.environ (and the process environment) exactly env."""
+    for key in set(os.environ) - set(env):
+        del os.environ[key]
+    os.environ.update(env)
+
+
+def _collect(pid: int, out_fd: int, err_fd: int, timeout):
+    """Read a child's stdout/stderr until EOF or timeout (child is then killed)."""
+    buffers = {out_fd: bytearray(), err_fd: bytearray()}
+    truncated = False
+    timed_out = False
+    deadline = time.monotonic() + timeout if timeout else None
+
+    with selectors.DefaultSelector() as selector:
+        for fd in buffers:
+            selector.register(fd, selectors.EVENT_READ)
+        while selector.get_map():
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                timed_out = True
+                with contextlib.suppress(ProcessLookupError):
+                    os.kill(pid, signal.SIGKILL)
+                break
+            for key, _ in selector.select(remaining):
+                chunk = os.read(key.fd, 65536)
+                if not chunk:
+                    selector.unregister(key.fd)
+                    continue
+                buffer = buffers[key.fd]
+                room = MAX_OUTPUT - len(buffer)
+                if len(chunk) > room:
+                    truncated = True
+                buffer += chunk[:max(room, 0)]
+
+    for fd in buffers:
+        os.close(fd)
+    return buffers[out_fd], buffers[err_fd], timed_out, truncated
+
+
+def _run_forked(request):
+    """Run request in a child forked from this warm process."""
+    out_r, out_w = os.pipe()
+    err_r, err_w = os.pipe()
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    pid = os.fork()
+    if pid == 0:  # Child
+        code = 1
+        try:
+            for fd in (out_r, err_r, *_proto_fds):
+                os.close(fd)
+            os.dup2(out_w, 1)
+            os.dup2(err_w, 2)
+            os.close(out_w)
+            os.close(err_w)
+            if request.get("cwd"):
+                os.chdir(request["cwd"])
+            if request.get("env") is not None:
+                _replace_environ(request["env"])
+            limit = request.get("memory_mb")
+            if limit and resource is not None:
+                limit_bytes = int(limit) * 1024 * 1024
+                resource.setrlimit(resource.RLIMIT_AS, (limit_bytes, limit_bytes))
+            code = _execute(request)
+        except BaseException:
+            traceback.print_exc()
+        finally:
+            with contextlib.suppress(BaseException):
+                sys.stdout.flush()
+                sys.stderr.flush()
+            os._exit(code & 0xFF if code >= 0 else 1)
+
+    os.close(out_w)
+    os.close(err_w)
+    stdout, stderr, timed_out, truncated = _collect(pid, out_r, err_r, request.get("timeout"))
+    _, status = os.waitpid(pid, 0)
+    stderr_text = stderr.decode("utf-8", "replace")
+    if timed_out:
+        stderr_text += f"\nTimed out after {request.get('timeout')}s"
+    return {
+        "stdout": stdout.decode("utf-8", "replace"),
+        "stderr": stderr_text,
+        "exit_code": os.waitstatus_to_exitcode(status),
+        "timed_out": timed_out,
+        "truncated": truncated,
+    }
+
+
+def _run_inline(request):
+    """Run request in this process (no fork; fastest, least isolated)."""
+    out, err = io.StringIO(), io.StringIO()
+    saved_cwd, saved_argv, saved_path0 = os.getcwd(), sys.argv, sys.path[0]
+    saved_env = dict(os.environ)
+    try:
+        if request.get("cwd"):
+            os.chdir(request["cwd"])
+        if request.get("env") is not None:
+            _replace_environ(request["env"])
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            code = _execute(request)
+    finally:
+        os.chdir(saved_cwd)
+        sys.argv = saved_argv
+        sys.path[0] = saved_path0
+        _replace_environ(saved_env)
+    return {
+        "stdout": out.getvalue()[:MAX_OUTPUT],
+        "stderr": err.getvalue()[:MAX_OUTPUT],
+        "exit_code": code,
+        "timed_out": False,
+        "truncated": len(out.getvalue()) > MAX_OUTPUT or len(err.getvalue()) > MAX_OUTPUT,
+    }
+
+
+def main(argv=None) -> int:
+    global _proto_fds
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--preload", default="", help="Comma-separated modules to import at startup")
+    options = parser.parse_args(argv)
+
+    # Keep the protocol on private fds; stray output from user code or
+    # preloaded modules goes to stderr instead of corrupting it.
+    proto_in = os.fdopen(os.dup(0), "r", encoding="utf-8")
+    proto_out = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    _proto_fds = (proto_in.fileno(), proto_out.fileno())
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, 0)
+    os.close(devnull)
+    os.dup2(2, 1)
+
+    # Running as a script put ce/ on sys.path; user code must not see it
+    sys.path[0] = ""
+
+    def send(message) -> None:
+        proto_out.write(json.dumps(message) + "\n")
+        proto_out.flush()
+
+    preloaded, failed = [], {}
+    for module in filter(None, (m.strip() for m in options.preload.split(","))):
+        try:
+            importlib.import_module(module)
+            preloaded.append(module)
+        except Exception as e:
+            failed[module] = f"{type(e).__name__}: {e}"
+    send({"ready": True, "pid": os.getpid(), "preloaded": preloaded, "failed": failed})
+
+    for line in proto_in:
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        start = time.monotonic()
+        isolate = request.get("isolate", True) and hasattr(os, "fork")
+        result = _run_forked(request) if isolate else _run_inline(request)
+        result["id"] = request.get("id")
+        result["duration"] = time.monotonic() - start
+        send(result)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
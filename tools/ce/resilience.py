@@ -1,21 +1,70 @@
-"""Resilience module - retry logic and circuit breaker for error recovery.
+"""Resilience module - retry logic, circuit breaker and bulkheads for error recovery.
 
 Provides decorators and utilities for handling transient failures and
 preventing cascading failures in production systems.
+
+All primitives are safe to share between threads and work with both plain
+and `async def` functions:
+- retry_with_backoff: exponential backoff, optionally with full jitter so
+  concurrent retries don't synchronize into a thundering herd
+- CircuitBreaker: lock-protected state machine; every state transition is
+  logged and emitted to registered listeners
+- Bulkhead: per-dependency concurrency limit with a bounded wait queue
 """
 
-import time
+import asyncio
+import contextlib
 import functools
-from typing import Callable, Any, Type, Tuple
+import logging
+import random
+import threading
+import time
+import weakref
+from typing import Callable, Any, Dict, List, Optional, Type, Tuple
 from datetime import datetime, timedelta
 
+logger = logging.getLogger(__name__)
+
+# Marks a retryable failure in _try_call (a function may legitimately return None)
+_RETRY = object()
+
+# Poll interval for async bulkhead waiters (sync waiters use a Condition)
+_ASYNC_POLL_INTERVAL = 0.005
+
+
+def backoff_delay(
+    attempt: int,
+    base_delay: float = 1.0,
+    max_delay: float = 60.0,
+    exponential_base: float = 2.0,
+    jitter: bool = False
+) -> float:
+    """Delay before retry number attempt+1.
+
+    With jitter ("full jitter"), the delay is uniform in [0, capped backoff],
+    which spreads concurrent retriers out instead of retrying in lockstep.
+
+    Args:
+        attempt: Zero-based attempt that just failed
+        base_delay: Initial delay in seconds
+        max_delay: Maximum delay in seconds
+        exponential_base: Backoff multiplier
+        jitter: Randomize delay in [0, backoff]
+
+    Returns:
+        Delay in seconds
+    """
+    ceiling = min(base_delay * (exponential_base ** attempt), max_delay)
+    return random.uniform(0, ceiling) if jitter else ceiling
+
 
 def retry_with_backoff(
     max_attempts: int = 3,
     base_delay: float = 1.0,
     max_delay: float = 60.0,
     exponential_base: float = 2.0,
-    exceptions: Tuple[Type[Exception], ...] = (Exception,)
+    exceptions: Tuple[Type[Exception], ...] = (Exception,),
+    jitter: bool = False
 ):
     """Retry decorator with exponential backoff.
 
@@ -25,23 +74,39 @@ def retry_with_backoff(
         max_delay: Maximum delay in seconds (default: 60.0)
         exponential_base: Backoff multiplier (default: 2.0)
         exceptions: Tuple of exception types to retry (default: all)
+        jitter: Use full-jitter delays (default: False, deterministic)
 
     Returns:
-        Decorator function
+        Decorator function (works on sync and async functions)
 
     Example:
-        @retry_with_backoff(max_attempts=5, base_delay=2.0)
+        @retry_with_backoff(max_attempts=5, base_delay=2.0, jitter=True)
         def fetch_data():
             return api.get("/data")
 
     Note: Only retries on specified exceptions. Non-retryable errors propagate immediately.
     """
     def decorator(func: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs) -> Any:
+                for attempt in range(max_attempts):
+                    try:
+                        return await func(*args, **kwargs)
+                    except exceptions as e:
+                        if attempt == max_attempts - 1:
+                            _raise_retry_error(func, max_attempts, e)
+                        await asyncio.sleep(backoff_delay(
+                            attempt, base_delay, max_delay, exponential_base, jitter
+                        ))
+
+            return async_wrapper
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
             for attempt in range(max_attempts):
-                result = _try_call(func, args, kwargs, exceptions, attempt, max_attempts, base_delay, exponential_base, max_delay)
-                if result is not None:
+                result = _try_call(func, args, kwargs, exceptions, attempt, max_attempts, base_delay, exponential_base, max_delay, jitter)
+                if result is not _RETRY:
                     return result
             raise RuntimeError(
                 "Retry logic error - should not reach here\n"
@@ -54,10 +119,10 @@ def retry_with_backoff(
 
 def _try_call(func: Callable, args: tuple, kwargs: dict, exceptions: Tuple,
               attempt: int, max_attempts: int, base_delay: float,
-              exponential_base: float, max_delay: float) -> Any:
+              exponential_base: float, max_delay: float, jitter: bool = False) -> Any:
     """Try calling function with retry logic.
 
-    Returns function result on success, None on retryable failure.
+    Returns function result on success, _RETRY on retryable failure.
     Raises on final attempt failure.
     """
     try:
@@ -68,9 +133,8 @@ def _try_call(func: Callable, args: tuple, kwargs: dict, exceptions: Tuple,
             _raise_retry_error(func, max_attempts, e)
 
         # Backoff and retry
-        delay = min(base_delay * (exponential_base ** attempt), max_delay)
-        time.sleep(delay)
-        return None
+        time.sleep(backoff_delay(attempt, base_delay, max_delay, exponential_base, jitter))
+        return _RETRY
 
 
 def _raise_retry_error(func: Callable, max_attempts: int, last_error: Exception) -> None:
@@ -83,13 +147,51 @@ def _raise_retry_error(func: Callable, max_attempts: int, last_error: Exception)
     ) from last_error
 
 
+# ============================================================================
+# Metrics
+# ============================================================================
+
+_state_listeners: List[Callable[[Dict[str, Any]], None]] = []
+_breakers: "weakref.WeakValueDictionary[str, CircuitBreaker]" = weakref.WeakValueDictionary()
+_bulkheads: "weakref.WeakValueDictionary[str, Bulkhead]" = weakref.WeakValueDictionary()
+
+
+def add_state_listener(listener: Callable[[Dict[str, Any]], None]) -> None:
+    """Register callback for circuit breaker state transitions.
+
+    The callback receives {"breaker", "from", "to", "failure_count", "timestamp"}.
+    """
+    _state_listeners.append(listener)
+
+
+def remove_state_listener(listener: Callable[[Dict[str, Any]], None]) -> None:
+    """Unregister a state transition callback."""
+    if listener in _state_listeners:
+        _state_listeners.remove(listener)
+
+
+def get_resilience_metrics() -> Dict[str, Any]:
+    """Snapshot of all live circuit breakers and bulkheads.
+
+    Returns:
+        {"breakers": {name: snapshot}, "bulkheads": {name: snapshot}}
+    """
+    return {
+        "breakers": {name: b.snapshot() for name, b in list(_breakers.items())},
+        "bulkheads": {name: b.snapshot() for name, b in list(_bulkheads.items())}
+    }
+
+
 class CircuitBreaker:
     """Circuit breaker for preventing cascading failures.
 
     State machine: CLOSED → OPEN → HALF_OPEN → CLOSED
     - CLOSED: Normal operation, requests pass through
     - OPEN: Failure threshold exceeded, requests fail fast
-    - HALF_OPEN: Testing recovery, limited requests pass through
+    - HALF_OPEN: Testing recovery, at most half_open_max_calls trial requests
+
+    State changes happen under a lock, so one breaker can guard calls from
+    many threads or asyncio tasks.
 
     Example:
         breaker = CircuitBreaker(name="serena-mcp", failure_threshold=5)
@@ -102,6 +204,7 @@ class CircuitBreaker:
         state: Current circuit state (closed/open/half_open)
         failure_count: Consecutive failure count
         last_failure_time: Timestamp of last failure
+        metrics: Counters (calls, successes, failures, rejections, transitions)
     """
 
     def __init__(
@@ -131,11 +234,15 @@ class CircuitBreaker:
         self.half_open_calls = 0
         self.last_failure_time = None
 
+        self.metrics = {"calls": 0, "successes": 0, "failures": 0, "rejections": 0, "transitions": 0}
+        self._lock = threading.RLock()
+        _breakers[name] = self
+
     def call(self, func: Callable) -> Callable:
         """Decorator to protect function with circuit breaker.
 
         Args:
-            func: Function to protect
+            func: Function to protect (sync or async)
 
         Returns:
             Protected function
@@ -143,29 +250,104 @@ class CircuitBreaker:
         Raises:
             CircuitBreakerOpenError: If circuit is open
         """
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs) -> Any:
+                self.before_call()
+                try:
+                    result = await func(*args, **kwargs)
+                except Exception:
+                    self.record_failure()
+                    raise
+                except BaseException:
+                    # Cancelled/interrupted: not a service failure, free the trial slot
+                    self.release_call()
+                    raise
+                self.record_success()
+                return result
+
+            return async_wrapper
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            # Check circuit state
+            self.before_call()
+            try:
+                result = func(*args, **kwargs)
+            except Exception:
+                self.record_failure()
+                raise
+            except BaseException:
+                # Cancelled/interrupted: not a service failure, free the trial slot
+                self.release_call()
+                raise
+            self.record_success()
+            return result
+
+        return wrapper
+
+    def before_call(self) -> None:
+        """Admit a call or fail fast.
+
+        Moves OPEN → HALF_OPEN once recovery_timeout has passed, and limits
+        HALF_OPEN to half_open_max_calls trial calls.
+
+        Raises:
+            CircuitBreakerOpenError: If circuit is open (or half-open and full)
+        """
+        with self._lock:
             if self.state == "open":
                 if self._should_attempt_reset():
                     self._transition_to_half_open()
                 else:
+                    self.metrics["rejections"] += 1
                     raise CircuitBreakerOpenError(
                         f"Circuit breaker '{self.name}' is OPEN\n"
                         f"Failures: {self.failure_count}/{self.failure_threshold}\n"
                         f"🔧 Troubleshooting: Wait {self.recovery_timeout}s or check service health"
                     )
 
-            # Execute function
-            try:
-                result = func(*args, **kwargs)
-                self._on_success()
-                return result
-            except Exception as e:
-                self._on_failure()
-                raise
+            if self.state == "half_open":
+                if self.half_open_calls >= self.half_open_max_calls:
+                    self.metrics["rejections"] += 1
+                    raise CircuitBreakerOpenError(
+                        f"Circuit breaker '{self.name}' is HALF_OPEN with "
+                        f"{self.half_open_calls} trial calls in progress\n"
+                        f"🔧 Troubleshooting: Retry shortly or check service health"
+                    )
+                self.half_open_calls += 1
 
-        return wrapper
+            self.metrics["calls"] += 1
+
+    def release_call(self) -> None:
+        """Give back an admission for a call that never ran.
+
+        Use when before_call() succeeded but the call was skipped (e.g. a
+        full bulkhead) or cancelled, so the half-open trial slot is not
+        held forever.
+        """
+        with self._lock:
+            if self.state == "half_open" and self.half_open_calls > 0:
+                self.half_open_calls -= 1
+
+    def record_success(self) -> None:
+        """Record a successful protected call."""
+        self._on_success()
+
+    def record_failure(self) -> None:
+        """Record a failed protected call."""
+        self._on_failure()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current state and counters (for diagnostics and metrics export)."""
+        with self._lock:
+            return {
+                "name": self.name,
+                "state": self.state,
+                "failure_count": self.failure_count,
+                "failure_threshold": self.failure_threshold,
+                "last_failure_time": self.last_failure_time.isoformat() if self.last_failure_time else None,
+                **self.metrics
+            }
 
     def _should_attempt_reset(self) -> bool:
         """Check if enough time has passed to attempt reset."""
@@ -177,36 +359,238 @@ class CircuitBreaker:
 
     def _transition_to_half_open(self):
         """Transition from open to half-open state."""
-        self.state = "half_open"
-        self.half_open_calls = 0
+        with self._lock:
+            self._set_state("half_open")
+            self.half_open_calls = 0
+            self.success_count = 0
 
     def _on_success(self):
         """Handle successful call."""
-        if self.state == "half_open":
-            self.success_count += 1
-            if self.success_count >= self.half_open_max_calls:
-                # Recovered - close circuit
-                self.state = "closed"
+        with self._lock:
+            self.metrics["successes"] += 1
+            if self.state == "half_open":
+                self.success_count += 1
+                if self.success_count >= self.half_open_max_calls:
+                    # Recovered - close circuit
+                    self._set_state("closed")
+                    self.failure_count = 0
+                    self.success_count = 0
+            else:
+                # Reset failure count on success in closed state
                 self.failure_count = 0
-                self.success_count = 0
-        else:
-            # Reset failure count on success in closed state
-            self.failure_count = 0
 
     def _on_failure(self):
         """Handle failed call."""
-        self.failure_count += 1
-        self.last_failure_time = datetime.now()
-
-        if self.state == "half_open":
-            # Failed in half-open - reopen circuit
-            self.state = "open"
-            self.success_count = 0
-        elif self.failure_count >= self.failure_threshold:
-            # Threshold exceeded - open circuit
-            self.state = "open"
+        with self._lock:
+            self.metrics["failures"] += 1
+            self.failure_count += 1
+            self.last_failure_time = datetime.now()
+
+            if self.state == "half_open":
+                # Failed in half-open - reopen circuit
+                self._set_state("open")
+                self.success_count = 0
+            elif self.failure_count >= self.failure_threshold:
+                # Threshold exceeded - open circuit
+                self._set_state("open")
+
+    def _set_state(self, new_state: str) -> None:
+        """Change state and emit a transition event (caller holds the lock)."""
+        old_state = self.state
+        self.state = new_state
+        if old_state == new_state:
+            return
+
+        self.metrics["transitions"] += 1
+        event = {
+            "breaker": self.name,
+            "from": old_state,
+            "to": new_state,
+            "failure_count": self.failure_count,
+            "timestamp": datetime.now().isoformat()
+        }
+        logger.info(f"Circuit breaker '{self.name}': {old_state} → {new_state}")
+        for listener in list(_state_listeners):
+            try:
+                listener(event)
+            except Exception as e:
+                logger.warning(f"Circuit breaker listener failed: {e}")
 
 
 class CircuitBreakerOpenError(Exception):
     """Raised when circuit breaker is open."""
     pass
+
+
+class BulkheadFullError(Exception):
+    """Raised when a bulkhead has no free slot and its wait queue is full."""
+    pass
+
+
+class Bulkhead:
+    """Per-dependency concurrency limit with a bounded wait queue.
+
+    At most max_concurrent calls run at once; up to max_queue more wait for
+    a slot (optionally up to timeout seconds). Anything beyond that is
+    rejected immediately with BulkheadFullError, so one slow dependency
+    can't absorb every worker.
+
+    Example:
+        linear_bulkhead = Bulkhead("linear-mcp", max_concurrent=4, max_queue=16)
+
+        with linear_bulkhead.slot():
+            client.create_issue(...)
+
+    Attributes:
+        active: Calls currently holding a slot
+        waiting: Calls queued for a slot
+        metrics: Counters (admitted, rejected, max_waiting)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrent: int = 10,
+        max_queue: int = 0,
+        timeout: Optional[float] = None
+    ):
+        """Initialize bulkhead.
+
+        Args:
+            name: Bulkhead identifier (usually the dependency name)
+            max_concurrent: Concurrent calls allowed
+            max_queue: Calls allowed to wait for a slot (0 = reject when full)
+            timeout: Max seconds a queued call waits (None = no limit)
+        """
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.timeout = timeout
+
+        self.active = 0
+        self.waiting = 0
+        self.metrics = {"admitted": 0, "rejected": 0, "max_waiting": 0}
+        self._cond = threading.Condition()
+        _bulkheads[name] = self
+
+    def acquire(self) -> None:
+        """Take a slot, waiting in the queue if allowed.
+
+        Raises:
+            BulkheadFullError: If queue is full or wait timed out
+        """
+        with self._cond:
+            if self._try_admit():
+                return
+            self._enqueue()
+            try:
+                admitted = self._cond.wait_for(
+                    lambda: self.active < self.max_concurrent, timeout=self.timeout
+                )
+            finally:
+                self.waiting -= 1
+            if not admitted:
+                self._reject("timed out waiting for a slot")
+            self.active += 1
+            self.metrics["admitted"] += 1
+
+    async def acquire_async(self) -> None:
+        """Take a slot without blocking the event loop.
+
+        Raises:
+            BulkheadFullError: If queue is full or wait timed out
+        """
+        with self._cond:
+            if self._try_admit():
+                return
+            self._enqueue()
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout if self.timeout is not None else None
+        try:
+            while True:
+                await asyncio.sleep(_ASYNC_POLL_INTERVAL)
+                with self._cond:
+                    if self.active < self.max_concurrent:
+                        self.active += 1
+                        self.metrics["admitted"] += 1
+                        return
+                    if deadline is not None and loop.time() >= deadline:
+                        self._reject("timed out waiting for a slot")
+        finally:
+            with self._cond:
+                self.waiting -= 1
+
+    def release(self) -> None:
+        """Return a slot and wake one waiter."""
+        with self._cond:
+            self.active -= 1
+            self._cond.notify()
+
+    @contextlib.contextmanager
+    def slot(self):
+        """Context manager holding a slot for the duration of the block."""
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    @contextlib.asynccontextmanager
+    async def slot_async(self):
+        """Async context manager holding a slot for the duration of the block."""
+        await self.acquire_async()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def call(self, func: Callable) -> Callable:
+        """Decorator limiting concurrency of func (sync or async)."""
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs) -> Any:
+                async with self.slot_async():
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs) -> Any:
+            with self.slot():
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current occupancy and counters."""
+        with self._cond:
+            return {
+                "name": self.name,
+                "active": self.active,
+                "waiting": self.waiting,
+                "max_concurrent": self.max_concurrent,
+                "max_queue": self.max_queue,
+                **self.metrics
+            }
+
+    def _try_admit(self) -> bool:
+        if self.active < self.max_concurrent:
+            self.active += 1
+            self.metrics["admitted"] += 1
+            return True
+        if self.waiting >= self.max_queue:
+            self._reject("queue full")
+        return False
+
+    def _enqueue(self) -> None:
+        self.waiting += 1
+        self.metrics["max_waiting"] = max(self.metrics["max_waiting"], self.waiting)
+
+    def _reject(self, reason: str) -> None:
+        self.metrics["rejected"] += 1
+        raise BulkheadFullError(
+            f"Bulkhead '{self.name}' rejected call: {reason} "
+            f"({self.active}/{self.max_concurrent} active, {self.waiting}/{self.max_queue} queued)\n"
+            f"🔧 Troubleshooting: Reduce concurrency or raise the bulkhead limits"
+        )
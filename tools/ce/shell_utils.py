@@ -7,11 +7,22 @@ Usage:
     from ce.shell_utils import grep_text, count_lines, head, Pipeline
 
 All functions use pure Python stdlib - no external dependencies required.
+
+File-backed Pipelines stream: lines are read lazily through a buffered
+reader and grep/head/extract_fields are generator stages, so multi-GB logs
+are processed in constant memory. Only terminal operations (lines, text)
+materialize, and tail() on a file seeks from the end.
 """
 
+import locale
+import os
 import re
+from collections import deque
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Callable, Iterable, Iterator, List, Optional, Union
+
+_TAIL_BLOCK_SIZE = 64 * 1024
 
 
 def grep_text(pattern: str, text: str, context_lines: int = 0) -> List[str]:
@@ -34,18 +45,7 @@ def grep_text(pattern: str, text: str, context_lines: int = 0) -> List[str]:
 
     Performance: 10-50x faster than subprocess grep
     """
-    lines = text.split('\n')
-    regex = re.compile(pattern)
-    matches = []
-    matched_indices = set()
-
-    for i, line in enumerate(lines):
-        if regex.search(line):
-            start = max(0, i - context_lines)
-            end = min(len(lines), i + context_lines + 1)
-            matched_indices.update(range(start, end))
-
-    return [lines[i] for i in sorted(matched_indices)]
+    return list(_grep_lines(text.split('\n'), re.compile(pattern), context_lines))
 
 
 def count_lines(file_path: str) -> int:
@@ -66,9 +66,13 @@ def count_lines(file_path: str) -> int:
         >>> count_lines("config.yml")
         42
 
-    Performance: Direct file read, no subprocess overhead
+    Performance: Streams file in blocks, constant memory
     """
-    return len(Path(file_path).read_text().split('\n'))
+    newlines = 0
+    with open(file_path) as f:
+        for block in iter(lambda: f.read(_TAIL_BLOCK_SIZE), ""):
+            newlines += block.count('\n')
+    return newlines + 1
 
 
 def head(file_path: str, n: int = 10) -> List[str]:
@@ -92,7 +96,9 @@ def head(file_path: str, n: int = 10) -> List[str]:
 
     Performance: Reads only beginning of file, efficient for large files
     """
-    return Path(file_path).read_text().split('\n')[:n]
+    if n < 0:
+        return Path(file_path).read_text().split('\n')[:n]
+    return list(islice(_iter_file_lines(file_path), n))
 
 
 def tail(file_path: str, n: int = 10) -> List[str]:
@@ -114,9 +120,9 @@ def tail(file_path: str, n: int = 10) -> List[str]:
         >>> tail("log.txt", n=5)
         ['Line 96', 'Line 97', 'Line 98', 'Line 99', 'Line 100']
 
-    Performance: Efficient for large files, reads from end
+    Performance: Efficient for large files, seeks from end
     """
-    return Path(file_path).read_text().split('\n')[-n:]
+    return _tail_file(file_path, n)
 
 
 def find_files(
@@ -176,21 +182,7 @@ def extract_fields(
 
     Performance: Pure Python string operations, 10-50x faster than awk subprocess
     """
-    lines = text.strip().split('\n')
-    results = []
-
-    for line in lines:
-        if not line.strip():
-            continue
-        fields = line.split(delimiter) if delimiter else line.split()
-        extracted = []
-        for i in field_indices:
-            if i <= len(fields):
-                extracted.append(fields[i-1])
-        if extracted:
-            results.append(extracted)
-
-    return results
+    return list(_extract_rows(text.strip().split('\n'), field_indices, delimiter))
 
 
 def sum_column(
@@ -219,20 +211,7 @@ def sum_column(
 
     Performance: Type-safe Python arithmetic, no subprocess overhead
     """
-    lines = text.strip().split('\n')
-    total = 0.0
-
-    for line in lines:
-        if not line.strip():
-            continue
-        fields = line.split(delimiter) if delimiter else line.split()
-        if column <= len(fields):
-            try:
-                total += float(fields[column-1])
-            except ValueError:
-                continue
-
-    return total
+    return _sum_lines(text.strip().split('\n'), column, delimiter)
 
 
 def filter_and_extract(
@@ -281,13 +260,18 @@ class Pipeline:
     10-50x faster than equivalent bash pipes.
 
     Usage:
-        # Create pipeline from file
+        # Create pipeline from file (streamed, constant memory)
         result = Pipeline.from_file("log.txt").grep("ERROR", context_lines=1).count()
 
         # Create pipeline from text
         text = "line1\\nerror\\nline3"
         lines = Pipeline.from_text(text).grep("error").lines()
 
+    Stages (grep, head, extract_fields) are lazy generators; nothing is read
+    until a terminal operation (count, sum_column, lines, text, first, last)
+    runs. Each terminal operation re-runs the chain from the source, so a
+    file-backed pipeline can be consumed more than once.
+
     Performance: Chaining operations avoids intermediate string copies
     and subprocess forks. Typical 10-50x speedup vs bash equivalents.
     """
@@ -298,28 +282,50 @@ class Pipeline:
         Args:
             data: String content or list of lines
         """
-        if isinstance(data, str):
-            self._lines = data.split('\n')
-            self._text = data
-        else:
-            self._lines = data
-            self._text = '\n'.join(data)
+        lines = data.split('\n') if isinstance(data, str) else data
+        self._lines: Optional[List[str]] = lines
+        self._source: Callable[[], Iterator[str]] = lambda: iter(lines)
+        self._file_path: Optional[str] = None
+
+    @classmethod
+    def _stream(
+        cls,
+        source: Callable[[], Iterator[str]],
+        file_path: Optional[str] = None
+    ) -> "Pipeline":
+        """Create lazy pipeline over a line iterator factory."""
+        pipeline = cls.__new__(cls)
+        pipeline._lines = None
+        pipeline._source = source
+        pipeline._file_path = file_path
+        return pipeline
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate lines lazily (re-runs the chain from its source)."""
+        return self._source()
 
     @classmethod
     def from_file(cls, file_path: str) -> "Pipeline":
-        """Create pipeline from file contents.
+        """Create pipeline streaming lines from a file.
+
+        The file is opened when a terminal operation runs, and read through
+        a buffered reader one line at a time.
 
         Args:
             file_path: Path to file (absolute or relative)
 
         Returns:
-            Pipeline instance initialized with file contents
+            Lazy Pipeline over file lines
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
 
         Example:
             >>> result = Pipeline.from_file("log.txt").grep("ERROR").count()
         """
-        text = Path(file_path).read_text()
-        return cls(text)
+        if not Path(file_path).is_file():
+            raise FileNotFoundError(f"No such file: '{file_path}'")
+        return cls._stream(lambda: _iter_file_lines(file_path), file_path=str(file_path))
 
     @classmethod
     def from_text(cls, text: str) -> "Pipeline":
@@ -339,6 +345,9 @@ class Pipeline:
     def grep(self, pattern: str, context_lines: int = 0) -> "Pipeline":
         """Filter lines matching regex pattern.
 
+        Context before a match is kept in a ring buffer of context_lines
+        lines, so memory stays bounded on large inputs.
+
         Args:
             pattern: Regex pattern to match
             context_lines: Lines before/after to include
@@ -350,21 +359,12 @@ class Pipeline:
             >>> Pipeline.from_text("a\\nerror\\nb").grep("error").text()
             'error'
         """
-        # Use current lines, not reconstructed text
         regex = re.compile(pattern)
-        matched_indices = set()
-        
-        for i, line in enumerate(self._lines):
-            if regex.search(line):
-                start = max(0, i - context_lines)
-                end = min(len(self._lines), i + context_lines + 1)
-                matched_indices.update(range(start, end))
-        
-        filtered_lines = [self._lines[i] for i in sorted(matched_indices)]
-        return Pipeline(filtered_lines)
+        source = self._source
+        return Pipeline._stream(lambda: _grep_lines(source(), regex, context_lines))
 
     def head(self, n: int = 10) -> "Pipeline":
-        """Keep first N lines.
+        """Keep first N lines (stops reading the source after N lines).
 
         Args:
             n: Number of lines to keep
@@ -376,11 +376,17 @@ class Pipeline:
             >>> Pipeline.from_text("a\\nb\\nc").head(2).text()
             'a\\nb'
         """
-        return Pipeline(self._lines[:n])
+        if n < 0:
+            return Pipeline(list(self)[:n])
+        source = self._source
+        return Pipeline._stream(lambda: islice(source(), n))
 
     def tail(self, n: int = 10) -> "Pipeline":
         """Keep last N lines.
 
+        Seeks from the end when reading directly from a file; otherwise
+        streams through a bounded deque.
+
         Args:
             n: Number of lines to keep
 
@@ -391,7 +397,13 @@ class Pipeline:
             >>> Pipeline.from_text("a\\nb\\nc").tail(2).text()
             'b\\nc'
         """
-        return Pipeline(self._lines[-n:])
+        if n <= 0:
+            return Pipeline(list(self)[-n:])
+        if self._file_path is not None:
+            return Pipeline(_tail_file(self._file_path, n))
+        if self._lines is not None:
+            return Pipeline(self._lines[-n:])
+        return Pipeline(list(deque(self, maxlen=n)))
 
     def extract_fields(
         self,
@@ -411,10 +423,10 @@ class Pipeline:
             >>> Pipeline.from_text("a 1\\nb 2").extract_fields([1]).text()
             'a\\nb'
         """
-        extracted = extract_fields(self._text, field_indices, delimiter)
-        # Convert lists back to lines
-        lines = [' '.join(row) for row in extracted]
-        return Pipeline(lines)
+        source = self._source
+        return Pipeline._stream(
+            lambda: (' '.join(row) for row in _extract_rows(source(), field_indices, delimiter))
+        )
 
     def count(self) -> int:
         """Count lines in pipeline.
@@ -426,7 +438,7 @@ class Pipeline:
             >>> Pipeline.from_text("a\\nb\\nc").count()
             3
         """
-        return len([l for l in self._lines if l.strip()])
+        return sum(1 for line in self if line.strip())
 
     def sum_column(
         self,
@@ -446,7 +458,7 @@ class Pipeline:
             >>> Pipeline.from_text("a 100\\nb 200").sum_column(2)
             300.0
         """
-        return sum_column(self._text, column, delimiter)
+        return _sum_lines(self, column, delimiter)
 
     def text(self) -> str:
         """Get pipeline contents as text.
@@ -458,7 +470,7 @@ class Pipeline:
             >>> Pipeline.from_text("a\\nb").head(1).text()
             'a'
         """
-        return self._text
+        return '\n'.join(self.lines())
 
     def lines(self) -> List[str]:
         """Get pipeline contents as line list.
@@ -470,7 +482,9 @@ class Pipeline:
             >>> Pipeline.from_text("a\\nb\\nc").grep("[ab]").lines()
             ['a', 'b']
         """
-        return self._lines
+        if self._lines is not None:
+            return self._lines
+        return list(self)
 
     def first(self) -> Optional[str]:
         """Get first line.
@@ -482,7 +496,7 @@ class Pipeline:
             >>> Pipeline.from_text("\\na\\nb").first()
             'a'
         """
-        for line in self._lines:
+        for line in self:
             if line.strip():
                 return line
         return None
@@ -497,7 +511,105 @@ class Pipeline:
             >>> Pipeline.from_text("a\\nb\\n").last()
             'b'
         """
-        for line in reversed(self._lines):
+        if self._lines is not None:
+            for line in reversed(self._lines):
+                if line.strip():
+                    return line
+            return None
+
+        last = None
+        for line in self:
             if line.strip():
-                return line
-        return None
+                last = line
+        return last
+
+
+# ============================================================================
+# Streaming helpers
+# ============================================================================
+
+def _iter_file_lines(file_path: Union[str, Path]) -> Iterator[str]:
+    """Yield file lines without newlines, matching read_text().split('\\n').
+
+    A trailing newline yields a final empty line, like str.split().
+    """
+    with open(file_path) as f:
+        line = ""
+        for line in f:
+            yield line[:-1] if line.endswith('\n') else line
+        if not line or line.endswith('\n'):
+            yield ""
+
+
+def _tail_file(file_path: Union[str, Path], n: int) -> List[str]:
+    """Last N lines of a file, reading backwards from the end in blocks.
+
+    Matches read_text().split('\\n')[-n:] for n > 0.
+    """
+    if n <= 0:
+        return Path(file_path).read_text().split('\n')[-n:]
+
+    with open(file_path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        data = b""
+        # n lines need n newlines before them (or the start of file)
+        while pos > 0 and data.count(b'\n') <= n:
+            step = min(_TAIL_BLOCK_SIZE, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+
+    if pos > 0:
+        # Drop the partial first line (may also split a multi-byte char)
+        data = data[data.index(b'\n') + 1:]
+
+    text = data.decode(locale.getpreferredencoding(False))
+    text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text.split('\n')[-n:]
+
+
+def _grep_lines(lines: Iterable[str], regex: "re.Pattern", context_lines: int) -> Iterator[str]:
+    """Yield matching lines plus context, each line at most once, in order."""
+    before: deque = deque(maxlen=context_lines)
+    after = 0
+
+    for line in lines:
+        if regex.search(line):
+            yield from before
+            before.clear()
+            yield line
+            after = context_lines
+        elif after > 0:
+            yield line
+            after -= 1
+        else:
+            before.append(line)
+
+
+def _extract_rows(
+    lines: Iterable[str],
+    field_indices: List[int],
+    delimiter: Optional[str]
+) -> Iterator[List[str]]:
+    for line in lines:
+        if not line.strip():
+            continue
+        fields = line.split(delimiter) if delimiter else line.split()
+        extracted = [fields[i-1] for i in field_indices if i <= len(fields)]
+        if extracted:
+            yield extracted
+
+
+def _sum_lines(lines: Iterable[str], column: int, delimiter: Optional[str]) -> float:
+    total = 0.0
+    for line in lines:
+        if not line.strip():
+            continue
+        fields = line.split(delimiter) if delimiter else line.split()
+        if column <= len(fields):
+            try:
+                total += float(fields[column-1])
+            except ValueError:
+                continue
+    return total
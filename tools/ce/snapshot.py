@@ -0,0 +1,217 @@
+"""Copy-on-write snapshots of files and directory trees.
+
+Backups taken before a modification are cloned with FICLONE reflinks
+where the filesystem supports it (btrfs, XFS, bcachefs): the clone shares
+data blocks with the original until either side is written, so a
+snapshot costs metadata only. Other filesystems fall back to a regular
+copy. Restores are renames, so they are O(1) on any filesystem.
+
+Hardlinks are deliberately not used: blend strategies and most editors
+rewrite files in place, which would change a hardlinked backup too.
+
+Example:
+    snap = Snapshot.take(project, [".serena/memories", ".claude", "CLAUDE.md"],
+                         project / ".ce.blend-snapshot")
+    try:
+        run_blend()
+    except Exception:
+        snap.restore()
+        raise
+    snap.discard()
+"""
+
+import errno
+import logging
+import os
+import shutil
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# linux/fs.h: _IOW(0x94, 9, int)
+FICLONE = 0x40049409
+
+# Devices where FICLONE failed with "not supported" (skip the ioctl next time)
+_no_reflink_devices = set()
+
+_UNSUPPORTED = {errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL, errno.EXDEV, errno.ENOSYS, errno.EPERM}
+
+
+def clone_file(src: Union[str, Path], dst: Union[str, Path]) -> str:
+    """Copy src to dst (with metadata), as a reflink when possible.
+
+    Args:
+        src: Source file
+        dst: Destination file (overwritten)
+
+    Returns:
+        "reflink" or "copy"
+
+    Raises:
+        OSError: If the file cannot be copied
+    """
+    src, dst = Path(src), Path(dst)
+    if fcntl is not None:
+        device = os.stat(src).st_dev
+        if device not in _no_reflink_devices:
+            try:
+                with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                    fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+                shutil.copystat(src, dst)
+                return "reflink"
+            except OSError as e:
+                if e.errno not in _UNSUPPORTED:
+                    raise
+                _no_reflink_devices.add(device)
+                logger.debug(f"Reflinks unsupported for {src} ({e.strerror}), copying")
+
+    shutil.copy2(src, dst)
+    return "copy"
+
+
+def clone_tree(src: Union[str, Path], dst: Union[str, Path]) -> Dict[str, int]:
+    """Clone a directory tree file by file (reflinks when possible).
+
+    Symlinks are recreated as symlinks.
+
+    Args:
+        src: Source directory
+        dst: Destination directory (must not exist)
+
+    Returns:
+        Count of files per method: {"reflink": n, "copy": m}
+    """
+    counts = {"reflink": 0, "copy": 0}
+
+    def _copy(s, d):
+        counts[clone_file(s, d)] += 1
+        return d
+
+    shutil.copytree(src, dst, symlinks=True, copy_function=_copy)
+    return counts
+
+
+def clone_path(src: Union[str, Path], dst: Union[str, Path]) -> Dict[str, int]:
+    """Clone a file or directory tree (see clone_file / clone_tree)."""
+    src = Path(src)
+    if src.is_dir() and not src.is_symlink():
+        return clone_tree(src, dst)
+    if src.is_symlink():
+        os.symlink(os.readlink(src), dst)
+        return {"reflink": 0, "copy": 0}
+    return {clone_file(src, dst): 1}
+
+
+def remove_path(path: Union[str, Path]) -> None:
+    """Remove a file, symlink or directory tree (no-op if absent)."""
+    path = Path(path)
+    if path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path)
+    elif path.exists() or path.is_symlink():
+        path.unlink()
+
+
+def replace_path(src: Union[str, Path], dst: Union[str, Path]) -> None:
+    """Move src over dst, removing dst first (rename when on one filesystem)."""
+    src, dst = Path(src), Path(dst)
+    remove_path(dst)
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(str(src), str(dst))
+
+
+class Snapshot:
+    """Batch snapshot of several paths under one root.
+
+    Paths that do not exist at snapshot time are recorded as absent, so
+    restore() removes them if the failed operation created them.
+
+    Attributes:
+        root: Directory the snapshotted paths are relative to
+        snapshot_dir: Where the clones are kept
+        present: Relative paths that existed (and were cloned)
+        absent: Relative paths that did not exist
+        counts: Files cloned per method
+    """
+
+    def __init__(self, root: Path, snapshot_dir: Path):
+        self.root = Path(root)
+        self.snapshot_dir = Path(snapshot_dir)
+        self.present: List[str] = []
+        self.absent: List[str] = []
+        self.counts: Dict[str, int] = {"reflink": 0, "copy": 0}
+
+    @classmethod
+    def take(
+        cls,
+        root: Union[str, Path],
+        paths: Iterable[Union[str, Path]],
+        snapshot_dir: Optional[Union[str, Path]] = None,
+    ) -> "Snapshot":
+        """Snapshot files and directory trees under root in one call.
+
+        Args:
+            root: Base directory
+            paths: Paths relative to root (files or directories)
+            snapshot_dir: Snapshot location (default: <root>/.ce.snapshot);
+                replaced if it exists. Keep it on root's filesystem so
+                restore() is a rename.
+
+        Returns:
+            Snapshot
+
+        Raises:
+            OSError: If a path cannot be cloned (partial snapshot removed)
+        """
+        root = Path(root)
+        snap = cls(root, Path(snapshot_dir) if snapshot_dir else root / ".ce.snapshot")
+        remove_path(snap.snapshot_dir)
+        snap.snapshot_dir.mkdir(parents=True)
+
+        try:
+            for rel in paths:
+                rel = Path(rel).as_posix()
+                source = root / rel
+                if not source.exists() and not source.is_symlink():
+                    snap.absent.append(rel)
+                    continue
+                target = snap.snapshot_dir / rel
+                target.parent.mkdir(parents=True, exist_ok=True)
+                for method, count in clone_path(source, target).items():
+                    snap.counts[method] += count
+                snap.present.append(rel)
+        except OSError:
+            remove_path(snap.snapshot_dir)
+            raise
+
+        logger.debug(
+            f"Snapshot of {len(snap.present)} path(s) in {snap.snapshot_dir}: "
+            f"{snap.counts['reflink']} reflinked, {snap.counts['copy']} copied"
+        )
+        return snap
+
+    def restore(self) -> None:
+        """Put every snapshotted path back and drop the snapshot.
+
+        Raises:
+            OSError: If a path cannot be restored (snapshot kept for manual recovery)
+        """
+        for rel in self.absent:
+            remove_path(self.root / rel)
+        for rel in self.present:
+            replace_path(self.snapshot_dir / rel, self.root / rel)
+        remove_path(self.snapshot_dir)
+
+    def discard(self) -> None:
+        """Drop the snapshot (operation succeeded)."""
+        remove_path(self.snapshot_dir)
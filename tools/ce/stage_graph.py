@@ -0,0 +1,143 @@
+"""Run a small dependency graph of in-process stages on a thread pool.
+
+Each stage is a callable plus the names of the stages it depends on; it
+is called with their results, in that order, as soon as they are all
+available. Independent stages overlap, so total latency is bounded by
+the critical path rather than the sum of stage times. Stages should be
+I/O-bound (MCP calls, HTTP, SQLite) for the overlap to pay off.
+
+Example:
+    run = run_stage_graph({
+        "parsed": ((), lambda: parse_initial_md(path)),
+        "research": (("parsed",), lambda parsed: research_codebase(...)),
+        "docs": (("parsed",), lambda parsed: fetch_documentation(...)),
+    })
+    run["results"]["research"]
+    print(format_stage_timings(run))
+"""
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+StageSpec = Tuple[Sequence[str], Callable[..., Any]]
+
+
+def run_stage_graph(stages: Dict[str, StageSpec], max_workers: Optional[int] = None) -> Dict[str, Any]:
+    """Run stages respecting their dependencies.
+
+    Args:
+        stages: {name: (dependency names, fn)}; fn receives dependency results
+        max_workers: Thread pool size (default: number of stages)
+
+    Returns:
+        {
+            "results": {name: value},
+            "timings": {name: {"start": s, "end": s, "duration": s}},  # relative to run start
+            "critical_path": [names],  # dependency chain that bounded the run
+            "duration": s
+        }
+
+    Raises:
+        RuntimeError: Unknown dependency or dependency cycle
+        Exception: First exception raised by a stage (no new stages start;
+            running ones finish first)
+    """
+    _check_graph(stages)
+
+    origin = time.perf_counter()
+    results: Dict[str, Any] = {}
+    timings: Dict[str, Dict[str, float]] = {}
+    pending = dict(stages)
+
+    def run(name: str, fn: Callable[..., Any], args: List[Any]) -> Any:
+        start = time.perf_counter() - origin
+        try:
+            return fn(*args)
+        finally:
+            end = time.perf_counter() - origin
+            timings[name] = {"start": start, "end": end, "duration": end - start}
+
+    error: Optional[BaseException] = None
+    with ThreadPoolExecutor(max_workers=max_workers or max(1, len(stages))) as pool:
+        running = {}
+        while True:
+            if error is None:
+                for name, (deps, fn) in list(pending.items()):
+                    if all(dep in results for dep in deps):
+                        del pending[name]
+                        running[pool.submit(run, name, fn, [results[dep] for dep in deps])] = name
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    logger.debug(f"Stage {name} failed: {e}")
+                    error = error or e
+
+    if error is not None:
+        raise error
+
+    return {
+        "results": results,
+        "timings": timings,
+        "critical_path": _critical_path(stages, timings),
+        "duration": time.perf_counter() - origin,
+    }
+
+
+def format_stage_timings(run: Dict[str, Any]) -> str:
+    """Timing report for a run_stage_graph() result (critical path marked with *)."""
+    critical = set(run["critical_path"])
+    width = max((len(name) for name in run["timings"]), default=0)
+    lines = [f"Stage timings ({run['duration']:.2f}s total):"]
+    for name, timing in sorted(run["timings"].items(), key=lambda item: item[1]["start"]):
+        marker = "*" if name in critical else " "
+        lines.append(
+            f"  {marker} {name:<{width}}  {timing['duration']:7.3f}s"
+            f"  (+{timing['start']:.3f}s → +{timing['end']:.3f}s)"
+        )
+    lines.append(f"  critical path: {' → '.join(run['critical_path'])}")
+    return "\n".join(lines)
+
+
+def _check_graph(stages: Dict[str, StageSpec]) -> None:
+    """Raise RuntimeError on unknown dependencies or cycles."""
+    for name, (deps, _) in stages.items():
+        unknown = [dep for dep in deps if dep not in stages]
+        if unknown:
+            raise RuntimeError(
+                f"Stage '{name}' depends on unknown stage(s): {', '.join(unknown)}\n"
+                f"🔧 Troubleshooting: Check the stage names in the graph definition"
+            )
+
+    resolved: set = set()
+    remaining = dict(stages)
+    while remaining:
+        ready = [name for name, (deps, _) in remaining.items() if all(dep in resolved for dep in deps)]
+        if not ready:
+            raise RuntimeError(
+                f"Stage dependency cycle among: {', '.join(sorted(remaining))}\n"
+                f"🔧 Troubleshooting: Remove the circular depends-on entries"
+            )
+        for name in ready:
+            resolved.add(name)
+            del remaining[name]
+
+
+def _critical_path(stages: Dict[str, StageSpec], timings: Dict[str, Dict[str, float]]) -> List[str]:
+    """Chain ending at the last stage to finish, following the latest-finishing dependency."""
+    if not timings:
+        return []
+    name = max(timings, key=lambda stage: timings[stage]["end"])
+    path = [name]
+    while stages[name][0]:
+        name = max(stages[name][0], key=lambda dep: timings[dep]["end"])
+        path.append(name)
+    return path[::-1]
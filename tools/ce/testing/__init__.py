@@ -8,7 +8,7 @@ __version__ = "0.1.0"
 
 from .strategy import NodeStrategy, BaseRealStrategy, BaseMockStrategy
 from .mocks import MockSerenaStrategy, MockContext7Strategy, MockLLMStrategy
-from .builder import Pipeline, PipelineBuilder
+from .builder import NodeRun, Pipeline, PipelineBuilder
 from .real_strategies import RealParserStrategy, RealCommandStrategy
 
 __all__ = [
@@ -18,6 +18,7 @@ __all__ = [
     "MockSerenaStrategy",
     "MockContext7Strategy",
     "MockLLMStrategy",
+    "NodeRun",
     "Pipeline",
     "PipelineBuilder",
     "RealParserStrategy",
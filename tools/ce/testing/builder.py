@@ -2,17 +2,41 @@
 
 Provides Pipeline class for execution and PipelineBuilder for construction.
 Supports topological sorting for DAG execution and observable mocking.
+Independent nodes run concurrently on a thread pool.
 """
 
-from typing import Dict, Any, List, Tuple
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Tuple
 from .strategy import NodeStrategy
 
 
+@dataclass
+class NodeRun:
+    """Execution record for one pipeline node."""
+    name: str
+    mocked: bool
+    status: str = "pending"  # pending, ok, failed, cancelled
+    duration: float = 0.0
+    error: Optional[str] = None
+
+
 class Pipeline:
     """Executable pipeline with nodes and edges.
 
-    Pipeline executes nodes in topological order based on dependencies (edges).
-    Supports linear pipelines and DAGs with cycle detection.
+    Pipeline executes nodes as a DAG: a node starts as soon as all its
+    parents have finished, and ready nodes run concurrently. Supports
+    linear pipelines and DAGs with cycle detection.
+
+    Data flow:
+        - Root nodes (no parents) receive the pipeline input
+        - A node with one parent receives that parent's output
+        - A node with several parents receives their outputs merged in
+          topological order (later parents win on key conflicts), so the
+          result does not depend on which parent finished first
+        - The pipeline returns the sink output (sinks merged the same way)
 
     Example:
         nodes = {"parse": ParserStrategy(), "research": MockSerenaStrategy()}
@@ -21,42 +45,149 @@ class Pipeline:
         result = pipeline.execute({"prp_path": "test.md"})
     """
 
-    def __init__(self, nodes: Dict[str, NodeStrategy], edges: List[Tuple[str, str]]):
+    def __init__(
+        self,
+        nodes: Dict[str, NodeStrategy],
+        edges: List[Tuple[str, str]],
+        max_workers: Optional[int] = None
+    ):
         """Initialize pipeline.
 
         Args:
             nodes: {node_name: strategy}
             edges: [(from_node, to_node)] defining dependencies
+            max_workers: Concurrent nodes (default: number of nodes)
         """
         self.nodes = nodes
         self.edges = edges
+        self.max_workers = max_workers
+        self.runs: Dict[str, NodeRun] = {}
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        """Stop scheduling new nodes; execute() raises once running nodes finish."""
+        self._cancelled.set()
 
     def execute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """Execute pipeline from start to finish.
 
         Args:
-            input_data: Initial input to first node
+            input_data: Initial input to root nodes
 
         Returns:
-            Final output from last node
+            Output of the sink node (merged outputs if several sinks)
 
         Raises:
-            RuntimeError: If pipeline has cycles or execution fails
+            RuntimeError: If pipeline has cycles, a node fails or the run is cancelled
 
         Process:
-            1. Topologically sort nodes by edges
-            2. Execute nodes in order
-            3. Pass output from node to next node
-            4. Return final output
+            1. Topologically sort nodes by edges (detects cycles up front)
+            2. Start every node whose parents are done, concurrently
+            3. On first failure or cancel(), start nothing new and drain
+            4. Return sink output; per-node timings are in self.runs
         """
-        # Simple linear execution (no parallelism in MVP)
-        current_data = input_data
-
-        for node_name in self._topological_sort():
-            strategy = self.nodes[node_name]
-            current_data = strategy.execute(current_data)
+        order = self._topological_sort()
+        rank = {name: i for i, name in enumerate(order)}
+        parents: Dict[str, List[str]] = {name: [] for name in self.nodes}
+        children: Dict[str, List[str]] = {name: [] for name in self.nodes}
+        for from_node, to_node in self.edges:
+            parents[to_node].append(from_node)
+            children[from_node].append(to_node)
+        for name in parents:
+            parents[name].sort(key=rank.get)
+
+        self._cancelled.clear()
+        self.runs = {
+            name: NodeRun(name, bool(self.nodes[name].is_mocked())) for name in order
+        }
+        outputs: Dict[str, Dict[str, Any]] = {}
+        remaining = {name: len(parents[name]) for name in order}
+        failure: Optional[Tuple[str, BaseException]] = None
+
+        def run_node(name: str, data: Dict[str, Any]) -> Dict[str, Any]:
+            start = time.perf_counter()
+            try:
+                return self.nodes[name].execute(data)
+            finally:
+                self.runs[name].duration = time.perf_counter() - start
+
+        roots = [name for name in order if not parents[name]]
+
+        def node_input(name: str) -> Dict[str, Any]:
+            # Siblings get their own copy so concurrent nodes never share a dict
+            if not parents[name]:
+                return self._merge([input_data], fan_out=len(roots) > 1)
+            shared = len(parents[name]) > 1 or len(children[parents[name][0]]) > 1
+            return self._merge([outputs[p] for p in parents[name]], fan_out=shared)
+
+        workers = self.max_workers or max(1, len(self.nodes))
+        running: Dict[Future, str] = {}
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            ready = [name for name in order if remaining[name] == 0]
+            while ready or running:
+                if failure is None and not self._cancelled.is_set():
+                    for name in ready:
+                        running[pool.submit(run_node, name, node_input(name))] = name
+                ready = []
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda f: rank[running[f]]):
+                    name = running.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        self.runs[name].status = "failed"
+                        self.runs[name].error = str(error)
+                        failure = failure or (name, error)
+                        continue
+                    self.runs[name].status = "ok"
+                    outputs[name] = future.result()
+                    for child in children[name]:
+                        remaining[child] -= 1
+                        if remaining[child] == 0:
+                            ready.append(child)
+                ready.sort(key=rank.get)
+
+        for run in self.runs.values():
+            if run.status == "pending":
+                run.status = "cancelled"
+
+        if failure is not None:
+            name, error = failure
+            raise RuntimeError(
+                f"Pipeline node '{name}' failed: {error}\n"
+                f"🔧 Troubleshooting: Check the '{name}' strategy input/output; "
+                f"downstream nodes were not run"
+            ) from error
+        if self._cancelled.is_set():
+            raise RuntimeError(
+                "Pipeline cancelled\n"
+                "🔧 Troubleshooting: cancel() was called; completed nodes are in pipeline.runs"
+            )
 
-        return current_data
+        sinks = [name for name in order if not children[name]]
+        if len(sinks) == 1:
+            return outputs[sinks[0]]
+        return self._merge([outputs[name] for name in sinks], fan_out=True)
+
+    def timing_report(self) -> str:
+        """Per-node timings of the last run (🎭 marks mocked nodes)."""
+        lines = []
+        for run in self.runs.values():
+            marker = "🎭" if run.mocked else "  "
+            lines.append(f"{marker} {run.name}: {run.status} ({run.duration * 1000:.1f}ms)")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _merge(results: List[Dict[str, Any]], fan_out: bool) -> Dict[str, Any]:
+        """Single unshared result as-is, otherwise merged left to right into a new dict."""
+        if not fan_out:
+            return results[0]
+        merged: Dict[str, Any] = {}
+        for result in results:
+            merged.update(result)
+        return merged
 
     def _topological_sort(self) -> List[str]:
         """Sort nodes by dependencies (edges).
@@ -67,11 +198,6 @@ class Pipeline:
         Raises:
             RuntimeError: If pipeline has circular dependencies
         """
-        # Simple implementation: assume linear pipeline for MVP
-        # Future: proper topological sort for DAGs
-        if not self.edges:
-            return list(self.nodes.keys())
-
         # Build adjacency list
         in_degree = {node: 0 for node in self.nodes}
         adj = {node: [] for node in self.nodes}
@@ -174,9 +300,12 @@ class PipelineBuilder:
         self.edges.append((from_node, to_node))
         return self
 
-    def build(self) -> Pipeline:
+    def build(self, max_workers: Optional[int] = None) -> Pipeline:
         """Build pipeline and log mocked nodes.
 
+        Args:
+            max_workers: Concurrent nodes (default: number of nodes)
+
         Returns:
             Executable Pipeline instance
         """
@@ -189,4 +318,4 @@ class PipelineBuilder:
         if mocked:
             print(f"🎭 MOCKED NODES: {', '.join(mocked)}")
 
-        return Pipeline(self.nodes, self.edges)
+        return Pipeline(self.nodes, self.edges, max_workers=max_workers)
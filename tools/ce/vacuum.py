@@ -2,9 +2,11 @@
 
 import argparse
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 from .vacuum_strategies import (
     BackupFileStrategy,
@@ -20,13 +22,15 @@ from .vacuum_strategies import (
 class VacuumCommand:
     """Main vacuum command for project cleanup."""
 
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, max_workers: Optional[int] = None):
         """Initialize vacuum command.
 
         Args:
             project_root: Path to project root directory
+            max_workers: Strategy thread pool size (default: one per strategy)
         """
         self.project_root = project_root
+        self.max_workers = max_workers
         self.strategies = {
             "temp-files": TempFileStrategy,
             "backup-files": BackupFileStrategy,
@@ -87,26 +91,14 @@ class VacuumCommand:
         else:
             delete_threshold = 101  # Dry-run: delete nothing
 
-        # Run all strategies
-        all_candidates = []
-        for strategy_name, strategy_class in self.strategies.items():
-            if strategy_name in exclude_strategies:
-                print(f"⏭️  Skipping {strategy_name}")
-                continue
-
-            print(f"🔍 Running {strategy_name}...")
-            strategy = strategy_class(self.project_root, effective_scan_path)
-            candidates = strategy.find_candidates()
-
-            # Filter by minimum confidence
-            candidates = [c for c in candidates if c.confidence >= min_confidence]
-
-            all_candidates.extend(candidates)
-            print(f"   Found {len(candidates)} candidates")
+        # Run all strategies concurrently over one shared file inventory
+        all_candidates, timings = self._run_strategies(
+            effective_scan_path, exclude_strategies, min_confidence
+        )
 
         # Generate report
         report_path = self.project_root / ".ce" / "vacuum-report.md"
-        self._generate_report(all_candidates, report_path)
+        self._generate_report(all_candidates, report_path, timings)
         print(f"\n📄 Report generated: {report_path}")
 
         # Delete files if not dry-run
@@ -122,12 +114,75 @@ class VacuumCommand:
             print(f"\n⚠️  Found {len(all_candidates)} cleanup candidates")
             return 1
 
-    def _generate_report(self, candidates: List[CleanupCandidate], output_path: Path):
+    def _run_strategies(
+        self,
+        scan_path: Path,
+        exclude_strategies: List[str],
+        min_confidence: int,
+    ) -> Tuple[List[CleanupCandidate], Dict[str, float]]:
+        """Run enabled strategies on a thread pool sharing one file inventory.
+
+        The project tree is walked once up front; each strategy gets a
+        filtered view of it. Results are reported in registration order.
+
+        Args:
+            scan_path: Directory to scan
+            exclude_strategies: Strategy names to skip
+            min_confidence: Minimum confidence threshold (0-100)
+
+        Returns:
+            (candidates, {strategy_name: seconds}) - timings include "inventory"
+        """
+        timings: Dict[str, float] = {}
+        strategies = {}
+        for strategy_name, strategy_class in self.strategies.items():
+            if strategy_name in exclude_strategies:
+                print(f"⏭️  Skipping {strategy_name}")
+                continue
+            strategies[strategy_name] = strategy_class(self.project_root, scan_path)
+
+        if not strategies:
+            return [], timings
+
+        start = time.perf_counter()
+        inventory = next(iter(strategies.values())).build_inventory()
+        timings["inventory"] = time.perf_counter() - start
+        for strategy in strategies.values():
+            strategy.inventory = inventory
+
+        def run_one(strategy) -> Tuple[List[CleanupCandidate], float]:
+            started = time.perf_counter()
+            found = strategy.find_candidates()
+            return found, time.perf_counter() - started
+
+        all_candidates = []
+        with ThreadPoolExecutor(max_workers=self.max_workers or len(strategies)) as pool:
+            futures = {name: pool.submit(run_one, s) for name, s in strategies.items()}
+            for strategy_name, future in futures.items():
+                print(f"🔍 Running {strategy_name}...")
+                candidates, elapsed = future.result()
+                timings[strategy_name] = elapsed
+
+                # Filter by minimum confidence
+                candidates = [c for c in candidates if c.confidence >= min_confidence]
+
+                all_candidates.extend(candidates)
+                print(f"   Found {len(candidates)} candidates ({elapsed:.2f}s)")
+
+        return all_candidates, timings
+
+    def _generate_report(
+        self,
+        candidates: List[CleanupCandidate],
+        output_path: Path,
+        timings: Optional[Dict[str, float]] = None,
+    ):
         """Generate vacuum report.
 
         Args:
             candidates: List of cleanup candidates
             output_path: Path to output report file
+            timings: Per-strategy run time in seconds
         """
         # Ensure output directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -197,6 +252,18 @@ class VacuumCommand:
                 report.append(f"| {rel_path} | {c.reason} | {c.confidence}% | {refs} |")
             report.append("")
 
+        # Strategy timing section
+        if timings:
+            report.extend([
+                "## Strategy Timing",
+                "",
+                "| Strategy | Time |",
+                "|----------|------|",
+            ])
+            for name, elapsed in timings.items():
+                report.append(f"| {name} | {elapsed:.2f}s |")
+            report.append("")
+
         # Write report
         output_path.write_text("\n".join(report), encoding="utf-8")
 
@@ -1,6 +1,7 @@
 """Vacuum strategies for project cleanup."""
 
 from .base import BaseStrategy, CleanupCandidate
+from .inventory import FileInventory
 from .temp_files import TempFileStrategy
 from .backup_files import BackupFileStrategy
 from .obsolete_docs import ObsoleteDocStrategy
@@ -11,6 +12,7 @@ from .commented_code import CommentedCodeStrategy
 __all__ = [
     "BaseStrategy",
     "CleanupCandidate",
+    "FileInventory",
     "TempFileStrategy",
     "BackupFileStrategy",
     "ObsoleteDocStrategy",
@@ -23,16 +23,14 @@ class BackupFileStrategy(BaseStrategy):
             List of CleanupCandidate objects with HIGH confidence (100%)
         """
         candidates = []
+        inventory = self.get_inventory()
 
         for pattern in self.BACKUP_PATTERNS:
-            for path in self.scan_path.glob(pattern):
+            # Backup files are junk whether or not they are gitignored
+            for path in inventory.glob(pattern, self.scan_path, include_ignored=True):
                 if not path.exists():
                     continue
 
-                # Skip if protected
-                if self.is_protected(path):
-                    continue
-
                 candidate = CleanupCandidate(
                     path=path,
                     reason=f"Backup file: {pattern}",
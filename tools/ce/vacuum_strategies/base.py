@@ -3,9 +3,11 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 import subprocess
 
+from .inventory import FileInventory
+
 
 @dataclass
 class CleanupCandidate:
@@ -56,6 +58,7 @@ class BaseStrategy(ABC):
         """
         self.project_root = project_root
         self.scan_path = scan_path if scan_path else project_root
+        self.inventory: Optional[FileInventory] = None
 
     @abstractmethod
     def find_candidates(self) -> List[CleanupCandidate]:
@@ -66,8 +69,26 @@ class BaseStrategy(ABC):
         """
         pass
 
+    def get_inventory(self) -> FileInventory:
+        """Shared file inventory (set by VacuumCommand, else built on first use).
+
+        Returns:
+            FileInventory for project_root
+        """
+        if self.inventory is None:
+            self.inventory = self.build_inventory()
+        return self.inventory
+
+    def build_inventory(self) -> FileInventory:
+        """Walk project_root once, skipping wholesale-protected directories."""
+        protected_dirs = [
+            pattern[:-3] for pattern in self.PROTECTED_PATTERNS
+            if pattern.endswith("/**") and not any(ch in pattern[:-3] for ch in "*?[")
+        ]
+        return FileInventory(self.project_root, self._check_protected, protected_dirs)
+
     def is_protected(self, path: Path) -> bool:
-        """Check if path matches protected patterns.
+        """Check if path matches protected patterns (memoized via the inventory).
 
         Args:
             path: Path to check
@@ -75,6 +96,12 @@ class BaseStrategy(ABC):
         Returns:
             True if path is protected, False otherwise
         """
+        if self.inventory is not None:
+            return self.inventory.is_protected(path)
+        return self._check_protected(path)
+
+    def _check_protected(self, path: Path) -> bool:
+        """Uncached protection check behind is_protected()."""
         relative_path = path.relative_to(self.project_root)
         relative_str = str(relative_path)
 
@@ -1,17 +1,62 @@
 """Strategy for finding large commented code blocks."""
 
-import re
+import ast
+import hashlib
+import io
+import multiprocessing
+import os
+import textwrap
+import threading
+import tokenize
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional
 
+from ..prp_sections import read_disk_cache, write_disk_cache
 from .base import BaseStrategy, CleanupCandidate
 
+# Below this many uncached files, scanning in-process beats pool startup
+_PARALLEL_THRESHOLD = 32
+
+_MEMORY_CACHE_SIZE = 4096
+_memory_cache: "OrderedDict[str, List[dict]]" = OrderedDict()
+_memory_lock = threading.Lock()  # Strategies run in threads
+
+_CONTINUATION_HEADS = {
+    "elif": "if x:\n    pass\n",
+    "else": "if x:\n    pass\n",
+    "except": "try:\n    pass\n",
+    "finally": "try:\n    pass\n",
+}
+
 
 class CommentedCodeStrategy(BaseStrategy):
-    """Find large commented-out code blocks."""
+    """Find large commented-out code blocks.
+
+    Only real COMMENT tokens (via tokenize) are considered, so docstrings
+    and strings containing '#' never start or break a block. A run of
+    comment lines counts as code only if its uncommented text parses
+    with ast (as a whole, or line by line for fragments like `# else:`).
+
+    Results are cached per file content hash (in memory and under
+    .ce/cache/commented-code/), and uncached files are scanned across a
+    process pool.
+    """
 
     MIN_COMMENTED_LINES = 20  # Minimum consecutive commented lines to flag
 
+    def __init__(self, project_root: Path, scan_path: Path = None, workers: Optional[int] = None):
+        """Initialize strategy.
+
+        Args:
+            project_root: Path to project root directory
+            scan_path: Optional path to scan (defaults to project_root)
+            workers: Process pool size (default: CPU count)
+        """
+        super().__init__(project_root, scan_path)
+        self.workers = workers
+
     def find_candidates(self) -> List[CleanupCandidate]:
         """Find files with large commented code blocks.
 
@@ -20,18 +65,13 @@ class CommentedCodeStrategy(BaseStrategy):
         """
         candidates = []
 
-        # Find all Python files
-        for py_file in self.scan_path.glob("**/*.py"):
-            if not py_file.exists() or py_file.is_dir():
-                continue
-
-            # Skip if protected
-            if self.is_protected(py_file):
-                continue
-
-            # Find commented code blocks
-            blocks = self._find_commented_code_blocks(py_file)
+        # Find all Python files (protected and gitignored ones excluded)
+        py_files = [
+            p for p in self.get_inventory().python_files(self.scan_path, include_protected=False)
+            if p.exists()
+        ]
 
+        for py_file, blocks in zip(py_files, self._scan_files(py_files)):
             if blocks:
                 total_lines = sum(block["lines"] for block in blocks)
                 block_summary = ", ".join(
@@ -60,52 +100,164 @@ class CommentedCodeStrategy(BaseStrategy):
         Returns:
             List of dicts with block info: {"start": line_num, "lines": count}
         """
-        blocks = []
-
-        try:
-            content = py_file.read_text(encoding="utf-8")
-        except Exception:
-            return blocks
-
-        lines = content.split("\n")
-        in_block = False
-        block_start = 0
-        block_lines = 0
-
-        # Code patterns that indicate commented-out code (not prose)
-        code_patterns = [
-            r"^\s*#\s*(def|class|if|for|while|try|except|import|from)\s",
-            r"^\s*#\s*[a-zA-Z_][a-zA-Z0-9_]*\s*=",  # assignments
-            r"^\s*#\s*return\s",
-        ]
+        return self._scan_files([py_file])[0]
 
-        for i, line in enumerate(lines, start=1):
-            stripped = line.strip()
+    def _scan_files(self, py_files: List[Path]) -> List[List[dict]]:
+        """Blocks per file (input order), using the hash cache and a process pool."""
+        results: List[Optional[List[dict]]] = [None] * len(py_files)
+        pending: Dict[str, List[int]] = {}
+        sources: Dict[str, str] = {}
 
-            # Skip docstrings and module headers
-            if '"""' in line or "'''" in line:
+        for i, py_file in enumerate(py_files):
+            try:
+                source = py_file.read_text(encoding="utf-8")
+            except Exception:
+                results[i] = []
                 continue
 
-            # Check if line is a comment with code
-            is_code_comment = any(re.search(pattern, line) for pattern in code_patterns)
-
-            if is_code_comment:
-                if not in_block:
-                    in_block = True
-                    block_start = i
-                    block_lines = 1
-                else:
-                    block_lines += 1
+            key = f"{hashlib.sha256(source.encode('utf-8')).hexdigest()}-{self.MIN_COMMENTED_LINES}"
+            with _memory_lock:
+                cached = _memory_cache.get(key)
+            if cached is None:
+                cached = read_disk_cache("commented-code", key)
+            if cached is not None:
+                _remember(key, cached)
+                results[i] = cached
             else:
-                # End of block
-                if in_block and block_lines >= self.MIN_COMMENTED_LINES:
-                    blocks.append({"start": block_start, "lines": block_lines})
+                pending.setdefault(key, []).append(i)
+                sources[key] = source
+
+        keys = list(pending)
+        workers = self.workers or os.cpu_count() or 1
+        if workers == 1 or len(keys) < _PARALLEL_THRESHOLD:
+            scanned = [find_commented_code_blocks(sources[k], self.MIN_COMMENTED_LINES) for k in keys]
+        else:
+            # Large chunks amortize IPC; 4 chunks per worker keeps load balanced
+            chunksize = max(1, len(keys) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context()) as pool:
+                scanned = list(pool.map(
+                    find_commented_code_blocks,
+                    [sources[k] for k in keys],
+                    [self.MIN_COMMENTED_LINES] * len(keys),
+                    chunksize=chunksize,
+                ))
+
+        for key, blocks in zip(keys, scanned):
+            _remember(key, blocks)
+            write_disk_cache("commented-code", key, blocks)
+            for i in pending[key]:
+                results[i] = blocks
+
+        return results
+
+
+def _remember(key: str, blocks: List[dict]) -> None:
+    """Store blocks in the in-memory LRU (most recently used last)."""
+    with _memory_lock:
+        _memory_cache[key] = blocks
+        _memory_cache.move_to_end(key)
+        if len(_memory_cache) > _MEMORY_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
+
+
+def _pool_context():
+    """Start method for the scan pool.
+
+    The scan runs inside VacuumCommand's strategy threads; forking a
+    multi-threaded process can copy locks held by sibling threads and
+    deadlock, so workers come from a forkserver (spawn where unavailable).
+    """
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return multiprocessing.get_context(method)
+
+
+def find_commented_code_blocks(source: str, min_lines: int) -> List[dict]:
+    """Find runs of at least min_lines full-line comments that are code.
+
+    Args:
+        source: Python source text
+        min_lines: Minimum run length to report
+
+    Returns:
+        List of {"start": line_num, "lines": count}
+    """
+    comment_lines = _full_line_comments(source)
+    blocks = []
+
+    # Group consecutive full-line comments
+    group: List[tuple] = []
+    for lineno, text in comment_lines + [(None, None)]:
+        if group and (lineno is None or lineno != group[-1][0] + 1):
+            blocks.extend(_code_runs(group, min_lines))
+            group = []
+        if lineno is not None:
+            group.append((lineno, text))
+
+    return blocks
+
+
+def _full_line_comments(source: str) -> List[tuple]:
+    """(line_number, text after '#') for comments that are alone on their line."""
+    comments = []
+    last_code_line = 0
+    try:
+        for tok in tokenize.generate_tokens(io.StringIO(source).readline):
+            if tok.type == tokenize.COMMENT:
+                if tok.start[0] != last_code_line:
+                    comments.append((tok.start[0], tok.string[1:]))
+            elif tok.type not in (tokenize.NL, tokenize.NEWLINE, tokenize.INDENT,
+                                  tokenize.DEDENT, tokenize.ENDMARKER):
+                last_code_line = tok.end[0]
+    except (tokenize.TokenError, IndentationError, SyntaxError):
+        pass  # Keep comments seen before the error
+    return comments
+
+
+def _code_runs(group: List[tuple], min_lines: int) -> List[dict]:
+    """Sub-runs of a comment group whose uncommented text is code."""
+    if len(group) < min_lines:
+        return []
+
+    texts = [text for _, text in group]
+    if _parses_as_code(textwrap.dedent("\n".join(texts))):
+        return [{"start": group[0][0], "lines": len(group)}]
+
+    # Mixed prose and code: keep maximal runs of lines that parse on their own
+    runs = []
+    start = None
+    for i, text in enumerate(texts + [None]):
+        is_code = text is not None and (not text.strip() or _line_is_code(text))
+        if is_code and start is None:
+            start = i
+        elif not is_code and start is not None:
+            length = i - start
+            if length >= min_lines and any(t.strip() for t in texts[start:i]):
+                runs.append({"start": group[start][0], "lines": length})
+            start = None
+    return runs
+
+
+def _line_is_code(text: str) -> bool:
+    stripped = text.strip()
+    if not stripped.endswith(":"):
+        return _parses_as_code(stripped)
+
+    # Block openers (def/if/else/except...) need a body, and continuations a head
+    keyword = stripped.split(None, 1)[0].rstrip(":")
+    return _parses_as_code(f"{_CONTINUATION_HEADS.get(keyword, '')}{stripped}\n    pass")
+
 
-                in_block = False
-                block_lines = 0
+def _parses_as_code(text: str) -> bool:
+    """True if text parses and is not just bare names/literals (prose like 'TODO')."""
+    try:
+        tree = ast.parse(text)
+    except (SyntaxError, ValueError):
+        return False
+    return any(not _is_trivial(node) for node in tree.body)
 
-        # Check final block
-        if in_block and block_lines >= self.MIN_COMMENTED_LINES:
-            blocks.append({"start": block_start, "lines": block_lines})
 
-        return blocks
+def _is_trivial(node: ast.stmt) -> bool:
+    """Statements prose also parses as: bare words/literals, "Note: some text"."""
+    if isinstance(node, ast.Expr):
+        return isinstance(node.value, (ast.Name, ast.Constant))
+    return isinstance(node, ast.AnnAssign) and node.value is None
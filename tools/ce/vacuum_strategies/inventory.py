@@ -0,0 +1,171 @@
+"""Shared pruned file inventory for vacuum strategies."""
+
+import os
+import subprocess
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+
+class FileInventory:
+    """One walk of the project tree, shared by all strategies.
+
+    The walk never descends into VCS, dependency or virtualenv directories
+    or into directories that are protected wholesale (".ce/**" style
+    patterns). Gitignored paths are recorded once from a single
+    `git ls-files` call; strategies that hunt for junk (temp/backup files)
+    ask for them explicitly, all others skip them.
+
+    Protection checks are memoized, so each path is checked at most once
+    no matter how many strategies look at it.
+
+    Attributes:
+        project_root: Project root directory
+        files: All walked files (sorted)
+        dirs: All walked directories (sorted)
+    """
+
+    # Never walked (not project content)
+    PRUNED_DIRS = {".git", "node_modules", ".venv", "venv", ".tox", ".mypy_cache", ".ruff_cache"}
+
+    def __init__(
+        self,
+        project_root: Path,
+        is_protected: Callable[[Path], bool],
+        protected_dirs: Iterable[str] = (),
+    ):
+        """Walk project_root and collect files, directories and ignore status.
+
+        Args:
+            project_root: Path to project root directory
+            is_protected: Protection check (BaseStrategy.is_protected semantics)
+            protected_dirs: Root-relative directories protected wholesale (not walked)
+        """
+        self.project_root = project_root
+        self._is_protected = is_protected
+        self._protected_cache: Dict[Path, bool] = {}
+        skip = {str(Path(d)) for d in protected_dirs}
+
+        files: List[Path] = []
+        dirs: List[Path] = []
+        for dirpath, dirnames, filenames in os.walk(project_root):
+            current = Path(dirpath)
+            rel_dir = os.path.relpath(dirpath, project_root)
+            kept = []
+            for d in dirnames:
+                rel = d if rel_dir == "." else os.path.join(rel_dir, d)
+                if d in self.PRUNED_DIRS or rel in skip:
+                    continue
+                kept.append(d)
+                dirs.append(current / d)
+            dirnames[:] = kept
+            files.extend(current / f for f in filenames)
+
+        self.files = sorted(files)
+        self.dirs = sorted(dirs)
+        self._ignored_files, self._ignored_dirs = self._load_ignored()
+
+    # ------------------------------------------------------------------
+    # Views
+    # ------------------------------------------------------------------
+
+    def python_files(self, under: Optional[Path] = None, include_protected: bool = True) -> List[Path]:
+        """Non-ignored *.py files (optionally under a directory)."""
+        return self.select(lambda p: p.suffix == ".py", under, include_protected=include_protected)
+
+    def select(
+        self,
+        predicate: Callable[[Path], bool],
+        under: Optional[Path] = None,
+        include_dirs: bool = False,
+        include_ignored: bool = False,
+        include_protected: bool = False,
+    ) -> List[Path]:
+        """Filtered view of the inventory.
+
+        Args:
+            predicate: Path filter
+            under: Only paths inside this directory
+            include_dirs: Include directories as well as files
+            include_ignored: Include gitignored paths
+            include_protected: Include protected paths
+
+        Returns:
+            Matching paths (sorted)
+        """
+        under_parts = under.parts if under and under != self.project_root else None
+        pool = self.files + self.dirs if include_dirs else self.files
+
+        selected = []
+        for path in pool:
+            if under_parts and path.parts[:len(under_parts)] != under_parts:
+                continue
+            if not predicate(path):
+                continue
+            if not include_ignored and self.is_ignored(path):
+                continue
+            if not include_protected and self.is_protected(path):
+                continue
+            selected.append(path)
+        return sorted(selected)
+
+    def glob(self, pattern: str, under: Optional[Path] = None, include_ignored: bool = False) -> List[Path]:
+        """Equivalent of under.glob(pattern) for "**/<name pattern>" globs, files and dirs."""
+        name_pattern = pattern[3:] if pattern.startswith("**/") else pattern
+        return self.select(
+            lambda p: fnmatch(p.name, name_pattern),
+            under,
+            include_dirs=True,
+            include_ignored=include_ignored,
+        )
+
+    # ------------------------------------------------------------------
+    # Status checks
+    # ------------------------------------------------------------------
+
+    def is_protected(self, path: Path) -> bool:
+        """Memoized protection check."""
+        cached = self._protected_cache.get(path)
+        if cached is None:
+            cached = self._is_protected(path)
+            self._protected_cache[path] = cached
+        return cached
+
+    def is_ignored(self, path: Path) -> bool:
+        """True if path (or one of its parent dirs) is gitignored."""
+        if not self._ignored_files and not self._ignored_dirs:
+            return False
+        try:
+            rel = path.relative_to(self.project_root)
+        except ValueError:
+            return False
+        if rel.as_posix() in self._ignored_files:
+            return True
+        return any(parent.as_posix() in self._ignored_dirs for parent in [rel, *rel.parents][:-1])
+
+    def _load_ignored(self):
+        """Ignored untracked paths from one `git ls-files` call (empty outside git)."""
+        try:
+            result = subprocess.run(
+                ["git", "ls-files", "--others", "--ignored", "--exclude-standard", "--directory", "-z"],
+                cwd=self.project_root,
+                capture_output=True,
+                text=True,
+                timeout=30,
+            )
+        except Exception:
+            return set(), set()
+
+        if result.returncode != 0:
+            return set(), set()
+
+        ignored_files: Set[str] = set()
+        ignored_dirs: Set[str] = set()
+        for entry in result.stdout.split("\0"):
+            if not entry:
+                continue
+            if entry.endswith("/"):
+                ignored_dirs.add(entry.rstrip("/"))
+            else:
+                ignored_files.add(entry)
+        return ignored_files, ignored_dirs
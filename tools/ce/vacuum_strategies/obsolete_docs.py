@@ -4,6 +4,7 @@ import re
 from pathlib import Path
 from typing import List
 
+from ..doc_probe import probe_doc
 from .base import BaseStrategy, CleanupCandidate
 
 
@@ -91,13 +92,10 @@ class ObsoleteDocStrategy(BaseStrategy):
         # Check for root-level garbage files (all-caps, no extension)
         candidates.extend(self._find_root_garbage_files())
 
-        # Find all markdown files
-        for md_file in self.scan_path.glob("**/*.md"):
-            if not md_file.exists() or md_file.is_dir():
-                continue
-
-            # Skip if protected
-            if self.is_protected(md_file):
+        # Find all markdown files (protected and gitignored ones excluded)
+        md_files = self.get_inventory().select(lambda p: p.suffix == ".md", self.scan_path)
+        for md_file in md_files:
+            if not md_file.exists():
                 continue
 
             stem = md_file.stem
@@ -195,7 +193,8 @@ class ObsoleteDocStrategy(BaseStrategy):
     def _check_doc_content(self, file: Path) -> str | None:
         """Check document content for temporary markers.
 
-        Reads first 20 lines and looks for markers like "WIP", "DRAFT", "TODO", etc.
+        Probes the first 20 lines (bounded read, cached per file version)
+        and looks for markers like "WIP", "DRAFT", "TODO", etc.
 
         Args:
             file: Path to markdown file
@@ -204,24 +203,17 @@ class ObsoleteDocStrategy(BaseStrategy):
             Marker description if found, None otherwise
         """
         try:
-            with open(file, "r", encoding="utf-8", errors="ignore") as f:
-                # Read first 20 lines
-                lines = []
-                for i, line in enumerate(f):
-                    if i >= 20:
-                        break
-                    lines.append(line.lower())
-
-                content = " ".join(lines)
-
-                # Check for temporary markers
-                for marker in self.TEMP_CONTENT_MARKERS:
-                    if marker in content:
-                        return f"'{marker}' found"
-
+            lines = probe_doc(file, errors="ignore").lines(20)
         except Exception:
             # If we can't read the file, skip content check
-            pass
+            return None
+
+        content = " ".join(lines).lower()
+
+        # Check for temporary markers
+        for marker in self.TEMP_CONTENT_MARKERS:
+            if marker in content:
+                return f"'{marker}' found"
 
         return None
 
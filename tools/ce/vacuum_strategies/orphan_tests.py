@@ -22,12 +22,11 @@ class OrphanTestStrategy(BaseStrategy):
         if not tests_dir.exists():
             return candidates
 
-        for test_file in tests_dir.glob("**/test_*.py"):
-            if not test_file.exists() or test_file.is_dir():
-                continue
-
-            # Skip if protected
-            if self.is_protected(test_file):
+        test_files = self.get_inventory().select(
+            lambda p: p.name.startswith("test_") and p.suffix == ".py", tests_dir
+        )
+        for test_file in test_files:
+            if not test_file.exists():
                 continue
 
             # Extract module name from test_foo.py -> foo
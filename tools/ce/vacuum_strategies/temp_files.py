@@ -28,16 +28,14 @@ class TempFileStrategy(BaseStrategy):
             List of CleanupCandidate objects with HIGH confidence (100%)
         """
         candidates = []
+        inventory = self.get_inventory()
 
         for pattern in self.TEMP_PATTERNS:
-            for path in self.scan_path.glob(pattern):
+            # Temp files are usually gitignored - include ignored paths
+            for path in inventory.glob(pattern, self.scan_path, include_ignored=True):
                 if not path.exists():
                     continue
 
-                # Skip if protected (shouldn't happen but safety check)
-                if self.is_protected(path):
-                    continue
-
                 candidate = CleanupCandidate(
                     path=path,
                     reason=f"Temporary file: {pattern}",
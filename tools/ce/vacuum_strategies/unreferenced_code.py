@@ -1,74 +1,72 @@
-"""Strategy for finding unreferenced code files using Serena."""
+"""Strategy for finding unreferenced code files using the module import graph."""
 
 from pathlib import Path
-from typing import List, Set
-import subprocess
-import json
+from typing import List
 
+from ..import_graph import ImportGraph
 from .base import BaseStrategy, CleanupCandidate
 
 
 class UnreferencedCodeStrategy(BaseStrategy):
-    """Find Python files where ALL definitions are unreferenced.
+    """Find Python modules that nothing reachable imports.
 
-    A file is considered unreferenced if:
-    1. The file/module itself is not imported anywhere
-    2. (Future enhancement: Check individual symbols with Serena)
+    Builds an AST import graph of the project (cached per file content
+    hash) and walks it from entry points: pyproject scripts, tests and
+    __main__ / `if __name__ == "__main__"` scripts.
 
-    Note: Currently only checks #1 for performance. Full Serena integration
-    would check if each function/class is referenced, but this is slower.
+    A file is a candidate if:
+    1. Its module is not reachable from any entry point, or
+    2. It is reachable, not itself an entry point, and ALL its top-level
+       definitions are unreferenced (report only - it may be imported for
+       side effects)
     """
 
     def __init__(self, project_root: Path, scan_path: Path = None):
-        """Initialize strategy and activate Serena project.
+        """Initialize strategy.
 
         Args:
             project_root: Path to project root directory
             scan_path: Optional path to scan (defaults to project_root)
         """
         super().__init__(project_root, scan_path)
-        self.serena_available = False
+        self.graph = None
 
     def find_candidates(self) -> List[CleanupCandidate]:
         """Find unreferenced code files.
 
         Returns:
-            List of CleanupCandidate objects with LOW confidence (40%)
+            List of CleanupCandidate objects with LOW confidence (30-40%)
         """
         candidates = []
 
-        # Check if Serena is available via mcp CLI
-        if not self._check_serena_available():
-            return candidates
-
-        # Get all Python files
-        py_files = list(self.scan_path.glob("**/*.py"))
-
-        # Get all import statements to find which files are referenced
-        referenced_modules = self._get_all_imports()
-
-        for py_file in py_files:
-            if not py_file.exists() or py_file.is_dir():
-                continue
-
-            # Skip if protected
-            if self.is_protected(py_file):
-                continue
-
-            # Check if this file is imported anywhere
-            relative_path = py_file.relative_to(self.project_root)
-            module_name = str(relative_path).replace("/", ".").replace(".py", "")
-
-            # Also check stem (e.g., "core" from "ce/core.py")
-            stem = py_file.stem
-
-            is_referenced = False
-            for ref_module in referenced_modules:
-                if module_name in ref_module or stem in ref_module:
-                    is_referenced = True
-                    break
+        # Graph covers the whole project: imports from outside scan_path count
+        self.graph = ImportGraph(self.project_root, self.get_inventory().python_files())
+        reachable = self.graph.reachable()
+        unreferenced_symbols = self.graph.unreferenced_symbols()
+        scan_root = self.scan_path.resolve()
+
+        for module, paths in sorted(self.graph.modules.items()):
+            for py_file in paths:
+                if not py_file.resolve().is_relative_to(scan_root):
+                    continue
+
+                # Skip if protected
+                if self.is_protected(py_file):
+                    continue
+
+                if module not in reachable:
+                    reason = "Module not reachable from any entry point (scripts, tests, __main__)"
+                    report_only = False
+                elif module in self.graph.entry_points:
+                    continue  # Tests/scripts define functions their runner calls
+                else:
+                    defs = self.graph.scans[str(py_file)]["defs"]
+                    dead = unreferenced_symbols.get(module, [])
+                    if not defs or set(defs) - set(dead):
+                        continue
+                    reason = f"All definitions unreferenced: {', '.join(dead)}"
+                    report_only = True
 
-            if not is_referenced:
                 # Recently active files get lower confidence
                 confidence = 40
                 if self.is_recently_active(py_file, days=30):
@@ -76,77 +74,14 @@ class UnreferencedCodeStrategy(BaseStrategy):
 
                 candidate = CleanupCandidate(
                     path=py_file,
-                    reason="File not imported anywhere (all defs potentially unreferenced)",
+                    reason=reason,
                     confidence=confidence,  # LOW confidence
                     size_bytes=self.get_file_size(py_file),
                     last_modified=self.get_last_modified(py_file),
                     git_history=self.get_git_history(py_file),
-                    references=list(referenced_modules) if referenced_modules else [],
+                    references=sorted(self.graph.importers(module)),
+                    report_only=report_only,
                 )
                 candidates.append(candidate)
 
         return candidates
-
-    def _check_serena_available(self) -> bool:
-        """Check if Serena MCP is available.
-
-        Returns:
-            True if Serena is available, False otherwise
-        """
-        try:
-            result = subprocess.run(
-                ["mcp", "list"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            self.serena_available = "serena" in result.stdout.lower()
-            return self.serena_available
-        except Exception:
-            return False
-
-    def _get_all_imports(self) -> Set[str]:
-        """Get all import statements in the project.
-
-        Uses grep to find all import statements efficiently.
-
-        Returns:
-            Set of imported module names
-        """
-        imports = set()
-
-        try:
-            # Find all "from X import" and "import X" statements
-            result = subprocess.run(
-                ["grep", "-rh", "--include=*.py", "-E", r"^(from|import)\s+", str(self.project_root)],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-
-            if result.returncode == 0:
-                for line in result.stdout.split("\n"):
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    # Parse "from foo.bar import baz" -> "foo.bar"
-                    if line.startswith("from "):
-                        parts = line.split()
-                        if len(parts) >= 2:
-                            imports.add(parts[1])
-
-                    # Parse "import foo.bar" -> "foo.bar"
-                    elif line.startswith("import "):
-                        parts = line.split()
-                        if len(parts) >= 2:
-                            # Handle "import foo, bar, baz"
-                            for module in parts[1:]:
-                                module = module.strip(",")
-                                if module and not module.startswith("#"):
-                                    imports.add(module)
-
-        except Exception:
-            pass
-
-        return imports
@@ -7,10 +7,15 @@ from typing import Dict, Any, List, Optional
 from pathlib import Path
 from datetime import datetime, timezone
 
-from .core import run_cmd
+from .core import run_cmd, run_cmd_stream
 from .pattern_extractor import extract_patterns_from_prp
 from .drift_analyzer import analyze_implementation, calculate_drift_score, get_auto_fix_suggestions
 from .mermaid_validator import lint_all_markdown_mermaid
+from .drift_store import DriftStore
+from .prp_sections import load_prp
+from .impact_analysis import ImpactSelector, find_tools_dir
+
+L2_TIMEOUT = 1800  # Seconds for a pytest run (full suite included)
 
 
 def validate_level_1() -> Dict[str, Any]:
@@ -77,28 +82,68 @@ def validate_level_1() -> Dict[str, Any]:
     }
 
 
-def validate_level_2() -> Dict[str, Any]:
+def validate_level_2(select_tests: bool = False, force_full: bool = False) -> Dict[str, Any]:
     """Run Level 2 validation: Unit Tests.
 
+    Args:
+        select_tests: Run only the pytest files affected by changes since the
+            last green run (test impact analysis; see ce.impact_analysis).
+            Falls back to "npm test" when no tools/tests tree is found.
+        force_full: With select_tests, run the full suite and reset the
+            impact baseline
+
     Returns:
-        Dict with: success (bool), errors (List[str]), duration (float)
+        Dict with: success (bool), errors (List[str]), duration (float);
+        with select_tests also selection (mode, reason, tests, rationale)
 
     Raises:
         RuntimeError: If test command fails to execute
 
     Note: Real test execution - no mocked test pass.
     """
-    result = run_cmd("npm test", capture_output=True)
+    tools_dir = find_tools_dir() if select_tests else None
+    if tools_dir is None:
+        result = run_cmd("npm test", capture_output=True)
+
+        errors = []
+        if not result["success"]:
+            errors.append(f"Unit tests failed:\n{result['stderr']}")
+
+        return {
+            "success": result["success"],
+            "errors": errors,
+            "duration": result["duration"],
+            "level": 2
+        }
+
+    selector = ImpactSelector(tools_dir)
+    selection = selector.select(force_full=force_full)
+    summary = {k: v for k, v in selection.items() if not k.startswith("_")}
+
+    if selection["mode"] == "none":
+        # Nothing changed since the last green run; never baseline untested changes
+        if not selection["changed"]:
+            selector.record_green(selection)
+        return {"success": True, "errors": [], "duration": 0.0, "level": 2, "selection": summary}
+
+    result = run_cmd_stream(
+        [sys.executable, "-m", "pytest", "-q", *selection["tests"]],
+        cwd=str(tools_dir),
+        timeout=L2_TIMEOUT
+    )
 
     errors = []
-    if not result["success"]:
-        errors.append(f"Unit tests failed:\n{result['stderr']}")
+    if result["success"]:
+        selector.record_green(selection)
+    else:
+        errors.append(f"Unit tests failed:\n{result['stdout']}\n{result['stderr']}".rstrip())
 
     return {
         "success": result["success"],
         "errors": errors,
         "duration": result["duration"],
-        "level": 2
+        "level": 2,
+        "selection": summary
     }
 
 
@@ -269,19 +314,18 @@ def _auto_detect_implementation_paths(prp_path: str) -> List[str]:
 
 def _parse_prp_blueprint_paths(prp_path: str) -> List[str]:
     """Parse implementation file paths from PRP IMPLEMENTATION BLUEPRINT section."""
-    content = Path(prp_path).read_text()
+    doc = load_prp(prp_path)
 
-    # Find IMPLEMENTATION BLUEPRINT section
-    blueprint_match = re.search(
-        r"##\s+.*?IMPLEMENTATION\s+BLUEPRINT.*?\n(.*?)(?=\n##|\Z)",
-        content,
-        re.DOTALL | re.IGNORECASE
+    # Find IMPLEMENTATION BLUEPRINT section (including its Phase subsections)
+    blueprint = next(
+        (s for s in doc.find_all(r".*?IMPLEMENTATION\s+BLUEPRINT") if s.level >= 2),
+        None
     )
 
-    if not blueprint_match:
+    if not blueprint:
         return []
 
-    blueprint_text = blueprint_match.group(1)
+    blueprint_text = doc.text(blueprint)
 
     # Extract file paths from patterns like "Modify: path/file.py", "Create: path/file.py"
     file_patterns = re.findall(
@@ -425,6 +469,13 @@ def _persist_drift_decision(
         new_content = content[:insert_pos] + drift_yaml + content[insert_pos:]
         Path(prp_path).write_text(new_content)
         print(f"\n✅ Drift decision persisted to {prp_path}")
+
+        # Keep drift history index in sync (PRP file remains source of truth)
+        try:
+            with DriftStore() as store:
+                store.record(prp_path)
+        except Exception as e:
+            print(f"⚠️  Warning: Could not update drift history index: {e}", file=sys.stderr)
     else:
         print(f"\n⚠️  Warning: Could not find YAML header in {prp_path}")
 
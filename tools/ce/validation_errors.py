@@ -0,0 +1,247 @@
+"""One-pass structured error extraction from validation tool output.
+
+Each supported tool has a precompiled line grammar; iter_errors() walks
+the output once, line by line, and yields every error it recognizes.
+Memory is bounded: only the last CONTEXT_LINES lines are kept as context
+for the error being built, and at most max_errors errors are produced.
+
+Grammars:
+    Python tracebacks   File "x.py", line 5, in func  ...  ValueError: msg
+    pytest              tests/test_x.py:42: in test_fn / E   AssertionError
+                        FAILED tests/test_x.py::test_fn - msg
+    mypy                src/x.py:12: error: msg  [code]
+    ruff / flake8       src/x.py:12:5: F401 msg
+    tsc                 src/a.ts(12,5): error TS2322: msg / src/a.ts:12:5 - error TS2322: msg
+    eslint (stylish)    /path/a.js  then  "  12:5  error  msg  rule"
+    markdownlint        README.md:12:81 MD013/line-length msg
+
+Example:
+    with open("pytest.log") as f:
+        for error in iter_errors(f):
+            print(error["file"], error["line"], error["message"])
+"""
+
+import io
+import re
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+CONTEXT_LINES = 40
+DEFAULT_MAX_ERRORS = 50
+
+# Python exception class → error type
+_EXCEPTION_TYPES = {
+    "ImportError": "import_error",
+    "ModuleNotFoundError": "import_error",
+    "AssertionError": "assertion_error",
+    "SyntaxError": "syntax_error",
+    "IndentationError": "syntax_error",
+    "TabError": "syntax_error",
+    "TypeError": "type_error",
+    "NameError": "name_error",
+    "UnboundLocalError": "name_error",
+    "AttributeError": "attribute_error",
+}
+
+SUGGESTED_FIXES = {
+    "import_error": "Add missing import statement",
+    "assertion_error": "Check assertion logic",
+    "syntax_error": "Fix syntax error",
+    "type_error": "Check type annotations and conversions",
+    "name_error": "Define missing variable or import",
+    "attribute_error": "Check attribute exists on object",
+    "lint_error": "Fix lint violation",
+    "markdown_error": "Fix markdown lint violation",
+    "test_failure": "Check failing test",
+    "unknown_error": "Manual review required",
+}
+
+_TRACEBACK_FRAME = re.compile(r'^\s*File "(?P<file>[^"]+)", line (?P<line>\d+)(?:, in (?P<func>[\w<>.]+))?')
+_EXCEPTION = re.compile(
+    r"^\s*(?:[A-Za-z_]\w*\.)*(?P<exc>[A-Z]\w*(?:Error|Exception|Exit))(?::\s*(?P<msg>.*))?$"
+)
+_PYTEST_LOCATION = re.compile(r"^\s*(?P<file>[^\s:]+\.py):(?P<line>\d+):(?: in (?P<func>\w+)| (?P<exc>[A-Z]\w*))?\s*$")
+_PYTEST_E = re.compile(r"^\s*E\s{2,}(?P<text>\S.*)$")
+_PYTEST_SEPARATOR = re.compile(r"^(?:_{3,}|={3,}) .* (?:_{3,}|={3,})$")
+_PYTEST_SUMMARY = re.compile(r"^(?:FAILED|ERROR) (?P<file>[^\s:]+\.py)(?:::(?P<func>\S+))?(?: - (?P<msg>.*))?$")
+_MYPY = re.compile(r"^(?P<file>[^\s:]+\.pyi?):(?P<line>\d+):(?:\d+:)? error: (?P<msg>.*?)(?:\s+\[(?P<code>[\w-]+)\])?$")
+_PY_LINT = re.compile(r"^(?P<file>[^\s:]+\.pyi?):(?P<line>\d+):(?P<col>\d+): (?P<code>[A-Z]+\d+) (?P<msg>.*)$")
+_TSC = re.compile(
+    r"^(?P<file>[^\s(:]+\.[cm]?[jt]sx?)(?:\((?P<line>\d+),(?P<col>\d+)\): | ?:(?P<line2>\d+):(?P<col2>\d+) - )"
+    r"error (?P<code>TS\d+): (?P<msg>.*)$"
+)
+_ESLINT_FILE = re.compile(r"^(?P<file>\S.*\.(?:[cm]?[jt]sx?|vue))$")
+_ESLINT_ROW = re.compile(r"^\s+(?P<line>\d+):(?P<col>\d+)\s+(?P<sev>error|warning)\s+(?P<msg>.+?)(?:\s{2,}(?P<code>[@\w/-]+))?$")
+_MARKDOWNLINT = re.compile(r"^(?P<file>[^\s:]+\.md):(?P<line>\d+)(?::(?P<col>\d+))? (?P<code>MD\d{3})(?:/[\w-]+)* (?P<msg>.*)$")
+
+_NO_MODULE = re.compile(r"No module named '([^']+)'")
+_CANNOT_IMPORT = re.compile(r"cannot import name '([^']+)'")
+_TYPE_HINT = re.compile(
+    r"(?P<import_error>ModuleNotFoundError|ImportError|cannot import)|(?P<assertion_error>AssertionError)"
+    r"|(?P<syntax_error>SyntaxError)|(?P<type_error>TypeError)|(?P<name_error>NameError|is not defined)"
+    r"|(?P<attribute_error>AttributeError)"
+)
+
+
+def make_error(
+    error_type: str,
+    file: str = "unknown",
+    line: int = 0,
+    message: str = "",
+    function: Optional[str] = None,
+    traceback: str = "",
+    code: Optional[str] = None
+) -> Dict[str, Any]:
+    """Build a structured error dict (same shape as parse_validation_error)."""
+    error = {
+        "type": error_type,
+        "file": file,
+        "line": line,
+        "function": function,
+        "message": message,
+        "traceback": traceback,
+        "suggested_fix": SUGGESTED_FIXES.get(error_type, SUGGESTED_FIXES["unknown_error"]),
+    }
+    if code:
+        error["code"] = code
+
+    if error_type == "import_error":
+        missing = _NO_MODULE.search(message)
+        name = _CANNOT_IMPORT.search(message)
+        if missing:
+            error["message"] = f"No module named '{missing.group(1)}'"
+            error["suggested_fix"] = f"Install or import {missing.group(1)}"
+        elif name:
+            error["message"] = f"cannot import name '{name.group(1)}'"
+            error["suggested_fix"] = f"Check import of {name.group(1)}"
+    return error
+
+
+def iter_errors(lines: Iterable[str], max_errors: int = DEFAULT_MAX_ERRORS) -> Iterator[Dict[str, Any]]:
+    """Yield structured errors from tool output in a single pass.
+
+    Args:
+        lines: Output lines (a file object, a generator, or str.splitlines())
+        max_errors: Stop after this many errors
+
+    Yields:
+        Error dicts (see make_error). Duplicates are reported once; pytest
+        summary lines only count for files without traceback details.
+    """
+    context: deque = deque(maxlen=CONTEXT_LINES)
+    location: Optional[Dict[str, Any]] = None  # Last traceback frame / pytest "in func" line
+    pending_e: Optional[str] = None  # First pytest "E   ..." line awaiting its location
+    eslint_file: Optional[str] = None
+    seen_keys = set()
+    detailed_files = set()  # Files with errors from tracebacks
+    count = 0
+
+    for raw in lines:
+        line = raw.rstrip("\r\n")
+        context.append(line)
+        error = None
+        detailed = True
+
+        if (match := _TRACEBACK_FRAME.match(line)):
+            location = {"file": match["file"], "line": int(match["line"]), "function": match["func"]}
+            continue
+
+        if (match := _PYTEST_LOCATION.match(line)):
+            where = {"file": match["file"], "line": int(match["line"]), "function": match["func"]}
+            if not match["exc"]:
+                if match["func"]:  # Short traceback: "path.py:42: in func" precedes the E lines
+                    location = where
+                continue
+            # Long traceback: "path.py:42: AssertionError" follows the E lines
+            error = _python_error(pending_e or match["exc"], where, context, default_exc=match["exc"])
+            location = pending_e = None
+        elif (match := _PYTEST_E.match(line)):
+            if location is not None:
+                error = _python_error(match["text"], location, context)
+                location = None
+            elif pending_e is None:
+                pending_e = match["text"]
+        elif (match := _EXCEPTION.match(line)) and (location is not None or match["msg"] is not None):
+            error = _python_error(line.strip(), location or {}, context)
+            location = None
+        elif (match := _PYTEST_SUMMARY.match(line)):
+            if match["file"] in detailed_files:
+                continue  # Already reported from its traceback (summary text may be truncated)
+            message = match["msg"] or f"{match['file']}::{match['func']} failed"
+            exc = _EXCEPTION.match(message)
+            error_type = _EXCEPTION_TYPES.get(exc["exc"], "test_failure") if exc else "test_failure"
+            error = make_error(error_type, file=match["file"], function=match["func"], message=message, traceback=line)
+            detailed = False
+        elif (match := _MYPY.match(line)):
+            error = make_error("type_error", match["file"], int(match["line"]), match["msg"], traceback=line,
+                               code=match["code"])
+        elif (match := _PY_LINT.match(line)):
+            error_type = "syntax_error" if match["code"] == "E999" else "lint_error"
+            error = make_error(error_type, match["file"], int(match["line"]), match["msg"], traceback=line,
+                               code=match["code"])
+        elif (match := _TSC.match(line)):
+            error = make_error("type_error", match["file"], int(match["line"] or match["line2"]), match["msg"],
+                               traceback=line, code=match["code"])
+        elif (match := _MARKDOWNLINT.match(line)):
+            error = make_error("markdown_error", match["file"], int(match["line"]), match["msg"], traceback=line,
+                               code=match["code"])
+        elif eslint_file and (match := _ESLINT_ROW.match(line)):
+            if match["sev"] == "error":
+                error = make_error("lint_error", eslint_file, int(match["line"]), match["msg"], traceback=line,
+                                   code=match["code"])
+        elif (match := _ESLINT_FILE.match(line)):
+            eslint_file = match["file"]
+        elif _PYTEST_SEPARATOR.match(line):
+            location = pending_e = None
+        elif not line.strip():
+            eslint_file = None
+
+        if error is None:
+            continue
+        key = (error["type"], error["file"], error["message"])
+        if key in seen_keys:
+            continue
+        seen_keys.add(key)
+        if detailed:
+            detailed_files.add(error["file"])
+        yield error
+        count += 1
+        if count >= max_errors:
+            return
+
+
+def _python_error(
+    text: str,
+    where: Dict[str, Any],
+    context: deque,
+    default_exc: Optional[str] = None
+) -> Dict[str, Any]:
+    """Error from an exception line ("ValueError: msg") or pytest E text."""
+    match = _EXCEPTION.match(text)
+    if match:
+        exc = match["exc"]
+        message = f"{exc}: {match['msg']}" if match["msg"] else exc
+    else:
+        exc = default_exc or ("AssertionError" if text.startswith("assert") else "")
+        message = text
+    error = make_error(
+        _EXCEPTION_TYPES.get(exc, "unknown_error"),
+        file=where.get("file", "unknown"),
+        line=where.get("line", 0),
+        function=where.get("function"),
+        message=message,
+        traceback="\n".join(context),
+    )
+    context.clear()
+    return error
+
+
+def extract_errors(output: str, max_errors: int = DEFAULT_MAX_ERRORS) -> List[Dict[str, Any]]:
+    """All structured errors in output (see iter_errors)."""
+    return list(iter_errors(io.StringIO(output), max_errors))
+
+
+def guess_error_type(output: str) -> str:
+    """Error type from keywords when no grammar matched ("unknown_error" if none)."""
+    match = _TYPE_HINT.search(output)
+    return match.lastgroup if match else "unknown_error"
@@ -6,10 +6,13 @@ human intervention when automated fixes are insufficient.
 """
 
 import re
+import sys
 from typing import Dict, Any, List
 from pathlib import Path
 
 from .exceptions import EscalationRequired
+from .validation_errors import extract_errors, guess_error_type, make_error
+from .impact_analysis import ImpactSelector, failed_test_ids, find_tools_dir, narrow_pytest_command
 
 
 def run_validation_loop(
@@ -118,14 +121,31 @@ def run_validation_loop(
 
     if phase.get("validation_command"):
         print(f"    L2: Running {phase['validation_command']}...")
-        from .core import run_cmd
+        from .core import run_cmd_stream
+
+        # Retries of a pytest command re-run only the tests that failed plus
+        # tests affected by the self-healing edits since the previous attempt
+        tools_dir = find_tools_dir()
+        selector = ImpactSelector(tools_dir) if tools_dir else None
+        l2_snapshot = None
+        l2_failed: List[str] = []
 
         for attempt in range(1, max_attempts + 1):
             l2_attempts = attempt
             try:
-                l2_result = run_cmd(phase["validation_command"])
+                command = phase["validation_command"]
+                if attempt > 1 and l2_failed:
+                    narrowed = narrow_pytest_command(command, l2_failed + _impacted_since(selector, l2_snapshot))
+                    if narrowed:
+                        command = narrowed
+                        print(f"    L2: Re-running {len(l2_failed)} failed test(s) and impacted tests")
+                if selector and narrow_pytest_command(phase["validation_command"], ["tests"]):
+                    l2_snapshot = selector.snapshot(l2_snapshot)
+
+                l2_result = run_cmd_stream(command, tee=sys.stdout, prefix="       ")
                 if not l2_result["success"]:
                     # Validation failed - try self-healing
+                    l2_failed = failed_test_ids(l2_result.get("stdout", "") + "\n" + l2_result.get("stderr", ""))
                     l2_errors = [l2_result.get("stderr", "Test failed")]
                     print(f"    ❌ L2 failed (attempt {attempt}/{max_attempts})")
                     print(f"       {l2_result.get('stderr', 'Unknown error')[:200]}")
@@ -217,6 +237,28 @@ def run_validation_loop(
     }
 
 
+def _impacted_since(selector, snapshot) -> List[str]:
+    """Test files affected by changes since snapshot (["tests"] if unattributable).
+
+    Args:
+        selector: ImpactSelector for the tools directory (None = unavailable)
+        snapshot: Snapshot taken before the previous attempt
+
+    Returns:
+        Test files relative to the tools directory
+    """
+    if selector is None or snapshot is None:
+        return []
+    changes = ImpactSelector.diff(snapshot, selector.snapshot(snapshot))
+    changed = changes["added"] + changes["modified"]
+    if changes["deleted"]:
+        return ["tests"]
+    if not changed:
+        return []
+    impacted = selector.impacted_tests(changed)
+    return ["tests"] if impacted is None else sorted(impacted)
+
+
 def _try_self_heal(
     error_output: str,
     level: str,
@@ -244,6 +286,8 @@ def _try_self_heal(
 
     error = parse_validation_error(error_output, level)
     error_history.append(error["message"])
+    if len(error["errors"]) > 1:
+        print(f"      Found {len(error['errors'])} errors")
 
     # Check escalation triggers
     if check_escalation_triggers(error, attempt, error_history):
@@ -316,81 +360,29 @@ def parse_validation_error(output: str, _level: str) -> Dict[str, Any]:
             "line": 42,
             "function": "authenticate",
             "message": "Expected User, got None",
-            "traceback": "<full traceback>",
-            "suggested_fix": "Check return value"
+            "traceback": "<traceback of this error>",
+            "suggested_fix": "Check return value",
+            "errors": [<every error found, this one first>]
         }
 
     Process:
-        1. Detect error type (assertion, import, syntax, type, etc.)
-        2. Extract file:line location
-        3. Extract function/class context
-        4. Extract error message
-        5. Generate suggested fix hint
+        1. Extract all errors in one pass with per-tool grammars
+           (see ce.validation_errors: pytest, tracebacks, mypy, ruff, tsc,
+           eslint, markdownlint)
+        2. Return the first as the primary error, all of them in "errors"
+        3. If no grammar matched, classify by keywords without a location
     """
-    error = {
-        "type": "unknown_error",
-        "file": "unknown",
-        "line": 0,
-        "function": None,
-        "message": output[:200] if output else "Unknown error",
-        "traceback": output,
-        "suggested_fix": "Manual review required"
-    }
-
-    # Detect error type from output patterns
-    if "ImportError" in output or "ModuleNotFoundError" in output or "cannot import" in output:
-        error["type"] = "import_error"
-        error["suggested_fix"] = "Add missing import statement"
-
-        # Extract module name: "No module named 'jwt'" or "cannot import name 'User'"
-        import_match = re.search(r"No module named '([^']+)'", output)
-        if import_match:
-            error["message"] = f"No module named '{import_match.group(1)}'"
-            error["suggested_fix"] = f"Install or import {import_match.group(1)}"
-        else:
-            name_match = re.search(r"cannot import name '([^']+)'", output)
-            if name_match:
-                error["message"] = f"cannot import name '{name_match.group(1)}'"
-                error["suggested_fix"] = f"Check import of {name_match.group(1)}"
-
-    elif "AssertionError" in output or "assert" in output.lower():
-        error["type"] = "assertion_error"
-        error["suggested_fix"] = "Check assertion logic"
-
-    elif "SyntaxError" in output:
-        error["type"] = "syntax_error"
-        error["suggested_fix"] = "Fix syntax error"
-
-    elif "TypeError" in output:
-        error["type"] = "type_error"
-        error["suggested_fix"] = "Check type annotations and conversions"
-
-    elif "NameError" in output or "is not defined" in output:
-        error["type"] = "name_error"
-        error["suggested_fix"] = "Define missing variable or import"
-
-    elif "AttributeError" in output:
-        error["type"] = "attribute_error"
-        error["suggested_fix"] = "Check attribute exists on object"
-
-    # Extract file:line location (common patterns)
-    # Pattern 1: File "path/to/file.py", line 42
-    file_match = re.search(r'File "([^"]+)", line (\d+)', output)
-    if file_match:
-        error["file"] = file_match.group(1)
-        error["line"] = int(file_match.group(2))
-
-    # Pattern 2: path/to/file.py:42:
-    location_match = re.search(r'([^:\s]+\.py):(\d+):', output)
-    if location_match:
-        error["file"] = location_match.group(1)
-        error["line"] = int(location_match.group(2))
-
-    # Extract function/class context
-    func_match = re.search(r'in (\w+)', output)
-    if func_match:
-        error["function"] = func_match.group(1)
-
+    errors = extract_errors(output or "")
+    if errors:
+        return dict(errors[0], errors=errors)
+
+    error_type = guess_error_type(output or "")
+    error = make_error(
+        error_type,
+        message=output[:200] if output else "Unknown error",
+        traceback=output or ""
+    )
+    error["errors"] = [dict(error)]
     return error
 
 
@@ -422,6 +414,13 @@ def check_escalation_triggers(
         if len(set(error_history[-3:])) == 1:
             return True
 
+    # Triggers 2-5 look at every error of a multi-error parse
+    errors = error.get("errors") or [error]
+    return any(_error_triggers_escalation(e) for e in errors)
+
+
+def _error_triggers_escalation(error: Dict[str, Any]) -> bool:
+    """Escalation triggers 2-5 for a single parsed error."""
     # Trigger 2: Ambiguous error messages
     ambiguous_patterns = [
         "something went wrong",
@@ -510,6 +509,9 @@ def apply_self_healing_fix(error: Dict[str, Any], _attempt: int) -> Dict[str, An
         3. Apply fix using file operations
         4. Log fix for debugging
     """
+    if len(error.get("errors") or []) > 1:
+        return _apply_batch_fix(error["errors"], _attempt)
+
     error_type = error.get("type", "unknown_error")
 
     # Import errors - can auto-fix by adding import statement
@@ -547,6 +549,47 @@ def apply_self_healing_fix(error: Dict[str, Any], _attempt: int) -> Dict[str, An
     }
 
 
+def _apply_batch_fix(errors: List[Dict[str, Any]], attempt: int) -> Dict[str, Any]:
+    """Apply fixes for every error of one validation run.
+
+    Args:
+        errors: Parsed errors (from parse_validation_error()["errors"])
+        attempt: Current attempt number
+
+    Returns:
+        Fix result dict (success if any fix applied) with "fixes": one
+        result per distinct fixable error
+    """
+    fixes = []
+    attempted = set()
+    for error in errors:
+        key = (error.get("type"), error.get("file"), error.get("message"))
+        if error.get("type") != "import_error" or key in attempted:
+            continue
+        attempted.add(key)
+        fixes.append(apply_self_healing_fix({k: v for k, v in error.items() if k != "errors"}, attempt))
+
+    applied = [fix for fix in fixes if fix["success"]]
+    if not applied:
+        if fixes:
+            return dict(fixes[0], fixes=fixes)
+        return {
+            "success": False,
+            "fix_type": f"{errors[0].get('type', 'unknown_error')}_not_implemented",
+            "description": f"Auto-fix not implemented for {len(errors)} error(s) - escalate to human",
+            "fixes": []
+        }
+
+    return {
+        "success": True,
+        "fix_type": "batch",
+        "location": ", ".join(fix["location"] for fix in applied),
+        "description": f"Applied {len(applied)}/{len(errors)} fix(es): " +
+                       "; ".join(fix["description"] for fix in applied),
+        "fixes": fixes
+    }
+
+
 def _add_import_statement(filepath: str, import_stmt: str) -> Dict[str, Any]:
     """Add import statement to file.
 
@@ -0,0 +1,140 @@
+"""Tests for incremental PRP/command migration via the blend manifest."""
+
+import json
+import os
+
+from ce.blending.manifest import MigrationManifest, hash_bytes
+from ce.blending.strategies.simple import CommandOverwriteStrategy, PRPMoveStrategy
+
+
+def _bump_mtime(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def _prp_inputs(tmp_path):
+    source = tmp_path / "PRPs"
+    (source / "executed").mkdir(parents=True)
+    (source / "executed" / "PRP-1.md").write_text("---\nprp_id: PRP-1\n---\n# Done\n")
+    (source / "PRP-2.md").write_text("# Feature without header\n")
+    return {
+        "source_dir": source,
+        "target_dir": tmp_path / "target" / ".ce" / "PRPs",
+        "manifest_path": tmp_path / "target" / ".ce" / "blend-manifest.json",
+    }
+
+
+def test_manifest_roundtrip(tmp_path):
+    src = tmp_path / "a.md"
+    dest = tmp_path / "b.md"
+    src.write_text("x")
+    dest.write_text("x")
+
+    manifest = MigrationManifest.load(tmp_path / "manifest.json")
+    manifest.section("prps").record(src, dest, hash_bytes(b"x"))
+    manifest.save()
+
+    reloaded = MigrationManifest.load(tmp_path / "manifest.json")
+    section = reloaded.section("prps")
+    assert section.is_unchanged(src)
+    assert section.is_unchanged(src, dest)
+    assert not section.is_unchanged(src, tmp_path / "other.md")
+    assert not reloaded.section("commands").is_unchanged(src)
+
+    _bump_mtime(dest)
+    assert not section.is_unchanged(src)
+
+
+def test_corrupt_manifest_is_ignored(tmp_path):
+    path = tmp_path / "manifest.json"
+    path.write_text("{not json")
+    assert len(MigrationManifest.load(path).section("prps")) == 0
+
+
+def test_prp_rerun_skips_via_manifest(tmp_path, monkeypatch):
+    inputs = _prp_inputs(tmp_path)
+    first = PRPMoveStrategy().execute(inputs)
+    assert first["prps_moved"] == 2
+    assert json.loads(inputs["manifest_path"].read_text())["sections"]["prps"]
+
+    # Unchanged sources are never read on re-run
+    reads = []
+    original = type(inputs["source_dir"]).read_bytes
+    monkeypatch.setattr(type(inputs["source_dir"]), "read_bytes",
+                        lambda self: reads.append(self) or original(self))
+    second = PRPMoveStrategy().execute(inputs)
+    assert second["prps_moved"] == 0
+    assert second["prps_unchanged"] == 2
+    assert reads == []
+
+
+def test_prp_headerless_file_not_rewritten_after_touch(tmp_path):
+    inputs = _prp_inputs(tmp_path)
+    PRPMoveStrategy().execute(inputs)
+    dest = inputs["target_dir"] / "feature-requests" / "PRP-2.md"
+    before = dest.read_text()
+
+    _bump_mtime(inputs["source_dir"] / "PRP-2.md")
+    result = PRPMoveStrategy().execute(inputs)
+    assert result["prps_moved"] == 0
+    assert result["prps_skipped"] == 2
+    assert dest.read_text() == before  # Header timestamp kept
+
+
+def test_prp_changed_source_is_migrated(tmp_path):
+    inputs = _prp_inputs(tmp_path)
+    PRPMoveStrategy().execute(inputs)
+
+    (inputs["source_dir"] / "executed" / "PRP-1.md").write_text("---\nprp_id: PRP-1\n---\n# Redone\n")
+    result = PRPMoveStrategy().execute(inputs)
+    assert result["prps_moved"] == 1
+    assert "Redone" in (inputs["target_dir"] / "executed" / "PRP-1.md").read_text()
+
+
+def test_prp_edited_destination_is_restored(tmp_path):
+    inputs = _prp_inputs(tmp_path)
+    PRPMoveStrategy().execute(inputs)
+
+    dest = inputs["target_dir"] / "executed" / "PRP-1.md"
+    dest.write_text("edited")
+    result = PRPMoveStrategy().execute(inputs)
+    assert result["prps_moved"] == 1
+    assert "# Done" in dest.read_text()
+
+
+def test_commands_rerun_and_backup(tmp_path):
+    source = tmp_path / "framework"
+    source.mkdir()
+    (source / "generate.md").write_text("framework version\n")
+    target = tmp_path / ".claude" / "commands"
+    target.mkdir(parents=True)
+    (target / "generate.md").write_text("user version\n")
+    inputs = {
+        "source_dir": source,
+        "target_dir": target,
+        "backup_dir": tmp_path / ".claude" / "commands.backup",
+        "manifest_path": tmp_path / ".ce" / "blend-manifest.json",
+    }
+
+    first = CommandOverwriteStrategy().execute(inputs)
+    assert first["commands_overwritten"] == 1
+    assert first["commands_backed_up"] == 1
+    assert (tmp_path / ".claude" / "commands.backup" / "generate.md").read_text() == "user version\n"
+
+    second = CommandOverwriteStrategy().execute(inputs)
+    assert second["commands_unchanged"] == 1
+    assert second["commands_overwritten"] == 0
+
+    (target / "generate.md").write_text("user edit\n")
+    third = CommandOverwriteStrategy().execute(inputs)
+    assert third["commands_overwritten"] == 1
+    assert (target / "generate.md").read_text() == "framework version\n"
+
+
+def test_without_manifest_path_still_dedupes(tmp_path):
+    inputs = _prp_inputs(tmp_path)
+    del inputs["manifest_path"]
+    PRPMoveStrategy().execute(inputs)
+    result = PRPMoveStrategy().execute(inputs)
+    assert result["prps_skipped"] >= 1  # File with header is byte-identical
+    assert result["prps_unchanged"] == 0
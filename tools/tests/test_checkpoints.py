@@ -0,0 +1,107 @@
+"""Tests for PRP checkpoint ref index."""
+
+import subprocess
+
+import pytest
+
+from ce.checkpoints import CheckpointManager, parse_checkpoint_tag
+
+
+@pytest.fixture
+def git_repo(tmp_path):
+    """Create git repo with one commit."""
+    def git(*args):
+        subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+
+    git("init", "-q")
+    git("config", "user.email", "test@example.com")
+    git("config", "user.name", "Test")
+    (tmp_path / "file.txt").write_text("content\n")
+    git("add", "file.txt")
+    git("commit", "-q", "-m", "initial")
+    return tmp_path, git
+
+
+def test_parse_checkpoint_tag():
+    """Test parsing checkpoint tag names."""
+    parsed = parse_checkpoint_tag("checkpoint-PRP-003-phase1-20251012-143000")
+    assert parsed == {
+        "prp_id": "PRP-003",
+        "phase": "phase1",
+        "timestamp": "2025-10-12T14:30:00+00:00"
+    }
+    assert parse_checkpoint_tag("v1.0.0") is None
+
+
+def test_list_and_latest_from_single_ref_scan(git_repo):
+    """Test index lists checkpoints and answers latest lookups."""
+    repo, git = git_repo
+    git("tag", "-a", "checkpoint-PRP-003-phase1-20251012-100000", "-m", "Phase 1 | done")
+    git("tag", "-a", "checkpoint-PRP-003-phase2-20251012-110000", "-m", "Phase 2")
+    git("tag", "-a", "checkpoint-PRP-003-phase1-20251012-120000", "-m", "Phase 1 redo")
+    git("tag", "-a", "checkpoint-PRP-004-final-20251012-090000", "-m", "Final")
+    git("tag", "v1.0.0")
+
+    manager = CheckpointManager(cwd=str(repo))
+
+    assert len(manager.list()) == 4
+    assert len(manager.list("PRP-003")) == 3
+    assert manager.list("PRP-003")[0]["message"] == "Phase 1 | done"
+    assert manager.latest("PRP-003")["message"] == "Phase 1 redo"
+    assert manager.latest("PRP-003", "phase2")["message"] == "Phase 2"
+    assert manager.latest("PRP-003", "missing") is None
+
+    head = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"], cwd=repo, capture_output=True, text=True
+    ).stdout.strip()
+    assert manager.latest("PRP-004")["commit_sha"] == head
+
+
+def test_create_updates_index_and_requires_clean_tree(git_repo):
+    """Test create tags HEAD, updates index, rejects dirty tree."""
+    repo, _ = git_repo
+    manager = CheckpointManager(cwd=str(repo))
+    assert manager.list() == []
+
+    checkpoint = manager.create("PRP-010", "phase1", "Core logic")
+    assert checkpoint["tag_name"].startswith("checkpoint-PRP-010-phase1-")
+    assert manager.latest("PRP-010", "phase1")["tag_name"] == checkpoint["tag_name"]
+
+    (repo / "file.txt").write_text("changed\n")
+    with pytest.raises(RuntimeError, match="uncommitted changes"):
+        manager.create("PRP-010", "phase2")
+
+
+def test_prune_batches_deletes_and_keeps_final(git_repo):
+    """Test prune deletes intermediate tags and keeps final."""
+    repo, git = git_repo
+    git("tag", "-a", "checkpoint-PRP-003-phase1-20251012-100000", "-m", "p1")
+    git("tag", "-a", "checkpoint-PRP-003-phase2-20251012-110000", "-m", "p2")
+    git("tag", "-a", "checkpoint-PRP-003-final-20251012-120000", "-m", "final")
+    git("tag", "-a", "checkpoint-PRP-004-phase1-20251012-100000", "-m", "other")
+
+    manager = CheckpointManager(cwd=str(repo))
+    result = manager.prune("PRP-003", keep_final=True)
+
+    assert result["success"] is True
+    assert result["deleted_count"] == 2
+    assert result["kept"] == ["checkpoint-PRP-003-final-20251012-120000"]
+    assert manager.latest("PRP-003")["phase"] == "final"
+
+    tags = subprocess.run(
+        ["git", "tag", "-l", "checkpoint-*"], cwd=repo, capture_output=True, text=True
+    ).stdout.split()
+    assert sorted(tags) == [
+        "checkpoint-PRP-003-final-20251012-120000",
+        "checkpoint-PRP-004-phase1-20251012-100000",
+    ]
+
+
+def test_index_refreshes_on_external_tag_changes(git_repo):
+    """Test cached index notices tags created outside the manager."""
+    repo, git = git_repo
+    manager = CheckpointManager(cwd=str(repo))
+    assert manager.list() == []
+
+    git("tag", "-a", "checkpoint-PRP-005-phase1-20251012-100000", "-m", "external")
+    assert [cp["prp_id"] for cp in manager.list()] == ["PRP-005"]
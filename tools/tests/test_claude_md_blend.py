@@ -0,0 +1,125 @@
+"""Tests for incremental CLAUDE.md section blending."""
+
+import threading
+
+import pytest
+
+from ce.blending.strategies import claude_md
+from ce.blending.strategies.claude_md import ClaudeMdBlendStrategy
+
+FRAMEWORK = """## Core Principles
+Be correct.
+
+## Quick Commands
+- ce validate
+
+## Troubleshooting
+Read the logs.
+"""
+
+TARGET = """## Quick Commands
+- make test
+
+## Troubleshooting
+Ask the team.
+
+## Code Quality
+Local extra rules.
+
+## Project Notes
+Our service.
+"""
+
+
+class CountingLLM:
+    """blend_content() stand-in that records calls."""
+
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def blend_content(self, framework_content, target_content, rules_content=None, domain="unknown"):
+        with self.lock:
+            self.calls.append(domain)
+        return {"blended": f"{framework_content}\n{target_content}".strip(), "confidence": 0.9}
+
+
+@pytest.fixture(autouse=True)
+def empty_memory_cache():
+    claude_md._memory_cache.clear()
+    yield
+    claude_md._memory_cache.clear()
+
+
+def _blend(framework, target, llm, tmp_path):
+    (tmp_path / ".ce").mkdir(exist_ok=True)
+    return ClaudeMdBlendStrategy().blend(
+        framework, target, {"llm_client": llm, "target_dir": tmp_path, "rules_content": "rules"}
+    )
+
+
+def test_first_blend_calls_llm_per_section(tmp_path):
+    llm = CountingLLM()
+    blended = _blend(FRAMEWORK, TARGET, llm, tmp_path)
+
+    assert sorted(llm.calls) == [
+        "claude_md_quick_commands",
+        "claude_md_troubleshooting",
+        "validate_code_quality",
+    ]
+    assert "- make test" in blended
+    assert "## Project Notes" in blended
+    assert "Local extra rules." in blended  # Validated with confidence 0.9
+    assert len(list((tmp_path / ".ce" / "cache" / "claude-md").glob("*.json"))) == 3
+
+
+def test_reblend_only_sends_changed_sections(tmp_path):
+    first = _blend(FRAMEWORK, TARGET, CountingLLM(), tmp_path)
+    claude_md._memory_cache.clear()  # Force disk cache
+
+    llm = CountingLLM()
+    assert _blend(FRAMEWORK, TARGET, llm, tmp_path) == first
+    assert llm.calls == []
+
+    edited = TARGET.replace("Ask the team.", "Ask the on-call.")
+    blended = _blend(FRAMEWORK, edited, llm, tmp_path)
+    assert llm.calls == ["claude_md_troubleshooting"]
+    assert "Ask the on-call." in blended
+
+
+def test_rules_change_invalidates_cache(tmp_path):
+    _blend(FRAMEWORK, TARGET, CountingLLM(), tmp_path)
+
+    llm = CountingLLM()
+    ClaudeMdBlendStrategy().blend(
+        FRAMEWORK, TARGET, {"llm_client": llm, "target_dir": tmp_path, "rules_content": "new rules"}
+    )
+    assert len(llm.calls) == 3
+
+
+def test_low_confidence_section_skipped(tmp_path):
+    class DoubtfulLLM(CountingLLM):
+        def blend_content(self, **kwargs):
+            result = super().blend_content(**kwargs)
+            if kwargs["domain"].startswith("validate_"):
+                result["confidence"] = 0.5
+            return result
+
+    blended = _blend(FRAMEWORK, TARGET, DoubtfulLLM(), tmp_path)
+    assert "Local extra rules." not in blended
+
+
+def test_memory_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(claude_md, "_MEMORY_CACHE_SIZE", 2)
+    for key in ("a", "b", "c"):
+        claude_md._write_cached(None, key, {"blended": key, "confidence": 1.0})
+
+    assert list(claude_md._memory_cache) == ["b", "c"]
+    assert claude_md._read_cached(None, "a") is None
+
+
+def test_no_disk_cache_outside_ce_project(tmp_path):
+    ClaudeMdBlendStrategy().blend(
+        FRAMEWORK, TARGET, {"llm_client": CountingLLM(), "target_dir": tmp_path, "rules_content": "rules"}
+    )
+    assert not (tmp_path / ".ce").exists()
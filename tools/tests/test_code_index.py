@@ -0,0 +1,104 @@
+"""Tests for the offline code search index."""
+
+import os
+
+from ce.code_index import CodeIndex, python_symbols, script_symbols, tokenize
+
+
+def write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def make_project(root):
+    (root / ".ce").mkdir()
+    write(root / "src" / "auth.py", (
+        "import jwt\n\n"
+        "class AuthHandler:\n"
+        "    def authenticate(self, token):\n"
+        "        return jwt.decode(token)\n"
+    ))
+    write(root / "src" / "billing.py", "def charge_invoice(amount):\n    return amount\n")
+    write(root / "web" / "login.ts", (
+        "export class LoginForm {\n"
+        "  submitCredentials(user: string): void {\n"
+        "  }\n"
+        "}\n"
+        "export const validateToken = (token: string) => token.length > 0;\n"
+    ))
+    write(root / "node_modules" / "dep" / "index.js", "function authenticate() {}\n")
+
+
+def test_tokenize_splits_identifier_words():
+    assert tokenize("parseHTTPResponse_v2") == ["parsehttpresponse_v2", "parse", "http", "response", "v2"]
+
+
+def test_symbol_extraction():
+    assert python_symbols("class A:\n    def run(self): pass\ndef main(): pass\n") == [
+        ("A", "A", "class", 1), ("run", "A.run", "method", 2), ("main", "main", "function", 3)
+    ]
+    source = "export class LoginForm {\n  submit(x: number): void {\n  }\n}\nexport const go = () => 1;\n"
+    assert [(q, k) for _, q, k, _ in script_symbols(source)] == [
+        ("LoginForm", "class"), ("LoginForm.submit", "method"), ("go", "function")
+    ]
+
+
+def test_search_ranks_symbols_and_substrings(tmp_path):
+    make_project(tmp_path)
+    with CodeIndex(tmp_path) as index:
+        assert index.update()["indexed"] == 3  # node_modules pruned
+        assert index.db_path == str(tmp_path / ".ce" / "index" / "code-index.db")
+
+        hits = index.search(["authenticate", "jwt"])
+        assert hits[0]["file"] == "src/auth.py"
+        assert hits[0]["symbol"] == "AuthHandler.authenticate"
+        assert hits[0]["line"] == 4
+        assert "def authenticate" in hits[0]["snippet"]
+
+        files = {hit["file"] for hit in index.search(["token"])}
+        assert files == {"src/auth.py", "web/login.ts"}
+
+        assert [hit["file"] for hit in index.search(["credential"])] == ["web/login.ts"]
+        assert index.find_symbols("validateToken")[0]["file"] == "web/login.ts"
+
+
+def test_incremental_update(tmp_path):
+    make_project(tmp_path)
+    with CodeIndex(tmp_path) as index:
+        index.update()
+        assert index.update() == {"indexed": 0, "unchanged": 3, "removed": 0, "files": 3}
+
+        write(tmp_path / "src" / "billing.py", "def refund_invoice(amount):\n    return -amount\n")
+        (tmp_path / "web" / "login.ts").unlink()
+        assert index.update() == {"indexed": 1, "unchanged": 1, "removed": 1, "files": 2}
+
+        assert index.search(["charge"]) == []
+        assert index.search(["refund"])[0]["symbol"] == "refund_invoice"
+        assert index.search(["credential"]) == []
+
+        # Tokens only the removed/replaced files had are pruned from the vocabulary
+        conn = index._conn
+        assert conn.execute("SELECT 1 FROM vocab WHERE token = 'credential'").fetchone() is None
+        assert conn.execute("SELECT 1 FROM trigrams WHERE token = 'charge'").fetchone() is None
+        assert conn.execute("SELECT 1 FROM vocab WHERE token = 'refund'").fetchone() is not None
+
+
+def test_exact_token_survives_common_substring(tmp_path):
+    names = "\n".join(f"def {word}user():\n    pass" for word in ("alpha", "beta", "gamma", "delta", "omega"))
+    write(tmp_path / "users.py", names + "\ndef user():\n    pass\n")
+    with CodeIndex(tmp_path) as index:
+        index.update()
+        assert index._matching_tokens("user", limit=1) == ["user"]
+        assert len(index._matching_tokens("user", limit=10)) == 6
+
+
+def test_research_codebase_uses_index(tmp_path, monkeypatch):
+    from ce.generate import research_codebase
+
+    make_project(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    result = research_codebase("Invoice charge", [], "")
+    assert result["related_files"] == ["src/billing.py"]
+    assert result["similar_implementations"][0]["symbol"] == "charge_invoice"
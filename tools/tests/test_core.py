@@ -3,7 +3,12 @@
 import pytest
 import tempfile
 from pathlib import Path
+import io
+import sys
+import time
+
 from ce.core import run_cmd, read_file, write_file, git_status, git_checkpoint
+from ce.core import OutputCapture, run_cmd_stream, run_cmds_parallel
 
 
 def test_run_cmd_success():
@@ -148,3 +153,48 @@ def test_write_file_creates_nested_dirs():
         write_file(str(nested_path), "nested content")
         assert nested_path.exists()
         assert nested_path.read_text() == "nested content"
+
+
+def test_output_capture_keeps_head_and_tail():
+    """Test bounded capture drops the middle of long output."""
+    capture = OutputCapture(max_chars=10)
+    for i in range(100):
+        capture.write(f"{i % 10}")
+    value = capture.getvalue()
+    assert capture.truncated
+    assert value.startswith("01234")
+    assert value.endswith("56789")
+    assert "[90 characters truncated]" in value
+
+
+def test_run_cmd_stream_captures_both_pipes():
+    """Test streaming runner with tee and bounded output."""
+    script = "import sys\nprint('out ' * 2000)\nprint('err', file=sys.stderr)"
+    tee = io.StringIO()
+    result = run_cmd_stream([sys.executable, "-c", script], tee=tee, max_output=100, prefix="> ")
+    assert result["success"] is True
+    assert result["truncated"] is True
+    assert len(result["stdout"]) < 200
+    assert result["stderr"] == "err\n"
+    assert "> err\n" in tee.getvalue()
+
+
+def test_run_cmd_stream_timeout_kills_process():
+    """Test timeout raises TimeoutError and does not hang."""
+    with pytest.raises(TimeoutError, match="timed out"):
+        run_cmd_stream([sys.executable, "-c", "import time; time.sleep(30)"], timeout=1)
+
+
+def test_run_cmd_stream_timeout_covers_lingering_grandchild():
+    """Test a background child holding the pipes open does not outlive timeout."""
+    start = time.monotonic()
+    with pytest.raises(TimeoutError, match="timed out"):
+        run_cmd_stream(["bash", "-c", "sleep 30 & echo hi"], timeout=1)
+    assert time.monotonic() - start < 10
+
+
+def test_run_cmds_parallel_preserves_order():
+    """Test parallel runner returns results in command order."""
+    results = run_cmds_parallel(["echo one", "false", "echo three"])
+    assert [r["exit_code"] for r in results] == [0, 1, 0]
+    assert results[2]["stdout"] == "three\n"
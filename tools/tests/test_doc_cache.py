@@ -0,0 +1,165 @@
+"""Tests for the documentation cache and fetcher."""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from ce.doc_cache import DocCache, DocFetcher, html_to_text, library_key, url_key
+from ce.generate import fetch_external_link, resolve_and_fetch_library_docs
+
+
+class DocHandler(BaseHTTPRequestHandler):
+    """Serves /page with an ETag, /slow after a delay; records requests."""
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append((self.path, self.headers.get("If-None-Match")))
+            server.active += 1
+            server.peak = max(server.peak, server.active)
+        try:
+            if self.path.startswith("/slow"):
+                time.sleep(0.2)
+            if self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                self.end_headers()
+                return
+            body = b"<html><script>x()</script><h1>JWT security</h1><p>Tokens &amp; claims</p></html>"
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("ETag", '"v1"')
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), DocHandler)
+    httpd.lock = threading.Lock()
+    httpd.requests = []
+    httpd.active = httpd.peak = 0
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def base_url(server):
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    with DocCache(str(tmp_path / "docs.db")) as cache:
+        yield cache
+
+
+def test_fresh_entry_is_served_without_request(server, cache):
+    fetcher = DocFetcher(cache)
+    url = base_url(server) + "/page"
+
+    first = fetcher.fetch_url(url)
+    second = fetcher.fetch_url(url)
+
+    assert first["status"] == "fetched"
+    assert "JWT security" in first["content"] and "x()" not in first["content"]
+    assert second["status"] == "cached"
+    assert len(server.requests) == 1
+
+
+def test_expired_entry_is_revalidated_with_etag(server, tmp_path):
+    url = base_url(server) + "/page"
+    with DocCache(str(tmp_path / "docs.db"), max_age=0) as cache:
+        fetcher = DocFetcher(cache)
+        fetcher.fetch_url(url)
+        again = fetcher.fetch_url(url)
+
+    assert again["status"] == "revalidated"
+    assert server.requests[1] == ("/page", '"v1"')
+    assert "Tokens & claims" in again["content"]
+
+
+def test_offline_and_network_failure_use_cache(server, tmp_path):
+    url = base_url(server) + "/page"
+    with DocCache(str(tmp_path / "docs.db"), max_age=0) as cache:
+        DocFetcher(cache).fetch_url(url)
+        assert DocFetcher(cache, offline=True).fetch_url(url)["status"] == "stale"
+        with pytest.raises(RuntimeError, match="offline mode"):
+            DocFetcher(cache, offline=True).fetch_url(url + "?other")
+
+        server.shutdown()
+        server.server_close()
+        assert DocFetcher(cache, timeout=2).fetch_url(url)["status"] == "stale"
+
+
+def test_non_http_schemes_rejected(cache, tmp_path):
+    secret = tmp_path / "secret.txt"
+    secret.write_text("do not embed")
+
+    with pytest.raises(ValueError, match="not http"):
+        DocFetcher(cache).fetch_url(secret.as_uri())
+    assert DocFetcher(cache).fetch_all([secret.as_uri()]) == [None]
+    assert cache.stats()["entries"] == 0
+
+
+def test_lru_eviction_respects_size_bound(tmp_path):
+    with DocCache(str(tmp_path / "docs.db"), max_bytes=250) as cache:
+        cache.put("a", "x" * 100)
+        cache.put("b", "x" * 100)
+        time.sleep(0.01)
+        cache.get("a")  # b is now least recently used
+        cache.put("c", "x" * 100)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None and cache.get("c") is not None
+        assert cache.stats() == {"entries": 2, "bytes": 200}
+
+
+def test_fetch_all_dedupes_and_caps_per_host(server, cache):
+    urls = [base_url(server) + f"/slow/{i}" for i in range(6)]
+    fetcher = DocFetcher(cache, per_host=2, max_workers=6)
+
+    results = fetcher.fetch_all(urls + urls[:2])
+
+    assert [r["url"] for r in results] == urls + urls[:2]
+    assert len(server.requests) == 6
+    assert server.peak <= 2
+
+
+def test_library_docs_come_from_cache(cache):
+    cache.put(library_key("FastAPI", []), "/tiangolo/fastapi")
+    cache.put(
+        library_key("/tiangolo/fastapi", ["security", "routing"]),
+        "# Security docs",
+        metadata={"library_name": "FastAPI", "library_id": "/tiangolo/fastapi", "tokens_used": 10},
+    )
+
+    result = resolve_and_fetch_library_docs("FastAPI", ["routing", "security"], "", cache=cache)
+
+    assert result["library_id"] == "/tiangolo/fastapi"
+    assert result["content"] == "# Security docs"
+    assert resolve_and_fetch_library_docs("Django", ["routing"], "", cache=cache) is None
+
+
+def test_fetch_external_link_reports_relevant_topics(server, cache):
+    result = fetch_external_link(base_url(server) + "/page", "JWT", ["security", "graphql"],
+                                 fetcher=DocFetcher(cache))
+
+    assert result["relevant_sections"] == ["security"]
+    assert result["cache_status"] == "fetched"
+
+
+def test_keys_and_html_text():
+    assert library_key("/A/b", ["y", "X"]) == library_key("/a/b", ["x", "y"])
+    assert url_key("https://x.io/p#frag") == "url:https://x.io/p"
+    assert html_to_text("<p>a</p><style>p{}</style><p>b &lt; c</p>") == "a\nb < c"
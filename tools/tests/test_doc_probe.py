@@ -0,0 +1,109 @@
+"""Tests for bounded-read document probes."""
+
+import os
+
+import pytest
+
+from ce import doc_probe
+from ce.doc_probe import probe_doc
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    doc_probe.clear_cache()
+    yield
+    doc_probe.clear_cache()
+
+
+def test_small_file_is_complete(tmp_path):
+    doc = tmp_path / "small.md"
+    doc.write_text("---\ntype: regular\n---\n# Title\n")
+
+    probe = probe_doc(doc)
+    assert probe.complete
+    assert probe.frontmatter() == "type: regular"
+    assert probe.body == doc.read_text()
+
+
+def test_head_checks_do_not_read_body(tmp_path):
+    doc = tmp_path / "large.md"
+    doc.write_text("---\nprp_id: PRP-7\n---\n# Title\n" + "filler line\n" * 5000)
+
+    probe = probe_doc(doc, head_size=256)
+    assert not probe.complete
+    assert probe.frontmatter() == "prp_id: PRP-7"
+    assert probe.search(r"PRP-\d+")
+    assert probe.lines(3) == ["---", "prp_id: PRP-7", "---"]
+    assert probe.char_count_exceeds(500)
+    assert not probe.body_loaded
+
+
+def test_search_falls_back_to_body(tmp_path):
+    doc = tmp_path / "large.md"
+    doc.write_text("# Title\n" + "filler\n" * 2000 + "## Validation\n")
+
+    probe = probe_doc(doc, head_size=256)
+    assert probe.search(r"## Validation")
+    assert probe.body_loaded
+    assert probe.search(r"## Missing") is None
+
+
+def test_frontmatter_longer_than_head(tmp_path):
+    doc = tmp_path / "memory.md"
+    doc.write_text("---\n" + "key: value\n" * 100 + "type: critical\n---\nbody\n")
+
+    probe = probe_doc(doc, head_size=64)
+    assert probe.frontmatter().endswith("type: critical")
+
+
+def test_multibyte_char_split_at_head_boundary(tmp_path):
+    doc = tmp_path / "utf8.md"
+    doc.write_text("a" * 9 + "é" + "tail\n" * 100, encoding="utf-8")
+
+    probe = probe_doc(doc, head_size=10)  # Cuts "é" (2 bytes) in half
+    assert probe.head == "a" * 9
+    assert probe.body.startswith("a" * 9 + "é")
+
+
+def test_cached_until_file_changes(tmp_path):
+    doc = tmp_path / "doc.md"
+    doc.write_text("# One\n")
+
+    first = probe_doc(doc)
+    assert probe_doc(doc) is first
+
+    doc.write_text("# Two, longer\n")
+    stat = doc.stat()
+    os.utime(doc, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    second = probe_doc(doc)
+    assert second is not first
+    assert second.head == "# Two, longer\n"
+
+
+def test_classification_uses_probe(tmp_path):
+    from ce.blending.classification import validate_memory, validate_prp
+
+    memory = tmp_path / "memory.md"
+    memory.write_text('---\ntype: critical\ncategory: docs\ncreated: "2025-01-01"\n---\n' + "x\n" * 5000)
+    result = validate_memory(str(memory))
+    assert result.valid and result.file_type == "memory"
+    assert not probe_doc(memory).body_loaded
+
+    prp = tmp_path / "feature.md"
+    prp.write_text("# Feature\n" + "text\n" * 2000 + "See PRP-12 for details\n")
+    assert validate_prp(str(prp)).valid  # ID only found past the head
+
+
+def test_body_cache_is_bounded_by_size(tmp_path, monkeypatch):
+    monkeypatch.setattr(doc_probe, "_BODY_CACHE_CHARS", 1500)
+    probes = []
+    for name in ("a", "b", "c"):
+        doc = tmp_path / f"{name}.md"
+        doc.write_text(name * 600)
+        probe = probe_doc(doc, head_size=16)
+        assert probe.body == name * 600
+        probes.append(probe)
+
+    assert [p.body_loaded for p in probes] == [False, True, True]
+    assert doc_probe._body_chars == 1200
+    assert probes[0].body == "a" * 600  # Re-read from disk after eviction
@@ -322,3 +322,87 @@ drift_decision:
         assert summary["score_distribution"]["high"] == 1
     finally:
         os.chdir(original_dir)
+
+
+def _write_drift_prp(path, prp_id, score, action, timestamp):
+    path.write_text(f"""---
+name: "Test {prp_id}"
+prp_id: "{prp_id}"
+drift_decision:
+  score: {score}
+  action: "{action}"
+  justification: "Test"
+  timestamp: "{timestamp}"
+  reviewer: "human"
+---
+
+# Test
+""")
+
+
+def test_drift_store_incremental_sync(tmp_path):
+    """Test drift store only re-parses new or modified PRPs."""
+    from ce.drift_store import DriftStore
+
+    prp_dir = tmp_path / "PRPs" / "executed"
+    prp_dir.mkdir(parents=True)
+    _write_drift_prp(prp_dir / "PRP-001.md", "PRP-001", 12.0, "accepted", "2025-10-01T10:00:00Z")
+    _write_drift_prp(prp_dir / "PRP-002.md", "PRP-002", 40.0, "rejected", "2025-10-05T10:00:00Z")
+
+    db_path = str(tmp_path / "drift.db")
+    with DriftStore(db_path=db_path, prp_dirs=[str(prp_dir)]) as store:
+        assert store.sync() == {"scanned": 2, "reparsed": 2, "removed": 0}
+        assert store.sync() == {"scanned": 2, "reparsed": 0, "removed": 0}
+
+    # Persisted index survives reopen; deleted PRPs are dropped
+    (prp_dir / "PRP-002.md").unlink()
+    with DriftStore(db_path=db_path, prp_dirs=[str(prp_dir)]) as store:
+        assert store.sync() == {"scanned": 1, "reparsed": 0, "removed": 1}
+        assert [h["prp_id"] for h in store.query()] == ["PRP-001"]
+
+
+def test_drift_store_record_updates_index(tmp_path):
+    """Test record() re-indexes a PRP after its decision changes."""
+    from ce.drift_store import DriftStore
+
+    prp = tmp_path / "PRP-001.md"
+    _write_drift_prp(prp, "PRP-001", 12.0, "accepted", "2025-10-01T10:00:00Z")
+
+    with DriftStore(db_path=":memory:", prp_dirs=[str(tmp_path)]) as store:
+        store.sync()
+        _write_drift_prp(prp, "PRP-001", 55.0, "rejected", "2025-10-02T10:00:00Z")
+        store.record(str(prp))
+
+        history = store.query(prp_id="PRP-001")
+        assert len(history) == 1
+        assert history[0]["drift_decision"]["action"] == "rejected"
+        assert store.sync()["reparsed"] == 0
+
+
+def test_get_drift_history_score_and_time_filters(tmp_path):
+    """Test filtering drift history by score range and time window."""
+    prp_dir = tmp_path / "PRPs" / "executed"
+    prp_dir.mkdir(parents=True)
+    (tmp_path / ".ce").mkdir()
+    rows = [
+        ("PRP-001", 5.0, "2025-09-30T10:00:00Z"),
+        ("PRP-002", 25.0, "2025-10-02T10:00:00Z"),
+        ("PRP-003", 45.0, "2025-10-04T10:00:00Z"),
+    ]
+    for prp_id, score, ts in rows:
+        _write_drift_prp(prp_dir / f"{prp_id}.md", prp_id, score, "accepted", ts)
+
+    import os
+    original_dir = os.getcwd()
+    os.chdir(tmp_path)
+
+    try:
+        by_score = get_drift_history(min_score=20.0, max_score=50.0)
+        assert [h["prp_id"] for h in by_score] == ["PRP-003", "PRP-002"]
+
+        by_time = get_drift_history(since="2025-10-01", until="2025-10-03")
+        assert [h["prp_id"] for h in by_time] == ["PRP-002"]
+
+        assert (tmp_path / ".ce" / "drift-history.db").exists()
+    finally:
+        os.chdir(original_dir)
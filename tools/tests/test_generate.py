@@ -1,7 +1,10 @@
 """Tests for PRP generation from INITIAL.md."""
+import functools
 import pytest
 import re
 from pathlib import Path
+
+from ce.doc_cache import DocCache
 from ce.generate import (
     parse_initial_md,
     extract_code_examples,
@@ -23,6 +26,21 @@ FIXTURES_DIR = Path(__file__).parent / "fixtures"
 SAMPLE_INITIAL = FIXTURES_DIR / "sample_initial.md"
 
 
+@pytest.fixture(autouse=True)
+def offline_doc_cache(tmp_path, monkeypatch):
+    """Keep documentation fetches off the network and their cache out of the checkout."""
+    monkeypatch.setenv("CE_DOCS_OFFLINE", "1")
+    monkeypatch.setattr("ce.generate.DocCache", functools.partial(DocCache, str(tmp_path / "docs.db")))
+
+
+@pytest.fixture
+def isolated_project(tmp_path, monkeypatch):
+    """Run from an empty directory so codebase research indexes nothing of the checkout."""
+    project = tmp_path / "project"
+    project.mkdir()
+    monkeypatch.chdir(project)
+    return project
+
 def test_parse_initial_md_complete():
     """Test parsing complete INITIAL.md with all sections."""
     result = parse_initial_md(str(SAMPLE_INITIAL))
@@ -88,7 +106,7 @@ def test_infer_test_patterns():
     assert pattern["coverage_required"] is True
 
 
-def test_research_codebase():
+def test_research_codebase(isolated_project):
     """Test codebase research orchestration."""
     feature_name = "User Authentication System"
     examples = [
@@ -294,13 +312,14 @@ Test content
     prp_path.unlink()
 
 
-def test_generate_prp_end_to_end(tmp_path):
+def test_generate_prp_end_to_end(tmp_path, isolated_project):
     """Test complete PRP generation from INITIAL.md."""
     # Use sample_initial.md fixture
     output_dir = tmp_path / "prps"
     output_dir.mkdir()
 
-    prp_path = generate_prp(str(SAMPLE_INITIAL), str(output_dir))
+    timings = {}
+    prp_path = generate_prp(str(SAMPLE_INITIAL), str(output_dir), timings=timings)
 
     # Verify file created
     assert Path(prp_path).exists()
@@ -314,11 +333,18 @@ def test_generate_prp_end_to_end(tmp_path):
     assert "## 4. Validation Gates" in content
     assert "## 5. Testing Strategy" in content
     assert "## 6. Rollout Plan" in content
+    # Linear create is queued; placeholder ID until a real issue exists
+    assert re.search(r"^issue: PRP-\S+-created$", content, re.MULTILINE)
 
     # Verify completeness
     completeness = check_prp_completeness(prp_path)
     assert completeness["complete"] is True
 
+    # Verify stage timings (research and documentation both follow parsing)
+    assert {"parsed", "research", "documentation", "tldr", "prp_id"} <= set(timings["timings"])
+    assert timings["critical_path"][-1] in timings["timings"]
+    assert timings["timings"]["research"]["start"] >= timings["timings"]["parsed"]["end"]
+
 
 def test_parse_initial_md_with_planning_context(tmp_path):
     """Test parsing INITIAL.md with PLANNING CONTEXT section."""
@@ -0,0 +1,137 @@
+"""Tests for test impact analysis."""
+
+import os
+
+import pytest
+
+from ce.impact_analysis import ImpactSelector, failed_test_ids, narrow_pytest_command
+
+
+@pytest.fixture
+def tools(tmp_path):
+    root = tmp_path / "tools"
+    (root / "ce").mkdir(parents=True)
+    (root / "tests").mkdir()
+    (root / "ce" / "__init__.py").write_text("")
+    (root / "ce" / "core.py").write_text("def run():\n    return 1\n")
+    (root / "ce" / "report.py").write_text("from .core import run\n")
+    (root / "ce" / "other.py").write_text("X = 1\n")
+    (root / "tests" / "__init__.py").write_text("")
+    (root / "tests" / "test_core.py").write_text("from ce.core import run\n")
+    (root / "tests" / "test_report.py").write_text("from ce import report\n")
+    (root / "tests" / "test_other.py").write_text("from ce.other import X\n")
+    (root / "pyproject.toml").write_text("[project]\nname = 'demo'\n")
+    return root
+
+
+def touch(path, text):
+    path.write_text(text)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def green(selector):
+    selection = selector.select()
+    selector.record_green(selection)
+    return selection
+
+
+def test_first_run_is_full_then_none(tools):
+    selector = ImpactSelector(tools)
+    assert green(selector)["mode"] == "full"
+    assert selector.state_path == tools.parent / ".ce" / "test-impact.json"
+
+    selection = selector.select()
+    assert selection["mode"] == "none"
+    assert selection["tests"] == []
+
+
+def test_transitive_importers_selected(tools):
+    selector = ImpactSelector(tools)
+    green(selector)
+
+    touch(tools / "ce" / "core.py", "def run():\n    return 2\n")
+    selection = selector.select()
+    assert selection["mode"] == "impacted"
+    assert selection["tests"] == ["tests/test_core.py", "tests/test_report.py"]
+    assert selection["rationale"]["tests/test_report.py"] == ["ce/core.py"]
+
+
+def test_changed_test_file_selects_itself(tools):
+    selector = ImpactSelector(tools)
+    green(selector)
+
+    touch(tools / "tests" / "test_other.py", "from ce.other import X\n\n\ndef test_x():\n    pass\n")
+    assert selector.select()["tests"] == ["tests/test_other.py"]
+
+
+def test_config_change_forces_full_run(tools):
+    selector = ImpactSelector(tools)
+    green(selector)
+
+    touch(tools / "pyproject.toml", "[project]\nname = 'demo2'\n")
+    selection = selector.select()
+    assert selection["mode"] == "full"
+    assert selection["tests"] == ["tests"]
+
+
+def test_deleted_module_forces_full_run(tools):
+    selector = ImpactSelector(tools)
+    green(selector)
+
+    (tools / "ce" / "other.py").unlink()
+    assert selector.select()["mode"] == "full"
+
+
+def test_change_no_test_imports_forces_full_run(tools):
+    selector = ImpactSelector(tools)
+    (tools / "ce" / "__main__.py").write_text("from .report import run\n")
+    green(selector)
+
+    touch(tools / "ce" / "__main__.py", "from .report import run\nrun()\n")
+    assert selector.impacted_tests(["ce/__main__.py"]) is None
+    selection = selector.select()
+    assert selection["mode"] == "full"
+    assert "not attributable" in selection["reason"]
+
+
+def test_scheduled_full_run(tools):
+    selector = ImpactSelector(tools, full_run_interval=0)
+    green(selector)
+
+    touch(tools / "ce" / "other.py", "X = 2\n")
+    selection = selector.select()
+    assert selection["mode"] == "full"
+    assert "scheduled" in selection["reason"]
+
+
+def test_impacted_run_keeps_last_full_timestamp(tools):
+    selector = ImpactSelector(tools)
+    green(selector)
+    last_full = selector.load_state()["last_full"]
+
+    touch(tools / "ce" / "other.py", "X = 2\n")
+    assert green(selector)["mode"] == "impacted"
+    assert selector.load_state()["last_full"] == last_full
+    assert selector.select()["mode"] == "none"
+
+
+def test_failed_test_ids():
+    output = (
+        "FAILED tests/test_a.py::test_one - AssertionError\n"
+        "ERROR tests/test_b.py\n"
+        "FAILED tests/test_a.py::test_one - AssertionError\n"
+        "collected 3 items\n"
+    )
+    assert failed_test_ids(output) == ["tests/test_a.py::test_one", "tests/test_b.py"]
+
+
+def test_narrow_pytest_command():
+    command = "uv run pytest tests/ -v --tb short"
+    narrowed = narrow_pytest_command(command, ["tests/test_a.py::test_one", "other/test_x.py"])
+    assert narrowed == "uv run pytest -v --tb short tests/test_a.py::test_one"
+
+    assert narrow_pytest_command("python -m pytest -q", ["tests/test_a.py"]) == "python -m pytest -q tests/test_a.py"
+    assert narrow_pytest_command("npm test", ["tests/test_a.py"]) is None
+    assert narrow_pytest_command("cd tools && pytest", ["tests/test_a.py"]) is None
+    assert narrow_pytest_command("pytest tests/unit", ["tests/test_a.py"]) is None
@@ -0,0 +1,112 @@
+"""Tests for AST import graph."""
+
+import pytest
+
+from ce import import_graph
+from ce.import_graph import ImportGraph, iter_python_files, module_name
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Small project: package with relative imports, re-exports, tests, scripts."""
+    root = tmp_path / "proj"
+    pkg = root / "src" / "app"
+    sub = pkg / "sub"
+    sub.mkdir(parents=True)
+
+    (pkg / "__init__.py").write_text("from .core import run\n")
+    (pkg / "core.py").write_text("from . import helpers\n\ndef run():\n    return helpers.fmt()\n")
+    (pkg / "helpers.py").write_text("def fmt():\n    return 'x'\n\ndef never_called():\n    pass\n")
+    (pkg / "cli.py").write_text("from .sub.tool import go\n\ndef main():\n    go()\n")
+    (sub / "__init__.py").write_text("")
+    (sub / "tool.py").write_text("from ..helpers import fmt\n\ndef go():\n    fmt()\n")
+    (pkg / "orphan.py").write_text("import os\n\ndef lonely():\n    pass\n")
+    (pkg / "broken.py").write_text("def oops(:\n")
+
+    tests = root / "tests"
+    tests.mkdir()
+    (tests / "test_app.py").write_text("import app\n\ndef test_run():\n    assert app.run()\n")
+
+    (root / "script.py").write_text("if __name__ == '__main__':\n    print('hi')\n")
+    (root / "pyproject.toml").write_text('[project]\nname = "app"\n\n[project.scripts]\napp = "app.cli:main"\n')
+
+    node_modules = root / "node_modules" / "pkg"
+    node_modules.mkdir(parents=True)
+    (node_modules / "vendored.py").write_text("import app.orphan\n")
+
+    import_graph.clear_cache()
+    return root
+
+
+def test_iter_python_files_prunes_dependency_dirs(project):
+    files = {p.name for p in iter_python_files(project)}
+    assert "vendored.py" not in files
+    assert "core.py" in files
+
+
+def test_module_names_follow_packages(project):
+    pkg = project / "src" / "app"
+    package_dirs = {pkg, pkg / "sub"}
+    assert module_name(pkg / "sub" / "tool.py", package_dirs) == "app.sub.tool"
+    assert module_name(pkg / "__init__.py", package_dirs) == "app"
+    assert module_name(project / "script.py", package_dirs) == "script"
+
+
+def test_edges_cover_relative_and_reexport_imports(project):
+    graph = ImportGraph(project)
+
+    assert graph.edges["app"] == {"app.core"}
+    assert "app.helpers" in graph.edges["app.core"]
+    assert graph.edges["app.sub.tool"] == {"app", "app.helpers"}
+    assert "app.sub" in graph.edges["app.cli"]
+    assert graph.importers("app.helpers") == {"app.core", "app.sub.tool"}
+
+
+def test_reachability_from_entry_points(project):
+    graph = ImportGraph(project)
+
+    assert {"test_app", "script", "app.cli"} <= graph.entry_points
+    assert graph.unreachable_modules() == ["app.broken", "app.orphan"]
+
+
+def test_unreferenced_symbols(project):
+    graph = ImportGraph(project)
+    dead = graph.unreferenced_symbols()
+
+    assert dead["app.helpers"] == ["never_called"]
+    assert dead["app.orphan"] == ["lonely"]
+    assert "app.core" not in dead
+
+
+def test_scans_cached_by_content_hash(project, monkeypatch):
+    ImportGraph(project)
+    calls = []
+    original = import_graph._scan_source
+    monkeypatch.setattr(import_graph, "_scan_source", lambda *a: calls.append(a) or original(*a))
+
+    (project / "src" / "app" / "orphan.py").write_text("import app.core\n")
+    graph = ImportGraph(project)
+
+    assert len(calls) == 1
+    assert graph.edges["app.orphan"] == {"app", "app.core"}
+
+
+def test_scan_cache_bounded_and_versioned(project, monkeypatch):
+    monkeypatch.chdir(project)
+    (project / ".ce").mkdir()
+    monkeypatch.setattr(import_graph, "_MEMORY_CACHE_SIZE", 2)
+    import_graph.clear_cache()
+    ImportGraph(project)
+    assert len(import_graph._memory_cache) == 2
+
+    import_graph.clear_cache()
+    calls = []
+    original = import_graph._scan_source
+    monkeypatch.setattr(import_graph, "_scan_source", lambda *a: calls.append(a) or original(*a))
+    ImportGraph(project)
+    assert calls == []  # Served from disk
+
+    import_graph.clear_cache()
+    monkeypatch.setattr(import_graph, "SCAN_CACHE_VERSION", import_graph.SCAN_CACHE_VERSION + 1)
+    ImportGraph(project)
+    assert calls  # Old-version entries ignored
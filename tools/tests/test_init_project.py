@@ -243,6 +243,28 @@ class TestProjectInitializerBlend:
         assert "❌" in result["message"]
         assert "Blend phase failed" in result["message"]
 
+    @patch('ce.init_project.subprocess.run')
+    def test_blend_failure_restores_user_files(self, mock_run, initializer, temp_project):
+        """Test failed blend restores snapshotted user files."""
+        memories = temp_project / ".serena" / "memories"
+        memories.mkdir(parents=True)
+        (memories / "note.md").write_text("user memory")
+
+        def clobber(*args, **kwargs):
+            (memories / "note.md").write_text("half-blended")
+            (temp_project / "CLAUDE.md").write_text("partial")
+            return Mock(returncode=1, stdout="", stderr="Blend error")
+
+        mock_run.side_effect = clobber
+
+        result = initializer.blend()
+
+        assert result["success"] is False
+        assert "Restored user files" in result["message"]
+        assert (memories / "note.md").read_text() == "user memory"
+        assert not (temp_project / "CLAUDE.md").exists()
+        assert not (temp_project / ".ce.blend-snapshot").exists()
+
     @patch('ce.init_project.subprocess.run')
     def test_blend_timeout(self, mock_run, initializer):
         """Test blend phase handles timeout."""
@@ -15,8 +15,10 @@ from ce.linear_mcp_resilience import (
     get_linear_mcp_status,
     _auth_reset_cache,
     AUTH_RESET_COOLDOWN,
-    linear_breaker
+    linear_breaker,
+    linear_bulkhead
 )
+from ce.resilience import BulkheadFullError
 
 
 class TestAuthErrorDetection:
@@ -261,6 +263,21 @@ class TestResilientCall:
         assert result["success"] is False
         mock_reset.assert_not_called()  # Auth recovery not attempted
 
+    def test_bulkhead_full_in_half_open_releases_trial_slot(self):
+        """Bulkhead rejections while half-open don't leak trial slots."""
+        linear_breaker.state = "half_open"
+        linear_breaker.half_open_calls = 0
+        mock_func = Mock(return_value={"id": "BLA-1"})
+
+        with patch.object(linear_bulkhead, "slot", side_effect=BulkheadFullError("full")):
+            for _ in range(linear_breaker.half_open_max_calls + 1):
+                result = call_linear_mcp_resilient(mock_func, operation_name="test")
+                assert result["method"] == "bulkhead_full"
+
+        assert linear_breaker.half_open_calls == 0
+        result = call_linear_mcp_resilient(mock_func, operation_name="test")
+        assert result["success"] is True
+
 
 class TestCreateIssueResilient:
     """Test resilient issue creation."""
@@ -0,0 +1,223 @@
+"""Tests for Linear outbox and batched dispatcher."""
+
+import threading
+
+import pytest
+
+from ce.linear_mcp_resilience import linear_breaker
+from ce.linear_outbox import LinearOutbox, LinearDispatcher, coalesce_operations
+
+
+class FakeLinear:
+    """Local stand-in for Linear MCP issue handlers."""
+
+    def __init__(self, fail_times: int = 0):
+        self.creates = []
+        self.updates = []
+        self.fail_times = fail_times
+        self._lock = threading.Lock()
+        self._next_id = 1
+
+    def create(self, title, description, state, labels):
+        with self._lock:
+            if self.fail_times:
+                self.fail_times -= 1
+                raise ConnectionError("Linear unreachable")
+            issue_id = f"BLA-{self._next_id}"
+            self._next_id += 1
+            self.creates.append(title)
+        return {"id": issue_id, "title": title}
+
+    def update(self, issue_id, description, state):
+        with self._lock:
+            if self.fail_times:
+                self.fail_times -= 1
+                raise ConnectionError("Linear unreachable")
+            self.updates.append((issue_id, description, state))
+        return {"id": issue_id}
+
+
+@pytest.fixture(autouse=True)
+def reset_breaker(monkeypatch):
+    """Fresh circuit breaker state and no real backoff sleeps."""
+    monkeypatch.setattr("ce.resilience.time.sleep", lambda _: None)
+    linear_breaker.state = "closed"
+    linear_breaker.failure_count = 0
+    linear_breaker.success_count = 0
+    yield
+    linear_breaker.state = "closed"
+    linear_breaker.failure_count = 0
+    linear_breaker.success_count = 0
+
+
+def test_outbox_persists_under_ce(tmp_path, monkeypatch):
+    """Operations survive reopening the outbox."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".ce").mkdir()
+
+    with LinearOutbox() as outbox:
+        outbox.enqueue_update("BLA-1", "text")
+    assert (tmp_path / ".ce" / "linear-outbox.db").exists()
+
+    with LinearOutbox() as outbox:
+        assert [op["issue_key"] for op in outbox.pending()] == ["BLA-1"]
+
+
+def test_outbox_in_memory_outside_ce_project(tmp_path, monkeypatch):
+    """No .ce/ directory means no file is written."""
+    monkeypatch.chdir(tmp_path)
+
+    outbox = LinearOutbox()
+
+    assert outbox.db_path == ":memory:"
+
+
+def test_coalesce_updates_per_issue():
+    """Updates to one issue merge; creates stay separate."""
+    ops = [
+        {"id": 1, "kind": "update", "issue_key": "BLA-1", "payload": {"description": "a", "state": None}},
+        {"id": 2, "kind": "create", "issue_key": "PRP-9", "payload": {"title": "t"}},
+        {"id": 3, "kind": "update", "issue_key": "BLA-1", "payload": {"description": "b", "state": "done"}},
+        {"id": 4, "kind": "update", "issue_key": "BLA-2", "payload": {"description": "c", "state": None}},
+    ]
+
+    batches = coalesce_operations(ops)
+
+    assert [(b["kind"], b["issue_key"], b["op_ids"]) for b in batches] == [
+        ("update", "BLA-1", [1, 3]),
+        ("create", "PRP-9", [2]),
+        ("update", "BLA-2", [4]),
+    ]
+    assert batches[0]["payload"] == {"description": "ab", "state": "done"}
+
+
+def test_flush_sends_coalesced_calls():
+    """Flush delivers creates and one call per updated issue."""
+    fake = FakeLinear()
+    outbox = LinearOutbox(":memory:")
+    created = []
+    dispatcher = LinearDispatcher(
+        outbox, create_fn=fake.create, update_fn=fake.update,
+        on_created=lambda payload, issue: created.append((payload["prp_path"], issue["id"]))
+    )
+
+    outbox.enqueue_create("PRP-1", "PRP-1: Feature", "desc", prp_path="PRPs/PRP-1.md")
+    outbox.enqueue_update("BLA-7", "first ")
+    outbox.enqueue_update("BLA-7", "second", state="in_progress")
+
+    summary = dispatcher.flush()
+
+    assert summary == {"sent": 3, "failed": 0, "deferred": 0, "coalesced": 1}
+    assert fake.updates == [("BLA-7", "first second", "in_progress")]
+    assert created == [("PRPs/PRP-1.md", "BLA-1")]
+    assert outbox.stats() == {"pending": 0, "sent": 3, "dead": 0}
+
+
+def test_flush_concurrent_creates():
+    """Many creates are delivered with bounded parallelism."""
+    fake = FakeLinear()
+    outbox = LinearOutbox(":memory:")
+    for i in range(20):
+        outbox.enqueue_create(f"PRP-{i}", f"PRP-{i}", "desc")
+
+    summary = LinearDispatcher(outbox, create_fn=fake.create, max_workers=4).flush()
+
+    assert summary["sent"] == 20
+    assert sorted(fake.creates) == sorted(f"PRP-{i}" for i in range(20))
+
+
+def test_failures_stay_pending_then_dead():
+    """Failed operations keep retrying across flushes until max_attempts."""
+    fake = FakeLinear(fail_times=1000)
+    outbox = LinearOutbox(":memory:")
+    outbox.enqueue_update("BLA-1", "text")
+    dispatcher = LinearDispatcher(outbox, update_fn=fake.update, max_attempts=2)
+
+    assert dispatcher.flush()["failed"] == 1
+    assert outbox.pending()[0]["attempts"] == 1
+
+    dispatcher.flush()
+    assert outbox.stats()["dead"] == 1
+
+    assert outbox.requeue_dead() == 1
+    assert outbox.stats()["pending"] == 1
+
+
+def test_open_breaker_defers_without_losing_work():
+    """Operations rejected by an open breaker remain pending."""
+    fake = FakeLinear()
+    outbox = LinearOutbox(":memory:")
+    outbox.enqueue_create("PRP-1", "PRP-1", "desc")
+    dispatcher = LinearDispatcher(outbox, create_fn=fake.create)
+
+    for _ in range(linear_breaker.failure_threshold):
+        linear_breaker._on_failure()
+    summary = dispatcher.flush()
+
+    assert summary["deferred"] == 1
+    assert outbox.pending()[0]["attempts"] == 0
+
+    linear_breaker.state = "closed"
+    linear_breaker.failure_count = 0
+    assert dispatcher.flush()["sent"] == 1
+
+
+def test_missing_handler_defers():
+    """Operations without a configured handler are left queued."""
+    outbox = LinearOutbox(":memory:")
+    outbox.enqueue_update("BLA-1", "text")
+
+    summary = LinearDispatcher(outbox).flush()
+
+    assert summary["deferred"] == 1
+    assert outbox.stats()["pending"] == 1
+
+
+def test_create_without_issue_id_is_not_sent():
+    """A create handler that returns no issue ID does not mark the operation sent."""
+    outbox = LinearOutbox(":memory:")
+    outbox.enqueue_create("PRP-1", "PRP-1", "desc")
+    created = []
+    dispatcher = LinearDispatcher(
+        outbox,
+        create_fn=lambda **payload: payload,  # Prepared payload only, like create_issue_with_defaults
+        on_created=lambda payload, issue: created.append(issue)
+    )
+
+    summary = dispatcher.flush()
+
+    assert summary["failed"] == 1
+    assert outbox.stats()["sent"] == 0
+    assert outbox.pending()[0]["attempts"] == 1
+    assert created == []
+
+
+def test_join_update_not_queued_without_handler(monkeypatch):
+    """generate_prp --join-prp reports updates as unsupported instead of queueing them."""
+    from ce import linear_outbox
+    from ce.generate import _update_linear_issue_with_resilience
+
+    outbox = LinearOutbox(":memory:")
+    monkeypatch.setattr(linear_outbox, "_dispatcher", LinearDispatcher(outbox, create_fn=FakeLinear().create))
+
+    result = _update_linear_issue_with_resilience("BLA-1", "PRP-2", "Feature", "PRPs/PRP-2.md")
+
+    assert result["success"] is False
+    assert result["method"] == "not_supported"
+    assert outbox.stats()["pending"] == 0
+
+    fake = FakeLinear()
+    monkeypatch.setattr(linear_outbox, "_dispatcher", LinearDispatcher(outbox, update_fn=fake.update))
+    assert _update_linear_issue_with_resilience("BLA-1", "PRP-2", "Feature", "PRPs/PRP-2.md")["success"] is True
+    assert outbox.stats()["pending"] == 1
+
+
+def test_flush_async_returns_summary():
+    """Background flush resolves to the same summary."""
+    fake = FakeLinear()
+    outbox = LinearOutbox(":memory:")
+    outbox.enqueue_create("PRP-1", "PRP-1", "desc")
+
+    future = LinearDispatcher(outbox, create_fn=fake.create).flush_async()
+
+    assert future.result(timeout=10)["sent"] == 1
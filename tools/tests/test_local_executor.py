@@ -0,0 +1,143 @@
+"""Tests for the local pipeline executor."""
+
+import os
+import time
+
+import pytest
+
+from ce.executors import local
+from ce.executors.local import LocalExecutor
+
+
+def _pipeline(*stages):
+    return {"name": "local-test", "stages": list(stages)}
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / ".ce").mkdir()
+    return tmp_path
+
+
+def _executor(project, lines=None, **kwargs):
+    return LocalExecutor(cwd=project, log=(lines.append if lines is not None else lambda _: None), **kwargs)
+
+
+def test_parallel_stage_runs_nodes_concurrently(project):
+    stage = {
+        "name": "test",
+        "parallel": True,
+        "nodes": [{"name": f"n{i}", "command": "sleep 0.3"} for i in range(3)],
+    }
+    start = time.perf_counter()
+    result = _executor(project, use_cache=False, max_workers=3).run(_pipeline(stage))
+    assert result["success"]
+    assert time.perf_counter() - start < 0.8
+
+
+def test_sequential_stage_stops_at_failure_and_skips_dependents(project):
+    result = _executor(project).run(_pipeline(
+        {"name": "lint", "nodes": [
+            {"name": "bad", "command": "echo broken; exit 3"},
+            {"name": "never", "command": "true"},
+        ]},
+        {"name": "test", "depends_on": ["lint"], "nodes": [{"name": "unit", "command": "true"}]},
+        {"name": "docs", "nodes": [{"name": "build", "command": "true"}]},
+    ))
+    lint, test, docs = result["stages"]
+    assert not result["success"]
+    assert [n["status"] for n in lint["nodes"]] == ["failed", "skipped"]
+    assert lint["nodes"][0]["exit_code"] == 3
+    assert lint["nodes"][0]["output"] == "broken"
+    assert test["status"] == "skipped"
+    assert docs["status"] == "passed"  # Independent stage still runs
+
+
+def test_timeout_kills_node(project):
+    result = _executor(project).run(_pipeline(
+        {"name": "slow", "nodes": [{"name": "hang", "command": "sleep 30", "timeout": 1}]}
+    ))
+    node = result["stages"][0]["nodes"][0]
+    assert node["status"] == "timeout"
+    assert node["duration"] < 10
+
+
+def test_interrupt_kills_running_nodes(project, monkeypatch):
+    executor = _executor(project, use_cache=False)
+
+    def interrupted_wait(*args, **kwargs):
+        deadline = time.time() + 10
+        while not (project / "pid").exists() and time.time() < deadline:
+            time.sleep(0.01)
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(local, "wait", interrupted_wait)
+    start = time.perf_counter()
+    with pytest.raises(KeyboardInterrupt):
+        executor.run(_pipeline(
+            {"name": "slow", "nodes": [{"name": "hang", "command": "echo $$ > pid; sleep 30"}]},
+            {"name": "later", "depends_on": ["slow"], "nodes": [{"name": "never", "command": "touch ran"}]},
+        ))
+
+    assert time.perf_counter() - start < 10
+    with pytest.raises(ProcessLookupError):
+        os.kill(int((project / "pid").read_text()), 0)
+    assert not (project / "ran").exists()
+
+
+def test_output_is_streamed_with_node_prefix(project):
+    lines = []
+    _executor(project, lines).run(_pipeline(
+        {"name": "s", "nodes": [{"name": "echo", "command": "echo one; echo two"}]}
+    ))
+    assert "[s/echo] one" in lines
+    assert "[s/echo] two" in lines
+
+
+def test_cached_node_skipped_until_inputs_change(project):
+    (project / "src.txt").write_text("v1")
+    counter = project / "runs.log"
+    stage = {"name": "build", "nodes": [
+        {"name": "count", "command": f"echo run >> {counter}", "inputs": ["src.txt"]}
+    ]}
+
+    assert _executor(project).run(_pipeline(stage))["stages"][0]["nodes"][0]["status"] == "passed"
+    assert _executor(project).run(_pipeline(stage))["stages"][0]["nodes"][0]["status"] == "cached"
+    assert counter.read_text().count("run") == 1
+
+    (project / "src.txt").write_text("v2")
+    assert _executor(project).run(_pipeline(stage))["stages"][0]["nodes"][0]["status"] == "passed"
+    assert _executor(project, use_cache=False).run(_pipeline(stage))["stages"][0]["nodes"][0]["status"] == "passed"
+    assert counter.read_text().count("run") == 3
+
+
+def test_mock_nodes_are_not_run(project):
+    result = _executor(project).run(_pipeline(
+        {"name": "s", "nodes": [{"name": "ext", "command": "exit 1", "strategy": "mock"}]}
+    ))
+    assert result["success"]
+    assert result["stages"][0]["nodes"][0]["status"] == "mocked"
+
+
+def test_cycle_rejected_before_running(project):
+    with pytest.raises(RuntimeError, match="circular"):
+        _executor(project).run(_pipeline(
+            {"name": "a", "depends_on": ["b"], "nodes": [{"name": "x", "command": "true"}]},
+            {"name": "b", "depends_on": ["a"], "nodes": [{"name": "y", "command": "true"}]},
+        ))
+
+
+def test_render_plan_and_report(project):
+    executor = _executor(project)
+    pipeline = _pipeline(
+        {"name": "lint", "nodes": [{"name": "md", "command": "true"}]},
+        {"name": "test", "depends_on": ["lint"], "parallel": True,
+         "nodes": [{"name": "unit", "command": "true"}]},
+    )
+    plan = executor.render(pipeline)
+    assert "# Wave 1 (concurrent): lint" in plan
+    assert "test [parallel]" in plan
+
+    report = executor.format_report(executor.run(pipeline))
+    assert "## Pipeline Timing" in report
+    assert "Wall time" in report
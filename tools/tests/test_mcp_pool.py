@@ -0,0 +1,260 @@
+"""Tests for pooled MCP stdio sessions."""
+
+import json
+import sys
+import threading
+import time
+
+import pytest
+
+from ce.mcp_pool import MCPConnectionManager, load_server_configs
+from ce import mcp_pool
+
+
+STUB_SERVER = r'''
+import json, os, sys, threading, time
+
+lock = threading.Lock()
+
+def send(msg):
+    with lock:
+        sys.stdout.write(json.dumps(msg) + "\n")
+        sys.stdout.flush()
+
+def handle(msg):
+    method, params = msg.get("method"), msg.get("params", {})
+    if method == "initialize":
+        with open(sys.argv[1], "a") as f:
+            f.write("init\n")
+        send({"jsonrpc": "2.0", "id": msg["id"], "result": {
+            "protocolVersion": params["protocolVersion"],
+            "capabilities": {"tools": {}},
+            "serverInfo": {"name": "stub", "version": "0.1"}}})
+    elif method == "tools/list":
+        with open(sys.argv[1], "a") as f:
+            f.write("list\n")
+        send({"jsonrpc": "2.0", "id": msg["id"], "result": {
+            "tools": [{"name": "echo"}, {"name": "sleep"}, {"name": "fail"}, {"name": "exit"},
+                      {"name": "read_file"}, {"name": "create_text_file"},
+                      {"name": "get_symbols_overview"}, {"name": "insert_after_symbol"}]}})
+    elif method == "tools/call":
+        name, args = params["name"], params["arguments"]
+        if name == "sleep":
+            time.sleep(args["seconds"])
+            send({"jsonrpc": "2.0", "id": msg["id"], "result": {
+                "content": [{"type": "text", "text": str(args["tag"])}]}})
+        elif name == "echo":
+            send({"jsonrpc": "2.0", "id": msg["id"], "result": {
+                "content": [{"type": "text", "text": json.dumps(args)}]}})
+        elif name == "fail":
+            send({"jsonrpc": "2.0", "id": msg["id"], "result": {
+                "isError": True, "content": [{"type": "text", "text": "boom"}]}})
+        elif name == "exit":
+            os._exit(3)
+        elif name == "get_symbols_overview":
+            send({"jsonrpc": "2.0", "id": msg["id"], "result": {
+                "content": [{"type": "text", "text": json.dumps([{"name_path": "main", "file": args["relative_path"]}])}]}})
+        elif name in ("read_file", "create_text_file", "insert_after_symbol"):
+            send({"jsonrpc": "2.0", "id": msg["id"], "result": {
+                "content": [{"type": "text", "text": "OK"}]}})
+        else:
+            send({"jsonrpc": "2.0", "id": msg["id"], "error": {"code": -32602, "message": "unknown tool"}})
+    elif "id" in msg:
+        send({"jsonrpc": "2.0", "id": msg["id"], "error": {"code": -32601, "message": "no method"}})
+
+for line in sys.stdin:
+    msg = json.loads(line)
+    threading.Thread(target=handle, args=(msg,)).start()
+'''
+
+
+@pytest.fixture
+def stub_manager(tmp_path):
+    """Manager with one stub server; log file records handshakes."""
+    script = tmp_path / "stub_server.py"
+    script.write_text(STUB_SERVER)
+    log = tmp_path / "server.log"
+    log.touch()
+    manager = MCPConnectionManager(configs={
+        "syn-stub": {"command": sys.executable, "args": [str(script), str(log)], "env": {}}
+    }, startup_timeout=10)
+    yield manager, log
+    manager.close_all()
+
+
+def test_load_server_configs(tmp_path):
+    config = tmp_path / "servers.json"
+    config.write_text(json.dumps({"servers": {"syn-git": {"command": "uvx", "args": ["mcp-server-git"]}}}))
+
+    configs = load_server_configs(config)
+    assert configs["syn-git"]["command"] == "uvx"
+    assert load_server_configs(tmp_path / "missing.json") == {}
+
+
+def test_load_server_configs_invalid_json(tmp_path):
+    config = tmp_path / "servers.json"
+    config.write_text("{not json")
+    with pytest.raises(ValueError, match="Invalid MCP server config"):
+        load_server_configs(config)
+
+
+def test_session_spawned_once_and_reused(stub_manager):
+    manager, log = stub_manager
+
+    first = manager.get_session("stub")
+    second = manager.get_session("syn-stub")
+    assert first is second
+    assert first.server_info["name"] == "stub"
+
+    assert manager.has_tool("stub", "echo")
+    assert not manager.has_tool("stub", "missing")
+    manager.tool_names("stub")
+
+    assert log.read_text().splitlines() == ["init", "list"]
+
+
+def test_call_tool_roundtrip(stub_manager):
+    manager, _ = stub_manager
+    result = manager.call_tool("stub", "echo", {"x": 1})
+    assert json.loads(result["content"][0]["text"]) == {"x": 1}
+
+
+def test_concurrent_calls_multiplexed(stub_manager):
+    manager, log = stub_manager
+    results = {}
+
+    def worker(tag):
+        result = manager.call_tool("stub", "sleep", {"seconds": 0.5, "tag": tag})
+        results[tag] = result["content"][0]["text"]
+
+    start = time.monotonic()
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.monotonic() - start
+
+    assert results == {i: str(i) for i in range(8)}
+    assert elapsed < 3.0  # Serialized would take 4s
+    assert log.read_text().count("init") == 1
+
+
+def test_tool_error_raises(stub_manager):
+    manager, _ = stub_manager
+    with pytest.raises(RuntimeError, match="boom"):
+        manager.call_tool("stub", "fail")
+    with pytest.raises(RuntimeError, match="unknown tool"):
+        manager.call_tool("stub", "nope")
+
+
+def test_request_timeout(stub_manager):
+    manager, _ = stub_manager
+    session = manager.get_session("stub")
+    with pytest.raises(TimeoutError):
+        session.call_tool("sleep", {"seconds": 2, "tag": 0}, timeout=0.2)
+    # Session still usable after a timed-out request
+    assert manager.call_tool("stub", "echo", {})["content"]
+
+
+def test_dead_session_respawned(stub_manager):
+    manager, log = stub_manager
+    session = manager.get_session("stub")
+
+    with pytest.raises(ConnectionError):
+        session.call_tool("exit", timeout=5)
+    session._process.wait(timeout=5)
+    assert not manager.is_connected("stub")
+
+    result = manager.call_tool("stub", "echo", {"again": True})
+    assert json.loads(result["content"][0]["text"]) == {"again": True}
+    assert log.read_text().count("init") == 2
+
+
+def test_async_requests_share_session(stub_manager):
+    import asyncio
+
+    manager, _ = stub_manager
+    session = manager.get_session("stub")
+
+    async def run():
+        return await asyncio.gather(*(
+            session.request_async("tools/call", {"name": "echo", "arguments": {"n": i}})
+            for i in range(5)
+        ))
+
+    results = asyncio.run(run())
+    assert [json.loads(r["content"][0]["text"])["n"] for r in results] == list(range(5))
+
+
+def test_unknown_and_uninstalled_servers():
+    manager = MCPConnectionManager(configs={
+        "syn-ghost": {"command": "definitely-not-installed-mcp-binary", "args": []}
+    })
+    assert not manager.is_available("ghost")
+    assert not manager.has_tool("ghost", "anything")
+    assert not manager.is_available("unknown")
+    with pytest.raises(ValueError, match="Unknown MCP server"):
+        manager.get_session("unknown")
+    with pytest.raises(RuntimeError, match="Failed to start MCP server"):
+        manager.get_session("ghost")
+
+
+def test_status_does_not_spawn(stub_manager):
+    manager, log = stub_manager
+    status = manager.status()
+    assert status["syn-stub"]["connected"] is False
+    assert log.read_text() == ""
+
+    manager.tool_names("stub")
+    status = manager.status()
+    assert status["syn-stub"]["connected"] is True
+    assert "echo" in status["syn-stub"]["tools"]
+
+
+def test_mcp_utils_uses_pool_when_enabled(stub_manager, monkeypatch):
+    from ce.mcp_utils import call_syntropy_mcp, is_mcp_available
+
+    manager, _ = stub_manager
+    monkeypatch.setattr(mcp_pool, "_manager", manager)
+    monkeypatch.setenv("CE_MCP_SESSIONS", "true")
+
+    assert is_mcp_available("stub")
+    result = call_syntropy_mcp("stub", "echo", {"k": "v"})
+    assert json.loads(result["content"][0]["text"]) == {"k": "v"}
+
+
+def test_mcp_adapter_uses_pooled_serena_when_enabled(tmp_path, monkeypatch):
+    import importlib
+
+    from ce import mcp_adapter
+
+    script = tmp_path / "stub_server.py"
+    script.write_text(STUB_SERVER)
+    log = tmp_path / "server.log"
+    log.touch()
+    manager = MCPConnectionManager(configs={
+        "syn-serena": {"command": sys.executable, "args": [str(script), str(log)], "env": {}}
+    }, startup_timeout=10)
+    monkeypatch.setattr(mcp_pool, "_manager", manager)
+    real_import = importlib.import_module
+
+    def no_serena_module(name, *args):
+        if name == "mcp__serena":
+            raise ImportError(name)
+        return real_import(name, *args)
+
+    monkeypatch.setattr(importlib, "import_module", no_serena_module)
+    try:
+        monkeypatch.delenv("CE_MCP_SESSIONS", raising=False)
+        assert mcp_adapter.is_mcp_available() is False
+        assert log.read_text() == ""  # Nothing spawned unless opted in
+
+        monkeypatch.setenv("CE_MCP_SESSIONS", "true")
+        assert mcp_adapter.is_mcp_available() is True
+        serena = mcp_adapter._import_serena_mcp()
+        assert serena.get_symbols_overview("ce/core.py") == [{"name_path": "main", "file": "ce/core.py"}]
+        assert serena.create_text_file("x.py", "pass") == "OK"
+        assert log.read_text().splitlines() == ["init", "list"]  # One session for all calls
+    finally:
+        manager.close_all()
@@ -8,19 +8,22 @@ from ce.mcp_utils import (
 )
 
 
-def test_call_syntropy_mcp_raises_not_implemented():
-    """Test MCP call raises until implemented."""
-    with pytest.raises(RuntimeError, match="not yet implemented"):
+def test_call_syntropy_mcp_raises_when_sessions_disabled(monkeypatch):
+    """Test MCP call raises unless Python-side sessions are enabled."""
+    monkeypatch.delenv("CE_MCP_SESSIONS", raising=False)
+    with pytest.raises(RuntimeError, match="MCP sessions disabled"):
         call_syntropy_mcp("thinking", "sequentialthinking", {})
 
 
-def test_is_mcp_available_returns_false():
-    """Test availability check returns False until implemented."""
+def test_is_mcp_available_returns_false(monkeypatch):
+    """Test availability check returns False when sessions are disabled."""
+    monkeypatch.delenv("CE_MCP_SESSIONS", raising=False)
     assert is_mcp_available("thinking") is False
     assert is_mcp_available("serena") is False
 
 
-def test_call_sequential_thinking_returns_none():
+def test_call_sequential_thinking_returns_none(monkeypatch):
     """Test sequential thinking wrapper returns None gracefully."""
+    monkeypatch.delenv("CE_MCP_SESSIONS", raising=False)
     result = call_sequential_thinking("Test prompt")
     assert result is None
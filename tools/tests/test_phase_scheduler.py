@@ -0,0 +1,133 @@
+"""Tests for parallel phase scheduling (phase_scheduler.py)."""
+
+import subprocess
+
+import pytest
+
+from ce.phase_scheduler import (
+    build_phase_graph,
+    plan_waves,
+    run_parallel_wave,
+    merge_phase_commits
+)
+
+
+def _phase(num, modify=(), create=(), depends_on=()):
+    return {
+        "phase_number": num,
+        "phase_name": f"Phase {num}",
+        "goal": "Test goal",
+        "approach": "Test approach",
+        "files_to_modify": [{"path": p, "description": "modify"} for p in modify],
+        "files_to_create": [{"path": p, "description": "create"} for p in create],
+        "functions": [],
+        "validation_command": None,
+        "depends_on": list(depends_on)
+    }
+
+
+def test_build_phase_graph_file_overlap_and_explicit_deps():
+    """Test dependencies from file overlap and **Depends On**."""
+    phases = [
+        _phase(1, modify=["src/a.py"]),
+        _phase(2, modify=["src/b.py"]),
+        _phase(3, modify=["./src/a.py"]),
+        _phase(4, create=["src/c.py"], depends_on=[2]),
+    ]
+
+    graph = build_phase_graph(phases)
+
+    assert graph == {1: set(), 2: set(), 3: {1}, 4: {2}}
+
+
+def test_plan_waves_groups_independent_phases():
+    """Test waves follow critical path; phases without files are barriers."""
+    phases = [
+        _phase(1, modify=["a.py"]),
+        _phase(2, modify=["b.py"]),
+        _phase(3, modify=["a.py"]),
+        _phase(4),
+        _phase(5, modify=["c.py"]),
+    ]
+
+    waves = [[p["phase_number"] for p in wave] for wave in plan_waves(phases)]
+
+    assert waves == [[1, 2], [3], [4], [5]]
+
+
+def test_plan_waves_cycle_raises():
+    """Test circular explicit dependencies are rejected."""
+    phases = [_phase(1, modify=["a.py"], depends_on=[2]), _phase(2, modify=["b.py"], depends_on=[1])]
+
+    with pytest.raises(RuntimeError, match="Circular phase dependency"):
+        plan_waves(phases)
+
+
+@pytest.fixture
+def git_repo(tmp_path, monkeypatch):
+    """Git repo with one commit, cwd set to repo root."""
+    def git(*args):
+        return subprocess.run(
+            ["git", *args], cwd=tmp_path, check=True, capture_output=True, text=True
+        ).stdout
+
+    git("init", "-q")
+    git("config", "user.email", "test@example.com")
+    git("config", "user.name", "Test")
+    (tmp_path / "shared.py").write_text("# shared\n")
+    git("add", "shared.py")
+    git("commit", "-q", "-m", "initial")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path, git
+
+
+def test_run_parallel_wave_merges_in_phase_order(git_repo):
+    """Test independent phases run in worktrees and merge back."""
+    repo, git = git_repo
+    wave = [_phase(1, create=["one.py"]), _phase(2, create=["two.py"])]
+
+    results = run_parallel_wave(wave, str(repo / "PRP.md"), skip_validation=True)
+    assert [r["phase_number"] for r in results] == [1, 2]
+
+    merge_phase_commits(results)
+
+    assert (repo / "one.py").exists()
+    assert (repo / "two.py").exists()
+    assert git("log", "--format=%s", "-2").split("\n")[:2] == ["Phase 2: Phase 2", "Phase 1: Phase 1"]
+    assert git("worktree", "list").count("\n") == 1
+
+
+def test_merge_phase_commits_calls_back_at_each_phase_head(git_repo):
+    """Test on_merged sees HEAD at each phase's own commit (for checkpoint tags)."""
+    repo, git = git_repo
+    wave = [_phase(1, create=["one.py"]), _phase(2, create=["two.py"])]
+    results = run_parallel_wave(wave, str(repo / "PRP.md"), skip_validation=True)
+
+    seen = []
+    merge_phase_commits(results, on_merged=lambda result: seen.append(
+        (result["phase_number"], git("log", "-1", "--format=%s").strip(), (repo / "two.py").exists())
+    ))
+
+    assert seen == [(1, "Phase 1: Phase 1", False), (2, "Phase 2: Phase 2", True)]
+
+
+def test_merge_phase_commits_detects_conflicts(git_repo):
+    """Test conflicting phase commits abort cleanly with file list."""
+    repo, git = git_repo
+    branch = git("rev-parse", "--abbrev-ref", "HEAD").strip()
+    shas = []
+    for content in ("one\n", "two\n"):
+        git("checkout", "-q", "--detach", branch)
+        (repo / "shared.py").write_text(content)
+        git("commit", "-q", "-am", f"edit {content.strip()}")
+        shas.append(git("rev-parse", "HEAD").strip())
+    git("checkout", "-q", branch)
+
+    with pytest.raises(RuntimeError, match="Conflicting files: shared.py"):
+        merge_phase_commits([
+            {"phase_number": 1, "commit_sha": shas[0]},
+            {"phase_number": 2, "commit_sha": shas[1]},
+        ])
+
+    assert git("status", "--porcelain") == ""
+    assert (repo / "shared.py").read_text() == "one\n"
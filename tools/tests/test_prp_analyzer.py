@@ -10,6 +10,9 @@ from ce.prp_analyzer import (
     suggest_decomposition,
     analyze_prp,
     format_analysis_report,
+    analyze_corpus,
+    discover_prp_files,
+    format_corpus_report,
     SizeCategory,
     PRPMetrics,
 )
@@ -63,6 +66,7 @@ def large_prp(tmp_path):
 
     # Add lots of padding to exceed 1000 lines
     background = '\n'.join(['Large implementation line. ' * 10 for _ in range(100)])
+    padding = 'Extra padding line.\n' * 200
 
     content = f"""---
 prp_id: PRP-4
@@ -86,7 +90,7 @@ estimated_hours: 18-20
 {functions}
 
 ## Additional Content
-{'Extra padding line.\n' * 200}
+{padding}
 """
     prp.write_text(content)
     return prp
@@ -102,6 +106,7 @@ def medium_prp(tmp_path):
 
     # Add content to reach 750+ lines for YELLOW
     background = '\n'.join(['Medium implementation line. ' * 10 for _ in range(70)])
+    padding = 'Padding line.\n' * 100
 
     content = f"""---
 prp_id: PRP-2
@@ -125,7 +130,7 @@ estimated_hours: 8-10
 {functions}
 
 ## Additional Content
-{'Padding line.\n' * 100}
+{padding}
 """
     prp.write_text(content)
     return prp
@@ -429,6 +434,95 @@ class TestFormatAnalysisReport:
         assert "Success Criteria:" in report
 
 
+class TestCorpusAnalysis:
+    """Test corpus-wide analysis mode."""
+
+    def test_discover_prp_files(self, tmp_path):
+        """Test recursive PRP discovery under PRPs/."""
+        (tmp_path / "PRPs" / "executed").mkdir(parents=True)
+        (tmp_path / "PRPs" / "feature-requests").mkdir()
+        (tmp_path / "PRPs" / "executed" / "PRP-1-a.md").write_text("# A")
+        (tmp_path / "PRPs" / "feature-requests" / "PRP-2-b.md").write_text("# B")
+        (tmp_path / "PRPs" / "README.md").write_text("# not a PRP")
+
+        files = discover_prp_files(tmp_path)
+
+        assert [f.name for f in files] == ["PRP-1-a.md", "PRP-2-b.md"]
+
+    def test_corpus_aggregates(self, small_prp, large_prp):
+        """Test per-PRP rows and aggregate distributions."""
+        result = analyze_corpus([small_prp, large_prp], workers=1)
+
+        assert [r['name'] for r in result['prps']] == ["PRP-1-small", "PRP-4-large"]
+        summary = result['summary']
+        assert summary['total'] == 2
+        assert summary['size_categories'] == {'GREEN': 1, 'YELLOW': 0, 'RED': 1}
+        assert summary['risk'] == {'HIGH': 1, 'LOW': 1}
+        assert summary['hours']['known'] == 2
+        assert summary['hours']['total'] == 2.5 + 19
+        assert sum(summary['complexity']['histogram'].values()) == 2
+
+    def test_corpus_parallel_matches_inline(self, tmp_path, small_prp):
+        """Test process pool results match in-process analysis."""
+        paths = []
+        for i in range(40):
+            path = tmp_path / f"PRP-{i}-copy.md"
+            path.write_text(small_prp.read_text() + "\n- [ ] extra\n" * i)
+            paths.append(path)
+
+        inline = analyze_corpus(paths, workers=1)
+        parallel = analyze_corpus(paths, workers=2)
+
+        assert parallel == inline
+
+    def test_corpus_reports_errors(self, small_prp, tmp_path):
+        """Test missing files are reported, not fatal."""
+        result = analyze_corpus([small_prp, tmp_path / "PRP-404.md"], workers=1)
+
+        assert result['summary']['total'] == 1
+        assert len(result['errors']) == 1
+        assert "PRP file not found" in result['errors'][0]['error']
+
+    def test_corpus_csv_and_json(self, small_prp):
+        """Test CSV has one row per PRP and JSON round-trips."""
+        import json
+
+        result = analyze_corpus([small_prp], workers=1)
+
+        csv_lines = format_corpus_report(result, "csv").strip().split("\n")
+        assert csv_lines[0].startswith("name,path,size_category,complexity_score")
+        assert csv_lines[1].startswith("PRP-1-small,")
+        assert json.loads(format_corpus_report(result, "json")) == result
+        assert "PRP Corpus Analysis: 1 PRPs" in format_corpus_report(result)
+
+    def test_metrics_cached_on_disk(self, small_prp, tmp_path, monkeypatch):
+        """Test metrics are cached by content hash under .ce/cache/."""
+        from ce import prp_analyzer
+        from ce.prp_sections import load_prp
+
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / ".ce").mkdir()
+        prp_analyzer._metrics_cache.clear()
+
+        extract_prp_metrics(small_prp)
+
+        cache_key = f"{load_prp(small_prp).content_hash}-v{prp_analyzer.METRICS_CACHE_VERSION}"
+        cache_file = tmp_path / ".ce" / "cache" / "prp-metrics" / f"{cache_key}.json"
+        assert cache_file.exists()
+
+    def test_metrics_memory_cache_is_bounded(self, small_prp, medium_prp, monkeypatch):
+        """Test the in-memory metrics cache evicts least recently used entries."""
+        from ce import prp_analyzer
+
+        monkeypatch.setattr(prp_analyzer, "_METRICS_CACHE_SIZE", 1)
+        prp_analyzer._metrics_cache.clear()
+
+        extract_prp_metrics(small_prp)
+        extract_prp_metrics(medium_prp)
+
+        assert len(prp_analyzer._metrics_cache) == 1
+
+
 class TestRealPRPs:
     """Test analyzer on real PRP files from project."""
 
@@ -0,0 +1,160 @@
+"""Tests for cached PRP sectionizer."""
+
+import pytest
+
+from ce import prp_sections
+from ce.prp_sections import load_prp, parse_sections, clear_cache
+
+
+SAMPLE_PRP = """---
+name: "Test PRP"
+# yaml comment, not a heading
+prp_id: "PRP-999"
+---
+
+# Test PRP
+
+## EXAMPLES
+
+```python
+## not a heading
+def foo():
+    pass
+```
+
+### Sub Example
+
+More text.
+
+## 🔧 Implementation Blueprint
+
+### Phase 1: Core (2 hours)
+
+Phase one body.
+
+### Phase 2: Tests (1 hours)
+
+Phase two body.
+"""
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_cache()
+    yield
+    clear_cache()
+
+
+def test_parse_sections_headings_and_ranges():
+    """Test heading table skips front matter and code fences."""
+    frontmatter_end, sections = parse_sections(SAMPLE_PRP)
+
+    assert SAMPLE_PRP[:frontmatter_end].endswith("---\n")
+    assert [(s.level, s.title) for s in sections] == [
+        (1, "Test PRP"),
+        (2, "EXAMPLES"),
+        (3, "Sub Example"),
+        (2, "🔧 Implementation Blueprint"),
+        (3, "Phase 1: Core (2 hours)"),
+        (3, "Phase 2: Tests (1 hours)"),
+    ]
+
+    examples = sections[1]
+    assert examples.end == sections[3].start
+    assert examples.own_end == sections[2].start
+    assert SAMPLE_PRP[examples.start:examples.body_start] == "## EXAMPLES\n"
+
+
+def test_document_queries(tmp_path):
+    """Test find/text/children/frontmatter accessors."""
+    prp = tmp_path / "PRP-999.md"
+    prp.write_text(SAMPLE_PRP)
+
+    doc = load_prp(prp)
+
+    blueprint = doc.find(r"🔧\s+Implementation\s+Blueprint$", level=2)
+    assert [c.title for c in doc.children(blueprint)] == [
+        "Phase 1: Core (2 hours)",
+        "Phase 2: Tests (1 hours)",
+    ]
+    assert "Phase two body." in doc.text(blueprint)
+
+    examples = doc.find("EXAMPLES$")
+    assert "More text." in doc.text(examples)
+    assert "More text." not in doc.text(examples, include_subsections=False)
+
+    assert 'prp_id: "PRP-999"' in doc.frontmatter
+    assert doc.line_count == len(SAMPLE_PRP.split("\n"))
+
+
+def test_load_prp_caches_by_path_and_content(tmp_path, monkeypatch):
+    """Test unchanged files are not re-parsed; identical content shares parse."""
+    calls = []
+    real_parse = prp_sections.parse_sections
+    monkeypatch.setattr(prp_sections, "parse_sections", lambda c: calls.append(1) or real_parse(c))
+
+    first = tmp_path / "a.md"
+    second = tmp_path / "b.md"
+    first.write_text(SAMPLE_PRP)
+    second.write_text(SAMPLE_PRP)
+
+    doc = load_prp(first)
+    assert load_prp(first) is doc
+    assert load_prp(second).sections == doc.sections
+    assert len(calls) == 1
+
+    first.write_text(SAMPLE_PRP + "\n## Extra\n")
+    assert load_prp(first).sections[-1].title == "Extra"
+    assert len(calls) == 2
+
+
+def test_disk_cache_reused_across_processes(tmp_path, monkeypatch):
+    """Test on-disk cache under .ce/ is written and read back."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".ce").mkdir()
+    prp = tmp_path / "PRP.md"
+    prp.write_text(SAMPLE_PRP)
+
+    doc = load_prp(prp)
+    cache_dir = tmp_path / ".ce" / "cache" / "prp-sections"
+    cache_file = cache_dir / f"{doc.content_hash}-v{prp_sections.SECTIONS_CACHE_VERSION}.json"
+    assert cache_file.exists()
+    assert [p.name for p in cache_dir.iterdir()] == [cache_file.name]  # No temp files left
+
+    clear_cache()
+    monkeypatch.setattr(prp_sections, "parse_sections", lambda c: pytest.fail("re-parsed"))
+    assert load_prp(prp).sections == doc.sections
+
+
+def test_cache_version_bump_ignores_old_disk_entries(tmp_path, monkeypatch):
+    """Test entries written under an older schema version are not reused."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".ce").mkdir()
+    prp = tmp_path / "PRP.md"
+    prp.write_text(SAMPLE_PRP)
+    load_prp(prp)
+
+    clear_cache()
+    calls = []
+    real_parse = prp_sections.parse_sections
+    monkeypatch.setattr(prp_sections, "parse_sections", lambda c: calls.append(1) or real_parse(c))
+    monkeypatch.setattr(prp_sections, "SECTIONS_CACHE_VERSION", prp_sections.SECTIONS_CACHE_VERSION + 1)
+    load_prp(prp)
+    assert len(calls) == 1
+
+
+def test_path_cache_is_bounded(tmp_path, monkeypatch):
+    """Test least recently loaded paths are evicted."""
+    monkeypatch.setattr(prp_sections, "_PATH_CACHE_SIZE", 2)
+    paths = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / f"{name}.md"
+        path.write_text(SAMPLE_PRP)
+        paths.append(path)
+
+    load_prp(paths[0])
+    load_prp(paths[1])
+    load_prp(paths[0])  # a is now most recently used
+    load_prp(paths[2])
+
+    assert list(prp_sections._path_cache) == [str(paths[0].resolve()), str(paths[2].resolve())]
@@ -0,0 +1,145 @@
+"""Tests for the warm interpreter pool."""
+
+import os
+import sys
+import threading
+
+import pytest
+
+from ce.py_pool import PoolServerRunningError, PyPoolServer, PyWorkerPool, default_socket_path, run_warm, socket_dir, warm_supported
+
+pytestmark = pytest.mark.skipif(not warm_supported(), reason="needs fork and Unix sockets")
+
+
+@pytest.fixture
+def pool():
+    pool = PyWorkerPool(size=1, preload=["json"], interpreter=[sys.executable])
+    yield pool
+    pool.close()
+
+
+def test_runs_code_with_clean_namespace(pool):
+    first = pool.run(code="x = 41; print(x + 1)")
+    assert first["success"] is True
+    assert first["stdout"] == "42\n"
+
+    second = pool.run(code="print('x' in globals())")
+    assert second["stdout"] == "False\n"
+
+
+def test_preloaded_module_and_worker_reuse(pool):
+    pid = pool.run(code="import os; print(os.getppid())")["stdout"]
+    assert pool.run(code="import sys; print('json' in sys.modules)")["stdout"] == "True\n"
+    assert pool.run(code="import os; print(os.getppid())")["stdout"] == pid
+
+
+def test_exit_code_stderr_and_argv(pool, tmp_path):
+    script = tmp_path / "script.py"
+    script.write_text("import sys\nprint(sys.argv[1:], file=sys.stderr)\nsys.exit(3)\n")
+
+    result = pool.run(file=str(script), argv=["--flag"])
+    assert result["exit_code"] == 3
+    assert result["success"] is False
+    assert "['--flag']" in result["stderr"]
+
+
+def test_exception_reports_traceback(pool):
+    result = pool.run(code="raise ValueError('boom')")
+    assert result["exit_code"] == 1
+    assert "ValueError: boom" in result["stderr"]
+
+
+def test_timeout_kills_run_and_worker_survives(pool):
+    with pytest.raises(TimeoutError, match="timed out"):
+        pool.run(code="import time; time.sleep(30)", timeout=0.5)
+    assert pool.run(code="print('ok')")["stdout"] == "ok\n"
+
+
+def test_memory_limit(pool):
+    result = pool.run(code="b = bytearray(512 * 1024 * 1024)", memory_mb=256)
+    assert result["success"] is False
+    assert "MemoryError" in result["stderr"]
+
+
+def test_inline_mode_still_uses_fresh_namespace(tmp_path):
+    pool = PyWorkerPool(size=1, preload=[], interpreter=[sys.executable], isolate=False)
+    try:
+        pool.run(code="y = 1")
+        result = pool.run(code="print('y' in globals())", cwd=str(tmp_path))
+        assert result["stdout"] == "False\n"
+
+        show = "import os; print(os.environ.get('ONLY_HERE'))"
+        assert pool.run(code=show, env={"ONLY_HERE": "1"})["stdout"] == "1\n"
+        assert pool.run(code=show)["stdout"] == "None\n"  # Restored after the run
+    finally:
+        pool.close()
+
+
+def test_server_round_trip(tmp_path):
+    pool = PyWorkerPool(size=1, preload=[], interpreter=[sys.executable])
+    socket_path = tmp_path / "pool.sock"
+    server = PyPoolServer(socket_path, pool, idle_timeout=60)
+    thread = threading.Thread(target=server.serve_until_idle, daemon=True)
+    thread.start()
+    try:
+        result = run_warm(code="print(6 * 7)", socket_path=socket_path)
+        assert result["stdout"] == "42\n"
+        os.environ["CE_POOL_TEST_VAR"] = "from-client"
+        try:
+            env_result = run_warm(code="import os; print(os.environ.get('CE_POOL_TEST_VAR'))",
+                                  socket_path=socket_path)
+        finally:
+            del os.environ["CE_POOL_TEST_VAR"]
+        assert env_result["stdout"] == "from-client\n"
+        with pytest.raises(ValueError):
+            run_warm(socket_path=socket_path)
+    finally:
+        server.shutdown()
+        thread.join(timeout=10)
+    assert not socket_path.exists()
+
+
+def test_socket_dir_is_private(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    path = default_socket_path(tmp_path / "project")
+    assert path.parent == tmp_path / "ce"
+    assert (path.parent.stat().st_mode & 0o777) == 0o700
+
+    os.chmod(path.parent, 0o755)
+    with pytest.raises(RuntimeError, match="not a private directory"):
+        socket_dir()
+
+
+def test_client_refuses_non_socket_path(tmp_path):
+    impostor = tmp_path / "pool.sock"
+    impostor.write_text("")
+    with pytest.raises(RuntimeError, match="Refusing to use"):
+        run_warm(code="print(1)", socket_path=impostor)
+
+
+def test_second_server_refused_and_first_keeps_socket(tmp_path):
+    socket_path = tmp_path / "pool.sock"
+    pool = PyWorkerPool(size=1, preload=[], interpreter=[sys.executable])
+    server = PyPoolServer(socket_path, pool, idle_timeout=60)
+    thread = threading.Thread(target=server.serve_until_idle, daemon=True)
+    thread.start()
+    try:
+        with pytest.raises(PoolServerRunningError):
+            PyPoolServer(socket_path, PyWorkerPool(size=1), idle_timeout=60)
+        assert run_warm(code="print('still here')", socket_path=socket_path)["stdout"] == "still here\n"
+    finally:
+        server.shutdown()
+        thread.join(timeout=10)
+    assert not socket_path.exists()
+
+
+def test_server_does_not_unlink_a_socket_it_did_not_bind(tmp_path):
+    socket_path = tmp_path / "pool.sock"
+    server = PyPoolServer(socket_path, PyWorkerPool(size=1), idle_timeout=60)
+    socket_path.unlink()
+    socket_path.write_text("")  # Someone else's file now
+
+    server.server_close()
+    server._release_socket()
+
+    assert socket_path.exists()
@@ -3,8 +3,17 @@
 import pytest
 import time
 from unittest.mock import Mock
+import asyncio
+import threading
+
 from ce.resilience import (
     retry_with_backoff,
+    backoff_delay,
+    add_state_listener,
+    remove_state_listener,
+    get_resilience_metrics,
+    Bulkhead,
+    BulkheadFullError,
     CircuitBreaker,
     CircuitBreakerOpenError
 )
@@ -330,3 +339,188 @@ class TestIntegration:
         with pytest.raises(CircuitBreakerOpenError):
             always_fail()
         assert call_count["value"] == call_count_before  # No additional calls
+
+
+class TestJitterAndAsync:
+    """Test full-jitter backoff and async support."""
+
+    def test_full_jitter_within_bounds(self):
+        """Test jittered delays stay within [0, capped backoff]."""
+        delays = [backoff_delay(3, base_delay=1.0, max_delay=5.0, jitter=True) for _ in range(200)]
+
+        assert all(0 <= d <= 5.0 for d in delays)
+        assert len(set(delays)) > 1
+        assert backoff_delay(3, base_delay=1.0, max_delay=5.0) == 5.0
+
+    def test_retry_returns_none_without_retrying(self):
+        """Test a function returning None is not treated as a failure."""
+        mock_func = Mock(return_value=None)
+
+        assert retry_with_backoff(max_attempts=3)(mock_func)() is None
+        assert mock_func.call_count == 1
+
+    def test_async_retry(self):
+        """Test retry decorator on coroutine functions."""
+        calls = {"n": 0}
+
+        @retry_with_backoff(max_attempts=3, base_delay=0.01, exceptions=(ConnectionError,), jitter=True)
+        async def flaky():
+            calls["n"] += 1
+            if calls["n"] < 3:
+                raise ConnectionError("fail")
+            return "ok"
+
+        assert asyncio.run(flaky()) == "ok"
+        assert calls["n"] == 3
+
+    def test_async_breaker_opens(self):
+        """Test circuit breaker on coroutine functions."""
+        breaker = CircuitBreaker(name="async-test", failure_threshold=2)
+
+        @breaker.call
+        async def failing():
+            raise ConnectionError("fail")
+
+        async def run():
+            for _ in range(2):
+                with pytest.raises(ConnectionError):
+                    await failing()
+            with pytest.raises(CircuitBreakerOpenError):
+                await failing()
+
+        asyncio.run(run())
+        assert breaker.state == "open"
+
+
+class TestThreadSafety:
+    """Test breaker state under concurrent callers."""
+
+    def test_concurrent_failures_counted_exactly(self):
+        """Test no failure increments are lost across threads."""
+        breaker = CircuitBreaker(name="thread-test", failure_threshold=10_000)
+
+        def fail_many():
+            for _ in range(500):
+                breaker.record_failure()
+
+        threads = [threading.Thread(target=fail_many) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert breaker.failure_count == 4000
+        assert breaker.metrics["failures"] == 4000
+
+    def test_half_open_limits_trial_calls(self):
+        """Test half-open state admits at most half_open_max_calls."""
+        breaker = CircuitBreaker(name="half-open-test", failure_threshold=1, half_open_max_calls=2)
+        breaker._transition_to_half_open()
+
+        breaker.before_call()
+        breaker.before_call()
+        with pytest.raises(CircuitBreakerOpenError):
+            breaker.before_call()
+
+    def test_cancelled_half_open_trial_frees_slot(self):
+        """Test a cancelled trial call does not leave the breaker stuck half-open."""
+        breaker = CircuitBreaker(name="cancel-test", failure_threshold=1,
+                                 recovery_timeout=0, half_open_max_calls=3)
+
+        @breaker.call
+        async def trial(hang):
+            if hang:
+                await asyncio.sleep(10)
+            return "ok"
+
+        async def run():
+            breaker.record_failure()
+            task = asyncio.ensure_future(trial(True))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            for _ in range(3):
+                assert await trial(False) == "ok"
+
+        asyncio.run(run())
+        assert breaker.state == "closed"
+
+    def test_state_transitions_emitted(self):
+        """Test listeners receive each transition and metrics are exported."""
+        events = []
+        add_state_listener(events.append)
+        try:
+            breaker = CircuitBreaker(name="metrics-test", failure_threshold=1)
+            breaker.record_failure()
+            breaker._transition_to_half_open()
+        finally:
+            remove_state_listener(events.append)
+
+        assert [(e["from"], e["to"]) for e in events] == [("closed", "open"), ("open", "half_open")]
+        assert get_resilience_metrics()["breakers"]["metrics-test"]["transitions"] == 2
+
+
+class TestBulkhead:
+    """Test concurrency bulkheads."""
+
+    def test_limits_concurrency(self):
+        """Test at most max_concurrent calls run at once."""
+        bulkhead = Bulkhead("bulk-test", max_concurrent=2, max_queue=10)
+        active = {"now": 0, "peak": 0}
+        lock = threading.Lock()
+
+        @bulkhead.call
+        def work():
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            time.sleep(0.02)
+            with lock:
+                active["now"] -= 1
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert active["peak"] == 2
+        assert bulkhead.metrics["admitted"] == 8
+        assert bulkhead.active == 0
+
+    def test_rejects_when_queue_full(self):
+        """Test calls beyond slots + queue fail fast."""
+        bulkhead = Bulkhead("bulk-reject", max_concurrent=1, max_queue=0)
+
+        with bulkhead.slot():
+            with pytest.raises(BulkheadFullError):
+                bulkhead.acquire()
+
+        assert bulkhead.metrics["rejected"] == 1
+
+    def test_queue_timeout(self):
+        """Test queued callers give up after timeout."""
+        bulkhead = Bulkhead("bulk-timeout", max_concurrent=1, max_queue=1, timeout=0.05)
+
+        with bulkhead.slot():
+            with pytest.raises(BulkheadFullError, match="timed out"):
+                bulkhead.acquire()
+
+    def test_async_bulkhead(self):
+        """Test async callers share the same slots."""
+        bulkhead = Bulkhead("bulk-async", max_concurrent=2, max_queue=10)
+        active = {"now": 0, "peak": 0}
+
+        @bulkhead.call
+        async def work():
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+            await asyncio.sleep(0.01)
+            active["now"] -= 1
+
+        async def run():
+            await asyncio.gather(*(work() for _ in range(6)))
+
+        asyncio.run(run())
+        assert active["peak"] == 2
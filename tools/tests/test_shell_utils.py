@@ -536,3 +536,66 @@ class TestPipelineEdgeCases:
         result = pipe.tail(0)
         # Python's list[-0:] returns the entire list, not empty
         assert result.count() == 3
+
+
+class TestPipelineStreaming:
+    """Tests for lazy file-backed pipelines."""
+
+    def test_from_file_matches_eager(self, tmp_path):
+        """Test streamed file lines match read_text().split('\\n')."""
+        test_file = tmp_path / "log.txt"
+        test_file.write_text("INFO start\nERROR one 5\nINFO mid\nERROR two 7\n")
+
+        streamed = Pipeline.from_file(str(test_file))
+        eager = Pipeline(test_file.read_text())
+
+        assert streamed.lines() == eager.lines()
+        assert streamed.grep("ERROR", context_lines=1).lines() == \
+            eager.grep("ERROR", context_lines=1).lines()
+        assert streamed.grep("ERROR").sum_column(3) == 12.0
+        assert streamed.last() == "ERROR two 7"
+
+    def test_from_file_nonexistent(self):
+        """Test missing file raises at construction."""
+        with pytest.raises(FileNotFoundError):
+            Pipeline.from_file("/nonexistent/log.txt")
+
+    def test_stages_are_lazy(self):
+        """Test head stops reading the source early."""
+        consumed = []
+
+        def source():
+            for i in range(1000):
+                consumed.append(i)
+                yield f"line {i}"
+
+        pipe = Pipeline._stream(source)
+        assert pipe.grep("line").head(3).lines() == ["line 0", "line 1", "line 2"]
+        assert len(consumed) == 3
+
+    def test_pipeline_reusable(self, tmp_path):
+        """Test a file-backed pipeline can be consumed repeatedly."""
+        test_file = tmp_path / "log.txt"
+        test_file.write_text("a\nb\nc")
+
+        pipe = Pipeline.from_file(str(test_file)).grep("[ab]")
+        assert pipe.count() == 2
+        assert pipe.text() == "a\nb"
+
+    def test_tail_seeks_from_end(self, tmp_path, monkeypatch):
+        """Test tail reads only trailing blocks of a large file."""
+        import ce.shell_utils as shell_utils
+
+        test_file = tmp_path / "big.log"
+        test_file.write_text("".join(f"line {i}\n" for i in range(10000)))
+        monkeypatch.setattr(shell_utils, "_TAIL_BLOCK_SIZE", 16)
+
+        assert tail(str(test_file), 3) == ["line 9998", "line 9999", ""]
+        assert Pipeline.from_file(str(test_file)).tail(2).lines() == ["line 9999", ""]
+
+    def test_tail_crlf(self, tmp_path):
+        """Test tail normalizes CRLF like text-mode reads."""
+        test_file = tmp_path / "crlf.txt"
+        test_file.write_bytes(b"a\r\nb\r\nc")
+
+        assert tail(str(test_file), 2) == ["b", "c"]
@@ -0,0 +1,97 @@
+"""Tests for copy-on-write snapshots."""
+
+import errno
+
+import pytest
+
+from ce import snapshot
+from ce.blending.core import backup_context
+from ce.snapshot import Snapshot, clone_file, clone_tree
+
+
+def test_clone_file_copies_content_and_mtime(tmp_path):
+    src = tmp_path / "a.txt"
+    src.write_text("data")
+    dst = tmp_path / "b.txt"
+
+    assert clone_file(src, dst) in ("reflink", "copy")
+    assert dst.read_text() == "data"
+    assert dst.stat().st_mtime_ns == src.stat().st_mtime_ns
+
+
+@pytest.mark.skipif(snapshot.fcntl is None, reason="No fcntl on this platform")
+def test_unsupported_reflink_falls_back_once(tmp_path, monkeypatch):
+    calls = []
+
+    def no_clone(fd, request, arg):
+        calls.append(request)
+        raise OSError(errno.EOPNOTSUPP, "Operation not supported")
+
+    monkeypatch.setattr(snapshot.fcntl, "ioctl", no_clone)
+    monkeypatch.setattr(snapshot, "_no_reflink_devices", set())
+    for name in ("a", "b"):
+        (tmp_path / name).write_text(name)
+        assert clone_file(tmp_path / name, tmp_path / f"{name}.bak") == "copy"
+        assert (tmp_path / f"{name}.bak").read_text() == name
+    assert calls == [snapshot.FICLONE]  # Device remembered as unsupported
+
+
+def test_clone_tree_counts_files(tmp_path):
+    src = tmp_path / "memories"
+    (src / "nested").mkdir(parents=True)
+    (src / "one.md").write_text("1")
+    (src / "nested" / "two.md").write_text("2")
+
+    counts = clone_tree(src, tmp_path / "copy")
+    assert sum(counts.values()) == 2
+    assert (tmp_path / "copy" / "nested" / "two.md").read_text() == "2"
+
+
+def test_snapshot_restore_and_discard(tmp_path):
+    (tmp_path / ".serena" / "memories").mkdir(parents=True)
+    (tmp_path / ".serena" / "memories" / "m.md").write_text("user memory")
+    (tmp_path / "CLAUDE.md").write_text("user rules")
+
+    snap = Snapshot.take(tmp_path, [".serena", "CLAUDE.md", ".claude"], tmp_path / ".snap")
+    assert snap.present == [".serena", "CLAUDE.md"]
+    assert snap.absent == [".claude"]
+
+    # Failed operation: edits in place, creates new paths
+    (tmp_path / ".serena" / "memories" / "m.md").write_text("clobbered")
+    (tmp_path / "CLAUDE.md").write_text("clobbered")
+    (tmp_path / ".claude").mkdir()
+
+    snap.restore()
+    assert (tmp_path / ".serena" / "memories" / "m.md").read_text() == "user memory"
+    assert (tmp_path / "CLAUDE.md").read_text() == "user rules"
+    assert not (tmp_path / ".claude").exists()
+    assert not (tmp_path / ".snap").exists()
+
+    Snapshot.take(tmp_path, ["CLAUDE.md"], tmp_path / ".snap").discard()
+    assert not (tmp_path / ".snap").exists()
+
+
+def test_backup_context_restores_directory(tmp_path):
+    tree = tmp_path / "memories"
+    tree.mkdir()
+    (tree / "a.md").write_text("original")
+
+    with pytest.raises(RuntimeError):
+        with backup_context(tree):
+            (tree / "a.md").write_text("changed")
+            raise RuntimeError("blend failed")
+
+    assert (tree / "a.md").read_text() == "original"
+    assert not (tmp_path / "memories.backup").exists()
+
+
+def test_backup_context_removes_backup_on_success(tmp_path):
+    target = tmp_path / "CLAUDE.md"
+    target.write_text("original")
+
+    with backup_context(target) as backup:
+        assert backup.read_text() == "original"
+        target.write_text("changed")
+
+    assert target.read_text() == "changed"
+    assert not backup.exists()
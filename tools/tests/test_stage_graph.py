@@ -0,0 +1,60 @@
+"""Tests for the stage dependency graph runner."""
+
+import time
+
+import pytest
+
+from ce.stage_graph import format_stage_timings, run_stage_graph
+
+
+def sleeper(seconds, value):
+    def run(*_):
+        time.sleep(seconds)
+        return value
+    return run
+
+
+def test_independent_stages_overlap_and_receive_dependency_results():
+    run = run_stage_graph({
+        "parsed": ((), lambda: 2),
+        "research": (("parsed",), lambda parsed: time.sleep(0.3) or parsed * 10),
+        "docs": (("parsed",), lambda parsed: time.sleep(0.3) or parsed + 1),
+        "content": (("research", "docs"), lambda research, docs: f"{research}/{docs}"),
+    })
+
+    assert run["results"]["content"] == "20/3"
+    assert run["duration"] < 0.55  # research and docs ran concurrently
+    timings = run["timings"]
+    assert timings["content"]["start"] >= max(timings["research"]["end"], timings["docs"]["end"])
+
+
+def test_critical_path_follows_slowest_dependency():
+    run = run_stage_graph({
+        "a": ((), sleeper(0, "a")),
+        "fast": (("a",), sleeper(0.01, "fast")),
+        "slow": (("a",), sleeper(0.2, "slow")),
+        "join": (("fast", "slow"), sleeper(0, "join")),
+    })
+
+    assert run["critical_path"] == ["a", "slow", "join"]
+    report = format_stage_timings(run)
+    assert "critical path: a → slow → join" in report
+    assert "* slow" in report
+
+
+def test_stage_error_propagates_and_stops_dependents():
+    started = []
+
+    with pytest.raises(ValueError, match="bad input"):
+        run_stage_graph({
+            "parsed": ((), lambda: (_ for _ in ()).throw(ValueError("bad input"))),
+            "research": (("parsed",), lambda parsed: started.append("research")),
+        })
+    assert started == []
+
+
+def test_unknown_dependency_and_cycle_rejected():
+    with pytest.raises(RuntimeError, match="unknown stage"):
+        run_stage_graph({"a": (("missing",), lambda _: None)})
+    with pytest.raises(RuntimeError, match="cycle"):
+        run_stage_graph({"a": (("b",), lambda _: None), "b": (("a",), lambda _: None)})
@@ -0,0 +1,130 @@
+"""Tests for concurrent DAG execution in ce.testing pipelines."""
+
+import threading
+import time
+
+import pytest
+
+from ce.testing import BaseMockStrategy, BaseRealStrategy, Pipeline, PipelineBuilder
+
+
+class Step(BaseRealStrategy):
+    """Adds its name to the trail after an optional delay."""
+
+    def __init__(self, name, delay=0.0, fail=False, barrier=None):
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.barrier = barrier
+
+    def execute(self, input_data):
+        if self.barrier:
+            self.barrier.wait(timeout=5)
+        time.sleep(self.delay)
+        if self.fail:
+            raise ValueError(f"{self.name} broke")
+        return {**input_data, self.name: True, "trail": input_data.get("trail", []) + [self.name]}
+
+
+class CannedStep(BaseMockStrategy):
+    def execute(self, input_data):
+        return {**input_data, "canned": True}
+
+
+def test_linear_pipeline_passes_data_through():
+    pipeline = (
+        PipelineBuilder()
+        .add_node("a", Step("a"))
+        .add_node("b", Step("b"))
+        .add_edge("a", "b")
+        .build()
+    )
+    result = pipeline.execute({"trail": []})
+    assert result["trail"] == ["a", "b"]
+
+
+def test_fan_out_branches_run_concurrently():
+    barrier = threading.Barrier(2)  # Deadlocks (times out) unless both run at once
+    pipeline = (
+        PipelineBuilder()
+        .add_node("root", Step("root"))
+        .add_node("left", Step("left", barrier=barrier))
+        .add_node("right", Step("right", barrier=barrier))
+        .add_node("join", Step("join"))
+        .add_edge("root", "left")
+        .add_edge("root", "right")
+        .add_edge("left", "join")
+        .add_edge("right", "join")
+        .build()
+    )
+    result = pipeline.execute({})
+    assert not barrier.broken
+    assert result["left"] and result["right"] and result["join"]
+
+
+def test_merge_order_is_deterministic():
+    # "slow" finishes last but is earlier in topological order, so "fast" wins conflicts
+    pipeline = Pipeline(
+        {"slow": Step("slow", delay=0.05), "fast": Step("fast"), "join": Step("join")},
+        [("slow", "join"), ("fast", "join")],
+    )
+    result = pipeline.execute({"trail": []})
+    assert result["trail"] == ["fast", "join"]
+
+
+def test_root_nodes_get_their_own_input_copy():
+    class Mutator(BaseRealStrategy):
+        def __init__(self, name):
+            self.name = name
+
+        def execute(self, input_data):
+            input_data[self.name] = True  # Mutates its input in place
+            return {self.name: sorted(input_data)}
+
+    original = {"seed": 1}
+    pipeline = Pipeline({"a": Mutator("a"), "b": Mutator("b")}, [])
+    result = pipeline.execute(original)
+
+    assert result == {"a": ["a", "seed"], "b": ["b", "seed"]}
+    assert original == {"seed": 1}
+
+
+def test_failure_stops_downstream_and_records_runs():
+    pipeline = Pipeline(
+        {"a": Step("a"), "bad": Step("bad", fail=True), "after": Step("after")},
+        [("a", "bad"), ("bad", "after")],
+    )
+    with pytest.raises(RuntimeError, match="'bad' failed"):
+        pipeline.execute({})
+
+    assert pipeline.runs["a"].status == "ok"
+    assert pipeline.runs["bad"].status == "failed"
+    assert pipeline.runs["after"].status == "cancelled"
+
+
+def test_cancel_before_downstream():
+    class Canceller(BaseRealStrategy):
+        def execute(self, input_data):
+            pipeline.cancel()
+            return input_data
+
+    pipeline = Pipeline({"first": Canceller(), "second": Step("second")}, [("first", "second")])
+    with pytest.raises(RuntimeError, match="cancelled"):
+        pipeline.execute({})
+    assert pipeline.runs["second"].status == "cancelled"
+
+
+def test_timing_report_marks_mocked_nodes():
+    pipeline = Pipeline({"real": Step("real"), "mock": CannedStep()}, [("real", "mock")])
+    pipeline.execute({})
+    report = pipeline.timing_report()
+    assert "🎭 mock: ok" in report
+    assert pipeline.runs["mock"].mocked and not pipeline.runs["real"].mocked
+
+
+def test_cycle_detected_before_running():
+    step = Step("a")
+    pipeline = Pipeline({"a": step, "b": Step("b")}, [("a", "b"), ("b", "a")])
+    with pytest.raises(RuntimeError, match="circular"):
+        pipeline.execute({})
+    assert pipeline.runs == {}
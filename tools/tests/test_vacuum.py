@@ -122,6 +122,30 @@ class TestOrphanTestStrategy:
         assert all(c.confidence >= 40 for c in orphan_tests)
 
 
+class TestUnreferencedCodeStrategy:
+    """Test import-graph unreferenced code strategy."""
+
+    def test_finds_unreachable_modules(self, temp_project):
+        """Should flag modules no entry point reaches, not imported ones."""
+        pkg = temp_project / "pkg"
+        pkg.mkdir()
+        (pkg / "__init__.py").write_text("")
+        (pkg / "used.py").write_text("def helper():\n    pass\n")
+        (pkg / "dead.py").write_text("def unused():\n    pass\n")
+        (temp_project / "tests" / "test_used.py").write_text(
+            "from pkg.used import helper\n\ndef test_helper():\n    helper()\n"
+        )
+
+        strategy = UnreferencedCodeStrategy(temp_project)
+        candidates = {c.path.name: c for c in strategy.find_candidates()}
+
+        assert "dead.py" in candidates
+        assert "not reachable" in candidates["dead.py"].reason
+        assert "used.py" not in candidates
+        assert "test_used.py" not in candidates
+        assert all(c.confidence <= 40 for c in candidates.values())
+
+
 class TestCommentedCodeStrategy:
     """Test commented code detection strategy."""
 
@@ -134,6 +158,62 @@ class TestCommentedCodeStrategy:
         assert len(commented_files) >= 1
         assert all(c.confidence <= 40 for c in commented_files)
 
+    def test_ignores_docstrings_and_prose(self):
+        """Only real comments that parse as code count."""
+        from ce.vacuum_strategies.commented_code import find_commented_code_blocks
+
+        in_docstring = '"""\n' + "\n".join(["# x = 1"] * 25) + '\n"""\n'
+        prose = "\n".join(["# This module does things.", "# Note: it is fine", "# TODO"] * 8)
+        trailing = "\n".join(f"x = {i}  # set x" for i in range(30))
+
+        assert find_commented_code_blocks(in_docstring, 20) == []
+        assert find_commented_code_blocks(prose, 20) == []
+        assert find_commented_code_blocks(trailing, 20) == []
+
+    def test_detects_code_fragments(self):
+        """Fragments like else:/except: are recognized line by line."""
+        from ce.vacuum_strategies.commented_code import find_commented_code_blocks
+
+        fragment = "\n".join(["# if a:", "#     b = 2", "# else:", "#     c = 3"] * 6)
+        source = "# Header prose that is not code.\n" + fragment + "\nvalue = 1\n"
+
+        assert find_commented_code_blocks(source, 20) == [{"start": 2, "lines": 24}]
+
+    def test_parallel_scan_matches_serial(self, temp_project, monkeypatch):
+        """Process-pool scanning returns the same blocks as in-process."""
+        from ce.vacuum_strategies import commented_code
+
+        for i in range(4):
+            (temp_project / f"mod{i}.py").write_text(
+                f"value = {i}\n" + "\n".join(f"# y_{j} = {i}" for j in range(20 + i))
+            )
+
+        commented_code._memory_cache.clear()
+        serial = {c.path.name: c.references for c in CommentedCodeStrategy(temp_project, workers=1).find_candidates()}
+
+        commented_code._memory_cache.clear()
+        monkeypatch.setattr(commented_code, "_PARALLEL_THRESHOLD", 2)
+        parallel = {c.path.name: c.references for c in CommentedCodeStrategy(temp_project, workers=2).find_candidates()}
+
+        assert parallel == serial
+        assert serial["mod3.py"] == ["Line 2: 23 lines"]
+        # Strategies run in threads: the pool must not fork this process
+        assert commented_code._pool_context().get_start_method() != "fork"
+
+
+    def test_memory_cache_is_bounded(self, temp_project, monkeypatch):
+        """In-memory scan cache evicts least recently used files."""
+        from ce.vacuum_strategies import commented_code
+
+        for i in range(3):
+            (temp_project / f"bounded{i}.py").write_text(f"value = {i}\n")
+        monkeypatch.setattr(commented_code, "_MEMORY_CACHE_SIZE", 2)
+        commented_code._memory_cache.clear()
+
+        CommentedCodeStrategy(temp_project, workers=1).find_candidates()
+
+        assert len(commented_code._memory_cache) == 2
+
 
 class TestVacuumCommand:
     """Test main vacuum command."""
@@ -226,6 +306,51 @@ class TestVacuumCommand:
             assert low_section.count("|") <= 6  # Just header rows
 
 
+class TestFileInventory:
+    """Test shared file inventory."""
+
+    def test_prunes_dependency_and_protected_dirs(self, temp_project):
+        """Should not walk node_modules, .git or wholesale-protected dirs."""
+        (temp_project / "node_modules" / "pkg").mkdir(parents=True)
+        (temp_project / "node_modules" / "pkg" / "old.bak").write_text("x")
+        (temp_project / ".ce" / "notes.bak").write_text("x")
+
+        strategy = BackupFileStrategy(temp_project)
+        inventory = strategy.get_inventory()
+        names = {p.name for p in inventory.files}
+
+        assert "old.bak" not in names
+        assert "notes.bak" not in names
+        assert "file.bak" in names
+
+    def test_honors_gitignore(self, temp_project):
+        """Gitignored files are hidden unless explicitly requested."""
+        import subprocess
+
+        subprocess.run(["git", "init", "-q"], cwd=temp_project, check=True)
+        (temp_project / ".gitignore").write_text("generated/\n*.pyc\n")
+        (temp_project / "generated").mkdir()
+        (temp_project / "generated" / "ANALYSIS-output.md").write_text("gen")
+
+        strategy = ObsoleteDocStrategy(temp_project)
+        docs = {c.path.name for c in strategy.find_candidates()}
+        assert "ANALYSIS-output.md" not in docs
+
+        inventory = strategy.get_inventory()
+        assert inventory.is_ignored(temp_project / "generated" / "ANALYSIS-output.md")
+        temp = [p.name for p in inventory.glob("**/*.pyc", include_ignored=True)]
+        assert "test.pyc" in temp
+
+    def test_report_includes_strategy_timing(self, temp_project):
+        """Report should list per-strategy run time."""
+        VacuumCommand(temp_project).run(dry_run=True)
+
+        report = (temp_project / ".ce" / "vacuum-report.md").read_text()
+        assert "## Strategy Timing" in report
+        for name in ("inventory", "temp-files", "unreferenced-code", "commented-code"):
+            assert f"| {name} |" in report
+
+
 class TestProtectedPaths:
     """Test NEVER_DELETE protection."""
 
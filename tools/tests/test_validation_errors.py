@@ -0,0 +1,113 @@
+"""Tests for one-pass validation error extraction."""
+
+from ce.validation_errors import extract_errors, iter_errors
+from ce.validation_loop import apply_self_healing_fix, check_escalation_triggers, parse_validation_error
+
+PYTEST_LONG = """\
+=================================== FAILURES ===================================
+____________________________________ test_a ____________________________________
+
+    def test_a():
+>       helper()
+
+tests/test_demo.py:5: 
+_ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _ _
+
+    def helper():
+>       assert 1 == 2, "numbers differ"
+E       AssertionError: numbers differ
+E       assert 1 == 2
+
+tests/test_demo.py:3: AssertionError
+____________________________________ test_c ____________________________________
+
+    def test_c():
+>       import nonexistent_mod
+E       ModuleNotFoundError: No module named 'nonexistent_mod'
+
+tests/test_demo.py:9: ModuleNotFoundError
+=========================== short test summary info ============================
+FAILED tests/test_demo.py::test_a - AssertionError: numbers differ
+FAILED tests/test_demo.py::test_c - ModuleNotFoundError: No module named 'nonex...
+"""
+
+
+def test_pytest_long_traceback_yields_each_failure_once():
+    errors = extract_errors(PYTEST_LONG)
+    assert [(e["type"], e["line"]) for e in errors] == [("assertion_error", 3), ("import_error", 9)]
+    assert errors[0]["message"] == "AssertionError: numbers differ"
+    assert errors[1]["message"] == "No module named 'nonexistent_mod'"
+
+
+def test_pytest_summary_without_tracebacks():
+    output = "FAILED tests/test_x.py::test_one - assert 1 == 2\nFAILED tests/test_x.py::test_two\n"
+    errors = extract_errors(output)
+    assert [(e["type"], e["function"]) for e in errors] == [("test_failure", "test_one"), ("test_failure", "test_two")]
+
+
+def test_lint_and_compiler_grammars():
+    output = "\n".join([
+        "src/app.py:12: error: Incompatible return value type  [return-value]",
+        "src/app.py:3:1: F401 'os' imported but unused",
+        "src/main.ts(7,3): error TS2322: Type 'string' is not assignable to type 'number'.",
+        "src/util.ts:4:10 - error TS2304: Cannot find name 'foo'.",
+        "README.md:12:81 MD013/line-length Line length [Expected: 80; Actual: 95]",
+        "",
+        "/repo/src/index.js",
+        "  3:7  error    'x' is assigned a value but never used  no-unused-vars",
+        "  5:1  warning  Unexpected console statement            no-console",
+        "",
+    ])
+    errors = extract_errors(output)
+    assert [(e["type"], e["file"], e["line"], e.get("code")) for e in errors] == [
+        ("type_error", "src/app.py", 12, "return-value"),
+        ("lint_error", "src/app.py", 3, "F401"),
+        ("type_error", "src/main.ts", 7, "TS2322"),
+        ("type_error", "src/util.ts", 4, "TS2304"),
+        ("markdown_error", "README.md", 12, "MD013"),
+        ("lint_error", "/repo/src/index.js", 3, "no-unused-vars"),
+    ]
+
+
+def test_streaming_stops_at_max_errors():
+    def lines():
+        for i in range(1_000_000):
+            yield f"src/app.py:{i + 1}:1: F401 unused import {i}\n"
+
+    errors = list(iter_errors(lines(), max_errors=5))
+    assert [e["line"] for e in errors] == [1, 2, 3, 4, 5]
+
+
+def test_parse_returns_all_errors_and_keyword_fallback():
+    error = parse_validation_error(PYTEST_LONG, "L2")
+    assert error["type"] == "assertion_error"
+    assert len(error["errors"]) == 2
+
+    fallback = parse_validation_error("name 'x' is not defined", "L2")
+    assert fallback["type"] == "name_error"
+    assert fallback["file"] == "unknown"
+
+
+def test_batch_fix_applies_every_import_fix(tmp_path):
+    first = tmp_path / "a.py"
+    second = tmp_path / "b.py"
+    first.write_text("import sys\n")
+    second.write_text("import os\n")
+    output = (
+        f'File "{first}", line 1, in <module>\nModuleNotFoundError: No module named \'jwt\'\n'
+        f'File "{second}", line 1, in <module>\nImportError: cannot import name \'User\'\n'
+    )
+
+    result = apply_self_healing_fix(parse_validation_error(output, "L2"), 1)
+    assert result["success"] is True
+    assert len(result["fixes"]) == 2
+    assert "import jwt" in first.read_text()
+    assert "from . import User" in second.read_text()
+
+
+def test_escalation_checks_every_error():
+    output = (
+        'File "src/a.py", line 1, in f\nTypeError: bad operand\n'
+        'File "src/b.py", line 2, in g\nRuntimeError: connection refused by upstream\n'
+    )
+    assert check_escalation_triggers(parse_validation_error(output, "L2"), 1, [])